@@ -330,6 +330,32 @@ inline mgp_vertices_iterator *graph_iter_vertices(mgp_graph *g, mgp_memory *memo
   return MgInvoke<mgp_vertices_iterator *>(mgp_graph_iter_vertices, g, memory);
 }
 
+inline mgp_vertices_iterator *graph_iter_vertices_by_label(mgp_graph *g, mgp_label label, mgp_memory *memory) {
+  return MgInvoke<mgp_vertices_iterator *>(mgp_graph_iter_vertices_by_label, g, label, memory);
+}
+
+inline mgp_vertices_iterator *graph_iter_vertices_by_property(mgp_graph *g, mgp_label label, const char *property_name,
+                                                              mgp_value *value, mgp_memory *memory) {
+  return MgInvoke<mgp_vertices_iterator *>(mgp_graph_iter_vertices_by_property, g, label, property_name, value, memory);
+}
+
+inline mgp_vertices_iterator *graph_iter_vertices_by_property_range(mgp_graph *g, mgp_label label,
+                                                                    const char *property_name, mgp_value *lower_bound,
+                                                                    int lower_bound_inclusive, mgp_value *upper_bound,
+                                                                    int upper_bound_inclusive, mgp_memory *memory) {
+  return MgInvoke<mgp_vertices_iterator *>(mgp_graph_iter_vertices_by_property_range, g, label, property_name,
+                                           lower_bound, lower_bound_inclusive, upper_bound, upper_bound_inclusive,
+                                           memory);
+}
+
+inline int64_t graph_vertex_count(mgp_graph *g) { return MgInvoke<int64_t>(mgp_graph_vertex_count, g); }
+
+inline int64_t graph_vertex_count_by_label(mgp_graph *g, mgp_label label) {
+  return MgInvoke<int64_t>(mgp_graph_vertex_count_by_label, g, label);
+}
+
+inline int64_t graph_edge_count(mgp_graph *g) { return MgInvoke<int64_t>(mgp_graph_edge_count, g); }
+
 // mgp_vertices_iterator
 
 inline void vertices_iterator_destroy(mgp_vertices_iterator *it) { mgp_vertices_iterator_destroy(it); }
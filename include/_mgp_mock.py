@@ -1,4 +1,5 @@
 import typing
+from array import array
 from enum import Enum
 
 import networkx as nx
@@ -40,6 +41,32 @@ class EdgeConstants(Enum):
     I_KEY = 2
 
 
+_INT64_MAX = (1 << 63) - 1
+
+
+def _read_int64_values(values, name: str) -> list:
+    # Like in Memgraph, unsigned 64-bit integers which don't fit into int64 are rejected.
+    values = memoryview(values).tolist()
+    if any(isinstance(value, int) and value > _INT64_MAX for value in values):
+        raise ValueError(f"Elements of {name} don't fit into 64-bit signed integers.")
+    return values
+
+
+def _read_property_columns(columns, size: int):
+    read_columns = []
+    for name, values, null_mask in columns:
+        values = _read_int64_values(values, "values")
+        null_mask = memoryview(null_mask).tolist() if null_mask is not None else [False] * len(values)
+        if not len(values) == len(null_mask) == size:
+            raise ValueError(f"Expected the values and null mask of property '{name}' to have {size} elements.")
+        read_columns.append((name, values, null_mask))
+    return read_columns
+
+
+def _column_properties(columns, i: int) -> dict:
+    return {name: values[i] for name, values, null_mask in columns if not null_mask[i]}
+
+
 class Graph:
     """Wrapper around a NetworkX MultiDiGraph instance."""
 
@@ -121,6 +148,36 @@ class Graph:
 
         return Edge((from_id, to_id, edge_id), self)
 
+    def create_vertices(self, count: int, labels: typing.List[str], columns) -> array:
+        columns = _read_property_columns(columns, count)
+        vertex_ids = array("q")
+        for i in range(count):
+            vertex_id = self._new_vertex_id()
+            self.nx.add_node(vertex_id, **_column_properties(columns, i))
+            if labels:
+                self.nx.nodes[vertex_id][NX_LABEL_ATTR] = ":".join(labels)
+            self._highest_vertex_id = vertex_id
+            vertex_ids.append(vertex_id)
+
+        return vertex_ids
+
+    def create_edges(self, from_ids, to_ids, edge_type: str, columns) -> array:
+        from_ids, to_ids = memoryview(from_ids).tolist(), memoryview(to_ids).tolist()
+        if len(from_ids) != len(to_ids):
+            raise ValueError("Expected source and destination vertex IDs to have the same length.")
+        columns = _read_property_columns(columns, len(from_ids))
+        edge_ids = array("q")
+        for i, (from_id, to_id) in enumerate(zip(from_ids, to_ids)):
+            for vertex_id in (from_id, to_id):
+                if not self.nx.has_node(vertex_id):
+                    raise IndexError(f"Unable to find the vertex with ID {vertex_id}.")
+            edge_id = self._new_edge_id()
+            self.nx.add_edge(from_id, to_id, key=edge_id, **{NX_TYPE_ATTR: edge_type}, **_column_properties(columns, i))
+            self._highest_edge_id = edge_id
+            edge_ids.append(edge_id)
+
+        return edge_ids
+
     def delete_vertex(self, vertex_id: int):
         self.nx.remove_node(vertex_id)
 
@@ -141,6 +198,99 @@ class Graph:
 
         return self._highest_edge_id + 1
 
+    def adjacency(
+        self,
+        direction: str,
+        edge_types: typing.Optional[typing.List[str]],
+        weight_property: typing.Optional[str],
+        default_weight: float,
+        start: int = 0,
+        stop: typing.Optional[int] = None,
+    ):
+        if direction not in ("out", "in", "both"):
+            raise ValueError("Expected direction to be one of 'out', 'in' or 'both'.")
+
+        vertex_ids = array("q", self.nx.nodes)
+        positions = {vertex_id: position for position, vertex_id in enumerate(vertex_ids)}
+        indptr = array("q", [0])
+        indices = array("q")
+        edge_ids = array("q")
+        weights = array("d") if weight_property is not None else None
+
+        for vertex_id in vertex_ids[start:stop]:
+            edges = []
+            if direction in ("out", "both"):
+                out_edges = self.nx.out_edges(vertex_id, keys=True, data=True)
+                edges.extend((end, key, data) for _, end, key, data in out_edges)
+            if direction in ("in", "both"):
+                in_edges = self.nx.in_edges(vertex_id, keys=True, data=True)
+                edges.extend((start, key, data) for start, _, key, data in in_edges)
+            for neighbour_id, edge_id, data in edges:
+                if edge_types is not None and data[NX_TYPE_ATTR] not in edge_types:
+                    continue
+                indices.append(positions[neighbour_id])
+                edge_ids.append(edge_id)
+                if weights is not None:
+                    weight = data.get(weight_property)
+                    if weight is None:
+                        weight = default_weight
+                    elif isinstance(weight, bool) or not isinstance(weight, (int, float)):
+                        raise ValueError(f"Property '{weight_property}' of edge {edge_id} is not a number")
+                    weights.append(weight)
+            indptr.append(len(indices))
+
+        return vertex_ids[start:stop], indptr, indices, edge_ids, weights
+
+    def vertex_ids_with_label(self, label: typing.Optional[str]):
+        return array(
+            "q",
+            (
+                vertex_id
+                for vertex_id, labels in self.nx.nodes(data=NX_LABEL_ATTR)
+                if label is None or (labels is not None and label in labels.split(":"))
+            ),
+        )
+
+    def property_column(self, label: typing.Optional[str], property: str, dtype: str):
+        if dtype == "int64":
+            values, is_valid = array("q"), lambda value: isinstance(value, int) and not isinstance(value, bool)
+        elif dtype == "float64":
+            values, is_valid = array("d"), lambda value: isinstance(value, (int, float)) and not isinstance(value, bool)
+        elif dtype == "bool":
+            values, is_valid = array("B"), lambda value: isinstance(value, bool)
+        else:
+            raise ValueError("Expected dtype to be one of 'int64', 'float64' or 'bool'.")
+
+        null_mask = array("B")
+        for vertex_id in self.vertex_ids_with_label(label):
+            value = self.nx.nodes[vertex_id].get(property)
+            if value is None:
+                values.append(0)
+                null_mask.append(True)
+                continue
+            if not is_valid(value):
+                raise ValueError(f"Property '{property}' of vertex {vertex_id} cannot be stored as {dtype}")
+            values.append(value)
+            null_mask.append(False)
+
+        return values, null_mask
+
+    def set_property_column(self, vertex_ids, property: str, values, null_mask) -> None:
+        vertex_ids, values = memoryview(vertex_ids).tolist(), _read_int64_values(values, "values")
+        null_mask = memoryview(null_mask).tolist() if null_mask is not None else [False] * len(vertex_ids)
+        if not len(vertex_ids) == len(values) == len(null_mask):
+            raise ValueError("Expected vertex IDs, values and null mask to have the same length.")
+        if nx.is_frozen(self.nx):
+            raise ImmutableObjectError("Cannot modify immutable object.")
+
+        for vertex_id, value, is_null in zip(vertex_ids, values, null_mask):
+            if not self.nx.has_node(vertex_id):
+                raise IndexError(f"Unable to find the vertex with ID {vertex_id}.")
+            if is_null:
+                self.nx.nodes[vertex_id].pop(property, None)
+            else:
+                self.nx.nodes[vertex_id][property] = value
+
 
 class Vertex:
     """Represents a graph vertex."""
@@ -0,0 +1,369 @@
+# Copyright 2024 Memgraph Ltd.
+#
+# Use of this software is governed by the Business Source License
+# included in the file licenses/BSL.txt; by using this file, you agree to be bound by the terms of the Business Source
+# License, and you may not use this file except in compliance with the Business Source License.
+#
+# As of the Change Date specified in that file, in accordance with
+# the Business Source License, use of this software will be governed
+# by the Apache License, Version 2.0, included in the file
+# licenses/APL.txt.
+
+"""
+This module runs the functions passed to `mgp.offload` in a pool of worker
+processes. It's imported both by Memgraph and by the workers, which run a
+regular Python interpreter, so it mustn't depend on `_mgp`.
+
+Each worker runs one call at a time, so a call which has to be stopped, because
+it ran out of time or the query was aborted, is stopped by killing just its own
+worker, without affecting the calls of other procedures.
+
+Buffers in the snapshot are copied into shared memory blocks once, and the
+workers map them instead of unpickling copies. The structure around them is
+described by a layout of nested tuples:
+
+  ("buffer", (name, nbytes, format, shape))  a buffer in the shared memory block `name`
+  ("tuple", [layout, ...])                   a tuple, and likewise for "list"
+  ("dict", [(key, layout), ...])             a dictionary
+  ("object", [(name, layout), ...])          an object with `__slots__`, e.g. `mgp.Adjacency`
+  ("value", value)                           anything else, which is pickled
+"""
+
+import collections
+import os
+import pickle
+import shutil
+import sys
+import threading
+import time
+import types
+import typing
+from concurrent.futures.process import BrokenProcessPool
+
+# Number of seconds between the checks whether the query was aborted.
+_ABORT_CHECK_INTERVAL = 0.1
+
+
+class UnavailableError(RuntimeError):
+    """Signals that there is no Python interpreter to run the workers."""
+
+    pass
+
+
+def _python_executable() -> str:
+    # `sys.executable` is the Memgraph binary, so the workers need a Python
+    # interpreter of the same version, in order to unpickle the functions.
+    version = f"{sys.version_info.major}.{sys.version_info.minor}"
+    for name in (f"python{version}", f"python{sys.version_info.major}"):
+        path = shutil.which(name)
+        if path is not None:
+            return path
+    raise UnavailableError(f"Unable to find a Python {version} interpreter to run the offloaded functions.")
+
+
+def _init_worker(path: typing.List[str]) -> None:
+    sys.path[:] = path
+    # Query modules import `mgp`, which is only available within Memgraph, so
+    # the workers import them with the mock API in its place.
+    if "mgp" not in sys.modules:
+        import mgp_mock
+
+        sys.modules["mgp"] = mgp_mock
+
+
+def _picklable_error(error: Exception) -> Exception:
+    try:
+        pickle.loads(pickle.dumps(error))
+        return error
+    except Exception:
+        return RuntimeError(f"{type(error).__name__}: {error}")
+
+
+def _run_worker(connection, path: typing.List[str]) -> None:
+    _init_worker(path)
+    while True:
+        try:
+            request = connection.recv_bytes()
+        except EOFError:
+            # Memgraph closed the connection or exited.
+            return
+        try:
+            fn, layout, args, kwargs = pickle.loads(request)
+            reply = (True, _call(fn, layout, args, kwargs))
+        except Exception as error:
+            reply = (False, _picklable_error(error))
+        connection.send_bytes(pickle.dumps(reply))
+
+
+def _max_workers() -> int:
+    return os.cpu_count() or 1
+
+
+class _Worker:
+    __slots__ = ("process", "connection")
+
+    def __init__(self, context):
+        self.connection, child_connection = context.Pipe()
+        self.process = context.Process(target=_run_worker, args=(child_connection, list(sys.path)), daemon=True)
+        self.process.start()
+        child_connection.close()
+
+    def kill(self) -> None:
+        self.process.kill()
+        self.process.join()
+        self.connection.close()
+
+
+class _Pool:
+    """Workers shared by all of the procedures, up to one per CPU."""
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._context = None
+        self._idle = []
+        self._size = 0
+
+    def acquire(self) -> typing.Optional[_Worker]:
+        """Return an idle worker, or start a new one, or return `None` if all of them are busy."""
+        with self._condition:
+            if self._idle:
+                return self._idle.pop()
+            if self._size >= _max_workers():
+                return None
+            if self._context is None:
+                import multiprocessing
+
+                self._context = multiprocessing.get_context("spawn")
+                self._context.set_executable(_python_executable())
+            self._size += 1
+        try:
+            return _Worker(self._context)
+        except BaseException:
+            self._remove()
+            raise
+
+    def release(self, worker: _Worker) -> None:
+        with self._condition:
+            self._idle.append(worker)
+            self._condition.notify()
+
+    def discard(self, worker: _Worker) -> None:
+        """Kill a worker, e.g. to stop the call it's running."""
+        worker.kill()
+        self._remove()
+
+    def wait(self, timeout: typing.Optional[float]) -> None:
+        """Wait until a worker might be available, or the timeout expires."""
+        with self._condition:
+            if not self._idle and self._size >= _max_workers():
+                self._condition.wait(timeout)
+
+    def _remove(self) -> None:
+        with self._condition:
+            self._size -= 1
+            self._condition.notify()
+
+
+_pool = _Pool()
+
+
+def _export(obj: typing.Any, blocks: list) -> tuple:
+    from multiprocessing import shared_memory
+
+    if isinstance(obj, (tuple, list)):
+        return (type(obj).__name__, [_export(item, blocks) for item in obj])
+    if isinstance(obj, dict):
+        return ("dict", [(key, _export(value, blocks)) for key, value in obj.items()])
+    if hasattr(type(obj), "__slots__"):
+        return ("object", [(name, _export(getattr(obj, name), blocks)) for name in type(obj).__slots__])
+    try:
+        view = memoryview(obj)
+    except TypeError:
+        return ("value", obj)
+    if not view.c_contiguous or view.ndim == 0:
+        raise ValueError("Expected the buffers in the snapshot to be contiguous arrays.")
+    # Fail early if the workers won't be able to restore the buffer.
+    _restore(view.cast("B"), view.format, view.shape)
+    # Shared memory blocks cannot be empty.
+    block = shared_memory.SharedMemory(create=True, size=max(view.nbytes, 1))
+    blocks.append(block)
+    block.buf[: view.nbytes] = view.cast("B")
+    return ("buffer", (block.name, view.nbytes, view.format, view.shape))
+
+
+def _restore(view: memoryview, format: str, shape: typing.Tuple[int, ...]) -> memoryview:
+    # Casting to a shape with zeros isn't supported, but isn't needed for
+    # one-dimensional buffers either.
+    return view.cast(format) if len(shape) == 1 else view.cast(format, shape)
+
+
+def _import(layout: tuple, blocks: list, views: list) -> typing.Any:
+    from multiprocessing import shared_memory
+
+    kind, value = layout
+    if kind == "buffer":
+        name, nbytes, format, shape = value
+        # The workers share the resource tracker of Memgraph, which unlinks
+        # the blocks it created if it exits before releasing them.
+        block = shared_memory.SharedMemory(name=name)
+        blocks.append(block)
+        views.append(block.buf[:nbytes])
+        views.append(_restore(views[-1], format, shape))
+        return views[-1]
+    if kind == "tuple":
+        return tuple(_import(item, blocks, views) for item in value)
+    if kind == "list":
+        return [_import(item, blocks, views) for item in value]
+    if kind == "dict":
+        return {key: _import(item, blocks, views) for key, item in value}
+    if kind == "object":
+        return types.SimpleNamespace(**{name: _import(item, blocks, views) for name, item in value})
+    return value
+
+
+def _call(fn: typing.Callable, layout: tuple, args: tuple, kwargs: dict) -> bytes:
+    blocks = []
+    views = []
+    try:
+        result = fn(_import(layout, blocks, views), *args, **kwargs)
+        # The result is pickled before the shared memory is unmapped, in case
+        # it references the snapshot.
+        return pickle.dumps(result)
+    finally:
+        try:
+            for view in reversed(views):
+                view.release()
+            for block in blocks:
+                block.close()
+        except BufferError:
+            # The snapshot is still referenced, e.g. by a global variable, so
+            # it's left mapped.
+            pass
+
+
+def call_isolated(snapshot: None, fn: typing.Callable, args: tuple) -> typing.Any:
+    """Call a procedure registered with `isolated=True` and return its records as dictionaries of their fields."""
+    record_type = sys.modules["mgp"].Record
+
+    def fields(record):
+        return dict(record.fields) if isinstance(record, record_type) else record
+
+    result = fn(*args)
+    if result is None or isinstance(result, record_type):
+        return fields(result)
+    return [fields(record) for record in result]
+
+
+def _run_calls(
+    calls: typing.List[tuple],
+    layout: tuple,
+    timeout: typing.Optional[float],
+    abort_check: typing.Optional[typing.Callable[[], None]],
+) -> list:
+    from multiprocessing.connection import wait
+
+    results = [None] * len(calls)
+    requests = collections.deque()
+    for index, (fn, args, kwargs) in enumerate(calls):
+        try:
+            requests.append((index, pickle.dumps((fn, layout, args, kwargs))))
+        except Exception as error:
+            results[index] = (False, error)
+    running = {}
+    try:
+        while requests or running:
+            if abort_check is not None:
+                abort_check()
+            # Calls are started only once a worker is free, so that their time
+            # budget doesn't include the time they spend waiting for it.
+            while requests:
+                worker = _pool.acquire()
+                if worker is None:
+                    break
+                index, request = requests.popleft()
+                try:
+                    worker.connection.send_bytes(request)
+                except OSError:
+                    # The worker exited while it was idle.
+                    _pool.discard(worker)
+                    requests.appendleft((index, request))
+                    continue
+                running[worker.connection] = (index, worker, None if timeout is None else time.monotonic() + timeout)
+            if not running:
+                _pool.wait(_ABORT_CHECK_INTERVAL if abort_check is not None else None)
+                continue
+            wait_timeout = None
+            if abort_check is not None or requests:
+                # Workers released by other procedures don't wake this one up.
+                wait_timeout = _ABORT_CHECK_INTERVAL
+            deadlines = [deadline for _, _, deadline in running.values() if deadline is not None]
+            if deadlines:
+                remaining = max(0.0, min(deadlines) - time.monotonic())
+                wait_timeout = remaining if wait_timeout is None else min(wait_timeout, remaining)
+            ready = wait(list(running), timeout=wait_timeout)
+            now = time.monotonic()
+            for connection in list(running):
+                index, worker, deadline = running[connection]
+                if connection in ready:
+                    del running[connection]
+                    try:
+                        succeeded, value = pickle.loads(connection.recv_bytes())
+                    except (EOFError, OSError):
+                        _pool.discard(worker)
+                        error = BrokenProcessPool("The worker running the call terminated abruptly.")
+                        results[index] = (False, error)
+                        continue
+                    _pool.release(worker)
+                    try:
+                        results[index] = (True, pickle.loads(value)) if succeeded else (False, value)
+                    except Exception as error:
+                        results[index] = (False, error)
+                elif deadline is not None and deadline <= now:
+                    del running[connection]
+                    # A running call can't be cancelled, so its worker is killed.
+                    _pool.discard(worker)
+                    results[index] = (False, TimeoutError(f"The call didn't finish within {timeout} seconds."))
+    finally:
+        # The calls are still running if the query was aborted or waiting for
+        # them failed.
+        for _, worker, _ in running.values():
+            _pool.discard(worker)
+    return results
+
+
+def offload(
+    fn: typing.Callable,
+    snapshot: typing.Any,
+    args: tuple,
+    kwargs: dict,
+    timeout: typing.Optional[float],
+    abort_check: typing.Optional[typing.Callable[[], None]] = None,
+):
+    blocks = []
+    try:
+        layout = _export(snapshot, blocks)
+        [(succeeded, value)] = _run_calls([(fn, args, kwargs)], layout, timeout, abort_check)
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+    if not succeeded:
+        raise value
+    return value
+
+
+def offload_all(
+    calls: typing.List[tuple],
+    snapshot: typing.Any,
+    timeout: typing.Optional[float],
+    abort_check: typing.Optional[typing.Callable[[], None]] = None,
+) -> list:
+    blocks = []
+    try:
+        layout = _export(snapshot, blocks)
+        results = _run_calls([(fn, tuple(args), {}) for fn, *args in calls], layout, timeout, abort_check)
+        return [value for _, value in results]
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
@@ -1029,6 +1029,59 @@ void mgp_vertices_iterator_destroy(struct mgp_vertices_iterator *it);
 enum mgp_error mgp_graph_iter_vertices(struct mgp_graph *g, struct mgp_memory *memory,
                                        struct mgp_vertices_iterator **result);
 
+/// Start iterating over vertices of the given graph which have the given label.
+/// The label index is used if it exists, otherwise all of the vertices are scanned.
+/// Resulting mgp_vertices_iterator needs to be deallocated with mgp_vertices_iterator_destroy.
+/// Return mgp_error::MGP_ERROR_UNABLE_TO_ALLOCATE if unable to allocate a mgp_vertices_iterator.
+enum mgp_error mgp_graph_iter_vertices_by_label(struct mgp_graph *g, struct mgp_label label, struct mgp_memory *memory,
+                                                struct mgp_vertices_iterator **result);
+
+/// Start iterating over vertices of the given graph which have the given label
+/// and whose property is equal to the given value.
+/// The label-property index is used if it exists, otherwise all of the vertices are scanned.
+/// Resulting mgp_vertices_iterator needs to be deallocated with mgp_vertices_iterator_destroy.
+/// Return mgp_error::MGP_ERROR_UNABLE_TO_ALLOCATE if unable to allocate a mgp_vertices_iterator.
+/// Return mgp_error::MGP_ERROR_INVALID_ARGUMENT if `value` is null.
+/// Return mgp_error::MGP_ERROR_VALUE_CONVERSION if `value` cannot be stored as a property.
+enum mgp_error mgp_graph_iter_vertices_by_property(struct mgp_graph *g, struct mgp_label label,
+                                                   const char *property_name, struct mgp_value *value,
+                                                   struct mgp_memory *memory, struct mgp_vertices_iterator **result);
+
+/// Start iterating over vertices of the given graph which have the given label
+/// and whose property is within the given bounds.
+/// A bound which is NULL or a null value leaves the range unbounded on that side.
+/// A bound is inclusive if the corresponding `*_inclusive` argument is non-zero.
+/// Only the property values of types comparable to the bounds are within them,
+/// integers and doubles being comparable with each other.
+/// The label-property index is used if it exists, otherwise all of the vertices are scanned.
+/// Resulting mgp_vertices_iterator needs to be deallocated with mgp_vertices_iterator_destroy.
+/// Return mgp_error::MGP_ERROR_UNABLE_TO_ALLOCATE if unable to allocate a mgp_vertices_iterator.
+/// Return mgp_error::MGP_ERROR_VALUE_CONVERSION if a bound cannot be stored as a property.
+enum mgp_error mgp_graph_iter_vertices_by_property_range(struct mgp_graph *g, struct mgp_label label,
+                                                         const char *property_name, struct mgp_value *lower_bound,
+                                                         int lower_bound_inclusive, struct mgp_value *upper_bound,
+                                                         int upper_bound_inclusive, struct mgp_memory *memory,
+                                                         struct mgp_vertices_iterator **result);
+
+/// Get the number of vertices of the given graph.
+/// The vertices are counted without creating an mgp_vertex for each of them.
+/// Projected graphs are counted in constant time, unless some of the vertices
+/// may be hidden from the user.
+/// Return mgp_error::MGP_ERROR_UNABLE_TO_ALLOCATE if unable to count the vertices.
+enum mgp_error mgp_graph_vertex_count(struct mgp_graph *g, int64_t *result);
+
+/// Get the number of vertices of the given graph which have the given label.
+/// The label index is used if it exists, otherwise all of the vertices are scanned.
+/// Return mgp_error::MGP_ERROR_UNABLE_TO_ALLOCATE if unable to count the vertices.
+enum mgp_error mgp_graph_vertex_count_by_label(struct mgp_graph *g, struct mgp_label label, int64_t *result);
+
+/// Get the number of edges of the given graph.
+/// The edges are counted from the degrees of the vertices, without creating an
+/// mgp_edge for each of them. Projected graphs are counted in constant time,
+/// unless some of the edges may be hidden from the user.
+/// Return mgp_error::MGP_ERROR_UNABLE_TO_ALLOCATE if unable to count the edges.
+enum mgp_error mgp_graph_edge_count(struct mgp_graph *g, int64_t *result);
+
 /// Result is non-zero if the vertices returned by this iterator can be modified.
 /// The mutability of the mgp_vertices_iterator is the same as the graph which it belongs to.
 /// Current implementation always returns without errors.
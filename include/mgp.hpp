@@ -224,11 +224,25 @@ class Graph {
 
   /// @brief Returns the graph order (number of nodes).
   int64_t Order() const;
+  /// @brief Returns the number of nodes with the given label.
+  int64_t Order(std::string_view label) const;
   /// @brief Returns the graph size (number of relationships).
   int64_t Size() const;
 
   /// @brief Returns an iterable structure of the graph’s nodes.
   GraphNodes Nodes() const;
+  /// @brief Returns an iterable structure of the graph’s nodes with the given label.
+  /// @note The label index is used if it exists, otherwise all of the nodes are scanned.
+  GraphNodes NodesByLabel(std::string_view label) const;
+  /// @brief Returns an iterable structure of the graph’s nodes with the given label whose property is equal to `value`.
+  /// @note The label-property index is used if it exists, otherwise all of the nodes are scanned.
+  GraphNodes NodesByProperty(std::string_view label, std::string_view property, const Value &value) const;
+  /// @brief Returns an iterable structure of the graph’s nodes with the given label whose property is within the
+  /// given bounds. A null bound leaves the range unbounded on that side.
+  /// @note The label-property index is used if it exists, otherwise all of the nodes are scanned.
+  GraphNodes NodesByPropertyRange(std::string_view label, std::string_view property, const Value &lower_bound,
+                                  bool lower_bound_inclusive, const Value &upper_bound,
+                                  bool upper_bound_inclusive) const;
   /// @brief Returns an iterable structure of the graph’s relationships.
   GraphRelationships Relationships() const;
 
@@ -1943,24 +1957,51 @@ inline void Graph::CheckMustAbort() const {
   }
 }
 
-inline int64_t Graph::Order() const {
-  int64_t i = 0;
-  for (const auto _ : Nodes()) {
-    i++;
+inline int64_t Graph::Order() const { return mgp::graph_vertex_count(graph_); }
+
+inline int64_t Graph::Order(std::string_view label) const {
+  return mgp::graph_vertex_count_by_label(graph_, mgp_label{.name = std::string(label).c_str()});
+}
+
+inline int64_t Graph::Size() const { return mgp::graph_edge_count(graph_); }
+
+inline GraphNodes Graph::Nodes() const {
+  auto *nodes_it = mgp::MemHandlerCallback(graph_iter_vertices, graph_);
+  if (nodes_it == nullptr) {
+    throw mg_exception::NotEnoughMemoryException();
   }
-  return i;
+  return GraphNodes(nodes_it);
 }
 
-inline int64_t Graph::Size() const {
-  int64_t i = 0;
-  for (const auto _ : Relationships()) {
-    i++;
+inline GraphNodes Graph::NodesByLabel(std::string_view label) const {
+  const auto label_name = std::string(label);
+  auto *nodes_it = mgp::MemHandlerCallback(graph_iter_vertices_by_label, graph_, mgp_label{.name = label_name.c_str()});
+  if (nodes_it == nullptr) {
+    throw mg_exception::NotEnoughMemoryException();
   }
-  return i;
+  return GraphNodes(nodes_it);
 }
 
-inline GraphNodes Graph::Nodes() const {
-  auto *nodes_it = mgp::MemHandlerCallback(graph_iter_vertices, graph_);
+inline GraphNodes Graph::NodesByProperty(std::string_view label, std::string_view property, const Value &value) const {
+  const auto label_name = std::string(label);
+  const auto property_name = std::string(property);
+  auto *nodes_it = mgp::MemHandlerCallback(graph_iter_vertices_by_property, graph_,
+                                           mgp_label{.name = label_name.c_str()}, property_name.c_str(), value.ptr());
+  if (nodes_it == nullptr) {
+    throw mg_exception::NotEnoughMemoryException();
+  }
+  return GraphNodes(nodes_it);
+}
+
+inline GraphNodes Graph::NodesByPropertyRange(std::string_view label, std::string_view property,
+                                              const Value &lower_bound, bool lower_bound_inclusive,
+                                              const Value &upper_bound, bool upper_bound_inclusive) const {
+  const auto label_name = std::string(label);
+  const auto property_name = std::string(property);
+  auto *nodes_it =
+      mgp::MemHandlerCallback(graph_iter_vertices_by_property_range, graph_, mgp_label{.name = label_name.c_str()},
+                              property_name.c_str(), lower_bound.ptr(), static_cast<int>(lower_bound_inclusive),
+                              upper_bound.ptr(), static_cast<int>(upper_bound_inclusive));
   if (nodes_it == nullptr) {
     throw mg_exception::NotEnoughMemoryException();
   }
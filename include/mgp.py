@@ -25,11 +25,14 @@ This module provides the API for usage in custom openCypher procedures.
 # actual implementation. Functions have type annotations as supported by Python
 # 3.5, but variable type annotations are only available with Python 3.6+
 
+import array
+import collections.abc
 import datetime
 import inspect
 import sys
+import threading
 import typing
-from collections import namedtuple
+from collections import OrderedDict, namedtuple
 from functools import wraps
 
 import _mgp
@@ -1046,6 +1049,168 @@ class Path:
         return self._path.size()
 
 
+class LazyList(collections.abc.Sequence):
+    """
+    Read-only sequence of a list argument, passed to procedures registered
+    with `lazy_args=True`. The elements are converted to Python objects only
+    when they are accessed.
+    """
+
+    __slots__ = ("_list",)
+
+    def __init__(self, lst):
+        if not isinstance(lst, _mgp.LazyList):
+            raise TypeError("Expected '_mgp.LazyList', got '{}'".format(type(lst)))
+        self._list = lst
+
+    def __deepcopy__(self, memo):
+        # This is the same as the shallow copy, because we want to share the
+        # underlying C struct.
+        return LazyList(self._list)
+
+    def is_valid(self) -> bool:
+        """
+        Check if `LazyList` is in valid context and may be used.
+
+        Returns:
+            A `bool` value depends on if the `LazyList` is in valid context.
+        """
+        return self._list.is_valid()
+
+    def __len__(self) -> int:
+        if not self.is_valid():
+            raise InvalidContextError()
+        return self._list.size()
+
+    def __getitem__(self, index):
+        if not self.is_valid():
+            raise InvalidContextError()
+        if isinstance(index, slice):
+            return tuple(self._list.at(i) for i in range(*index.indices(self._list.size())))
+        if index < 0:
+            index += self._list.size()
+        return self._list.at(index)
+
+    def __repr__(self) -> str:
+        return "LazyList({})".format(list(self)) if self.is_valid() else "LazyList(<invalid>)"
+
+    def vertex_ids(self) -> memoryview:
+        """
+        Get the IDs of the vertices in the list without converting them.
+
+        Returns:
+            `memoryview` of 64-bit integer vertex IDs.
+
+        Raises:
+            InvalidContextError: If context is invalid.
+            TypeError: If an element of the list isn't a vertex.
+
+        Examples:
+            ```ids = numpy.asarray(nodes.vertex_ids())```
+        """
+        if not self.is_valid():
+            raise InvalidContextError()
+        return memoryview(self._list.vertex_ids())
+
+    def edge_ids(self) -> memoryview:
+        """
+        Get the IDs of the edges in the list without converting them.
+
+        Returns:
+            `memoryview` of 64-bit integer edge IDs.
+
+        Raises:
+            InvalidContextError: If context is invalid.
+            TypeError: If an element of the list isn't an edge.
+
+        Examples:
+            ```ids = numpy.asarray(relationships.edge_ids())```
+        """
+        if not self.is_valid():
+            raise InvalidContextError()
+        return memoryview(self._list.edge_ids())
+
+    def edge_endpoints(self, start: int = 0, stop: typing.Optional[int] = None) -> typing.Tuple[memoryview, memoryview]:
+        """
+        Get the IDs of the endpoints of the edges in the list without
+        converting them.
+
+        Only the edges from `start` to `stop`, like in a slice, are included,
+        so that a long list can be processed in chunks.
+
+        Args:
+            start: Index of the first edge.
+            stop: Index after the last edge, or `None` for the end of the list.
+
+        Returns:
+            Pair of `memoryview` objects of 64-bit integer IDs, the first of
+            the vertices the edges come from and the second of the vertices
+            they lead to.
+
+        Raises:
+            InvalidContextError: If context is invalid.
+            TypeError: If an element of the list isn't an edge.
+
+        Examples:
+            ```from_ids, to_ids = relationships.edge_endpoints(0, 1000000)```
+        """
+        if not self.is_valid():
+            raise InvalidContextError()
+        size = self._list.size()
+        start, stop, _ = slice(start, stop).indices(size)
+        from_ids, to_ids = self._list.edge_endpoints(start, stop)
+        return memoryview(from_ids), memoryview(to_ids)
+
+
+class LazyMap(collections.abc.Mapping):
+    """
+    Read-only mapping of a map argument, passed to procedures registered with
+    `lazy_args=True`. The values are converted to Python objects only when
+    they are accessed.
+    """
+
+    __slots__ = ("_map",)
+
+    def __init__(self, map_):
+        if not isinstance(map_, _mgp.LazyMap):
+            raise TypeError("Expected '_mgp.LazyMap', got '{}'".format(type(map_)))
+        self._map = map_
+
+    def __deepcopy__(self, memo):
+        # This is the same as the shallow copy, because we want to share the
+        # underlying C struct.
+        return LazyMap(self._map)
+
+    def is_valid(self) -> bool:
+        """
+        Check if `LazyMap` is in valid context and may be used.
+
+        Returns:
+            A `bool` value depends on if the `LazyMap` is in valid context.
+        """
+        return self._map.is_valid()
+
+    def __len__(self) -> int:
+        if not self.is_valid():
+            raise InvalidContextError()
+        return self._map.size()
+
+    def __iter__(self) -> typing.Iterator[str]:
+        if not self.is_valid():
+            raise InvalidContextError()
+        return iter(self._map.keys())
+
+    def __getitem__(self, key: str):
+        if not self.is_valid():
+            raise InvalidContextError()
+        if not isinstance(key, str):
+            raise KeyError(key)
+        return self._map.at(key)
+
+    def __repr__(self) -> str:
+        return "LazyMap({})".format(dict(self)) if self.is_valid() else "LazyMap(<invalid>)"
+
+
 class Record:
     """Represents a record of resulting field values."""
 
@@ -1146,16 +1311,119 @@ class Vertices:
 
         Raises:
             InvalidContextError: If context is invalid.
-            UnableToAllocateError: If unable to allocate an iterator or a vertex.
+            UnableToAllocateError: If unable to count the vertices.
 
         Examples:
             ```len(graph.vertices)```
         """
-        if not self._len:
-            self._len = sum(1 for _ in self)
+        if not self.is_valid():
+            raise InvalidContextError()
+        if self._len is None:
+            self._len = self._graph.vertex_count()
         return self._len
 
 
+class Adjacency:
+    """
+    Snapshot of the adjacency of a graph in compressed sparse row (CSR) format.
+
+    Vertices are numbered by their position in `vertex_ids`, which holds their
+    IDs. The neighbours of the vertex at position `i` are at positions
+    `indices[indptr[i]:indptr[i + 1]]`, the IDs of the edges leading to them
+    are `edge_ids[indptr[i]:indptr[i + 1]]`, and their weights, if requested,
+    are at the same positions in `weights`.
+
+    Each of the arrays is a read-only `memoryview` of contiguous memory, with
+    64-bit integer or, for `weights`, 64-bit floating point elements. NumPy and
+    SciPy can wrap them without copying, e.g. with
+    `numpy.asarray(adjacency.indptr)`, and copy them to modify them.
+    Unlike the vertices and edges of a graph, the snapshot remains usable after
+    the procedure returns, but it doesn't reflect later changes of the graph.
+    """
+
+    __slots__ = ("vertex_ids", "indptr", "indices", "edge_ids", "weights")
+
+    def __init__(
+        self,
+        vertex_ids: memoryview,
+        indptr: memoryview,
+        indices: memoryview,
+        edge_ids: memoryview,
+        weights: typing.Optional[memoryview] = None,
+    ):
+        self.vertex_ids = vertex_ids
+        self.indptr = indptr
+        self.indices = indices
+        self.edge_ids = edge_ids
+        self.weights = weights
+
+    def __len__(self) -> int:
+        """Return the number of vertices."""
+        return len(self.vertex_ids)
+
+    @property
+    def num_edges(self) -> int:
+        """Number of edges in the snapshot."""
+        return len(self.indices)
+
+
+class PropertyColumn:
+    """
+    Values of a vertex property as a contiguous typed array.
+
+    `values` holds the property of each vertex and `null_mask` is True for the
+    vertices which don't have the property, whose entries in `values` are
+    zero. Both are `memoryview` objects which NumPy can wrap without copying,
+    e.g. with `numpy.ma.masked_array(column.values, mask=column.null_mask)`.
+    """
+
+    __slots__ = ("values", "null_mask")
+
+    def __init__(self, values: memoryview, null_mask: memoryview):
+        self.values = values
+        self.null_mask = null_mask
+
+    def __len__(self) -> int:
+        """Return the number of vertices."""
+        return len(self.values)
+
+
+_COLUMN_DTYPES = {int: "int64", float: "float64", bool: "bool"}
+
+
+def _column_dtype_name(dtype: typing.Any) -> str:
+    if dtype in _COLUMN_DTYPES:
+        return _COLUMN_DTYPES[dtype]
+    # NumPy dtypes have a `name` and NumPy scalar types a `__name__`.
+    name = getattr(dtype, "name", None) or getattr(dtype, "__name__", None) or dtype
+    return name if isinstance(name, str) else str(name)
+
+
+def _column_buffer(values: typing.Any) -> typing.Any:
+    try:
+        memoryview(values)
+        return values
+    except TypeError:
+        pass
+    # Sequences which don't support the buffer protocol are copied into one.
+    values = list(values)
+    if all(isinstance(value, bool) for value in values):
+        return memoryview(array.array("B", values)).cast("?")
+    if all(isinstance(value, int) for value in values):
+        return array.array("q", values)
+    return array.array("d", values)
+
+
+def _property_columns(properties: typing.Optional[typing.Dict[str, typing.Any]]) -> list:
+    columns = []
+    for name, values in (properties or {}).items():
+        null_mask = None
+        if isinstance(values, PropertyColumn):
+            values, null_mask = values.values, values.null_mask
+        columns.append((name, _column_buffer(values), _column_buffer(null_mask) if null_mask is not None else None))
+    return columns
+
+
 class Graph:
     """State of the graph database in current ProcCtx."""
 
@@ -1241,6 +1509,182 @@ class Graph:
             raise InvalidContextError()
         return Vertices(self._graph)
 
+    def vertex_count(self, label: typing.Optional[str] = None) -> int:
+        """
+        Get the number of vertices in the graph, or of the ones which have the
+        given label.
+
+        The vertices are counted without creating a `Vertex` for each of them.
+        The label index is used if it exists. The counts of a graph which
+        can't be modified are computed once per procedure call.
+
+        Args:
+            label: Name of the label, or None to count all of the vertices.
+
+        Returns:
+            The number of vertices.
+
+        Raises:
+            InvalidContextError: If context is invalid.
+            UnableToAllocateError: If unable to count the vertices.
+
+        Examples:
+            ```context.graph.vertex_count("Person")```
+        """
+        if not self.is_valid():
+            raise InvalidContextError()
+        return self._graph.vertex_count(label)
+
+    def edge_count(self) -> int:
+        """
+        Get the number of edges in the graph.
+
+        The edges are counted from the degrees of the vertices, without
+        creating an `Edge` for each of them. The count of a graph which can't
+        be modified is computed once per procedure call.
+
+        Returns:
+            The number of edges.
+
+        Raises:
+            InvalidContextError: If context is invalid.
+            UnableToAllocateError: If unable to count the edges.
+
+        Examples:
+            ```context.graph.edge_count()```
+        """
+        if not self.is_valid():
+            raise InvalidContextError()
+        return self._graph.edge_count()
+
+    def vertices_by_label(self, label: str) -> typing.Iterator[Vertex]:
+        """
+        Get the vertices in the graph which have the given label.
+
+        The label index is used if it exists, so that only the vertices with
+        the label are visited. Otherwise, all of the vertices are scanned.
+
+        Access to a Vertex is only valid during a single execution of a
+        procedure in a query. You should not globally store the returned Vertex
+        instances.
+
+        Args:
+            label: Name of the label.
+
+        Returns:
+            Iterator over the `Vertex` objects with the label.
+
+        Raises:
+            InvalidContextError: If context is invalid.
+            UnableToAllocateError: If unable to allocate an iterator or a vertex.
+
+        Examples:
+            ```
+            for vertex in context.graph.vertices_by_label("Person"):
+            ```
+        """
+        if not self.is_valid():
+            raise InvalidContextError()
+        return self._iter_vertices(self._graph.iter_vertices_by_label(label))
+
+    def vertices_by_property(self, label: str, property: str, value: typing.Any) -> typing.Iterator[Vertex]:
+        """
+        Get the vertices in the graph which have the given label and whose
+        property is equal to the given value.
+
+        The label-property index is used if it exists, so that only the
+        matching vertices are visited. Otherwise, all of the vertices are
+        scanned.
+
+        Access to a Vertex is only valid during a single execution of a
+        procedure in a query. You should not globally store the returned Vertex
+        instances.
+
+        Args:
+            label: Name of the label.
+            property: Name of the property.
+            value: Value of the property, which mustn't be None.
+
+        Returns:
+            Iterator over the matching `Vertex` objects.
+
+        Raises:
+            InvalidContextError: If context is invalid.
+            ValueError: If `value` is None.
+            UnableToAllocateError: If unable to allocate an iterator or a vertex.
+            ValueConversionError: If `value` cannot be a property value.
+
+        Examples:
+            ```
+            for vertex in context.graph.vertices_by_property("Person", "name", "Alice"):
+            ```
+        """
+        if not self.is_valid():
+            raise InvalidContextError()
+        if value is None:
+            raise ValueError("Vertices cannot be looked up by a None property value")
+        return self._iter_vertices(self._graph.iter_vertices_by_property(label, property, value))
+
+    def vertices_by_property_range(
+        self,
+        label: str,
+        property: str,
+        lower_bound: typing.Any = None,
+        upper_bound: typing.Any = None,
+        lower_bound_inclusive: bool = True,
+        upper_bound_inclusive: bool = True,
+    ) -> typing.Iterator[Vertex]:
+        """
+        Get the vertices in the graph which have the given label and whose
+        property is within the given bounds.
+
+        A bound which is None leaves the range unbounded on that side. Only
+        the property values of types comparable to the bounds are within them,
+        with integers and floats being comparable to each other, just like in
+        Cypher range filters. The label-property index is used if it exists,
+        so that only the matching vertices are visited. Otherwise, all of the
+        vertices are scanned.
+
+        Access to a Vertex is only valid during a single execution of a
+        procedure in a query. You should not globally store the returned Vertex
+        instances.
+
+        Args:
+            label: Name of the label.
+            property: Name of the property.
+            lower_bound: Lowest value of the property.
+            upper_bound: Highest value of the property.
+            lower_bound_inclusive: Whether the property may equal `lower_bound`.
+            upper_bound_inclusive: Whether the property may equal `upper_bound`.
+
+        Returns:
+            Iterator over the matching `Vertex` objects.
+
+        Raises:
+            InvalidContextError: If context is invalid.
+            UnableToAllocateError: If unable to allocate an iterator or a vertex.
+            ValueConversionError: If a bound cannot be a property value.
+
+        Examples:
+            ```
+            for vertex in context.graph.vertices_by_property_range("Person", "age", 18, 65):
+            ```
+        """
+        if not self.is_valid():
+            raise InvalidContextError()
+        vertices_it = self._graph.iter_vertices_by_property_range(
+            label, property, lower_bound, lower_bound_inclusive, upper_bound, upper_bound_inclusive
+        )
+        return self._iter_vertices(vertices_it)
+
+    def _iter_vertices(self, vertices_it) -> typing.Iterator[Vertex]:
+        vertex = vertices_it.get()
+        while vertex is not None:
+            yield Vertex(vertex)
+            if not self.is_valid():
+                raise InvalidContextError()
+            vertex = vertices_it.next()
+
     def is_mutable(self) -> bool:
         """
         Check if the graph is mutable. Thus it can be used to modify vertices and edges.
@@ -1335,6 +1779,94 @@ class Graph:
             raise InvalidContextError()
         return Edge(self._graph.create_edge(from_vertex._vertex, to_vertex._vertex, edge_type.name))
 
+    def create_vertices(
+        self,
+        count: int,
+        labels: typing.Iterable[str] = (),
+        properties: typing.Optional[typing.Dict[str, typing.Any]] = None,
+    ) -> memoryview:
+        """
+        Create many vertices at once.
+
+        All of the vertices are created in a single call, without creating a
+        Python object for any of them or their property values, which makes it
+        much faster than calling `create_vertex` for each of them.
+
+        Args:
+            count: Number of vertices to create.
+            labels: Names of the labels each of the vertices gets.
+            properties: Dictionary mapping property names to columns with a
+                value for each of the vertices. A column is a NumPy array, any
+                other object supporting the buffer protocol, a sequence of
+                numbers or a `PropertyColumn`, whose missing values aren't set.
+
+        Returns:
+            `memoryview` of 64-bit integer IDs of the created vertices.
+
+        Raises:
+            InvalidContextError: If context is invalid.
+            ValueError: If a column doesn't have `count` values or has
+                values of unsupported types.
+            ImmutableObjectError: If `graph` is immutable.
+            UnableToAllocateError: If unable to allocate a vertex.
+
+        Examples:
+            ```
+            ids = graph.create_vertices(3, ["Person"], {"age": numpy.array([21, 42, 63])})
+            ```
+        """
+        if not self.is_valid():
+            raise InvalidContextError()
+        return memoryview(self._graph.create_vertices(count, list(labels), _property_columns(properties)))
+
+    def create_edges(
+        self,
+        from_ids: typing.Any,
+        to_ids: typing.Any,
+        edge_type: typing.Union[EdgeType, str],
+        properties: typing.Optional[typing.Dict[str, typing.Any]] = None,
+    ) -> memoryview:
+        """
+        Create many edges of the same type at once.
+
+        All of the edges are created in a single call, without creating a
+        Python object for any of them or their property values, which makes it
+        much faster than calling `create_edge` for each of them.
+
+        Args:
+            from_ids: IDs of the vertices from where the edges are directed,
+                e.g. returned by `create_vertices`.
+            to_ids: IDs of the vertices to where the edges are directed.
+            edge_type: `EdgeType` or name of the type of the edges.
+            properties: Dictionary mapping property names to columns with a
+                value for each of the edges, as in `create_vertices`.
+
+        Returns:
+            `memoryview` of 64-bit integer IDs of the created edges.
+
+        Raises:
+            InvalidContextError: If context is invalid.
+            ValueError: If the arguments have different lengths or values of
+                unsupported types.
+            IndexError: If there is no vertex with one of the IDs.
+            ImmutableObjectError: If `graph` is immutable.
+            UnableToAllocateError: If unable to allocate an edge.
+            DeletedObjectError: If a vertex has been deleted.
+            SerializationError: If a vertex has been modified by another transaction.
+
+        Examples:
+            ```edge_ids = graph.create_edges(ids[:-1], ids[1:], "NEXT")```
+        """
+        if not self.is_valid():
+            raise InvalidContextError()
+        if isinstance(edge_type, EdgeType):
+            edge_type = edge_type.name
+        return memoryview(
+            self._graph.create_edges(
+                _column_buffer(from_ids), _column_buffer(to_ids), edge_type, _property_columns(properties)
+            )
+        )
+
     def delete_edge(self, edge: Edge) -> None:
         """
         Delete an edge.
@@ -1350,6 +1882,186 @@ class Graph:
             raise InvalidContextError()
         self._graph.delete_edge(edge._edge)
 
+    def adjacency(
+        self,
+        direction: str = "out",
+        edge_types: typing.Optional[typing.Iterable[str]] = None,
+        weight_property: typing.Optional[str] = None,
+        default_weight: float = 1.0,
+        start: int = 0,
+        stop: typing.Optional[int] = None,
+    ) -> Adjacency:
+        """
+        Take a snapshot of the adjacency of the graph in compressed sparse row
+        format.
+
+        The snapshot is built in a single pass over the graph, without creating
+        a Python object for any of the vertices or edges, which makes it the
+        fastest way to feed the whole graph to an algorithm. The GIL is
+        released during the pass, so other Python procedures keep running
+        meanwhile. Threads of the same procedure which use the graph wait for
+        the pass to end.
+
+        Only the rows of the vertices from `start` to `stop` are included, so
+        that the adjacency of a large graph can be taken in chunks. The
+        `vertex_ids` of such an `Adjacency` hold only the IDs of those
+        vertices, while its `indices` still hold the positions of the
+        neighbours among all of the vertices of the graph.
+
+        Args:
+            direction: `"out"` to list the outgoing edges of each vertex, `"in"`
+                to list its incoming edges, or `"both"` to list both.
+            edge_types: Names of the edge types to include. All edges are
+                included if it is `None`.
+            weight_property: Name of the edge property which holds the weights
+                of the edges. Weights aren't collected if it is `None`.
+            default_weight: Weight of the edges without the weight property.
+            start: Position of the first vertex whose edges are listed, in the
+                order of `vertex_ids`.
+            stop: Position after the last vertex whose edges are listed, or
+                `None` for all of the remaining vertices.
+
+        Returns:
+            `Adjacency` of the graph.
+
+        Raises:
+            InvalidContextError: If context is invalid.
+            ValueError: If `direction` is not valid, if `start` or `stop` is
+                negative, or if the weight property of an edge is not a number.
+
+        Examples:
+            ```
+            adjacency = context.graph.adjacency(weight_property="distance")
+            matrix = scipy.sparse.csr_array(
+                (adjacency.weights, adjacency.indices, adjacency.indptr),
+                shape=(len(adjacency), len(adjacency)))
+            ```
+        """
+        if not self.is_valid():
+            raise InvalidContextError()
+        if start < 0 or (stop is not None and stop < 0):
+            raise ValueError("Expected start and stop to be non-negative.")
+        if edge_types is not None:
+            edge_types = list(edge_types)
+        arrays = self._graph.adjacency(direction, edge_types, weight_property, float(default_weight), start, stop)
+        return Adjacency(*(memoryview(array) if array is not None else None for array in arrays))
+
+    def vertex_ids(self, label: typing.Optional[str] = None) -> memoryview:
+        """
+        Get the IDs of the vertices in the graph as a contiguous array.
+
+        The IDs are in the same order as the values returned by
+        `property_column` for the same label, so the two can be used together.
+
+        Args:
+            label: Name of the label the vertices must have. All of the
+                vertices are included if it is `None`.
+
+        Returns:
+            `memoryview` of 64-bit integer vertex IDs.
+
+        Raises:
+            InvalidContextError: If context is invalid.
+
+        Examples:
+            ```ids = numpy.asarray(context.graph.vertex_ids("Person"))```
+        """
+        if not self.is_valid():
+            raise InvalidContextError()
+        return memoryview(self._graph.vertex_ids(label))
+
+    def property_column(
+        self, label: typing.Optional[str], property: str, dtype: typing.Any = "float64"
+    ) -> PropertyColumn:
+        """
+        Get the values of a property of the vertices in the graph as a
+        contiguous typed array.
+
+        The column is filled in a single pass over the vertices, without
+        creating a Python object for any of them or their values, which makes
+        it much faster than reading the property of each `Vertex`. Like with
+        `adjacency`, the GIL isn't held during the pass.
+
+        Args:
+            label: Name of the label the vertices must have. All of the
+                vertices are included if it is `None`.
+            property: Name of the property.
+            dtype: Type of the values, one of `"int64"`, `"float64"` or
+                `"bool"`. The Python types `int`, `float` and `bool` as well as
+                the equivalent NumPy types are accepted too. Integer properties
+                are converted to floats for a `"float64"` column.
+
+        Returns:
+            `PropertyColumn` with a value for each of the vertices, in the same
+            order as `vertex_ids`.
+
+        Raises:
+            InvalidContextError: If context is invalid.
+            ValueError: If `dtype` is not supported, or if a property value
+                cannot be stored as `dtype`.
+
+        Examples:
+            ```
+            column = context.graph.property_column("Person", "age", "int64")
+            ages = numpy.asarray(column.values)
+            ```
+        """
+        if not self.is_valid():
+            raise InvalidContextError()
+        values, null_mask = self._graph.property_column(label, property, _column_dtype_name(dtype))
+        return PropertyColumn(memoryview(values), memoryview(null_mask))
+
+    def set_property_column(
+        self,
+        vertex_ids: typing.Any,
+        property: str,
+        values: typing.Any,
+        null_mask: typing.Any = None,
+    ) -> None:
+        """
+        Set a property of many vertices at once.
+
+        All of the values are read in a single call, without creating a Python
+        object for any of the vertices or values, which makes it much faster
+        than setting the property of each `Vertex`. This is the counterpart of
+        `property_column`, e.g. for writing back the results of an algorithm.
+
+        Args:
+            vertex_ids: IDs of the vertices, e.g. from `vertex_ids`.
+            property: Name of the property.
+            values: Values of the property, as a NumPy array, any other object
+                supporting the buffer protocol, a sequence of numbers or a
+                `PropertyColumn`. Integers, floats and booleans are supported.
+            null_mask: Optional mask which is true for the vertices whose
+                property should be removed instead. The mask of a
+                `PropertyColumn` is used if it is `None`.
+
+        Raises:
+            InvalidContextError: If context is invalid.
+            ValueError: If the arguments have different lengths or contain
+                unsupported types, or unsigned integers too large for int64.
+            IndexError: If there is no vertex with one of the IDs.
+            UnableToAllocateError: If unable to allocate memory for storing a property.
+            ImmutableObjectError: If the graph is immutable.
+            DeletedObjectError: If a vertex has been deleted.
+            SerializationError: If a vertex has been modified by another transaction.
+
+        Examples:
+            ```
+            ids = context.graph.vertex_ids()
+            context.graph.set_property_column(ids, "rank", numpy.asarray(ranks))
+            ```
+        """
+        if not self.is_valid():
+            raise InvalidContextError()
+        if isinstance(values, PropertyColumn):
+            if null_mask is None:
+                null_mask = values.null_mask
+            values = values.values
+        if null_mask is not None:
+            null_mask = _column_buffer(null_mask)
+        self._graph.set_property_column(_column_buffer(vertex_ids), property, _column_buffer(values), null_mask)
+
 
 class AbortError(Exception):
     """Signals that the procedure was asked to abort its execution."""
@@ -1357,6 +2069,12 @@ class AbortError(Exception):
     pass
 
 
+class OffloadUnavailableError(RuntimeError):
+    """Signals that there is no Python interpreter to run offloaded functions."""
+
+    pass
+
+
 class ProcCtx:
     """Context of a procedure being executed.
 
@@ -1402,6 +2120,129 @@ class ProcCtx:
             raise AbortError
 
 
+def offload(
+    fn: typing.Callable,
+    snapshot: typing.Any = None,
+    *args,
+    timeout: typing.Optional[float] = None,
+    context: typing.Optional[ProcCtx] = None,
+    **kwargs,
+) -> typing.Any:
+    """
+    Call `fn(snapshot, *args, **kwargs)` in a pool of worker processes and
+    return its result.
+
+    CPU-heavy steps of a procedure, such as running an algorithm in pure
+    Python, block every other session using Python procedures for as long as
+    they hold the GIL. Offloading them to a worker process avoids that, and
+    concurrent calls run in parallel.
+
+    The snapshot may be a buffer, such as a `memoryview` or a NumPy array, an
+    `Adjacency`, a `PropertyColumn`, or a tuple, list or dictionary of them.
+    The buffers are copied into shared memory once and the function receives
+    `memoryview` objects mapping it, while `Adjacency` and `PropertyColumn`
+    become objects with the same attributes. Other values, as well as `args`,
+    `kwargs` and the result, are pickled, so graph objects such as `Vertex`
+    cannot be passed at all.
+
+    The workers run a Python interpreter of the same version as Memgraph,
+    which must be on the `PATH`. They import the module of `fn` with
+    `mgp_mock` in place of `mgp`, once per worker, so `fn` must be defined at
+    the top level of a module and mustn't depend on the state of Memgraph.
+
+    Each worker runs one call at a time. A call which runs out of time, or
+    whose query is aborted, is stopped by killing its worker, which doesn't
+    affect the calls of other procedures.
+
+    Args:
+        fn: Function to call.
+        snapshot: Data to share with the function.
+        args: Other positional arguments of the function.
+        timeout: Number of seconds the call may take once a worker is free to
+            run it, or `None` to wait until the result is available.
+        context: Context of the procedure, which is checked for an aborted
+            query while waiting for the result.
+        kwargs: Other keyword arguments of the function.
+
+    Returns:
+        The result of `fn`.
+
+    Raises:
+        AbortError: If the query of `context` was aborted.
+        OffloadUnavailableError: If there is no suitable Python interpreter.
+        TimeoutError: If the result isn't available within `timeout`.
+        ValueError: If a buffer in the snapshot isn't contiguous.
+        Any exception raised by `fn`.
+
+    Examples:
+        ```
+        def rank(adjacency, iterations):
+            ...
+
+        @mgp.read_proc
+        def procedure(context: mgp.ProcCtx) -> mgp.Record(rank=float):
+            ranks = mgp.offload(rank, context.graph.adjacency(), 100, context=context)
+        ```
+    """
+    import _mgp_offload
+
+    abort_check = None if context is None else context.check_must_abort
+    try:
+        return _mgp_offload.offload(fn, snapshot, args, kwargs, timeout, abort_check)
+    except _mgp_offload.UnavailableError as error:
+        raise OffloadUnavailableError(str(error)) from None
+
+
+def offload_all(
+    calls: typing.Iterable[tuple],
+    snapshot: typing.Any = None,
+    timeout: typing.Optional[float] = None,
+    context: typing.Optional[ProcCtx] = None,
+) -> typing.List[typing.Any]:
+    """
+    Make several calls like `offload`, sharing a single snapshot, and return
+    the result of each of them.
+
+    The calls run in parallel, as many at once as there are workers. Each of
+    them gets its own time budget, which starts once a worker is free to run
+    it. A call which runs out of time is stopped like in `offload`, so a call
+    which fails or runs out of time doesn't affect the results of the others.
+
+    Args:
+        calls: Tuples of a function and its positional arguments other than
+            the snapshot. `functools.partial` can be used to pass keyword
+            arguments.
+        snapshot: Data to share with all of the functions, like in `offload`.
+        timeout: Number of seconds each call may take, or `None` to wait until
+            all of the results are available.
+        context: Context of the procedure, which is checked for an aborted
+            query while waiting for the results.
+
+    Returns:
+        List with the result of each call, in the order of `calls`, or the
+        exception it raised instead. The calls which ran out of time have a
+        `TimeoutError` in place of their result.
+
+    Raises:
+        AbortError: If the query of `context` was aborted.
+        OffloadUnavailableError: If there is no suitable Python interpreter.
+        ValueError: If a buffer in the snapshot isn't contiguous.
+
+    Examples:
+        ```
+        results = mgp.offload_all(
+            [(rank, 100), (components,)], context.graph.adjacency(), timeout=60, context=context)
+        ```
+    """
+    import _mgp_offload
+
+    abort_check = None if context is None else context.check_must_abort
+    try:
+        return _mgp_offload.offload_all([tuple(call) for call in calls], snapshot, timeout, abort_check)
+    except _mgp_offload.UnavailableError as error:
+        raise OffloadUnavailableError(str(error)) from None
+
+
 # Additional typing support
 
 Number = typing.Union[int, float]
@@ -1627,7 +2468,7 @@ class Deprecated:
         self.field_type = type_
 
 
-def raise_if_does_not_meet_requirements(func: typing.Callable[..., Record]):
+def raise_if_does_not_meet_requirements(func: typing.Callable[..., Record], allow_generators: bool = False):
     if not callable(func):
         raise TypeError("Expected a callable object, got an instance of '{}'".format(type(func)))
     if inspect.iscoroutinefunction(func):
@@ -1635,30 +2476,258 @@ def raise_if_does_not_meet_requirements(func: typing.Callable[..., Record]):
     if sys.version_info >= (3, 6):
         if inspect.isasyncgenfunction(func):
             raise TypeError("Callable must not be 'async def' function")
-    if inspect.isgeneratorfunction(func):
+    if not allow_generators and inspect.isgeneratorfunction(func):
         raise NotImplementedError("Generator functions are not supported")
 
 
-def _register_proc(func: typing.Callable[..., Record], is_write: bool):
-    raise_if_does_not_meet_requirements(func)
-    register_func = _mgp.Module.add_write_procedure if is_write else _mgp.Module.add_read_procedure
+class _Uncacheable(Exception):
+    """Raised for arguments and results which can't be cached."""
+
+
+class _CachedVertex:
+    """A vertex in a cached result, looked up by its ID when the result is reused."""
+
+    __slots__ = ("id",)
+
+    def __init__(self, vertex_id: VertexId):
+        self.id = vertex_id
+
+
+def _cache_key(value: typing.Any) -> typing.Hashable:
+    if isinstance(value, (tuple, list, LazyList)):
+        return tuple(_cache_key(item) for item in value)
+    if isinstance(value, (dict, LazyMap)):
+        return (dict, tuple(sorted(((key, _cache_key(item)) for key, item in value.items()), key=lambda x: x[0])))
+    if isinstance(value, (Vertex, Edge)):
+        return (type(value), value.id)
+    if isinstance(value, Path):
+        return (Path, tuple(vertex.id for vertex in value.vertices), tuple(edge.id for edge in value.edges))
+    try:
+        hash(value)
+    except TypeError:
+        raise _Uncacheable()
+    # The type tells apart values such as 1, 1.0 and True, which are equal.
+    return (type(value), value)
+
+
+def _cache_value(value: typing.Any) -> typing.Any:
+    if isinstance(value, Vertex):
+        return _CachedVertex(value.id)
+    if isinstance(value, (Edge, Path)):
+        # Unlike vertices, edges can't be looked up by their ID.
+        raise _Uncacheable()
+    if isinstance(value, (tuple, list)):
+        return type(value)(_cache_value(item) for item in value)
+    if isinstance(value, dict):
+        return {key: _cache_value(item) for key, item in value.items()}
+    return value
+
+
+def _cached_value(value: typing.Any, graph: _mgp.Graph) -> typing.Any:
+    if isinstance(value, _CachedVertex):
+        return Vertex(graph.get_vertex_by_id(value.id))
+    if isinstance(value, (tuple, list)):
+        return type(value)(_cached_value(item, graph) for item in value)
+    if isinstance(value, dict):
+        return {key: _cached_value(item, graph) for key, item in value.items()}
+    return value
+
+
+def _cache_record(record: typing.Any) -> typing.Any:
+    if isinstance(record, Record):
+        return Record(**_cache_value(record.fields))
+    if isinstance(record, tuple):
+        return _cache_value(record)
+    # Let the procedure fail as it would without the cache.
+    raise _Uncacheable()
+
+
+def _cached_record(record: typing.Any, graph: _mgp.Graph) -> typing.Any:
+    if isinstance(record, Record):
+        return Record(**_cached_value(record.fields, graph))
+    return _cached_value(record, graph)
+
+
+def _cached_size(value: typing.Any) -> int:
+    size = sys.getsizeof(value)
+    if isinstance(value, Record):
+        size += _cached_size(value.fields)
+    elif isinstance(value, (tuple, list)):
+        size += sum(_cached_size(item) for item in value)
+    elif isinstance(value, dict):
+        size += sum(sys.getsizeof(key) + _cached_size(item) for key, item in value.items())
+    return size
+
+
+class _ResultCache:
+    """
+    Least recently used results of a read procedure, keyed by the arguments
+    and the version of the graph they were computed from. The memory held by
+    the results is charged to Memgraph's memory tracker.
+    """
+
+    __slots__ = ("max_entries", "max_bytes", "_entries", "_bytes", "_lock")
+
+    def __init__(self, max_entries: int, max_bytes: int):
+        if max_entries < 1:
+            raise ValueError("Expected 'max_entries' to be positive, got {}".format(max_entries))
+        if max_bytes < 1:
+            raise ValueError("Expected 'max_bytes' to be positive, got {}".format(max_bytes))
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def __del__(self):
+        if self._bytes:
+            _mgp.untrack_memory(self._bytes)
+
+    def get(self, key: typing.Hashable) -> typing.Optional[tuple]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: typing.Hashable, result: typing.Any) -> None:
+        size = _cached_size(result)
+        if size > self.max_bytes or not _mgp.track_memory(size):
+            return
+        with self._lock:
+            self._evict(self._entries.pop(key, None))
+            self._entries[key] = (result, size)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._evict(self._entries.popitem(last=False)[1])
+
+    def _evict(self, entry: typing.Optional[tuple]) -> None:
+        if entry is not None:
+            self._bytes -= entry[1]
+            _mgp.untrack_memory(entry[1])
+
+
+def _cache_proc(wrapper: typing.Callable, cache: _ResultCache, is_generator: bool) -> typing.Callable:
+    def cached_generator(records, key):
+        cached = []
+        for record in records:
+            if cached is not None:
+                try:
+                    cached.append(_cache_record(record))
+                except _Uncacheable:
+                    cached = None
+            yield record
+        # Procedures whose records weren't all pulled, e.g. due to LIMIT, are
+        # closed before getting here.
+        if cached is not None:
+            cache.put(key, cached)
+
+    @wraps(wrapper)
+    def cached_wrapper(graph, args):
+        version = graph.version()
+        if version is None:
+            return wrapper(graph, args)
+        try:
+            key = (version, _cache_key(args))
+        except _Uncacheable:
+            return wrapper(graph, args)
+        entry = cache.get(key)
+        if entry is not None:
+            result = entry[0]
+            if is_generator:
+                return (_cached_record(record, graph) for record in result)
+            if isinstance(result, list):
+                return [_cached_record(record, graph) for record in result]
+            return None if result is None else _cached_record(result, graph)
+        result = wrapper(graph, args)
+        if is_generator:
+            return cached_generator(result, key)
+        try:
+            if result is None:
+                cached = None
+            elif isinstance(result, (tuple, list)):
+                cached = [_cache_record(record) for record in result]
+            else:
+                cached = _cache_record(result)
+        except _Uncacheable:
+            return result
+        cache.put(key, cached)
+        return result
+
+    return cached_wrapper
+
+
+def _isolated_proc(func: typing.Callable[..., Record]) -> typing.Callable:
+    @wraps(func)
+    def isolated_wrapper(graph, args):
+        import _mgp_offload
+
+        def abort_check():
+            if graph.must_abort():
+                raise AbortError
+
+        result = _mgp_offload.offload(_mgp_offload.call_isolated, None, (func, args), {}, None, abort_check)
+        # The worker returns the fields of its records, because it uses the
+        # records of `mgp_mock`.
+        if isinstance(result, dict):
+            return Record(**result)
+        if isinstance(result, list):
+            return [Record(**record) if isinstance(record, dict) else record for record in result]
+        return result
+
+    return isolated_wrapper
+
+
+def _register_proc(
+    func: typing.Callable[..., Record],
+    is_write: bool,
+    cache: typing.Optional[_ResultCache] = None,
+    lazy_args: bool = False,
+    isolated: bool = False,
+):
+    raise_if_does_not_meet_requirements(func, allow_generators=True)
+    is_generator = inspect.isgeneratorfunction(func)
+    if is_generator and lazy_args:
+        # The arguments of a generator procedure don't outlive its first batch.
+        raise ValueError("Generator procedure '{}' can't have lazy arguments".format(func.__name__))
+    if isolated:
+        if lazy_args:
+            raise ValueError("Isolated procedure '{}' can't have lazy arguments".format(func.__name__))
+        # The worker collects all of the records a generator yields.
+        is_generator = False
+    if is_generator:
+        # Records of generator procedures are pulled lazily, as the query asks
+        # for more rows.
+        register_func = (
+            _mgp.Module.add_generator_write_procedure if is_write else _mgp.Module.add_generator_read_procedure
+        )
+    else:
+        register_func = _mgp.Module.add_write_procedure if is_write else _mgp.Module.add_read_procedure
     sig = inspect.signature(func)
     params = tuple(sig.parameters.values())
     if params and params[0].annotation is ProcCtx:
+        if isolated:
+            raise ValueError("Isolated procedure '{}' can't access the graph".format(func.__name__))
 
         @wraps(func)
         def wrapper(graph, args):
             return func(ProcCtx(graph), *args)
 
         params = params[1:]
-        mgp_proc = register_func(_mgp._MODULE, wrapper)
+    elif isolated:
+        wrapper = _isolated_proc(func)
     else:
 
         @wraps(func)
         def wrapper(graph, args):
             return func(*args)
 
+    if cache is not None:
+        wrapper = _cache_proc(wrapper, cache, is_generator)
+    if is_generator:
         mgp_proc = register_func(_mgp._MODULE, wrapper)
+    else:
+        mgp_proc = register_func(_mgp._MODULE, wrapper, lazy_args)
     for param in params:
         name = param.name
         type_ = param.annotation
@@ -1682,7 +2751,15 @@ def _register_proc(func: typing.Callable[..., Record], is_write: bool):
     return func
 
 
-def read_proc(func: typing.Callable[..., Record]):
+def read_proc(
+    func: typing.Optional[typing.Callable[..., Record]] = None,
+    *,
+    cache: bool = False,
+    max_entries: int = 32,
+    max_bytes: int = 64 * 1024 * 1024,
+    lazy_args: bool = False,
+    isolated: bool = False,
+):
     """
     Register `func` as a read-only procedure of the current module.
 
@@ -1693,8 +2770,13 @@ def read_proc(func: typing.Callable[..., Record]):
     annotated with types. The return type must be `Record(field_name=type, ...)`
     and the procedure must produce either a complete Record or None. To mark a
     field as deprecated, use `Record(field_name=Deprecated(type), ...)`.
-    Multiple records can be produced by returning an iterable of them.
-    Registering generator functions is currently not supported.
+    Multiple records can be produced by returning an iterable of them or by
+    yielding them from a generator function. Records of a generator function
+    are pulled lazily, as the query needs them, so the whole result never has
+    to be held in memory at once. Instead of a Record, each of the produced
+    records may also be a tuple with the values of the fields in the order
+    they are declared in the return type, e.g. `return [(result, args)]`,
+    which is cheaper for procedures producing many rows.
 
     Example usage.
 
@@ -1720,11 +2802,47 @@ def read_proc(func: typing.Callable[..., Record]):
       CALL example.procedure(1, 2) YIELD args, result;
       CALL example.procedure(1) YIELD args, result;
     Naturally, you may pass in different arguments or yield less fields.
+
+    Procedures which are called repeatedly on an unchanged graph, e.g. to
+    refresh a dashboard, can cache their results with
+    `@mgp.read_proc(cache=True)`. Records produced by a call are then reused
+    by later calls with equal arguments, as long as nothing was committed to
+    the database in between. Only deterministic procedures should be cached.
+    At most `max_entries` results of up to `max_bytes` bytes in total are
+    kept, evicting the least recently used ones first, and their memory counts
+    toward Memgraph's memory limit. Calls aren't cached if the transaction has
+    made changes of its own, if it doesn't run with snapshot isolation in the
+    in-memory transactional storage mode, if the procedure runs on a projected
+    graph, or if fine-grained access control is in use. Neither are results
+    containing edges or paths, nor generator procedures whose records weren't
+    all pulled.
+
+    Procedures taking huge lists or maps, e.g. `collect(n)`, can be
+    registered with `@mgp.read_proc(lazy_args=True)`. Their list and map
+    arguments are then passed as `mgp.LazyList` and `mgp.LazyMap`, which
+    convert the elements only when they are accessed. `LazyList.vertex_ids`
+    and `LazyList.edge_ids` return the IDs of a list of vertices or edges
+    without converting them at all. Like the other objects of the graph, the
+    lazy arguments are only valid during the procedure call. Generator
+    procedures can't have lazy arguments.
+
+    CPU-heavy procedures which don't need the graph can be registered with
+    `@mgp.read_proc(isolated=True)`. Each call then runs in a worker process,
+    like the functions passed to `mgp.offload`, so it doesn't hold the GIL
+    and calls from different sessions run in parallel. The procedure can't
+    take `ProcCtx` or have lazy arguments, its arguments and records are
+    pickled, so they can't contain graph objects, and the records a generator
+    yields are collected all at once. The call is stopped if the query is
+    aborted.
     """
-    return _register_proc(func, False)
 
+    def register(func):
+        return _register_proc(func, False, _ResultCache(max_entries, max_bytes) if cache else None, lazy_args, isolated)
 
-def write_proc(func: typing.Callable[..., Record]):
+    return register if func is None else register(func)
+
+
+def write_proc(func: typing.Optional[typing.Callable[..., Record]] = None, *, lazy_args: bool = False):
     """
     Register `func` as a writeable procedure of the current module.
 
@@ -1736,8 +2854,11 @@ def write_proc(func: typing.Callable[..., Record]):
     `Record(field_name=type, ...)` and the procedure must produce either a
     complete Record or None. To mark a field as deprecated, use
     `Record(field_name=Deprecated(type), ...)`. Multiple records can be produced
-    by returning an iterable of them. Registering generator functions is
-    currently not supported.
+    by returning an iterable of them or by yielding them from a generator
+    function. Records of a generator function are pulled lazily, as the query
+    needs them. Instead of a Record, each of the produced records may also be
+    a tuple with the values of the fields in the order they are declared in
+    the return type.
 
     Example usage.
 
@@ -1770,8 +2891,15 @@ def write_proc(func: typing.Callable[..., Record]):
       CALL example.procedure("property value", "another one") YIELD result;
       CALL example.procedure("single argument") YIELD result;
     Naturally, you may pass in different arguments.
+
+    With `@mgp.write_proc(lazy_args=True)`, list and map arguments are passed
+    as `mgp.LazyList` and `mgp.LazyMap`, like with `read_proc`.
     """
-    return _register_proc(func, True)
+
+    def register(func):
+        return _register_proc(func, True, lazy_args=lazy_args)
+
+    return register if func is None else register(func)
 
 
 def _register_batch_proc(
@@ -1914,6 +3042,24 @@ class Message:
             raise InvalidMessageError()
         return self._message.payload()
 
+    def payload_view(self) -> memoryview:
+        """
+        Supported stream sources:
+          - Kafka
+          - Pulsar
+
+        Return a read-only memoryview of the payload, which refers to the
+        received data without copying it. The view is released once the
+        transformation returns. If a buffer derived from the view, e.g. a
+        NumPy array, is still in use by then, the transformation fails, so use
+        `bytes(view)` to keep a copy.
+
+        Raise InvalidArgumentError if the message is from an unsupported stream source.
+        """
+        if not self.is_valid():
+            raise InvalidMessageError()
+        return self._message.payload_view()
+
     def topic_name(self) -> str:
         """
         Supported stream sources:
@@ -1937,6 +3083,20 @@ class Message:
             raise InvalidMessageError()
         return self._message.key()
 
+    def key_view(self) -> memoryview:
+        """
+        Supported stream sources:
+          - Kafka
+
+        Return a read-only memoryview of the key, with the same lifetime as
+        the views returned by `payload_view`.
+
+        Raise InvalidArgumentError if the message is from an unsupported stream source.
+        """
+        if not self.is_valid():
+            raise InvalidMessageError()
+        return self._message.key_view()
+
     def timestamp(self) -> int:
         """
         Supported stream sources:
@@ -1998,12 +3158,28 @@ class Messages:
             raise InvalidMessagesError()
         return self._messages.total_messages()
 
+    def payload_views(self) -> typing.List[memoryview]:
+        """
+        Return read-only memoryviews of the payloads of all the messages, in
+        the order of `message_at`. See `Message.payload_view`.
+
+        Raise InvalidMessagesError if context is invalid.
+        """
+        if not self.is_valid():
+            raise InvalidMessagesError()
+        return self._messages.payload_views()
+
 
 class TransCtx:
     """Context of a transformation being executed.
 
     Access to a TransCtx is only valid during a single execution of a transformation.
     You should not globally store a TransCtx instance.
+
+    With --stream-pipelined-consumption, a Kafka stream transforms a batch
+    while the queries of the previous batch are executed, so the graph doesn't
+    contain the changes made by those queries. CHECK STREAM always transforms
+    the batches sequentially.
     """
 
     __slots__ = "_graph"
@@ -2067,7 +3243,7 @@ class FuncCtx:
         return self._graph.is_valid()
 
 
-def function(func: typing.Callable):
+def function(func: typing.Optional[typing.Callable] = None, *, vectorized: bool = False):
     """
     Register `func` as a user-defined function in the current module.
 
@@ -2106,38 +3282,59 @@ def function(func: typing.Callable):
       RETURN example.func_example("first argument", "second_argument");
       RETURN example.func_example("first argument");
     Naturally, you may pass in different arguments.
-    """
-    raise_if_does_not_meet_requirements(func)
-    register_func = _mgp.Module.add_function
-    sig = inspect.signature(func)
-    params = tuple(sig.parameters.values())
-    if params and params[0].annotation is FuncCtx:
 
-        @wraps(func)
-        def wrapper(graph, args):
-            return func(FuncCtx(graph), *args)
+    Functions registered with `@mgp.function(vectorized=True)` are computed
+    for a batch of rows at once. Each argument is then a list of its values in
+    those rows, and the function has to return an iterable with a result for
+    each of the rows, in the same order. The arguments are still annotated
+    with the types of the single values. Calls which make up a whole
+    expression of `RETURN` or `WITH` are batched, while the other calls get a
+    batch of a single row.
 
-        params = params[1:]
-        mgp_func = register_func(_mgp._MODULE, wrapper)
-    else:
+    ```
+    import mgp
+    @mgp.function(vectorized=True)
+    def score(xs: int, weight: float = 1.0):
+        return [x * w for x, w in zip(xs, weight)]
+    ```
+    """
 
-        @wraps(func)
-        def wrapper(graph, args):
-            return func(*args)
+    def register(func):
+        raise_if_does_not_meet_requirements(func)
+        register_func = _mgp.Module.add_function
+        sig = inspect.signature(func)
+        params = tuple(sig.parameters.values())
+        if params and params[0].annotation is FuncCtx:
 
-        mgp_func = register_func(_mgp._MODULE, wrapper)
+            @wraps(func)
+            def wrapper(graph, args):
+                result = func(FuncCtx(graph), *args)
+                return list(result) if vectorized else result
 
-    for param in params:
-        name = param.name
-        type_ = param.annotation
-        if type_ is param.empty:
-            type_ = object
-        cypher_type = _typing_to_cypher_type(type_)
-        if param.default is param.empty:
-            mgp_func.add_arg(name, cypher_type)
+            params = params[1:]
+            mgp_func = register_func(_mgp._MODULE, wrapper, vectorized)
         else:
-            mgp_func.add_opt_arg(name, cypher_type, param.default)
-    return func
+
+            @wraps(func)
+            def wrapper(graph, args):
+                result = func(*args)
+                return list(result) if vectorized else result
+
+            mgp_func = register_func(_mgp._MODULE, wrapper, vectorized)
+
+        for param in params:
+            name = param.name
+            type_ = param.annotation
+            if type_ is param.empty:
+                type_ = object
+            cypher_type = _typing_to_cypher_type(type_)
+            if param.default is param.empty:
+                mgp_func.add_arg(name, cypher_type)
+            else:
+                mgp_func.add_opt_arg(name, cypher_type, param.default)
+        return func
+
+    return register if func is None else register(func)
 
 
 def _wrap_exceptions():
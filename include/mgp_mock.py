@@ -16,6 +16,7 @@ can develop procedures without setting Memgraph up for each run, and run them fr
 when they're implemented in full.
 """
 
+import array
 import datetime
 import inspect
 import sys
@@ -1104,6 +1105,97 @@ class Record:
         return str(self.fields)
 
 
+class Adjacency:
+    """
+    Snapshot of a graph’s adjacency in compressed sparse row (CSR) format.
+
+    Vertices are numbered by their position in `vertex_ids`, which holds their IDs. The neighbours of the vertex at
+    position `i` are at positions `indices[indptr[i]:indptr[i + 1]]`, the IDs of the edges leading to them are
+    `edge_ids[indptr[i]:indptr[i + 1]]`, and their weights, if requested, are at the same positions in `weights`.
+    All arrays are read-only `memoryview` objects that NumPy and SciPy can wrap without copying.
+    """
+
+    __slots__ = ("vertex_ids", "indptr", "indices", "edge_ids", "weights")
+
+    def __init__(
+        self,
+        vertex_ids: memoryview,
+        indptr: memoryview,
+        indices: memoryview,
+        edge_ids: memoryview,
+        weights: typing.Optional[memoryview] = None,
+    ):
+        self.vertex_ids = vertex_ids
+        self.indptr = indptr
+        self.indices = indices
+        self.edge_ids = edge_ids
+        self.weights = weights
+
+    def __len__(self) -> int:
+        """Return the number of vertices."""
+        return len(self.vertex_ids)
+
+    @property
+    def num_edges(self) -> int:
+        """Number of edges in the snapshot."""
+        return len(self.indices)
+
+
+class PropertyColumn:
+    """
+    Values of a vertex property as a contiguous typed array.
+
+    `values` holds the property of each vertex and `null_mask` is true for the vertices that don’t have the property,
+    whose entries in `values` are zero. Both are `memoryview` objects that NumPy can wrap without copying.
+    """
+
+    __slots__ = ("values", "null_mask")
+
+    def __init__(self, values: memoryview, null_mask: memoryview):
+        self.values = values
+        self.null_mask = null_mask
+
+    def __len__(self) -> int:
+        """Return the number of vertices."""
+        return len(self.values)
+
+
+_COLUMN_DTYPES = {int: "int64", float: "float64", bool: "bool"}
+
+
+def _column_dtype_name(dtype: typing.Any) -> str:
+    if dtype in _COLUMN_DTYPES:
+        return _COLUMN_DTYPES[dtype]
+    # NumPy dtypes have a `name` and NumPy scalar types a `__name__`.
+    name = getattr(dtype, "name", None) or getattr(dtype, "__name__", None) or dtype
+    return name if isinstance(name, str) else str(name)
+
+
+def _column_buffer(values: typing.Any) -> typing.Any:
+    try:
+        memoryview(values)
+        return values
+    except TypeError:
+        pass
+    # Sequences which don't support the buffer protocol are copied into one.
+    values = list(values)
+    if all(isinstance(value, bool) for value in values):
+        return memoryview(array.array("B", values)).cast("?")
+    if all(isinstance(value, int) for value in values):
+        return array.array("q", values)
+    return array.array("d", values)
+
+
+def _property_columns(properties: typing.Optional[typing.Dict[str, typing.Any]]) -> list:
+    columns = []
+    for name, values in (properties or {}).items():
+        null_mask = None
+        if isinstance(values, PropertyColumn):
+            values, null_mask = values.values, values.null_mask
+        columns.append((name, _column_buffer(values), _column_buffer(null_mask) if null_mask is not None else None))
+    return columns
+
+
 class Graph:
     """The graph that stands in for Memgraph’s graph."""
 
@@ -1184,6 +1276,149 @@ class Graph:
 
         return Vertices(self._graph)
 
+    def vertex_count(self, label: typing.Optional[str] = None) -> int:
+        """
+        Get the count of the graph vertices, or of the ones with the given label.
+
+        Args:
+            label: The label’s name, or `None` to count all of the vertices.
+
+        Returns:
+            The count of the vertices.
+
+        Raises:
+            InvalidContextError: If context is invalid.
+
+        Examples:
+            ```graph.vertex_count("Person")```
+        """
+        if not self.is_valid():
+            raise InvalidContextError()
+
+        if label is None:
+            return self._graph.nx.number_of_nodes()
+        return sum(1 for _ in self.vertices_by_label(label))
+
+    def edge_count(self) -> int:
+        """
+        Get the count of the graph edges.
+
+        Returns:
+            The count of the edges.
+
+        Raises:
+            InvalidContextError: If context is invalid.
+
+        Examples:
+            ```graph.edge_count()```
+        """
+        if not self.is_valid():
+            raise InvalidContextError()
+
+        return self._graph.nx.number_of_edges()
+
+    def vertices_by_label(self, label: str) -> typing.Iterator[Vertex]:
+        """
+        Get the graph vertices with the given label.
+
+        Args:
+            label: The label’s name.
+
+        Returns:
+            An iterator over the `Vertex` objects with the label.
+
+        Raises:
+            InvalidContextError: If context is invalid.
+
+        Examples:
+            ```for vertex in graph.vertices_by_label("Person"):```
+        """
+        if not self.is_valid():
+            raise InvalidContextError()
+
+        return (vertex for vertex in self.vertices if any(vertex_label.name == label for vertex_label in vertex.labels))
+
+    def vertices_by_property(self, label: str, property: str, value: typing.Any) -> typing.Iterator[Vertex]:
+        """
+        Get the graph vertices with the given label whose property equals the given value.
+
+        Args:
+            label: The label’s name.
+            property: The property’s name.
+            value: The property’s value. It mustn’t be `None`.
+
+        Returns:
+            An iterator over the matching `Vertex` objects.
+
+        Raises:
+            InvalidContextError: If context is invalid.
+            ValueError: If `value` is `None`.
+
+        Examples:
+            ```for vertex in graph.vertices_by_property("Person", "name", "Alice"):```
+        """
+        if value is None:
+            raise ValueError("Vertices cannot be looked up by a None property value")
+
+        return self.vertices_by_property_range(label, property, value, value)
+
+    def vertices_by_property_range(
+        self,
+        label: str,
+        property: str,
+        lower_bound: typing.Any = None,
+        upper_bound: typing.Any = None,
+        lower_bound_inclusive: bool = True,
+        upper_bound_inclusive: bool = True,
+    ) -> typing.Iterator[Vertex]:
+        """
+        Get the graph vertices with the given label whose property is within the given bounds.
+
+        A bound that is `None` leaves the range unbounded on that side. Only property values of types comparable to
+        the bounds are within them, with integers and floats being comparable to each other.
+
+        Args:
+            label: The label’s name.
+            property: The property’s name.
+            lower_bound: The property’s lowest value.
+            upper_bound: The property’s highest value.
+            lower_bound_inclusive: Whether the property may equal `lower_bound`.
+            upper_bound_inclusive: Whether the property may equal `upper_bound`.
+
+        Returns:
+            An iterator over the matching `Vertex` objects.
+
+        Raises:
+            InvalidContextError: If context is invalid.
+
+        Examples:
+            ```for vertex in graph.vertices_by_property_range("Person", "age", 18, 65):```
+        """
+
+        def comparable(value, bound) -> bool:
+            if isinstance(value, bool) or isinstance(bound, bool):
+                return isinstance(value, bool) and isinstance(bound, bool)
+            if isinstance(value, (int, float)) and isinstance(bound, (int, float)):
+                return True
+            return type(value) is type(bound)
+
+        def is_within_bounds(value) -> bool:
+            if value is None:
+                return False
+            if lower_bound is not None:
+                if not comparable(value, lower_bound) or value < lower_bound:
+                    return False
+                if not lower_bound_inclusive and value == lower_bound:
+                    return False
+            if upper_bound is not None:
+                if not comparable(value, upper_bound) or value > upper_bound:
+                    return False
+                if not upper_bound_inclusive and value == upper_bound:
+                    return False
+            return True
+
+        return (vertex for vertex in self.vertices_by_label(label) if is_within_bounds(vertex.properties.get(property)))
+
     def is_mutable(self) -> bool:
         """
         Check if the graph is mutable, i.e. if it can be modified.
@@ -1303,6 +1538,84 @@ class Graph:
         new_edge = self._graph.create_edge(from_vertex._vertex, to_vertex._vertex, edge_type.name)
         return Edge(new_edge)
 
+    def create_vertices(
+        self,
+        count: int,
+        labels: typing.Iterable[str] = (),
+        properties: typing.Optional[typing.Dict[str, typing.Any]] = None,
+    ) -> memoryview:
+        """
+        Create many vertices at once.
+
+        Args:
+            count: The number of vertices to create.
+            labels: The names of the labels each vertex gets.
+            properties: A dictionary mapping property names to columns with a value for each vertex. A column is a
+                NumPy array, any other object supporting the buffer protocol, a sequence of numbers or a
+                `PropertyColumn`, whose missing values aren’t set.
+
+        Returns:
+            A `memoryview` of the created vertices’ 64-bit integer IDs.
+
+        Raises:
+            InvalidContextError: If the graph is not in a valid context.
+            ValueError: If a column doesn’t have `count` values.
+            ImmutableObjectError: If the graph is immutable.
+
+        Examples:
+            ```ids = graph.create_vertices(3, ["Person"], {"age": [21, 42, 63]})```
+        """
+        if not self.is_valid():
+            raise InvalidContextError()
+
+        if self._graph.is_immutable():
+            raise ImmutableObjectError("Cannot modify immutable object.")
+
+        return memoryview(self._graph.create_vertices(count, list(labels), _property_columns(properties)))
+
+    def create_edges(
+        self,
+        from_ids: typing.Any,
+        to_ids: typing.Any,
+        edge_type: typing.Union[EdgeType, str],
+        properties: typing.Optional[typing.Dict[str, typing.Any]] = None,
+    ) -> memoryview:
+        """
+        Create many edges of the same type at once.
+
+        Args:
+            from_ids: The source (tail) vertices’ IDs.
+            to_ids: The destination (head) vertices’ IDs.
+            edge_type: The `EdgeType` or name of the edges’ type.
+            properties: A dictionary mapping property names to columns with a value for each edge, as in
+                `create_vertices`.
+
+        Returns:
+            A `memoryview` of the created edges’ 64-bit integer IDs.
+
+        Raises:
+            InvalidContextError: If the graph is not in a valid context.
+            ValueError: If the arguments have different lengths.
+            IndexError: If there is no vertex with one of the IDs.
+            ImmutableObjectError: If the graph is immutable.
+
+        Examples:
+            ```edge_ids = graph.create_edges(ids[:-1], ids[1:], "NEXT")```
+        """
+        if not self.is_valid():
+            raise InvalidContextError()
+
+        if self._graph.is_immutable():
+            raise ImmutableObjectError("Cannot modify immutable object.")
+
+        if isinstance(edge_type, EdgeType):
+            edge_type = edge_type.name
+        return memoryview(
+            self._graph.create_edges(
+                _column_buffer(from_ids), _column_buffer(to_ids), edge_type, _property_columns(properties)
+            )
+        )
+
     def delete_edge(self, edge: Edge) -> None:
         """
         Delete the given edge.
@@ -1325,6 +1638,142 @@ class Graph:
 
         self._graph.delete_edge(edge.from_vertex.id, edge.to_vertex.id, edge.id)
 
+    def adjacency(
+        self,
+        direction: str = "out",
+        edge_types: typing.Optional[typing.Iterable[str]] = None,
+        weight_property: typing.Optional[str] = None,
+        default_weight: float = 1.0,
+        start: int = 0,
+        stop: typing.Optional[int] = None,
+    ) -> Adjacency:
+        """
+        Take a snapshot of the graph’s adjacency in compressed sparse row format.
+
+        Only the rows of the vertices from `start` to `stop` are included. Their `vertex_ids` hold only the IDs of
+        those vertices, while `indices` hold the positions of the neighbours among all of the graph’s vertices.
+
+        Args:
+            direction: `"out"` to list the outgoing edges of each vertex, `"in"` to list its incoming edges, or
+                `"both"` to list both.
+            edge_types: Names of the edge types to include. All edges are included if it is `None`.
+            weight_property: Name of the edge property holding the edge weights. Weights aren’t collected if it
+                is `None`.
+            default_weight: Weight of the edges without the weight property.
+            start: The position of the first vertex whose edges are listed, in the order of `vertex_ids`.
+            stop: The position after the last vertex whose edges are listed, or `None` for the remaining vertices.
+
+        Returns:
+            The graph’s `Adjacency`.
+
+        Raises:
+            InvalidContextError: If the graph is not in a valid context.
+            ValueError: If `direction` is not valid, if `start` or `stop` is negative, or if the weight property of an
+                edge is not a number.
+
+        Examples:
+            ```adjacency = graph.adjacency(weight_property="distance")```
+        """
+        if not self.is_valid():
+            raise InvalidContextError()
+
+        if start < 0 or (stop is not None and stop < 0):
+            raise ValueError("Expected start and stop to be non-negative.")
+        if edge_types is not None:
+            edge_types = list(edge_types)
+        arrays = self._graph.adjacency(direction, edge_types, weight_property, float(default_weight), start, stop)
+        # Like in the Python API, the snapshot is read-only.
+        return Adjacency(*(memoryview(array).toreadonly() if array is not None else None for array in arrays))
+
+    def vertex_ids(self, label: typing.Optional[str] = None) -> memoryview:
+        """
+        Get the graph’s vertex IDs as a contiguous array, in the same order as the values from `property_column`.
+
+        Args:
+            label: The name of the label the vertices must have. All vertices are included if it is `None`.
+
+        Returns:
+            A `memoryview` of 64-bit integer vertex IDs.
+
+        Raises:
+            InvalidContextError: If the graph is not in a valid context.
+
+        Examples:
+            ```ids = graph.vertex_ids("Person")```
+        """
+        if not self.is_valid():
+            raise InvalidContextError()
+
+        return memoryview(self._graph.vertex_ids_with_label(label)).toreadonly()
+
+    def property_column(
+        self, label: typing.Optional[str], property: str, dtype: typing.Any = "float64"
+    ) -> PropertyColumn:
+        """
+        Get the values of a vertex property as a contiguous typed array.
+
+        Args:
+            label: The name of the label the vertices must have. All vertices are included if it is `None`.
+            property: The property’s name.
+            dtype: The values’ type: `"int64"`, `"float64"` or `"bool"` (or the equivalent Python or NumPy type).
+
+        Returns:
+            A `PropertyColumn` with a value for each vertex, in the same order as `vertex_ids`.
+
+        Raises:
+            InvalidContextError: If the graph is not in a valid context.
+            ValueError: If `dtype` is not supported, or if a property value cannot be stored as `dtype`.
+
+        Examples:
+            ```column = graph.property_column("Person", "age", "int64")```
+        """
+        if not self.is_valid():
+            raise InvalidContextError()
+
+        values, null_mask = self._graph.property_column(label, property, _column_dtype_name(dtype))
+        # Like in the Python API, booleans are exposed in the `?` format.
+        values = memoryview(values) if values.typecode != "B" else memoryview(values).cast("?")
+        return PropertyColumn(values.toreadonly(), memoryview(null_mask).cast("?").toreadonly())
+
+    def set_property_column(
+        self,
+        vertex_ids: typing.Any,
+        property: str,
+        values: typing.Any,
+        null_mask: typing.Any = None,
+    ) -> None:
+        """
+        Set a property of many vertices at once.
+
+        Args:
+            vertex_ids: The vertices’ IDs, e.g. from `vertex_ids`.
+            property: The property’s name.
+            values: The property’s values as a NumPy array, any other object supporting the buffer protocol, a
+                sequence of numbers or a `PropertyColumn`.
+            null_mask: Optional mask that is true for the vertices whose property should be removed instead. The
+                mask of a `PropertyColumn` is used if it is `None`.
+
+        Raises:
+            InvalidContextError: If the graph is not in a valid context.
+            ValueError: If the arguments have different lengths or contain unsupported types, or unsigned integers too
+                large for int64.
+            IndexError: If there is no vertex with one of the IDs.
+            ImmutableObjectError: If the graph is immutable.
+
+        Examples:
+            ```graph.set_property_column(graph.vertex_ids(), "rank", ranks)```
+        """
+        if not self.is_valid():
+            raise InvalidContextError()
+
+        if isinstance(values, PropertyColumn):
+            if null_mask is None:
+                null_mask = values.null_mask
+            values = values.values
+        if null_mask is not None:
+            null_mask = _column_buffer(null_mask)
+        self._graph.set_property_column(_column_buffer(vertex_ids), property, _column_buffer(values), null_mask)
+
 
 class AbortError(Exception):
     """Signals that the procedure was asked to abort its execution."""
@@ -1332,6 +1781,12 @@ class AbortError(Exception):
     pass
 
 
+class OffloadUnavailableError(RuntimeError):
+    """Signals that there is no Python interpreter to run offloaded functions."""
+
+    pass
+
+
 class ProcCtx:
     """The context of the procedure being executed.
 
@@ -1400,10 +1855,74 @@ List = typing.List
 Nullable = typing.Optional
 
 
+def offload(
+    fn: typing.Callable,
+    snapshot: typing.Any = None,
+    *args,
+    timeout: typing.Optional[float] = None,
+    context: typing.Optional[ProcCtx] = None,
+    **kwargs,
+) -> typing.Any:
+    """
+    Call `fn(snapshot, *args, **kwargs)` and return its result.
+
+    In Memgraph, the function runs in a pool of worker processes, with the buffers in the snapshot shared through
+    shared memory. The mock API calls it directly, so `timeout` and `context` are ignored.
+
+    Args:
+        fn: The function to call.
+        snapshot: The data to share with the function.
+        args: The function’s other positional arguments.
+        timeout: The number of seconds the call may take.
+        context: The context of the procedure, which is checked for an aborted query.
+        kwargs: The function’s other keyword arguments.
+
+    Returns:
+        The result of `fn`.
+
+    Examples:
+        ```ranks = mgp_mock.offload(rank, graph.adjacency(), 100)```
+    """
+    return fn(snapshot, *args, **kwargs)
+
+
+def offload_all(
+    calls: typing.Iterable[tuple],
+    snapshot: typing.Any = None,
+    timeout: typing.Optional[float] = None,
+    context: typing.Optional[ProcCtx] = None,
+) -> typing.List[typing.Any]:
+    """
+    Make several calls like `offload`, sharing a single snapshot, and return the result of each of them.
+
+    In Memgraph, the calls run in parallel in a pool of worker processes, each with its own time budget. The mock API
+    makes them one after another, so `timeout` and `context` are ignored.
+
+    Args:
+        calls: Tuples of a function and its positional arguments other than the snapshot.
+        snapshot: The data to share with all of the functions.
+        timeout: The number of seconds each call may take.
+        context: The context of the procedure, which is checked for an aborted query.
+
+    Returns:
+        A list with the result of each call, in the order of `calls`, or the exception it raised instead.
+
+    Examples:
+        ```results = mgp_mock.offload_all([(rank, 100), (components,)], graph.adjacency())```
+    """
+    results = []
+    for fn, *args in calls:
+        try:
+            results.append(fn(snapshot, *args))
+        except Exception as error:
+            results.append(error)
+    return results
+
+
 # Procedure registration
 
 
-def raise_if_does_not_meet_requirements(func: typing.Callable[..., Record]):
+def raise_if_does_not_meet_requirements(func: typing.Callable[..., Record], allow_generators: bool = False):
     if not callable(func):
         raise TypeError(f"Expected a callable object, got an instance of '{type(func)}'")
     if inspect.iscoroutinefunction(func):
@@ -1411,12 +1930,17 @@ def raise_if_does_not_meet_requirements(func: typing.Callable[..., Record]):
     if sys.version_info >= (3, 6):
         if inspect.isasyncgenfunction(func):
             raise TypeError("Callable must not be 'async def' function")
-    if inspect.isgeneratorfunction(func):
+    if not allow_generators and inspect.isgeneratorfunction(func):
         raise NotImplementedError("Generator functions are not supported")
 
 
+def _collect_records(result_record):
+    # Records of generator procedures have to be collected while the context is still valid.
+    return list(result_record) if inspect.isgenerator(result_record) else result_record
+
+
 def _register_proc(func: typing.Callable[..., Record], is_write: bool):
-    raise_if_does_not_meet_requirements(func)
+    raise_if_does_not_meet_requirements(func, allow_generators=True)
 
     sig = inspect.signature(func)
 
@@ -1430,7 +1954,7 @@ def _register_proc(func: typing.Callable[..., Record], is_write: bool):
             if is_write:
                 ctx_copy = ProcCtx(deepcopy(ctx._graph._graph.nx))
 
-                result_record = func(ctx_copy, *args)
+                result_record = _collect_records(func(ctx_copy, *args))
 
                 ctx._graph._graph = deepcopy(ctx_copy._graph._graph)
 
@@ -1439,7 +1963,7 @@ def _register_proc(func: typing.Callable[..., Record], is_write: bool):
             else:
                 ctx._graph._graph.make_immutable()
 
-                result_record = func(ctx, *args)
+                result_record = _collect_records(func(ctx, *args))
 
                 # Invalidate context after execution
                 ctx._graph._graph.invalidate()
@@ -1450,7 +1974,7 @@ def _register_proc(func: typing.Callable[..., Record], is_write: bool):
 
         @wraps(func)
         def wrapper(*args):
-            return func(*args)
+            return _collect_records(func(*args))
 
     if sig.return_annotation is not sig.empty:
         record = sig.return_annotation
@@ -1461,7 +1985,15 @@ def _register_proc(func: typing.Callable[..., Record], is_write: bool):
     return wrapper
 
 
-def read_proc(func: typing.Callable[..., Record]):
+def read_proc(
+    func: typing.Optional[typing.Callable[..., Record]] = None,
+    *,
+    cache: bool = False,
+    max_entries: int = 32,
+    max_bytes: int = 64 * 1024 * 1024,
+    lazy_args: bool = False,
+    isolated: bool = False,
+):
     """
     Register a function as a Memgraph read-only procedure.
 
@@ -1469,8 +2001,8 @@ def read_proc(func: typing.Callable[..., Record]):
     Other parameters of `func` will be bound to the passed arguments.
     The full signature of `func` needs to be annotated with types. The return type must
     be `Record(field_name=type, ...)`, and the procedure must produce either a complete
-    Record or None. Multiple records can be produced by returning an iterable of them.
-    Registering generator functions is currently not supported.
+    Record or None. Multiple records can be produced by returning an iterable of them
+    or by yielding them from a generator function.
 
     Example:
     ```
@@ -1491,8 +2023,18 @@ def read_proc(func: typing.Callable[..., Record]):
       * `result` is "Hello World!".
 
     Any errors can be reported by raising an Exception.
+
+    The `cache`, `max_entries` and `max_bytes` arguments are accepted for
+    compatibility with `mgp.read_proc`, but the results aren't cached, as the
+    mock graph has no notion of committed versions. Likewise, `lazy_args` is
+    accepted, but list and map arguments are always passed as they are, and
+    `isolated` is accepted, but the procedure is called directly.
     """
-    return _register_proc(func, False)
+
+    def register(func):
+        return _register_proc(func, False)
+
+    return register if func is None else register(func)
 
 
 def write_proc(func: typing.Callable[..., Record]):
@@ -1503,8 +2045,8 @@ def write_proc(func: typing.Callable[..., Record]):
     Other parameters of `func` will be bound to the passed arguments.
     The full signature of `func` needs to be annotated with types. The return type must
     be `Record(field_name=type, ...)`, and the procedure must produce either a complete
-    Record or None. Multiple records can be produced by returning an iterable of them.
-    Registering generator functions is currently not supported.
+    Record or None. Multiple records can be produced by returning an iterable of them
+    or by yielding them from a generator function.
 
     Example:
     ```
@@ -1565,7 +2107,7 @@ class FuncCtx:
         return self._graph.is_valid()
 
 
-def function(func: typing.Callable):
+def function(func: typing.Optional[typing.Callable] = None, *, vectorized: bool = False):
     """
     Register a function as a Memgraph function.
 
@@ -1598,32 +2140,44 @@ def function(func: typing.Callable):
         is not `null`.
 
     Any errors can be reported by raising an Exception.
+
+    Functions registered with `@mgp_mock.function(vectorized=True)` take a list
+    of values for each argument and return an iterable with a result for each
+    of them, as with `@mgp.function(vectorized=True)`. The mock returns the
+    results as a list.
     """
-    raise_if_does_not_meet_requirements(func)
 
-    sig = inspect.signature(func)
+    def register(func):
+        raise_if_does_not_meet_requirements(func)
 
-    params = tuple(sig.parameters.values())
-    if params and params[0].annotation is FuncCtx:
+        sig = inspect.signature(func)
 
-        @wraps(func)
-        def wrapper(ctx, *args):
-            ctx._graph._graph.make_immutable()
+        params = tuple(sig.parameters.values())
+        if params and params[0].annotation is FuncCtx:
+
+            @wraps(func)
+            def wrapper(ctx, *args):
+                ctx._graph._graph.make_immutable()
+
+                result = func(ctx, *args)
+                if vectorized:
+                    result = list(result)
 
-            result = func(ctx, *args)
+                # Invalidate context after execution
+                ctx._graph._graph.invalidate()
 
-            # Invalidate context after execution
-            ctx._graph._graph.invalidate()
+                return result
 
-            return result
+        else:
 
-    else:
+            @wraps(func)
+            def wrapper(*args):
+                result = func(*args)
+                return list(result) if vectorized else result
 
-        @wraps(func)
-        def wrapper(*args):
-            return func(*args)
+        return wrapper
 
-    return wrapper
+    return register if func is None else register(func)
 
 
 def _wrap_exceptions():
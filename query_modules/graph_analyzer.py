@@ -1,5 +1,6 @@
 import sys
 import mgp
+from array import array
 from collections import OrderedDict
 from itertools import chain, repeat
 from inspect import cleandoc
@@ -14,11 +15,11 @@ except ImportError as import_error:
         + sys.version +
         '\n'))
     raise import_error
-# Imported last because it also depends on networkx.
-from mgp_networkx import MemgraphMultiDiGraph  # noqa E402
 
 
 _MAX_LIST_SIZE = 10
+# Number of seconds each analysis may take if the timeout isn't given.
+_DEFAULT_TIMEOUT = 60
 
 
 @mgp.read_proc
@@ -42,7 +43,8 @@ def help() -> mgp.Record(name=str, value=str):
 
 @mgp.read_proc
 def analyze(context: mgp.ProcCtx,
-            analyses: mgp.Nullable[List[str]] = None
+            analyses: mgp.Nullable[List[str]] = None,
+            timeout: mgp.Nullable[mgp.Number] = None
             ) -> mgp.Record(name=str, value=str):
     '''
     Shows graph information.
@@ -52,14 +54,23 @@ def analyze(context: mgp.ProcCtx,
     The optional parameter is a list of graph analyses to run.
     If NULL, all available analyses are run.
 
+    The analyses run in parallel on a snapshot of the graph. The optional
+    timeout is the number of seconds each of them may take, 60 if NULL. The
+    value of an analysis which takes longer is 'Timed out', and that of an
+    analysis which fails is 'Failed: ' followed by the error, while the
+    results of the others are still shown.
+
     Example call (give all information):
         CALL graph_analyzer.analyze() YIELD *;
 
     Example call (with parameter):
         CALL graph_analyzer.analyze(['nodes', 'edges']) YIELD *;
+
+    Example call (with timeout):
+        CALL graph_analyzer.analyze(NULL, 60) YIELD *;
     '''
-    g = MemgraphMultiDiGraph(ctx=context)
-    recs = _analyze_graph(context, g, analyses)
+    recs = _analyze_graph(context, context.graph.adjacency(), analyses,
+                          timeout)
     return [mgp.Record(name=name, value=value) for name, value in recs]
 
 
@@ -67,7 +78,8 @@ def analyze(context: mgp.ProcCtx,
 def analyze_subgraph(context: mgp.ProcCtx,
                      vertices: mgp.List[mgp.Vertex],
                      edges: mgp.List[mgp.Edge],
-                     analyses: mgp.Nullable[List[str]] = None
+                     analyses: mgp.Nullable[List[str]] = None,
+                     timeout: mgp.Nullable[mgp.Number] = None
                      ) -> mgp.Record(name=str, value=str):
     '''
     Shows subgraph information.
@@ -77,6 +89,9 @@ def analyze_subgraph(context: mgp.ProcCtx,
     The optional parameter is a list of graph analyses to run.
     If NULL, all available analyses are run.
 
+    The optional timeout is the number of seconds each analysis may take,
+    like in 'analyze'.
+
     Example call (give all information):
         MATCH (n)-[e]->(m) WITH
         collect(n) AS nodes,
@@ -92,12 +107,8 @@ def analyze_subgraph(context: mgp.ProcCtx,
         YIELD *
         RETURN name, value;
     '''
-    vertices, edges = map(set, [vertices, edges])
-    g = nx.subgraph_view(
-        MemgraphMultiDiGraph(ctx=context),
-        lambda n: n in vertices,
-        lambda n1, n2, e: e in edges)
-    recs = _analyze_graph(context, g, analyses)
+    recs = _analyze_graph(context, _subgraph_adjacency(vertices, edges),
+                          analyses, timeout)
     return [mgp.Record(name=name, value=value) for name, value in recs]
 
 
@@ -123,6 +134,28 @@ def _get_analysis_mapping():
                         ('is_tree', _is_tree)])
 
 
+def _get_analysis_names():
+    return {
+        'nodes': 'Number of nodes',
+        'edges': 'Number of edges',
+        'bridges': 'Number of bridges',
+        'articulation_points': 'Number of articulation points',
+        'avg_degree': 'Average degree',
+        'sorted_nodes_degree': 'Sorted nodes degree',
+        'self_loops': 'Self loops',
+        'is_bipartite': 'Is bipartite',
+        'is_planar': 'Is planar',
+        'is_biconnected: ': 'Is biconnected',
+        'is_weakly_connected': 'Is weakly connected',
+        'number_of_weakly_components': 'Number of weakly connected components',
+        'is_strongly_connected': 'Is strongly connected',
+        'strongly_components': 'Number of strongly connected components',
+        'is_dag': 'Is DAG',
+        'is_eulerian': 'Is eulerian',
+        'is_forest': 'Is forest',
+        'is_tree': 'Is tree'}
+
+
 def _get_analysis_func(name: str):
     _name_to_proc = _get_analysis_mapping()
     return _name_to_proc.get(name.lower())
@@ -132,21 +165,94 @@ def _get_analysis_funcs():
     return _get_analysis_mapping().values()
 
 
+def _subgraph_adjacency(vertices: List[mgp.Vertex],
+                        edges: List[mgp.Edge]) -> mgp.Adjacency:
+    '''Returns the adjacency of the subgraph, which contains the edges
+       between the given vertices only.'''
+    vertex_ids = array('q', dict.fromkeys(v.id for v in vertices))
+    positions = {vertex_id: i for i, vertex_id in enumerate(vertex_ids)}
+    subgraph_edges = sorted(
+        (positions[e.from_vertex.id], positions[e.to_vertex.id], e.id)
+        for e in set(edges)
+        if e.from_vertex.id in positions and e.to_vertex.id in positions)
+    indptr = array('q', repeat(0, len(vertex_ids) + 1))
+    for source, _, _ in subgraph_edges:
+        indptr[source + 1] += 1
+    for i in range(len(vertex_ids)):
+        indptr[i + 1] += indptr[i]
+    return mgp.Adjacency(
+        memoryview(vertex_ids), memoryview(indptr),
+        memoryview(array('q', (target for _, target, _ in subgraph_edges))),
+        memoryview(array('q', (e for _, _, e in subgraph_edges))))
+
+
+def _snapshot_graph(adjacency: mgp.Adjacency) -> nx.MultiDiGraph:
+    '''Returns an immutable graph of the adjacency, whose nodes are vertex
+       IDs and whose edge keys are edge IDs.'''
+    vertex_ids = adjacency.vertex_ids.tolist()
+    indptr = adjacency.indptr.tolist()
+    indices = adjacency.indices.tolist()
+    edge_ids = adjacency.edge_ids.tolist()
+    g = nx.MultiDiGraph()
+    g.add_nodes_from(vertex_ids)
+    g.add_edges_from((vertex_ids[u], vertex_ids[indices[i]], edge_ids[i])
+                     for u in range(len(vertex_ids))
+                     for i in range(indptr[u], indptr[u + 1]))
+    return nx.freeze(g)
+
+
+def _run_analysis(adjacency: mgp.Adjacency, name: str) -> Tuple[str, str]:
+    # NOTE: This runs in a worker process, which gets the adjacency through
+    # shared memory and builds its own graph from it.
+    return _get_analysis_func(name)(_snapshot_graph(adjacency))
+
+
 def _analyze_graph(context: mgp.ProcCtx,
-                   g: nx.MultiDiGraph,
-                   analyses: List[str]
+                   adjacency: mgp.Adjacency,
+                   analyses: List[str],
+                   timeout: float = None
                    ) -> List[Tuple[str, str]]:
 
-    functions = (_get_analysis_funcs() if analyses is None
-                 else [_get_analysis_func(name) for name in analyses])
-
-    records = []
-    for index, f in enumerate(functions):
-        context.check_must_abort()
-        if f is None:
+    names = list(_get_analysis_mapping() if analyses is None
+                 else (name.lower() for name in analyses))
+    for index, name in enumerate(names):
+        if _get_analysis_func(name) is None:
             raise KeyError('Graph analysis is not supported: ' +
                            analyses[index])
-        name, value = f(g)
+
+    if timeout is None:
+        timeout = _DEFAULT_TIMEOUT
+
+    context.check_must_abort()
+    try:
+        results = mgp.offload_all([(_run_analysis, name) for name in names],
+                                  adjacency, timeout, context=context)
+    except mgp.OffloadUnavailableError:
+        # There is no Python interpreter to run the workers, so the analyses
+        # run one after another on a single graph, without a time budget.
+        g = _snapshot_graph(adjacency)
+        results = []
+        for name in names:
+            context.check_must_abort()
+            try:
+                results.append(_get_analysis_func(name)(g))
+            except Exception as error:
+                results.append(error)
+    context.check_must_abort()
+
+    records = []
+    for name, result in zip(names, results):
+        # The failed analyses don't return their names, so all of them are
+        # shown under the names from the mapping.
+        name = _get_analysis_names()[name]
+        if isinstance(result, TimeoutError):
+            records.append((name, 'Timed out'))
+            continue
+        if isinstance(result, Exception):
+            records.append((name, 'Failed: {}'.format(
+                str(result) or type(result).__name__)))
+            continue
+        _, value = result
         if isinstance(value, (list, set, tuple)):
             value = list(value)[:_MAX_LIST_SIZE]
         records.append((name, str(value)))
@@ -11,27 +11,65 @@ except ImportError as import_error:
         + sys.version +
         '\n'))
     raise import_error
+try:
+    import numpy as np
+    import scipy.sparse
+except ImportError:
+    # Only MemgraphMaterializedGraph needs them.
+    np = None
+
+
+class MemgraphAdjacencyIndex:
+    """Edges of each vertex, grouped by the neighbor they lead to or come from.
+
+    A vertex is indexed the first time its neighbors are needed. A single
+    index is shared by all the adjacency views of a graph, so that repeated
+    lookups of G[u] and G[u][v] don't scan the edges of u again. The index
+    holds graph objects, so it's valid only during the procedure call in which
+    the graph was created.
+    """
+    __slots__ = ('_succ', '_pred')
+
+    def __init__(self):
+        self._succ = {}
+        self._pred = {}
+
+    def neighbors(self, node, succ=True):
+        """Return a dict mapping the neighbors of `node` to lists of edges."""
+        index = self._succ if succ else self._pred
+        neighbors = index.get(node)
+        if neighbors is None:
+            neighbors = {}
+            if succ:
+                for edge in node.out_edges:
+                    neighbors.setdefault(edge.to_vertex, []).append(edge)
+            else:
+                for edge in node.in_edges:
+                    neighbors.setdefault(edge.from_vertex, []).append(edge)
+            index[node] = neighbors
+        return neighbors
 
 
 class MemgraphAdjlistOuterDict(collections.abc.Mapping):
-    __slots__ = ('_ctx', '_succ', '_multi')
+    __slots__ = ('_ctx', '_succ', '_multi', '_index')
 
-    def __init__(self, ctx, succ=True, multi=True):
+    def __init__(self, ctx, succ=True, multi=True, index=None):
         self._ctx = ctx
         self._succ = succ
         self._multi = multi
+        self._index = index if index is not None else MemgraphAdjacencyIndex()
 
     def __getitem__(self, key):
         if key not in self:
             raise KeyError
-        return MemgraphAdjlistInnerDict(key, succ=self._succ,
+        return MemgraphAdjlistInnerDict(key, self._index, succ=self._succ,
                                         multi=self._multi)
 
     def __iter__(self):
         return iter(self._ctx.graph.vertices)
 
     def __len__(self):
-        return len(self._ctx.graph.vertices)
+        return self._ctx.graph.vertex_count()
 
     def __contains__(self, key):
         if not isinstance(key, mgp.Vertex):
@@ -40,10 +78,11 @@ class MemgraphAdjlistOuterDict(collections.abc.Mapping):
 
 
 class MemgraphAdjlistInnerDict(collections.abc.Mapping):
-    __slots__ = ('_node', '_succ', '_multi', '_neighbors')
+    __slots__ = ('_node', '_index', '_succ', '_multi', '_neighbors')
 
-    def __init__(self, node, succ=True, multi=True):
+    def __init__(self, node, index, succ=True, multi=True):
         self._node = node
+        self._index = index
         self._succ = succ
         self._multi = multi
         self._neighbors = None
@@ -55,7 +94,7 @@ class MemgraphAdjlistInnerDict(collections.abc.Mapping):
             raise KeyError
         if not self._multi:
             return UnhashableProperties(self._get_edge(key).properties)
-        return MemgraphEdgeKeyDict(self._node, key, self._succ)
+        return MemgraphEdgeKeyDict(self._node, key, self._index, self._succ)
 
     def __iter__(self):
         yield from self._get_neighbors()
@@ -69,22 +108,12 @@ class MemgraphAdjlistInnerDict(collections.abc.Mapping):
         return key in self._get_neighbors()
 
     def _get_neighbors(self):
-        if not self._neighbors:
-            if self._succ:
-                self._neighbors = set(
-                    e.to_vertex for e in self._node.out_edges)
-            else:
-                self._neighbors = set(
-                    e.from_vertex for e in self._node.in_edges)
+        if self._neighbors is None:
+            self._neighbors = self._index.neighbors(self._node, self._succ)
         return self._neighbors
 
     def _get_edge(self, neighbor):
-        if self._succ:
-            edge = list(filter(lambda e: e.to_vertex == neighbor,
-                               self._node.out_edges))
-        else:
-            edge = list(filter(lambda e: e.from_vertex == neighbor,
-                               self._node.in_edges))
+        edge = self._get_neighbors()[neighbor]
 
         assert len(edge) >= 1
         if len(edge) > 1:
@@ -95,11 +124,12 @@ class MemgraphAdjlistInnerDict(collections.abc.Mapping):
 
 
 class MemgraphEdgeKeyDict(collections.abc.Mapping):
-    __slots__ = ('_node', '_neighbor', '_succ', '_edges')
+    __slots__ = ('_node', '_neighbor', '_index', '_succ', '_edges')
 
-    def __init__(self, node, neighbor, succ=True):
+    def __init__(self, node, neighbor, index, succ=True):
         self._node = node
         self._neighbor = neighbor
+        self._index = index
         self._succ = succ
         self._edges = None
 
@@ -120,15 +150,9 @@ class MemgraphEdgeKeyDict(collections.abc.Mapping):
         return key in self._get_edges()
 
     def _get_edges(self):
-        if not self._edges:
-            if self._succ:
-                self._edges = list(filter(
-                    lambda e: e.to_vertex == self._neighbor,
-                    self._node.out_edges))
-            else:
-                self._edges = list(filter(
-                    lambda e: e.from_vertex == self._neighbor,
-                    self._node.in_edges))
+        if self._edges is None:
+            self._edges = self._index.neighbors(
+                self._node, self._succ).get(self._neighbor, [])
         return self._edges
 
 
@@ -174,7 +198,7 @@ class MemgraphNodeDict(collections.abc.Mapping):
         return iter(self._ctx.graph.vertices)
 
     def __len__(self):
-        return len(self._ctx.graph.vertices)
+        return self._ctx.graph.vertex_count()
 
     def __contains__(self, key):
         # NOTE: NetworkX 2.4, graph.py:425. Graph.__contains__ relies on
@@ -205,8 +229,11 @@ class MemgraphDiGraphBase:
             if ctx else self._error
         self.node_attr_dict_factory = self._error
 
+        # NOTE: Both adjacency views share the index of the neighbors, which
+        # is built as the vertices are visited during a single procedure call.
+        index = MemgraphAdjacencyIndex()
         self.adjlist_outer_dict_factory = \
-            lambda: MemgraphAdjlistOuterDict(ctx, multi=multi) \
+            lambda: MemgraphAdjlistOuterDict(ctx, multi=multi, index=index) \
             if ctx else self._error
         self.adjlist_inner_dict_factory = self._error
         self.edge_key_dict_factory = self._error
@@ -228,7 +255,8 @@ class MemgraphDiGraphBase:
         # already populated, dictionaries. Because self._pred and self._end are
         # initialized by the same factory function, they end up storing the
         # same adjacency lists which is not good. We correct that here.
-        self._pred = MemgraphAdjlistOuterDict(ctx, succ=False, multi=multi)
+        self._pred = MemgraphAdjlistOuterDict(ctx, succ=False, multi=multi,
+                                              index=index)
 
     def _error(self):
         raise RuntimeError('Modification operations are not supported')
@@ -287,3 +315,129 @@ class PropertiesDictionary(collections.abc.Mapping):
         if not isinstance(vertex, mgp.Vertex):
             raise TypeError
         return self._prop in vertex.properties
+
+
+class MemgraphMaterializedGraph:
+    """Copy of the graph, or of a projection of it, in NumPy arrays.
+
+    The edges are exported with a single `mgp.Graph.adjacency` call, without
+    creating a Python object for any of the vertices or edges. Vertices are
+    numbered by their position in `vertex_ids`, and edge `i` leads from
+    `sources[i]` to `targets[i]` with weight `weights[i]`. Unlike the views
+    above, which pull each attribute from the database when NetworkX asks for
+    it, the copy can be turned into a SciPy sparse matrix or into a native
+    `nx.DiGraph`, which is orders of magnitude faster on large graphs.
+
+    Only the vertices with at least one of `labels`, and the edges between
+    them of one of `edge_types`, are copied. `None` stands for all labels or
+    all edge types. Weights are read from the `weight` property of the edges,
+    or are all 1 if `weight` is None.
+    """
+    __slots__ = ('_ctx', 'vertex_ids', 'sources', 'targets', 'weights',
+                 '_vertices')
+
+    def __init__(self, ctx, labels=None, edge_types=None, weight=None):
+        if np is None:
+            raise ImportError('Please install numpy and scipy to be able to '
+                              'materialize graphs')
+        adjacency = ctx.graph.adjacency(edge_types=edge_types,
+                                        weight_property=weight)
+        vertex_ids = np.asarray(adjacency.vertex_ids, dtype=np.int64)
+        targets = np.asarray(adjacency.indices, dtype=np.int64)
+        sources = np.repeat(np.arange(len(vertex_ids)),
+                            np.diff(np.asarray(adjacency.indptr)))
+        if adjacency.weights is None:
+            weights = np.ones(len(targets))
+        else:
+            weights = np.asarray(adjacency.weights, dtype=np.float64)
+
+        if labels is not None:
+            labelled = [np.asarray(ctx.graph.vertex_ids(label))
+                        for label in labels]
+            keep = np.isin(vertex_ids, np.concatenate(labelled)) \
+                if labelled else np.zeros(len(vertex_ids), dtype=bool)
+            kept_edges = keep[sources] & keep[targets]
+            positions = np.cumsum(keep) - 1
+            sources = positions[sources[kept_edges]]
+            targets = positions[targets[kept_edges]]
+            weights = weights[kept_edges]
+            vertex_ids = vertex_ids[keep]
+
+        self._ctx = ctx
+        self.vertex_ids = vertex_ids
+        self.sources = sources
+        self.targets = targets
+        self.weights = weights
+        self._vertices = {}
+
+    def __len__(self):
+        return len(self.vertex_ids)
+
+    def matrix(self, combine='sum'):
+        """Return the adjacency matrix as a `scipy.sparse.csr_matrix`.
+
+        The weights of parallel edges are combined with `combine`, which is
+        either 'sum' or 'min'. Zero weights are kept as explicit entries, so
+        that `scipy.sparse.csgraph` treats them as edges.
+        """
+        sources, targets, weights = self.sources, self.targets, self.weights
+        if combine == 'min':
+            order = np.lexsort((weights, targets, sources))
+            sources, targets, weights = \
+                sources[order], targets[order], weights[order]
+            first = np.ones(len(sources), dtype=bool)
+            first[1:] = (sources[1:] != sources[:-1]) | \
+                (targets[1:] != targets[:-1])
+            sources, targets, weights = \
+                sources[first], targets[first], weights[first]
+        elif combine != 'sum':
+            raise ValueError('Unknown way to combine weights: {}'
+                             .format(combine))
+        n = len(self)
+        return scipy.sparse.csr_matrix((weights, (sources, targets)),
+                                       shape=(n, n))
+
+    def to_networkx(self, combine='sum'):
+        """Return a native `nx.DiGraph` with the positions as nodes.
+
+        Parallel edges are merged into one like in `matrix`, and the weights
+        are stored in the 'weight' attribute of the edges.
+        """
+        graph = nx.DiGraph()
+        graph.add_nodes_from(range(len(self)))
+        matrix = self.matrix(combine).tocoo()
+        graph.add_weighted_edges_from(zip(matrix.row.tolist(),
+                                          matrix.col.tolist(),
+                                          matrix.data.tolist()))
+        return graph
+
+    def position(self, vertex):
+        """Return the position of `vertex`, which must be in the copy."""
+        positions = np.flatnonzero(self.vertex_ids == vertex.id)
+        if not len(positions):
+            raise nx.NodeNotFound('Node {} is not in the graph'
+                                  .format(vertex))
+        return int(positions[0])
+
+    def vertex(self, position):
+        """Return the `mgp.Vertex` at `position`."""
+        vertex = self._vertices.get(position)
+        if vertex is None:
+            vertex = self._ctx.graph.get_vertex_by_id(
+                int(self.vertex_ids[position]))
+            self._vertices[position] = vertex
+        return vertex
+
+    def property_values(self, prop):
+        """Return the `prop` property of each vertex as floats.
+
+        Vertices without the property get 0.
+        """
+        graph = self._ctx.graph
+        ids = np.asarray(graph.vertex_ids(), dtype=np.int64)
+        column = graph.property_column(None, prop, 'float64')
+        values = np.where(np.asarray(column.null_mask), 0.0,
+                          np.asarray(column.values))
+        sorter = np.argsort(ids)
+        return values[sorter[np.searchsorted(ids, self.vertex_ids,
+                                             sorter=sorter)]]
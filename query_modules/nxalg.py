@@ -16,7 +16,152 @@ except ImportError as import_error:
 # Imported last because it also depends on networkx.
 from mgp_networkx import (MemgraphMultiDiGraph, MemgraphDiGraph,  # noqa: E402
                           MemgraphMultiGraph, MemgraphGraph,
-                          PropertiesDictionary)
+                          MemgraphMaterializedGraph, PropertiesDictionary)
+import scipy.sparse.csgraph  # noqa: E402
+
+# NOTE: The procedures which take a `materialize` flag can run on a copy of the
+# graph made with a single export (see MemgraphMaterializedGraph) instead of on
+# a view of it. They use SciPy directly where it implements the algorithm.
+# Passing `labels` or `edge_types` runs them on a projection of the graph,
+# which is always materialized.
+
+# Number of distances computed at once by materialized shortest_path_length.
+_DISTANCES_CHUNK_SIZE = 1 << 22
+
+
+def _is_materialized(materialize, labels, edge_types):
+    return materialize or labels is not None or edge_types is not None
+
+
+def _materialized_core_number(graph):
+    # NOTE: Like in networkx.core_number, the neighbors of a vertex are both
+    # its predecessors and its successors, and parallel edges are counted once.
+    matrix = graph.matrix(combine='min')
+    if matrix.diagonal().any():
+        raise nx.NetworkXNotImplemented(
+            'Input graph has self loops which is not permitted; '
+            'Consider using G.remove_edges_from(nx.selfloop_edges(G)).')
+    matrix = (matrix + matrix.T).tocsr()
+    indptr, indices = matrix.indptr, matrix.indices
+    counts = matrix.data.astype(numpy.int64)
+    degrees = numpy.asarray(matrix.sum(axis=1)).ravel().astype(numpy.int64)
+    cores = numpy.zeros(len(graph), dtype=numpy.int64)
+    removed = numpy.zeros(len(graph), dtype=bool)
+    remaining = numpy.arange(len(graph))
+    core = 0
+    # Peel all of the vertices of degree at most `core` at once, until none
+    # are left, and then move to the next smallest degree.
+    while True:
+        remaining = remaining[~removed[remaining]]
+        if not len(remaining):
+            return cores
+        core = max(core, int(degrees[remaining].min()))
+        peeled = remaining[degrees[remaining] <= core]
+        while len(peeled):
+            cores[peeled] = core
+            removed[peeled] = True
+            starts, ends = indptr[peeled], indptr[peeled + 1]
+            lengths = ends - starts
+            edges = numpy.repeat(starts - numpy.cumsum(lengths) + lengths,
+                                 lengths) + numpy.arange(lengths.sum())
+            neighbors = indices[edges]
+            numpy.subtract.at(degrees, neighbors, counts[edges])
+            neighbors = numpy.unique(neighbors)
+            peeled = neighbors[~removed[neighbors] &
+                               (degrees[neighbors] <= core)]
+
+
+def _materialized_pagerank(graph, alpha, personalization, max_iter, tol,
+                           nstart, dangling):
+    # NOTE: This is networkx.pagerank on the adjacency matrix, in which the
+    # weights of parallel edges are summed like in a MultiDiGraph.
+    n = len(graph)
+    if n == 0:
+        return numpy.zeros(0)
+    matrix = graph.matrix(combine='sum')
+    out_weights = numpy.asarray(matrix.sum(axis=1)).ravel()
+    is_dangling = numpy.flatnonzero(out_weights == 0)
+    out_weights[out_weights != 0] = 1.0 / out_weights[out_weights != 0]
+    # NOTE: The matrix is transposed so that the iteration multiplies it by a
+    # vector, which gives a 1-d array for both sparse matrices and arrays.
+    matrix = (scipy.sparse.spdiags(out_weights, 0, n, n) @ matrix).T.tocsr()
+
+    if nstart is None:
+        x = numpy.repeat(1.0 / n, n)
+    else:
+        x = graph.property_values(nstart)
+        x /= x.sum()
+    if personalization is None:
+        p = numpy.repeat(1.0 / n, n)
+    else:
+        p = graph.property_values(personalization)
+        if p.sum() == 0:
+            raise ZeroDivisionError
+        p /= p.sum()
+    if dangling is None:
+        dangling_weights = p
+    else:
+        dangling_weights = graph.property_values(dangling)
+        dangling_weights /= dangling_weights.sum()
+
+    for _ in range(max_iter):
+        xlast = x
+        x = alpha * (matrix @ x + x[is_dangling].sum() * dangling_weights) + \
+            (1 - alpha) * p
+        if numpy.absolute(x - xlast).sum() < n * tol:
+            return x
+    raise nx.PowerIterationFailedConvergence(max_iter)
+
+
+def _materialized_shortest_path_length(graph, source, target, weight,
+                                       method):
+    # NOTE: Like in networkx.shortest_path_length of a MultiDiGraph, the
+    # length of parallel edges is the smallest of their weights.
+    methods = {'dijkstra': 'D', 'bellman-ford': 'BF'}
+    if method not in methods:
+        raise ValueError('method not supported: {}'.format(method))
+    matrix = graph.matrix(combine='min')
+    if method == 'dijkstra' and weight is not None and len(matrix.data) and \
+            matrix.data.min() < 0:
+        raise ValueError('Contradictory paths found: negative weights?')
+
+    def distances(matrix, positions):
+        return scipy.sparse.csgraph.shortest_path(
+            matrix, method=methods[method], unweighted=weight is None,
+            indices=positions)
+
+    def length(distance):
+        return int(distance) if weight is None else float(distance)
+
+    if source is not None:
+        row = distances(matrix, [graph.position(source)])[0]
+        if target is not None:
+            distance = row[graph.position(target)]
+            if numpy.isinf(distance):
+                raise nx.NetworkXNoPath(
+                    'No path between {} and {}.'.format(source, target))
+            return [mgp.Record(source=source, target=target,
+                               length=length(distance))]
+        return [mgp.Record(source=source, target=graph.vertex(t),
+                           length=length(row[t]))
+                for t in numpy.flatnonzero(~numpy.isinf(row)).tolist()]
+    if target is not None:
+        # Distances to the target are those from it in the reversed graph.
+        row = distances(matrix.T.tocsr(), [graph.position(target)])[0]
+        return [mgp.Record(source=graph.vertex(s), target=target,
+                           length=length(row[s]))
+                for s in numpy.flatnonzero(~numpy.isinf(row)).tolist()]
+
+    records = []
+    chunk_size = max(1, _DISTANCES_CHUNK_SIZE // max(1, len(graph)))
+    for start in range(0, len(graph), chunk_size):
+        positions = list(range(start, min(start + chunk_size, len(graph))))
+        for s, row in zip(positions, distances(matrix, positions)):
+            records.extend(
+                mgp.Record(source=graph.vertex(s), target=graph.vertex(t),
+                           length=length(row[t]))
+                for t in numpy.flatnonzero(~numpy.isinf(row)).tolist())
+    return records
 
 
 # networkx.algorithms.approximation.connectivity.node_connectivity
@@ -84,9 +229,19 @@ def betweenness_centrality(ctx: mgp.ProcCtx,
                            normalized: bool = True,
                            weight: mgp.Nullable[str] = None,
                            endpoints: bool = False,
-                           seed: mgp.Nullable[int] = None
+                           seed: mgp.Nullable[int] = None,
+                           materialize: bool = False,
+                           labels: mgp.Nullable[mgp.List[str]] = None,
+                           edge_types: mgp.Nullable[mgp.List[str]] = None
                            ) -> mgp.Record(node=mgp.Vertex,
                                            betweenness=mgp.Number):
+    if _is_materialized(materialize, labels, edge_types):
+        g = MemgraphMaterializedGraph(ctx, labels, edge_types, weight)
+        return [mgp.Record(node=g.vertex(n), betweenness=b)
+                for n, b in nx.betweenness_centrality(
+                    g.to_networkx(combine='min'), k=k, normalized=normalized,
+                    weight=None if weight is None else 'weight',
+                    endpoints=endpoints, seed=seed).items()]
     return [mgp.Record(node=n, betweenness=b)
             for n, b in nx.betweenness_centrality(
                     MemgraphDiGraph(ctx=ctx), k=k, normalized=normalized,
@@ -209,8 +364,15 @@ def k_edge_components(
 
 # networkx.algorithms.core.core_number
 @mgp.read_proc
-def core_number(ctx: mgp.ProcCtx
+def core_number(ctx: mgp.ProcCtx,
+                materialize: bool = False,
+                labels: mgp.Nullable[mgp.List[str]] = None,
+                edge_types: mgp.Nullable[mgp.List[str]] = None
                 ) -> mgp.Record(node=mgp.Vertex, core=mgp.Number):
+    if _is_materialized(materialize, labels, edge_types):
+        g = MemgraphMaterializedGraph(ctx, labels, edge_types)
+        return [mgp.Record(node=g.vertex(n), core=c) for n, c
+                in enumerate(_materialized_core_number(g).tolist())]
     return [mgp.Record(node=n, core=c)
             for n, c in nx.core_number(MemgraphDiGraph(ctx=ctx)).items()]
 
@@ -429,7 +591,17 @@ def pagerank(ctx: mgp.ProcCtx,
              nstart: mgp.Nullable[str] = None,
              weight: mgp.Nullable[str] = 'weight',
              dangling: mgp.Nullable[str] = None,
+             materialize: bool = False,
+             labels: mgp.Nullable[mgp.List[str]] = None,
+             edge_types: mgp.Nullable[mgp.List[str]] = None
              ) -> mgp.Record(node=mgp.Vertex, rank=float):
+    if _is_materialized(materialize, labels, edge_types):
+        g = MemgraphMaterializedGraph(ctx, labels, edge_types, weight)
+        ranks = _materialized_pagerank(g, alpha, personalization, max_iter,
+                                       tol, nstart, dangling)
+        return [mgp.Record(node=g.vertex(n), rank=r)
+                for n, r in enumerate(ranks.tolist())]
+
     def to_properties_dictionary(prop):
         return None if prop is None else PropertiesDictionary(ctx, prop)
 
@@ -533,9 +705,17 @@ def shortest_path_length(ctx: mgp.ProcCtx,
                          source: mgp.Nullable[mgp.Vertex] = None,
                          target: mgp.Nullable[mgp.Vertex] = None,
                          weight: mgp.Nullable[str] = None,
-                         method: str = 'dijkstra'
+                         method: str = 'dijkstra',
+                         materialize: bool = False,
+                         labels: mgp.Nullable[mgp.List[str]] = None,
+                         edge_types: mgp.Nullable[mgp.List[str]] = None
                          ) -> mgp.Record(source=mgp.Vertex, target=mgp.Vertex,
                                          length=mgp.Number):
+    if _is_materialized(materialize, labels, edge_types):
+        return _materialized_shortest_path_length(
+            MemgraphMaterializedGraph(ctx, labels, edge_types, weight),
+            source, target, weight, method)
+
     sp = nx.shortest_path_length(MemgraphMultiDiGraph(ctx=ctx), source=source,
                                  target=target, weight=weight, method=method)
 
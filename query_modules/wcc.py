@@ -1,19 +1,27 @@
 import sys
 import mgp
 try:
-    import networkx as nx
+    import numpy as np
 except ImportError as import_error:
     sys.stderr.write(
         '\n'
-        'NOTE: Please install networkx to be able to use wcc module.\n'
+        'NOTE: Please install numpy to be able to use wcc module.\n'
         'Using Python:\n'
         + sys.version +
         '\n')
     raise import_error
 
 
-@mgp.read_proc
-def get_components(vertices: mgp.List[mgp.Vertex],
+# Number of edges whose endpoints, or of vertices whose edges, are read and
+# merged at once.
+_CHUNK_SIZE = 1 << 20
+# Number of steps toward the roots taken before flattening all of the trees.
+_MAX_FIND_STEPS = 8
+
+
+@mgp.read_proc(lazy_args=True)
+def get_components(context: mgp.ProcCtx,
+                   vertices: mgp.List[mgp.Vertex],
                    edges: mgp.List[mgp.Edge]
                    ) -> mgp.Record(n_components=int,
                                    components=mgp.List[mgp.List[mgp.Vertex]]):
@@ -33,6 +41,12 @@ def get_components(vertices: mgp.List[mgp.Vertex],
         * `components` is a list of weakly connected components. Each component
         is given as a list of `mgp.Vertex` objects from that component.
 
+    The components are found with a union-find over the IDs of the vertices.
+    The IDs of the endpoints of the edges are read a chunk at a time instead
+    of creating an object for every edge, but the lists themselves still have
+    to be collected by the query and held in memory, so the memory used grows
+    with the size of the subgraph.
+
     For example, weakly connected components in a subgraph formed from all
     vertices labeled `Person` and edges between such vertices can be obtained
     using the following openCypher query:
@@ -42,10 +56,131 @@ def get_components(vertices: mgp.List[mgp.Vertex],
     CALL wcc.get_components(nodes, edges) YIELD *
     RETURN n_components, components;
     '''
-    g = nx.DiGraph()
-    g.add_nodes_from(vertices)
-    g.add_edges_from([(edge.from_vertex, edge.to_vertex) for edge in edges])
+    # The vertex IDs are mapped to positions in the sorted array of all of
+    # them, which takes a pass over the edges before the one merging them.
+    ids = np.unique(_vertex_ids(vertices))
+    pending = []
+    for from_ids, to_ids in _edge_endpoint_chunks(edges):
+        pending.append(np.unique(np.concatenate((from_ids, to_ids))))
+        if sum(map(len, pending)) > len(ids):
+            ids = np.unique(np.concatenate([ids] + pending))
+            pending = []
+    ids = np.unique(np.concatenate([ids] + pending))
+
+    parent = np.arange(len(ids))
+    for from_ids, to_ids in _edge_endpoint_chunks(edges):
+        _union(parent, np.searchsorted(ids, from_ids),
+               np.searchsorted(ids, to_ids))
+
+    return _components_record(context, ids, parent)
+
+
+@mgp.read_proc
+def get_graph_components(context: mgp.ProcCtx
+                         ) -> mgp.Record(
+                             n_components=int,
+                             components=mgp.List[mgp.List[mgp.Vertex]]):
+    '''
+    This procedure finds weakly connected components of the whole graph.
+
+    It returns the same fields as `get_components`, but reads the graph
+    directly instead of taking lists of vertices and edges, so there is no
+    need to collect them first. The adjacency is exported for a chunk of
+    the vertices at a time, so only the IDs of the vertices and the edges of
+    one chunk are held in memory at once.
+
+    For example, the weakly connected components of the graph can be obtained
+    using the following openCypher query:
+
+    CALL wcc.get_graph_components() YIELD *
+    RETURN n_components, components;
+    '''
+    # The neighbours of the rows of each chunk are given by their positions
+    # among all of the vertices, in the order of the IDs.
+    ids = np.asarray(context.graph.vertex_ids())
+    parent = np.arange(len(ids))
+    for start in range(0, len(ids), _CHUNK_SIZE):
+        adjacency = context.graph.adjacency(start=start,
+                                            stop=start + _CHUNK_SIZE)
+        indptr = np.asarray(adjacency.indptr)
+        sources = start + np.repeat(np.arange(len(indptr) - 1),
+                                    np.diff(indptr))
+        _union(parent, sources, np.asarray(adjacency.indices))
+
+    return _components_record(context, ids, parent)
+
+
+def _vertex_ids(vertices) -> np.ndarray:
+    # NOTE: The lists are lazy within Memgraph, which gives the IDs without
+    # creating any vertex objects, and plain lists in the mock API.
+    if hasattr(vertices, 'vertex_ids'):
+        return np.asarray(vertices.vertex_ids(), dtype=np.int64)
+    return np.fromiter((v.id for v in vertices), dtype=np.int64,
+                       count=len(vertices))
+
+
+def _edge_endpoint_chunks(edges):
+    '''Yields the IDs of the endpoints of the edges, a chunk at a time.'''
+    for start in range(0, len(edges), _CHUNK_SIZE):
+        stop = min(start + _CHUNK_SIZE, len(edges))
+        if hasattr(edges, 'edge_endpoints'):
+            from_ids, to_ids = edges.edge_endpoints(start, stop)
+            yield (np.asarray(from_ids, dtype=np.int64),
+                   np.asarray(to_ids, dtype=np.int64))
+        else:
+            chunk = edges[start:stop]
+            yield (np.fromiter((e.from_vertex.id for e in chunk),
+                               dtype=np.int64, count=len(chunk)),
+                   np.fromiter((e.to_vertex.id for e in chunk),
+                               dtype=np.int64, count=len(chunk)))
+
+
+def _find(parent: np.ndarray, x: np.ndarray) -> np.ndarray:
+    '''Returns the roots of the trees of the positions in `x`, and points the
+       positions directly at them.'''
+    roots = parent[x]
+    for _ in range(_MAX_FIND_STEPS):
+        grandparents = parent[roots]
+        if np.array_equal(grandparents, roots):
+            parent[x] = roots
+            return roots
+        roots = grandparents
+    # Following the parents one step at a time would take too long in deep
+    # trees, e.g. of long paths, so all of the trees are flattened instead.
+    _flatten(parent)
+    return parent[x]
+
+
+def _flatten(parent: np.ndarray) -> None:
+    '''Points every position directly at the root of its tree.'''
+    while True:
+        grandparents = parent[parent]
+        if np.array_equal(grandparents, parent):
+            return
+        parent[:] = grandparents
+
+
+def _union(parent: np.ndarray, u: np.ndarray, v: np.ndarray) -> None:
+    '''Merges the trees of each pair of positions in `u` and `v`.'''
+    while len(u):
+        u_roots, v_roots = _find(parent, u), _find(parent, v)
+        unmerged = u_roots != v_roots
+        u, v = u[unmerged], v[unmerged]
+        u_roots, v_roots = u_roots[unmerged], v_roots[unmerged]
+        # Roots are always pointed at smaller positions, so no cycles are
+        # made. A root paired with several others is pointed at the smallest
+        # of them, and the remaining pairs are merged in the next round.
+        np.minimum.at(parent, np.maximum(u_roots, v_roots),
+                      np.minimum(u_roots, v_roots))
 
-    components = [list(wcc) for wcc in nx.weakly_connected_components(g)]
 
+def _components_record(context: mgp.ProcCtx, ids: np.ndarray,
+                       parent: np.ndarray) -> mgp.Record:
+    _flatten(parent)
+    order = np.argsort(parent, kind='stable')
+    bounds = np.flatnonzero(np.diff(parent[order])) + 1
+    vertex = context.graph.get_vertex_by_id
+    components = [[vertex(vertex_id) for vertex_id in component.tolist()]
+                  for component in np.split(ids[order], bounds)
+                  if len(component)]
     return mgp.Record(n_components=len(components), components=components)
@@ -107,6 +107,9 @@ class Message:
     def key() -> bytes:  # type: ignore
         pass
 
+    def key_view() -> memoryview:  # type: ignore
+        pass
+
     def timestamp() -> int:  # type: ignore
         pass
 
@@ -116,6 +119,9 @@ class Message:
     def payload() -> bytes:  # type: ignore
         pass
 
+    def payload_view() -> memoryview:  # type: ignore
+        pass
+
 
 class Messages:
     def is_valid() -> bool:  # type: ignore
@@ -127,6 +133,43 @@ class Messages:
     def total_messages() -> int:  # type: ignore
         pass
 
+    def payload_views() -> list:  # type: ignore
+        pass
+
+
+class LazyList:
+    def is_valid() -> bool:  # type: ignore
+        pass
+
+    def size() -> int:  # type: ignore
+        pass
+
+    def at(self, index: int) -> Any:  # type: ignore
+        pass
+
+    def vertex_ids() -> Any:  # type: ignore
+        pass
+
+    def edge_ids() -> Any:  # type: ignore
+        pass
+
+    def edge_endpoints(self, start: int, stop: int) -> Any:  # type: ignore
+        pass
+
+
+class LazyMap:
+    def is_valid() -> bool:  # type: ignore
+        pass
+
+    def size() -> int:  # type: ignore
+        pass
+
+    def keys() -> tuple:  # type: ignore
+        pass
+
+    def at(self, key: str) -> Any:  # type: ignore
+        pass
+
 
 class UnknownError(Exception):
     pass
@@ -241,13 +284,29 @@ def type_any():
     pass
 
 
+def track_memory(size: int) -> bool:  # type: ignore
+    pass
+
+
+def untrack_memory(size: int):  # type: ignore
+    pass
+
+
 class _MODULE:
     @staticmethod
-    def add_read_procedure(wrapper):
+    def add_read_procedure(wrapper, lazy_args=False):
+        pass
+
+    @staticmethod
+    def add_write_procedure(wrapper, lazy_args=False):
+        pass
+
+    @staticmethod
+    def add_generator_read_procedure(wrapper):
         pass
 
     @staticmethod
-    def add_write_procedure(wrapper):
+    def add_generator_write_procedure(wrapper):
         pass
 
     @staticmethod
@@ -255,7 +314,7 @@ class _MODULE:
         pass
 
     @staticmethod
-    def add_function(wrapper):
+    def add_function(wrapper, vectorized=False):
         pass
 
 
@@ -276,6 +276,7 @@ void InMemoryReplicationHandlers::SnapshotHandler(dbms::DbmsHandler *dbms_handle
   // Clear the database
   storage->vertices_.clear();
   storage->edges_.clear();
+  storage->graph_generation_.fetch_add(1, std::memory_order_acq_rel);
 
   storage->constraints_.existence_constraints_ = std::make_unique<storage::ExistenceConstraints>();
   storage->constraints_.unique_constraints_ = std::make_unique<storage::InMemoryUniqueConstraints>();
@@ -361,6 +362,7 @@ void InMemoryReplicationHandlers::ForceResetStorageHandler(dbms::DbmsHandler *db
   // Clear the database
   storage->vertices_.clear();
   storage->edges_.clear();
+  storage->graph_generation_.fetch_add(1, std::memory_order_acq_rel);
   storage->commit_log_.reset();
   storage->commit_log_.emplace();
 
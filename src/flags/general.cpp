@@ -68,7 +68,9 @@ DEFINE_VALIDATED_uint64(storage_gc_cycle_sec, 30, "Storage garbage collector int
                         FLAG_IN_RANGE(1, 24UL * 3600));
 // NOLINTNEXTLINE(cppcoreguidelines-avoid-non-const-global-variables)
 DEFINE_VALIDATED_uint64(storage_python_gc_cycle_sec, 180,
-                        "Storage python full garbage collection interval (in seconds).", FLAG_IN_RANGE(1, 24UL * 3600));
+                        "Maximum interval between python full garbage collections (in seconds). Full collections run "
+                        "earlier if enough memory was allocated by Python.",
+                        FLAG_IN_RANGE(1, 24UL * 3600));
 // NOTE: The `storage_properties_on_edges` flag must be the same here and in
 // `mg_import_csv`. If you change it, make sure to change it there as well.
 // NOLINTNEXTLINE(cppcoreguidelines-avoid-non-const-global-variables)
@@ -148,6 +150,12 @@ DEFINE_uint32(
     stream_transaction_retry_interval, 500,
     "Retry interval in milliseconds when a stream transformation fails to commit because of conflicting transactions");
 // NOLINTNEXTLINE (cppcoreguidelines-avoid-non-const-global-variables)
+DEFINE_bool(stream_pipelined_consumption, false,
+            "Set to true to transform the next batch of a Kafka stream while the queries of the current batch are "
+            "executed. The offsets of the batches are still committed in order. A transformation then doesn't see the "
+            "changes made by the queries of the previous batch, so enable it only for transformations which don't read "
+            "the graph.");
+// NOLINTNEXTLINE (cppcoreguidelines-avoid-non-const-global-variables)
 DEFINE_string(kafka_bootstrap_servers, "",
               "List of default Kafka brokers as a comma separated list of broker host or host:port.");
 
@@ -182,6 +190,11 @@ auto memgraph::flags::ParseQueryModulesDirectory() -> std::vector<std::filesyste
   return query_modules_directories;
 }
 
+// NOLINTNEXTLINE (cppcoreguidelines-avoid-non-const-global-variables)
+DEFINE_bool(query_modules_lazy_loading, false,
+            "Import Python query modules on the first call of one of their procedures, transformations or functions "
+            "instead of at startup. The signatures of the modules are cached in the data directory.");
+
 // NOLINTNEXTLINE (cppcoreguidelines-avoid-non-const-global-variables)
 DEFINE_string(query_callable_mappings_path, "",
               "The path to mappings that describes aliases to callables in cypher queries in the form of key-value "
@@ -1,4 +1,4 @@
-// Copyright 2023 Memgraph Ltd.
+// Copyright 2024 Memgraph Ltd.
 //
 // Use of this software is governed by the Business Source License
 // included in the file licenses/BSL.txt; by using this file, you agree to be bound by the terms of the Business Source
@@ -22,6 +22,7 @@
 
 #include <utils/event_counter.hpp>
 #include <utils/event_gauge.hpp>
+#include "query/procedure/callable_profiles.hpp"
 #include "storage/v2/storage.hpp"
 #include "utils/event_histogram.hpp"
 
@@ -44,6 +45,9 @@ struct MetricsResponse {
   // Storage of all the percentile values across the histograms in the system
   // e.g. query latency percentiles, snapshot recovery duration percentiles, etc.
   std::vector<std::tuple<std::string, std::string, uint64_t>> event_histograms{};
+
+  // Runtime statistics of the procedures and functions of query modules
+  nlohmann::json query_module_profiles{};
 };
 
 class MetricsService {
@@ -68,7 +72,8 @@ class MetricsService {
                            .disk_usage = info.disk_usage,
                            .event_counters = GetEventCounters(),
                            .event_gauges = GetEventGauges(),
-                           .event_histograms = GetEventHistograms()};
+                           .event_histograms = GetEventHistograms(),
+                           .query_module_profiles = GetQueryModuleProfiles()};
   }
 
   nlohmann::json AsJson(MetricsResponse response) {
@@ -93,6 +98,8 @@ class MetricsService {
       metrics_response[type][name] = value;
     }
 
+    metrics_response["QueryModules"] = std::move(response.query_module_profiles);
+
     return metrics_response;
   }
 
@@ -139,6 +146,24 @@ class MetricsService {
 
     return event_histograms;
   }
+
+  inline static nlohmann::json GetQueryModuleProfiles() {
+    auto profiles = nlohmann::json::object();
+    query::procedure::gCallableProfiles.ForEach(
+        [&profiles](const std::string &name, const query::procedure::CallableProfile &profile) {
+          auto &profile_json = profiles[name];
+          profile_json["calls"] = profile.calls.load(std::memory_order_acquire);
+          profile_json["rows"] = profile.rows.load(std::memory_order_acquire);
+          profile_json["wall_time_us"] = profile.wall_time_us.load(std::memory_order_acquire);
+          for (auto &[percentile, value] : profile.wall_time_histogram.YieldPercentiles()) {
+            profile_json["wall_time_p" + std::to_string(percentile) + "_us"] = value;
+          }
+          profile_json["gil_time_us"] = profile.gil_time_us.load(std::memory_order_acquire);
+          profile_json["allocated_bytes"] = profile.allocated_bytes.load(std::memory_order_acquire);
+          profile_json["api_calls"] = profile.api_calls.load(std::memory_order_acquire);
+        });
+    return profiles;
+  }
 };
 
 // TODO: Should this be inside Database?
@@ -13,7 +13,9 @@
 
 #include <algorithm>
 #include <chrono>
+#include <future>
 #include <iterator>
+#include <map>
 #include <memory>
 #include <unordered_set>
 
@@ -88,8 +90,10 @@ void CheckAndDestroyLastAssignmentIfNeeded(RdKafka::KafkaConsumer &consumer, con
 }
 
 void TryToConsumeBatch(RdKafka::KafkaConsumer &consumer, const ConsumerInfo &info,
-                       const ConsumerFunction &consumer_function, const std::vector<Message> &batch) {
-  consumer_function(batch);
+                       const PipelinedConsumerFunction &consumer_function, const std::vector<Message> &batch) {
+  if (auto second_stage = consumer_function(batch)) {
+    second_stage();
+  }
   std::vector<RdKafka::TopicPartition *> partitions;
   utils::OnScopeExit clear_partitions([&]() { RdKafka::TopicPartition::destroy(partitions); });
 
@@ -105,6 +109,40 @@ void TryToConsumeBatch(RdKafka::KafkaConsumer &consumer, const ConsumerInfo &inf
     throw ConsumerCommitFailedException(info.consumer_name, RdKafka::err2str(err));
   }
 }
+
+// The offsets to commit by topic and partition.
+using BatchOffsets = std::map<std::pair<std::string, int32_t>, int64_t>;
+
+// The committed offset is the offset of the next message to consume, so the consumer position can't be used when the
+// following batches were already fetched.
+BatchOffsets GetBatchOffsets(const std::vector<Message> &batch) {
+  BatchOffsets offsets;
+  for (const auto &message : batch) {
+    auto &offset = offsets[{std::string{message.TopicName()}, message.Partition()}];
+    offset = std::max(offset, message.Offset() + 1);
+  }
+  return offsets;
+}
+
+void CommitBatchOffsets(RdKafka::KafkaConsumer &consumer, const ConsumerInfo &info, const BatchOffsets &offsets) {
+  std::vector<RdKafka::TopicPartition *> partitions;
+  utils::OnScopeExit clear_partitions([&]() { RdKafka::TopicPartition::destroy(partitions); });
+  partitions.reserve(offsets.size());
+  for (const auto &[topic_partition, offset] : offsets) {
+    partitions.push_back(RdKafka::TopicPartition::create(topic_partition.first, topic_partition.second, offset));
+  }
+  if (const auto err = consumer.commitSync(partitions); err != RdKafka::ERR_NO_ERROR) {
+    throw ConsumerCommitFailedException(info.consumer_name, RdKafka::err2str(err));
+  }
+}
+
+PipelinedConsumerFunction ToPipelinedConsumerFunction(ConsumerFunction consumer_function) {
+  MG_ASSERT(consumer_function, "Empty consumer function for Kafka consumer");
+  return [consumer_function = std::move(consumer_function)](const std::vector<Message> &batch) {
+    consumer_function(batch);
+    return std::function<void()>{};
+  };
+}
 }  // namespace
 
 Message::Message(std::unique_ptr<RdKafka::Message> &&message) : message_{std::move(message)} {
@@ -139,8 +177,22 @@ int64_t Message::Offset() const {
   return c_message->offset;
 }
 
+int32_t Message::Partition() const {
+  const auto *c_message = message_->c_ptr();
+  return c_message->partition;
+}
+
 Consumer::Consumer(ConsumerInfo info, ConsumerFunction consumer_function)
-    : info_{std::move(info)}, consumer_function_(std::move(consumer_function)), cb_(info_.consumer_name) {
+    : Consumer(std::move(info), ToPipelinedConsumerFunction(std::move(consumer_function)), false) {}
+
+Consumer::Consumer(ConsumerInfo info, PipelinedConsumerFunction consumer_function)
+    : Consumer(std::move(info), std::move(consumer_function), true) {}
+
+Consumer::Consumer(ConsumerInfo info, PipelinedConsumerFunction consumer_function, bool is_pipelined)
+    : info_{std::move(info)},
+      consumer_function_(std::move(consumer_function)),
+      is_pipelined_(is_pipelined),
+      cb_(info_.consumer_name) {
   MG_ASSERT(consumer_function_, "Empty consumer function for Kafka consumer");
   // NOLINTNEXTLINE (modernize-use-nullptr)
   if (info_.batch_interval < kMinimumInterval) {
@@ -394,6 +446,12 @@ void Consumer::StartConsuming() {
 
     utils::ThreadSetName(full_thread_name.substr(0, kMaxThreadNameSize));
 
+    if (is_pipelined_) {
+      ConsumePipelined();
+      is_running_.store(false);
+      return;
+    }
+
     while (is_running_) {
       auto maybe_batch = GetBatch(*consumer_, info_, is_running_);
       if (maybe_batch.HasError()) {
@@ -419,6 +477,53 @@ void Consumer::StartConsuming() {
   });
 }
 
+void Consumer::ConsumePipelined() {
+  // The batch in its second stage and the offsets to commit once it's done.
+  std::future<void> in_flight;
+  BatchOffsets in_flight_offsets;
+  const auto finish_in_flight = [&] {
+    if (!in_flight.valid()) return;
+    in_flight.get();
+    CommitBatchOffsets(*consumer_, info_, in_flight_offsets);
+    spdlog::info("Kafka consumer {} finished processing", info_.consumer_name);
+  };
+
+  while (is_running_) {
+    auto maybe_batch = GetBatch(*consumer_, info_, is_running_);
+    if (maybe_batch.HasError()) {
+      throw ConsumerReadMessagesFailedException(info_.consumer_name, maybe_batch.GetError());
+    }
+    const auto &batch = maybe_batch.GetValue();
+
+    try {
+      if (batch.empty()) {
+        // Don't hold back the commit of the previous batch while there are no new messages.
+        finish_in_flight();
+        continue;
+      }
+
+      spdlog::info("Kafka consumer {} is processing a batch", info_.consumer_name);
+
+      auto second_stage = consumer_function_(batch);
+      auto offsets = GetBatchOffsets(batch);
+      finish_in_flight();
+      in_flight = std::async(std::launch::async, [second_stage = std::move(second_stage)] {
+        if (second_stage) second_stage();
+      });
+      in_flight_offsets = std::move(offsets);
+    } catch (const std::exception &e) {
+      spdlog::warn("Error happened in consumer {} while processing a batch: {}!", info_.consumer_name, e.what());
+      break;
+    }
+  }
+
+  try {
+    finish_in_flight();
+  } catch (const std::exception &e) {
+    spdlog::warn("Error happened in consumer {} while processing a batch: {}!", info_.consumer_name, e.what());
+  }
+}
+
 void Consumer::StartConsumingWithLimit(uint64_t limit_batches, std::optional<std::chrono::milliseconds> timeout) const {
   MG_ASSERT(!is_running_, "Cannot start already running consumer!");
 
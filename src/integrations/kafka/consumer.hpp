@@ -72,12 +72,20 @@ class Message final {
   /// Returns the offset of the message
   int64_t Offset() const;
 
+  /// Returns the partition of the message
+  int32_t Partition() const;
+
  private:
   std::unique_ptr<RdKafka::Message> message_;
 };
 
 using ConsumerFunction = std::function<void(const std::vector<Message> &)>;
 
+/// Processes a batch of messages in two stages. The function itself is the first stage, and it returns the second
+/// stage, or an empty function if there is nothing left to do. The second stage must not access the messages, because
+/// it runs while the next batch is fetched and goes through the first stage.
+using PipelinedConsumerFunction = std::function<std::function<void()>(const std::vector<Message> &)>;
+
 /// ConsumerInfo holds all the information necessary to create a Consumer.
 struct ConsumerInfo {
   std::string consumer_name;
@@ -101,6 +109,14 @@ class Consumer final : public RdKafka::EventCb {
   /// @throws ConsumerFailedToInitializeException if the consumer can't connect
   ///         to the Kafka endpoint.
   Consumer(ConsumerInfo info, ConsumerFunction consumer_function);
+
+  /// Creates a new consumer which overlaps the processing of consecutive batches. The second stage of a batch runs
+  /// on a separate thread while the next batch goes through the first stage. Only a single batch is in its second
+  /// stage at a time, and the offsets of the batches are committed in order once their second stage is done.
+  ///
+  /// @throws ConsumerFailedToInitializeException if the consumer can't connect
+  ///         to the Kafka endpoint.
+  Consumer(ConsumerInfo info, PipelinedConsumerFunction consumer_function);
   ~Consumer() override;
 
   Consumer(const Consumer &other) = delete;
@@ -162,9 +178,12 @@ class Consumer final : public RdKafka::EventCb {
   const ConsumerInfo &Info() const;
 
  private:
+  Consumer(ConsumerInfo info, PipelinedConsumerFunction consumer_function, bool is_pipelined);
+
   void event_cb(RdKafka::Event &event) override;
 
   void StartConsuming();
+  void ConsumePipelined();
   void StartConsumingWithLimit(uint64_t limit_batches, std::optional<std::chrono::milliseconds> timeout) const;
 
   void StopConsuming();
@@ -184,7 +203,8 @@ class Consumer final : public RdKafka::EventCb {
   };
 
   ConsumerInfo info_;
-  ConsumerFunction consumer_function_;
+  PipelinedConsumerFunction consumer_function_;
+  bool is_pipelined_;
   mutable std::atomic<bool> is_running_{false};
   mutable std::vector<RdKafka::TopicPartition *> last_assignment_;  // Protected by is_running_
   std::unique_ptr<RdKafka::KafkaConsumer, std::function<void(RdKafka::KafkaConsumer *)>> consumer_;
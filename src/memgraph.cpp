@@ -153,6 +153,8 @@ int main(int argc, char **argv) {
   Py_SetProgramName(program_name);
   PyImport_AppendInittab("_mgp", &memgraph::query::procedure::PyInitMgpModule);
   Py_InitializeEx(0 /* = initsigs */);
+  memgraph::query::procedure::InstallPyAllocatorHooks();
+  memgraph::query::procedure::PySetUpGarbageCollection();
   PyEval_InitThreads();
   Py_BEGIN_ALLOW_THREADS;
 
@@ -194,8 +196,9 @@ int main(int argc, char **argv) {
   }
 
   memgraph::utils::Scheduler python_gc_scheduler;
-  python_gc_scheduler.Run("Python GC", std::chrono::seconds(FLAGS_storage_python_gc_cycle_sec),
-                          [] { memgraph::query::procedure::PyCollectGarbage(); });
+  python_gc_scheduler.Run("Python GC", std::chrono::seconds(1), [] {
+    memgraph::query::procedure::PyCollectGarbage(std::chrono::seconds(FLAGS_storage_python_gc_cycle_sec));
+  });
 
   // Initialize the communication library.
   memgraph::communication::SSLInit sslInit;
@@ -371,7 +374,8 @@ int main(int argc, char **argv) {
       .default_kafka_bootstrap_servers = FLAGS_kafka_bootstrap_servers,
       .default_pulsar_service_url = FLAGS_pulsar_service_url,
       .stream_transaction_conflict_retries = FLAGS_stream_transaction_conflict_retries,
-      .stream_transaction_retry_interval = std::chrono::milliseconds(FLAGS_stream_transaction_retry_interval)};
+      .stream_transaction_retry_interval = std::chrono::milliseconds(FLAGS_stream_transaction_retry_interval),
+      .stream_pipelined_consumption = FLAGS_stream_pipelined_consumption};
 
   auto auth_glue = [](memgraph::auth::SynchedAuth *auth, std::unique_ptr<memgraph::query::AuthQueryHandler> &ah,
                       std::unique_ptr<memgraph::query::AuthChecker> &ac) {
@@ -444,8 +448,8 @@ int main(int argc, char **argv) {
                                                            &replication_handler);
   MG_ASSERT(db_acc, "Failed to access the main database");
 
-  memgraph::query::procedure::gModuleRegistry.SetModulesDirectory(memgraph::flags::ParseQueryModulesDirectory(),
-                                                                  FLAGS_data_directory);
+  memgraph::query::procedure::gModuleRegistry.SetModulesDirectory(
+      memgraph::flags::ParseQueryModulesDirectory(), FLAGS_data_directory, FLAGS_query_modules_lazy_loading);
   memgraph::query::procedure::gModuleRegistry.UnloadAndLoadModulesFromDirectories();
   memgraph::query::procedure::gCallableAliasMapper.LoadMapping(FLAGS_query_callable_mappings_path);
 
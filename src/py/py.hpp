@@ -1,4 +1,4 @@
-// Copyright 2023 Memgraph Ltd.
+// Copyright 2024 Memgraph Ltd.
 //
 // Use of this software is governed by the Business Source License
 // included in the file licenses/BSL.txt; by using this file, you agree to be bound by the terms of the Business Source
@@ -48,6 +48,23 @@ class EnsureGIL final {
   EnsureGIL &operator=(EnsureGIL &&) = delete;
 };
 
+/// Release the GIL held by the current thread, so that other threads may run
+/// Python code until the GIL is reacquired on destruction.
+///
+/// You must *not* call Python C API, nor touch any `PyObject`, while the GIL
+/// is released.
+class ReleaseGIL final {
+  PyThreadState *thread_state_;
+
+ public:
+  ReleaseGIL() noexcept : thread_state_(PyEval_SaveThread()) {}
+  ~ReleaseGIL() noexcept { PyEval_RestoreThread(thread_state_); }
+  ReleaseGIL(const ReleaseGIL &) = delete;
+  ReleaseGIL(ReleaseGIL &&) = delete;
+  ReleaseGIL &operator=(const ReleaseGIL &) = delete;
+  ReleaseGIL &operator=(ReleaseGIL &&) = delete;
+};
+
 /// Owns a `PyObject *` and supports a more C++ idiomatic API to objects.
 class [[nodiscard]] Object final {
   PyObject *ptr_{nullptr};
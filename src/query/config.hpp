@@ -30,5 +30,6 @@ struct InterpreterConfig {
   std::string default_pulsar_service_url;
   uint32_t stream_transaction_conflict_retries;
   std::chrono::milliseconds stream_transaction_retry_interval;
+  bool stream_pipelined_consumption{false};
 };
 }  // namespace memgraph::query
@@ -691,6 +691,8 @@ class DbAccessor final {
 
   const std::string &id() const { return accessor_->id(); }
 
+  std::optional<storage::GraphVersion> GetGraphVersion() const { return accessor_->GetGraphVersion(); }
+
   utils::BasicResult<storage::StorageIndexDefinitionError, void> CreateIndex(storage::LabelId label) {
     return accessor_->CreateIndex(label);
   }
@@ -1308,6 +1308,8 @@ class Function : public memgraph::query::Expression {
   std::vector<memgraph::query::Expression *> arguments_;
   std::string function_name_;
   std::function<TypedValue(const TypedValue *, int64_t, const FunctionContext &)> function_;
+  /// Computes the function for several rows at once, if it's vectorized.
+  std::function<TypedValue(const TypedValue *, int64_t, int64_t, const FunctionContext &)> vectorized_function_;
 
   Function *Clone(AstStorage *storage) const override {
     Function *object = storage->Create<Function>();
@@ -1317,12 +1319,16 @@ class Function : public memgraph::query::Expression {
     }
     object->function_name_ = function_name_;
     object->function_ = function_;
+    object->vectorized_function_ = vectorized_function_;
     return object;
   }
 
  protected:
   Function(const std::string &function_name, const std::vector<Expression *> &arguments)
-      : arguments_(arguments), function_name_(function_name), function_(NameToFunction(function_name_)) {
+      : arguments_(arguments),
+        function_name_(function_name),
+        function_(NameToFunction(function_name_)),
+        vectorized_function_(NameToVectorizedFunction(function_name_)) {
     if (!function_) {
       throw SemanticException("Function '{}' doesn't exist.", function_name);
     }
@@ -22,6 +22,7 @@
 
 #include "query/db_accessor.hpp"
 #include "query/exceptions.hpp"
+#include "query/procedure/callable_profiles.hpp"
 #include "query/procedure/cypher_types.hpp"
 #include "query/procedure/mg_procedure_impl.hpp"
 #include "query/procedure/module.hpp"
@@ -1287,49 +1288,93 @@ TypedValue Duration(const TypedValue *args, int64_t nargs, const FunctionContext
   return TypedValue(utils::Duration(duration_parameters), ctx.memory);
 }
 
-std::function<TypedValue(const TypedValue *, const int64_t, const FunctionContext &)> UserFunction(
-    const mgp_func &func, const std::string &fully_qualified_name) {
-  return [func, fully_qualified_name](const TypedValue *args, int64_t nargs, const FunctionContext &ctx) -> TypedValue {
-    /// Find function is called to acquire the lock on Module pointer while user-defined function is executed
-    const auto &maybe_found =
-        procedure::FindFunction(procedure::gModuleRegistry, fully_qualified_name, utils::NewDeleteResource());
-    if (!maybe_found) {
-      throw QueryRuntimeException(
-          "Function '{}' has been unloaded. Please check query modules to confirm that function is loaded in Memgraph.",
-          fully_qualified_name);
-    }
-    /// Explicit extraction of module pointer, to clearly state that the lock is acquired.
-    // NOLINTNEXTLINE(clang-diagnostic-unused-variable)
-    const auto &module_ptr = (*maybe_found).first;
+// Call `func` with the arguments which `construct_arguments` adds to the list,
+// and return its result.
+TypedValue CallUserFunction(const mgp_func &func, const std::string &fully_qualified_name,
+                            procedure::CallableProfile *profile, const FunctionContext &ctx, const uint64_t rows,
+                            const std::function<void(mgp_list &, mgp_graph &)> &construct_arguments) {
+  /// Find function is called to acquire the lock on Module pointer while user-defined function is executed
+  const auto &maybe_found =
+      procedure::FindFunction(procedure::gModuleRegistry, fully_qualified_name, utils::NewDeleteResource());
+  if (!maybe_found) {
+    throw QueryRuntimeException(
+        "Function '{}' has been unloaded. Please check query modules to confirm that function is loaded in Memgraph.",
+        fully_qualified_name);
+  }
+  /// Explicit extraction of module pointer, to clearly state that the lock is acquired.
+  // NOLINTNEXTLINE(clang-diagnostic-unused-variable)
+  const auto &module_ptr = (*maybe_found).first;
+
+  const auto &func_cb = func.cb;
+  procedure::CallCountingResource call_counting_resource{ctx.memory};
+  mgp_memory memory{&call_counting_resource};
+  mgp_func_context functx{ctx.db_accessor, ctx.view};
+  auto graph = mgp_graph::NonWritableGraph(*ctx.db_accessor, ctx.view);
+
+  auto function_argument_list = mgp_list(ctx.memory);
+  construct_arguments(function_argument_list, graph);
+
+  mgp_func_result maybe_res;
+  {
+    procedure::ProfiledCall profiled_call(*profile);
+    func_cb(&function_argument_list, &functx, &maybe_res, &memory);
+    if (maybe_res.value) profiled_call.AddRows(rows);
+  }
+  if (maybe_res.error_msg) {
+    throw QueryRuntimeException(*maybe_res.error_msg);
+  }
+
+  if (!maybe_res.value) {
+    throw QueryRuntimeException(
+        "Function '{}' didn't set the result nor the error message. Please either set the result by using "
+        "mgp_func_result_set_value or the error by using mgp_func_result_set_error_msg.",
+        fully_qualified_name);
+  }
 
-    const auto &func_cb = func.cb;
-    mgp_memory memory{ctx.memory};
-    mgp_func_context functx{ctx.db_accessor, ctx.view};
-    auto graph = mgp_graph::NonWritableGraph(*ctx.db_accessor, ctx.view);
+  TypedValue result{*(maybe_res.value), ctx.memory};
+  if (func.is_vectorized && (!result.IsList() || result.ValueList().size() != rows)) {
+    throw QueryRuntimeException("Vectorized function '{}' has to return a list with a result for each of the {} rows.",
+                                fully_qualified_name, rows);
+  }
+  return result;
+}
 
+std::function<TypedValue(const TypedValue *, const int64_t, const FunctionContext &)> UserFunction(
+    const mgp_func &func, const std::string &fully_qualified_name) {
+  // Profiles are never removed, so it's looked up only once.
+  auto *profile = &procedure::gCallableProfiles.Get(fully_qualified_name);
+  return [func, fully_qualified_name, profile](const TypedValue *args, int64_t nargs,
+                                               const FunctionContext &ctx) -> TypedValue {
     std::vector<TypedValue> args_list;
     args_list.reserve(nargs);
-    for (std::size_t i = 0; i < nargs; ++i) {
-      args_list.emplace_back(args[i]);
-    }
-
-    auto function_argument_list = mgp_list(ctx.memory);
-    procedure::ConstructArguments(args_list, func, fully_qualified_name, function_argument_list, graph);
-
-    mgp_func_result maybe_res;
-    func_cb(&function_argument_list, &functx, &maybe_res, &memory);
-    if (maybe_res.error_msg) {
-      throw QueryRuntimeException(*maybe_res.error_msg);
+    if (!func.is_vectorized) {
+      for (std::size_t i = 0; i < nargs; ++i) {
+        args_list.emplace_back(args[i]);
+      }
+      return CallUserFunction(func, fully_qualified_name, profile, ctx, 1, [&](mgp_list &list, mgp_graph &graph) {
+        procedure::ConstructArguments(args_list, func, fully_qualified_name, list, graph);
+      });
     }
-
-    if (!maybe_res.value) {
-      throw QueryRuntimeException(
-          "Function '{}' didn't set the result nor the error message. Please either set the result by using "
-          "mgp_func_result_set_value or the error by using mgp_func_result_set_error_msg.",
-          fully_qualified_name);
+    // Vectorized functions called outside of a batch get a batch of a single row.
+    for (std::size_t i = 0; i < nargs; ++i) {
+      args_list.emplace_back(TypedValue::TVector(1, args[i], ctx.memory), ctx.memory);
     }
+    auto result = CallUserFunction(func, fully_qualified_name, profile, ctx, 1, [&](mgp_list &list, mgp_graph &graph) {
+      procedure::ConstructVectorizedArguments(args_list, 1, func, fully_qualified_name, list, graph);
+    });
+    return {std::move(result.ValueList().front()), ctx.memory};
+  };
+}
 
-    return {*(maybe_res.value), ctx.memory};
+std::function<TypedValue(const TypedValue *, const int64_t, const int64_t, const FunctionContext &)>
+VectorizedUserFunction(const mgp_func &func, const std::string &fully_qualified_name) {
+  auto *profile = &procedure::gCallableProfiles.Get(fully_qualified_name);
+  return [func, fully_qualified_name, profile](const TypedValue *columns, int64_t nargs, int64_t num_rows,
+                                               const FunctionContext &ctx) -> TypedValue {
+    std::vector<TypedValue> columns_list(columns, columns + nargs);
+    return CallUserFunction(func, fully_qualified_name, profile, ctx, num_rows, [&](mgp_list &list, mgp_graph &graph) {
+      procedure::ConstructVectorizedArguments(columns_list, num_rows, func, fully_qualified_name, list, graph);
+    });
   };
 }
 
@@ -1432,4 +1477,16 @@ std::function<TypedValue(const TypedValue *, int64_t, const FunctionContext &ctx
   return nullptr;
 }
 
+std::function<TypedValue(const TypedValue *, int64_t, int64_t, const FunctionContext &ctx)> NameToVectorizedFunction(
+    const std::string &function_name) {
+  const auto &maybe_found =
+      procedure::FindFunction(procedure::gModuleRegistry, function_name, utils::NewDeleteResource());
+
+  if (maybe_found && (*maybe_found).second->is_vectorized) {
+    return VectorizedUserFunction(*(*maybe_found).second, function_name);
+  }
+
+  return nullptr;
+}
+
 }  // namespace memgraph::query
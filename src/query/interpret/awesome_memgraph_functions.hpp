@@ -47,4 +47,14 @@ struct FunctionContext {
 std::function<TypedValue(const TypedValue *arguments, int64_t num_arguments, const FunctionContext &context)>
 NameToFunction(const std::string &function_name);
 
+/// Return the implementation of the vectorized user-defined function with the
+/// given name, or nullptr if there's no such function.
+///
+/// The implementation computes the function for `num_rows` rows at once. Each
+/// of the arguments is a list of its values in those rows, and the result is
+/// a list of the results for those rows.
+std::function<TypedValue(const TypedValue *argument_columns, int64_t num_arguments, int64_t num_rows,
+                         const FunctionContext &context)>
+NameToVectorizedFunction(const std::string &function_name);
+
 }  // namespace memgraph::query
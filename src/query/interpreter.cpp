@@ -1512,6 +1512,13 @@ Callback HandleStreamQuery(StreamQuery *stream_query, const Parameters &paramete
       };
       notifications->emplace_back(SeverityLevel::INFO, NotificationCode::CHECK_STREAM,
                                   fmt::format("Checked stream {}.", stream_query->stream_name_));
+      if (interpreter_context->config.stream_pipelined_consumption) {
+        notifications->emplace_back(
+            SeverityLevel::INFO, NotificationCode::CHECK_STREAM,
+            "CHECK STREAM transforms the batches sequentially. With pipelined consumption, a started Kafka stream "
+            "transforms a batch while the queries of the previous batch are executed, so the transformation doesn't "
+            "see the changes made by those queries.");
+      }
       return callback;
     }
   }
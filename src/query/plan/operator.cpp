@@ -43,6 +43,7 @@
 #include "query/interpret/eval.hpp"
 #include "query/path.hpp"
 #include "query/plan/scoped_profile.hpp"
+#include "query/procedure/callable_profiles.hpp"
 #include "query/procedure/cypher_types.hpp"
 #include "query/procedure/mg_procedure_impl.hpp"
 #include "query/procedure/module.hpp"
@@ -2740,13 +2741,130 @@ std::vector<Symbol> Produce::OutputSymbols(const SymbolTable &symbol_table) cons
 
 std::vector<Symbol> Produce::ModifiedSymbols(const SymbolTable &table) const { return OutputSymbols(table); }
 
+namespace {
+
+// Number of rows for which a vectorized function is called at most at once.
+// Batches start with a single row and double up to this size, so the first
+// rows are produced right away.
+constexpr size_t kMaxVectorizedFunctionBatchSize{4096};
+
+const Function *VectorizedFunctionCall(const NamedExpression &named_expr) {
+  const auto *function = utils::Downcast<const Function>(named_expr.expression_);
+  return function && function->vectorized_function_ ? function : nullptr;
+}
+
+}  // namespace
+
 Produce::ProduceCursor::ProduceCursor(const Produce &self, utils::MemoryResource *mem)
-    : self_(self), input_cursor_(self_.input_->MakeCursor(mem)) {}
+    : self_(self), input_cursor_(self_.input_->MakeCursor(mem)), batch_(mem) {
+  for (size_t i = 0; i < self_.named_expressions_.size(); ++i) {
+    if (VectorizedFunctionCall(*self_.named_expressions_[i])) vectorized_positions_.push_back(i);
+  }
+}
+
+bool Produce::ProduceCursor::PullBatch(Frame &frame, ExecutionContext &context) {
+  if (!input_symbols_) input_symbols_ = self_.input_->ModifiedSymbols(context.symbol_table);
+  // Produce should always yield the latest results.
+  ExpressionEvaluator evaluator(&frame, context.symbol_table, context.evaluation_context, context.db_accessor,
+                                storage::View::NEW, context.frame_change_collector);
+  batch_size_ = 0;
+  batch_position_ = 0;
+  // All the other named expressions are evaluated while the row is on the
+  // frame, so only the vectorized calls see the state after the whole batch
+  // was pulled.
+  while (batch_size_ < max_batch_size_ && input_cursor_->Pull(frame, context)) {
+    if (batch_size_ == batch_.size()) batch_.emplace_back();
+    auto &row = batch_[batch_size_++];
+    row.clear();
+    for (const auto &symbol : *input_symbols_) row.emplace_back(frame[symbol]);
+    auto vectorized_it = vectorized_positions_.begin();
+    for (size_t i = 0; i < self_.named_expressions_.size(); ++i) {
+      auto *named_expr = self_.named_expressions_[i];
+      if (context.frame_change_collector && context.frame_change_collector->IsKeyTracked(named_expr->name_)) {
+        context.frame_change_collector->ResetTrackingValue(named_expr->name_);
+      }
+      if (vectorized_it != vectorized_positions_.end() && *vectorized_it == i) {
+        for (auto *argument : VectorizedFunctionCall(*named_expr)->arguments_) {
+          row.emplace_back(argument->Accept(evaluator));
+        }
+        // Placeholder for the result.
+        row.emplace_back();
+        ++vectorized_it;
+      } else {
+        row.emplace_back(named_expr->Accept(evaluator));
+      }
+    }
+  }
+  if (batch_size_ == 0) return false;
+  max_batch_size_ = std::min(max_batch_size_ * 2, kMaxVectorizedFunctionBatchSize);
+
+  auto &evaluation_context = context.evaluation_context;
+  auto *memory = evaluation_context.memory;
+  FunctionContext function_ctx{context.db_accessor, memory, evaluation_context.timestamp, &evaluation_context.counters,
+                               storage::View::NEW};
+  const bool is_transactional = storage::IsTransactional(context.db_accessor->GetStorageMode());
+  auto offset = input_symbols_->size();
+  auto vectorized_it = vectorized_positions_.begin();
+  for (size_t i = 0; i < self_.named_expressions_.size(); ++i) {
+    if (vectorized_it == vectorized_positions_.end() || *vectorized_it != i) {
+      ++offset;
+      continue;
+    }
+    ++vectorized_it;
+    const auto *function = VectorizedFunctionCall(*self_.named_expressions_[i]);
+    const auto num_arguments = function->arguments_.size();
+    TypedValue::TVector columns(memory);
+    columns.reserve(num_arguments);
+    for (size_t j = 0; j < num_arguments; ++j) {
+      TypedValue::TVector column(memory);
+      column.reserve(batch_size_);
+      for (size_t row = 0; row < batch_size_; ++row) column.emplace_back(batch_[row][offset + j]);
+      columns.emplace_back(std::move(column));
+    }
+    auto results = function->vectorized_function_(columns.data(), static_cast<int64_t>(num_arguments),
+                                                  static_cast<int64_t>(batch_size_), function_ctx);
+    auto &values = results.ValueList();
+    for (size_t row = 0; row < batch_size_; ++row) {
+      auto &result = batch_[row][offset + num_arguments];
+      if (!is_transactional && values[row].ContainsDeleted()) [[unlikely]] {
+        result = TypedValue();
+      } else {
+        result = std::move(values[row]);
+      }
+    }
+    offset += num_arguments + 1;
+  }
+  return true;
+}
 
 bool Produce::ProduceCursor::Pull(Frame &frame, ExecutionContext &context) {
   OOMExceptionEnabler oom_exception;
   SCOPED_PROFILE_OP_BY_REF(self_);
 
+  if (!vectorized_positions_.empty()) {
+    if (batch_position_ == batch_size_ && !PullBatch(frame, context)) return false;
+    auto value_it = batch_[batch_position_++].begin();
+    for (const auto &symbol : *input_symbols_) {
+      if (context.frame_change_collector && context.frame_change_collector->IsKeyTracked(symbol.name())) {
+        context.frame_change_collector->ResetTrackingValue(symbol.name());
+      }
+      frame[symbol] = *value_it++;
+    }
+    auto vectorized_it = vectorized_positions_.begin();
+    for (size_t i = 0; i < self_.named_expressions_.size(); ++i) {
+      auto *named_expr = self_.named_expressions_[i];
+      if (context.frame_change_collector && context.frame_change_collector->IsKeyTracked(named_expr->name_)) {
+        context.frame_change_collector->ResetTrackingValue(named_expr->name_);
+      }
+      if (vectorized_it != vectorized_positions_.end() && *vectorized_it == i) {
+        value_it += static_cast<int64_t>(VectorizedFunctionCall(*named_expr)->arguments_.size());
+        ++vectorized_it;
+      }
+      frame[context.symbol_table.at(*named_expr)] = *value_it++;
+    }
+    return true;
+  }
+
   if (input_cursor_->Pull(frame, context)) {
     // Produce should always yield the latest results.
     ExpressionEvaluator evaluator(&frame, context.symbol_table, context.evaluation_context, context.db_accessor,
@@ -2764,7 +2882,12 @@ bool Produce::ProduceCursor::Pull(Frame &frame, ExecutionContext &context) {
 
 void Produce::ProduceCursor::Shutdown() { input_cursor_->Shutdown(); }
 
-void Produce::ProduceCursor::Reset() { input_cursor_->Reset(); }
+void Produce::ProduceCursor::Reset() {
+  input_cursor_->Reset();
+  batch_size_ = 0;
+  batch_position_ = 0;
+  max_batch_size_ = 1;
+}
 
 Delete::Delete(const std::shared_ptr<LogicalOperator> &input_, const std::vector<Expression *> &expressions,
                bool detach_)
@@ -4868,38 +4991,81 @@ std::unordered_map<std::string, int64_t> CallProcedure::GetAndResetCounters() {
 
 namespace {
 
+// Owns the projected graph a procedure is called with. Lazily evaluated
+// procedure calls keep it alive for as long as their stream exists.
+struct ProjectedGraph {
+  ProjectedGraph(query::Graph graph, DbAccessor &db_accessor)
+      : graph(std::move(graph)), db_accessor(db_accessor, &this->graph) {}
+
+  query::Graph graph;
+  query::SubgraphDbAccessor db_accessor;
+};
+
 void CallCustomProcedure(const std::string_view fully_qualified_procedure_name, const mgp_proc &proc,
                          const std::vector<Expression *> &args, mgp_graph &graph, ExpressionEvaluator *evaluator,
                          utils::MemoryResource *memory, std::optional<size_t> memory_limit, mgp_result *result,
-                         int64_t procedure_id, uint64_t transaction_id, const bool call_initializer = false) {
+                         int64_t procedure_id, uint64_t transaction_id, const bool call_initializer = false,
+                         std::optional<mgp_proc_stream> *stream = nullptr) {
   static_assert(std::uses_allocator_v<mgp_value, utils::Allocator<mgp_value>>,
                 "Expected mgp_value to use custom allocator and makes STL "
                 "containers aware of that");
-  // Build and type check procedure arguments.
+  // Lazily evaluated procedure calls consume their arguments only once, when
+  // the stream is started. Afterwards we only pull the next batch of results.
+  const bool is_streaming = stream != nullptr && proc.stream_factory;
+  const bool is_stream_started = is_streaming && stream->has_value();
   mgp_list proc_args(memory);
-  std::vector<TypedValue> args_list;
-  args_list.reserve(args.size());
-  for (auto *expression : args) {
-    args_list.emplace_back(expression->Accept(*evaluator));
-  }
-  std::optional<query::Graph> subgraph;
-  std::optional<query::SubgraphDbAccessor> db_acc;
+  std::shared_ptr<ProjectedGraph> projected_graph;
+  if (!is_stream_started) {
+    // Build and type check procedure arguments.
+    std::vector<TypedValue> args_list;
+    args_list.reserve(args.size());
+    for (auto *expression : args) {
+      args_list.emplace_back(expression->Accept(*evaluator));
+    }
 
-  if (!args_list.empty() && args_list.front().type() == TypedValue::Type::Graph) {
-    auto subgraph_value = args_list.front().ValueGraph();
-    subgraph = query::Graph(std::move(subgraph_value), subgraph_value.GetMemoryResource());
-    args_list.erase(args_list.begin());
+    if (!args_list.empty() && args_list.front().type() == TypedValue::Type::Graph) {
+      auto subgraph_value = args_list.front().ValueGraph();
+      args_list.erase(args_list.begin());
 
-    db_acc = query::SubgraphDbAccessor(*std::get<query::DbAccessor *>(graph.impl), &*subgraph);
-    graph.impl = &*db_acc;
-  }
+      projected_graph =
+          std::make_shared<ProjectedGraph>(std::move(subgraph_value), *std::get<query::DbAccessor *>(graph.impl));
+      graph.impl = &projected_graph->db_accessor;
+    }
 
-  procedure::ConstructArguments(args_list, proc, fully_qualified_procedure_name, proc_args, graph);
+    procedure::ConstructArguments(args_list, proc, fully_qualified_procedure_name, proc_args, graph);
+  }
+  procedure::ProfiledCall profiled_call(procedure::gCallableProfiles.Get(fully_qualified_procedure_name),
+                                        !is_stream_started);
+  utils::OnScopeExit count_rows{[&] { profiled_call.AddRows(result->rows.size()); }};
   if (call_initializer) {
     MG_ASSERT(proc.initializer);
     mgp_memory initializer_memory{memory};
     proc.initializer.value()(&proc_args, &graph, &initializer_memory);
   }
+  if (is_streaming && !is_stream_started) {
+    mgp_memory stream_memory{memory};
+    auto pull = proc.stream_factory.value()(&proc_args, &graph, &stream_memory);
+    if (projected_graph) {
+      stream->emplace(
+          [projected_graph, pull = std::move(pull)](mgp_graph *graph, mgp_result *result, mgp_memory *memory) {
+            graph->impl = &projected_graph->db_accessor;
+            pull(graph, result, memory);
+          });
+    } else {
+      stream->emplace(std::move(pull));
+    }
+  }
+
+  auto invoke_procedure = [&](mgp_memory *proc_memory) {
+    MG_ASSERT(result->signature == &proc.results);
+    // TODO: What about cross library boundary exceptions? OMG C++?!
+    if (is_streaming) {
+      stream->value()(&graph, result, proc_memory);
+    } else {
+      proc.cb(&proc_args, &graph, result, proc_memory);
+    }
+  };
+
   if (memory_limit) {
     SPDLOG_INFO("Running '{}' with memory limit of {}", fully_qualified_procedure_name,
                 utils::GetReadableSize(*memory_limit));
@@ -4909,6 +5075,7 @@ void CallCustomProcedure(const std::string_view fully_qualified_procedure_name,
     // immediately, so we want to give user info on leak still
     // considering our allocations
     utils::MemoryTrackingResource memory_tracking_resource{memory, *memory_limit};
+    procedure::CallCountingResource call_counting_resource{&memory_tracking_resource};
     // if we are already tracking, no harm no faul
     // if we are not tracking, we need to start now, with unlimited memory
     // for query, but limited for procedure
@@ -4931,16 +5098,14 @@ void CallCustomProcedure(const std::string_view fully_qualified_procedure_name,
     // memory. Here we need to update tracking
     memgraph::memory::CreateOrContinueProcedureTracking(transaction_id, procedure_id, *memory_limit);
 
-    mgp_memory proc_memory{&memory_tracking_resource};
-    MG_ASSERT(result->signature == &proc.results);
+    mgp_memory proc_memory{&call_counting_resource};
 
     utils::OnScopeExit on_scope_exit{[transaction_id = transaction_id]() {
       memgraph::memory::StopTrackingCurrentThreadTransaction(transaction_id);
       memgraph::memory::PauseProcedureTracking(transaction_id);
     }};
 
-    // TODO: What about cross library boundary exceptions? OMG C++?!
-    proc.cb(&proc_args, &graph, result, &proc_memory);
+    invoke_procedure(&proc_memory);
 
     auto leaked_bytes = memory_tracking_resource.GetAllocatedBytes();
     if (leaked_bytes > 0U) {
@@ -4949,10 +5114,9 @@ void CallCustomProcedure(const std::string_view fully_qualified_procedure_name,
   } else {
     // TODO: Add a tracking MemoryResource without limits, so that we report
     // memory leaks in procedure.
-    mgp_memory proc_memory{memory};
-    MG_ASSERT(result->signature == &proc.results);
-    // TODO: What about cross library boundary exceptions? OMG C++?!
-    proc.cb(&proc_args, &graph, result, &proc_memory);
+    procedure::CallCountingResource call_counting_resource{memory};
+    mgp_memory proc_memory{&call_counting_resource};
+    invoke_procedure(&proc_memory);
   }
 }
 
@@ -4967,6 +5131,8 @@ class CallProcedureCursor : public Cursor {
   bool stream_exhausted{true};
   bool call_initializer{false};
   std::optional<std::function<void()>> cleanup_{std::nullopt};
+  // Results of the current call of a lazily evaluated procedure.
+  std::optional<mgp_proc_stream> stream_{std::nullopt};
 
  public:
   CallProcedureCursor(const CallProcedure *self, utils::MemoryResource *mem)
@@ -5022,6 +5188,7 @@ class CallProcedureCursor : public Cursor {
       }
 
       if (stream_exhausted) {
+        stream_.reset();
         if (!input_cursor_->Pull(frame, context)) {
           if (proc->cleanup) {
             proc->cleanup.value()();
@@ -5051,16 +5218,16 @@ class CallProcedureCursor : public Cursor {
       result_->signature = &proc->results;
       result_->is_transactional = storage::IsTransactional(context.db_accessor->GetStorageMode());
 
-      // Use special memory as invoking procedure is complex
-      // TODO: This will probably need to be changed when we add support for
-      // generator like procedures which yield a new result on new query calls.
+      // Use special memory as invoking procedure is complex. Lazily evaluated
+      // procedures must not keep anything allocated here between batches,
+      // since the memory is released before each new batch.
       auto *memory = self_->memory_resource;
       auto memory_limit = EvaluateMemoryLimit(evaluator, self_->memory_limit_, self_->memory_scale_);
       auto graph = mgp_graph::WritableGraph(*context.db_accessor, graph_view, context);
       const auto transaction_id = context.db_accessor->GetTransactionId();
       MG_ASSERT(transaction_id.has_value());
       CallCustomProcedure(self_->procedure_name_, *proc, self_->arguments_, graph, &evaluator, memory, memory_limit,
-                          result_, self_->procedure_id_, transaction_id.value(), call_initializer);
+                          result_, self_->procedure_id_, transaction_id.value(), call_initializer, &stream_);
 
       if (call_initializer) call_initializer = false;
 
@@ -5073,12 +5240,13 @@ class CallProcedureCursor : public Cursor {
         memgraph::utils::MemoryTracker::OutOfMemoryExceptionBlocker blocker;
         throw QueryRuntimeException("{}: {}", self_->procedure_name_, *result_->error_msg);
       }
+      // An empty batch ends the stream, while a batch whose rows were all skipped because their values were deleted
+      // doesn't, so the next batch is pulled.
+      stream_exhausted = result_->rows.empty();
       result_row_it_ = result_->rows.begin();
       if (!result_->is_transactional) {
         skip_rows_with_deleted_values();
       }
-
-      stream_exhausted = result_row_it_ == result_->rows.end();
     }
 
     auto &values = result_row_it_->values;
@@ -5117,6 +5285,8 @@ class CallProcedureCursor : public Cursor {
     self_->monotonic_memory.Release();
     result_ =
         utils::Allocator<mgp_result>(self_->memory_resource).new_object<mgp_result>(nullptr, self_->memory_resource);
+    stream_.reset();
+    stream_exhausted = true;
     if (cleanup_) {
       cleanup_.value()();
     }
@@ -5124,6 +5294,7 @@ class CallProcedureCursor : public Cursor {
 
   void Shutdown() override {
     self_->monotonic_memory.Release();
+    stream_.reset();
     if (cleanup_) {
       cleanup_.value()();
     }
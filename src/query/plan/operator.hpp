@@ -1295,8 +1295,23 @@ class Produce : public memgraph::query::plan::LogicalOperator {
     void Reset() override;
 
    private:
+    /// Pull a batch of input rows and evaluate the named expressions for each
+    /// of them, then call each vectorized function once for the whole batch.
+    bool PullBatch(Frame &, ExecutionContext &);
+
     const Produce &self_;
     const UniqueCursorPtr input_cursor_;
+    /// Positions of the named expressions which are calls of vectorized
+    /// functions. Only those rows are batched.
+    std::vector<size_t> vectorized_positions_;
+    std::optional<std::vector<Symbol>> input_symbols_;
+    /// Values of the input symbols, followed by the value of each named
+    /// expression, for each of the batched rows. Vectorized function calls
+    /// store their arguments before the result.
+    utils::pmr::vector<utils::pmr::vector<TypedValue>> batch_;
+    size_t batch_size_{0};
+    size_t batch_position_{0};
+    size_t max_batch_size_{1};
   };
 };
 
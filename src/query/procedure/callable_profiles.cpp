@@ -0,0 +1,56 @@
+// Copyright 2024 Memgraph Ltd.
+//
+// Use of this software is governed by the Business Source License
+// included in the file licenses/BSL.txt; by using this file, you agree to be bound by the terms of the Business Source
+// License, and you may not use this file except in compliance with the Business Source License.
+//
+// As of the Change Date specified in that file, in accordance with
+// the Business Source License, use of this software will be governed
+// by the Apache License, Version 2.0, included in the file
+// licenses/APL.txt.
+
+#include "query/procedure/callable_profiles.hpp"
+
+#include <chrono>
+
+namespace memgraph::query::procedure {
+
+// NOLINTNEXTLINE(cppcoreguidelines-avoid-non-const-global-variables)
+CallableProfiles gCallableProfiles;
+
+ProfiledCall::ProfiledCall(CallableProfile &profile, bool is_new_call)
+    : profile_(&profile), is_new_call_(is_new_call), previous_counters_(current_call_counters) {
+  current_call_counters = &counters_;
+}
+
+ProfiledCall::~ProfiledCall() {
+  current_call_counters = previous_counters_;
+  const auto wall_time_us = static_cast<uint64_t>(timer_.Elapsed<std::chrono::microseconds>().count());
+  if (is_new_call_) profile_->calls.fetch_add(1, std::memory_order_relaxed);
+  profile_->rows.fetch_add(rows_, std::memory_order_relaxed);
+  profile_->wall_time_us.fetch_add(wall_time_us, std::memory_order_relaxed);
+  profile_->gil_time_us.fetch_add(counters_.gil_time_us, std::memory_order_relaxed);
+  profile_->allocated_bytes.fetch_add(counters_.allocated_bytes, std::memory_order_relaxed);
+  profile_->api_calls.fetch_add(counters_.api_calls, std::memory_order_relaxed);
+  profile_->wall_time_histogram.Measure(wall_time_us);
+}
+
+CallableProfile &CallableProfiles::Get(std::string_view name) {
+  {
+    auto profiles = profiles_.ReadLock();
+    if (auto it = profiles->find(name); it != profiles->end()) return *it->second;
+  }
+  auto profiles = profiles_.Lock();
+  auto [it, _] = profiles->try_emplace(std::string(name), nullptr);
+  if (!it->second) it->second = std::make_unique<CallableProfile>();
+  return *it->second;
+}
+
+void CallableProfiles::ForEach(const std::function<void(const std::string &, const CallableProfile &)> &func) const {
+  auto profiles = profiles_.ReadLock();
+  for (const auto &[name, profile] : *profiles) {
+    func(name, *profile);
+  }
+}
+
+}  // namespace memgraph::query::procedure
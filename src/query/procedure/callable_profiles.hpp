@@ -0,0 +1,131 @@
+// Copyright 2024 Memgraph Ltd.
+//
+// Use of this software is governed by the Business Source License
+// included in the file licenses/BSL.txt; by using this file, you agree to be bound by the terms of the Business Source
+// License, and you may not use this file except in compliance with the Business Source License.
+//
+// As of the Change Date specified in that file, in accordance with
+// the Business Source License, use of this software will be governed
+// by the Apache License, Version 2.0, included in the file
+// licenses/APL.txt.
+
+#pragma once
+
+#include <atomic>
+#include <cstdint>
+#include <functional>
+#include <map>
+#include <memory>
+#include <string>
+#include <string_view>
+
+#include "utils/event_histogram.hpp"
+#include "utils/memory.hpp"
+#include "utils/rw_spin_lock.hpp"
+#include "utils/synchronized.hpp"
+#include "utils/timer.hpp"
+
+namespace memgraph::query::procedure {
+
+/// Runtime statistics of a procedure or a function of a query module,
+/// accumulated over all of its calls.
+struct CallableProfile {
+  std::atomic<uint64_t> calls{0};
+  std::atomic<uint64_t> rows{0};
+  std::atomic<uint64_t> wall_time_us{0};
+  std::atomic<uint64_t> gil_time_us{0};
+  std::atomic<uint64_t> allocated_bytes{0};
+  std::atomic<uint64_t> api_calls{0};
+  /// Wall time of the calls, or of the batches pulled from lazily evaluated
+  /// procedures, in microseconds. Its percentiles are reported as
+  /// `wall_time_p50_us` and `wall_time_p99_us`.
+  metrics::Histogram wall_time_histogram{{50, 99}};
+};
+
+/// Counters of the call running on the current thread. They are updated
+/// without synchronization by the C API and the Python bindings, and added to
+/// the `CallableProfile` once the call is done.
+struct CallCounters {
+  uint64_t gil_time_us{0};
+  uint64_t allocated_bytes{0};
+  uint64_t api_calls{0};
+};
+
+/// The counters of the call running on the current thread, or nullptr if the
+/// thread isn't running a procedure or a function.
+// NOLINTNEXTLINE(cppcoreguidelines-avoid-non-const-global-variables)
+inline thread_local CallCounters *current_call_counters{nullptr};
+
+inline void CountApiCall() noexcept {
+  if (auto *counters = current_call_counters) ++counters->api_calls;
+}
+
+/// Measures a single call of a procedure or a function while it's alive.
+/// Lazily evaluated procedures are measured for each pulled batch, and only the
+/// first batch counts as a call.
+class ProfiledCall final {
+ public:
+  explicit ProfiledCall(CallableProfile &profile, bool is_new_call = true);
+  ProfiledCall(const ProfiledCall &) = delete;
+  ProfiledCall &operator=(const ProfiledCall &) = delete;
+  ProfiledCall(ProfiledCall &&) = delete;
+  ProfiledCall &operator=(ProfiledCall &&) = delete;
+  ~ProfiledCall();
+
+  void AddRows(uint64_t rows) { rows_ += rows; }
+
+ private:
+  CallableProfile *profile_;
+  bool is_new_call_;
+  uint64_t rows_{0};
+  CallCounters counters_;
+  CallCounters *previous_counters_;
+  utils::Timer timer_;
+};
+
+/// Counts the bytes allocated through it toward the call running on the
+/// current thread.
+class CallCountingResource final : public utils::MemoryResource {
+ public:
+  explicit CallCountingResource(utils::MemoryResource *memory) : memory_(memory) {}
+
+ private:
+  utils::MemoryResource *memory_;
+
+  void *DoAllocate(size_t bytes, size_t alignment) override {
+    if (auto *counters = current_call_counters) counters->allocated_bytes += bytes;
+    return memory_->Allocate(bytes, alignment);
+  }
+
+  void DoDeallocate(void *p, size_t bytes, size_t alignment) override { memory_->Deallocate(p, bytes, alignment); }
+
+  bool DoIsEqual(const MemoryResource &other) const noexcept override { return this == &other; }
+};
+
+/// Profiles of all the procedures and functions called so far, by their fully
+/// qualified names. Profiles are never removed, so references to them stay
+/// valid, and they outlive reloads of their modules.
+class CallableProfiles final {
+ public:
+  CallableProfiles() = default;
+  CallableProfiles(const CallableProfiles &) = delete;
+  CallableProfiles &operator=(const CallableProfiles &) = delete;
+  CallableProfiles(CallableProfiles &&) = delete;
+  CallableProfiles &operator=(CallableProfiles &&) = delete;
+  ~CallableProfiles() = default;
+
+  CallableProfile &Get(std::string_view name);
+
+  /// Calls `func` with the name and the profile of each callable, sorted by name.
+  void ForEach(const std::function<void(const std::string &, const CallableProfile &)> &func) const;
+
+ private:
+  utils::Synchronized<std::map<std::string, std::unique_ptr<CallableProfile>, std::less<>>, utils::RWSpinLock>
+      profiles_;
+};
+
+/// Single, global registry of callable profiles.
+// NOLINTNEXTLINE(cppcoreguidelines-avoid-non-const-global-variables)
+extern CallableProfiles gCallableProfiles;
+
+}  // namespace memgraph::query::procedure
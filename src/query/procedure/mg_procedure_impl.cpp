@@ -28,6 +28,7 @@
 #include "module.hpp"
 #include "query/db_accessor.hpp"
 #include "query/frontend/ast/ast.hpp"
+#include "query/procedure/callable_profiles.hpp"
 #include "query/procedure/cypher_types.hpp"
 #include "query/procedure/fmt.hpp"
 #include "query/procedure/mg_procedure_helpers.hpp"
@@ -160,6 +161,7 @@ void WrapExceptionsHelper(TFunc &&func, TReturn *result) {
 template <typename TFunc, typename... Args>
 [[nodiscard]] mgp_error WrapExceptions(TFunc &&func, Args &&...args) noexcept {
   static_assert(sizeof...(args) <= 1, "WrapExceptions should have only one or zero parameter!");
+  CountApiCall();
   try {
     memgraph::utils::MemoryTracker::OutOfMemoryExceptionEnabler oom_enabler;
     WrapExceptionsHelper(std::forward<TFunc>(func), std::forward<Args>(args)...);
@@ -3345,19 +3347,40 @@ void NextPermitted(mgp_vertices_iterator &it) {
 }  // namespace
 #endif
 
+namespace {
+/// Advance the iterator, starting from its current position, to the first vertex
+/// it should yield.
+void SkipToNextYieldedVertex(mgp_vertices_iterator &it) {
+  while (true) {
+#ifdef MG_ENTERPRISE
+    if (memgraph::license::global_license_checker.IsEnterpriseValidFast()) {
+      NextPermitted(it);
+    }
+#endif
+    if (it.current_it == it.vertices.end() || !it.filter || it.filter(*it.current_it)) {
+      return;
+    }
+    ++it.current_it;
+  }
+}
+}  // namespace
+
 /// @throw anything VerticesIterable may throw
 mgp_vertices_iterator::mgp_vertices_iterator(mgp_graph *graph, memgraph::utils::MemoryResource *memory)
+    : mgp_vertices_iterator(graph, std::visit([graph](auto *impl) { return impl->Vertices(graph->view); }, graph->impl),
+                            Filter{}, memory) {}
+
+/// @throw anything VerticesIterable may throw
+mgp_vertices_iterator::mgp_vertices_iterator(mgp_graph *graph, memgraph::query::VerticesIterable vertices,
+                                             Filter filter, memgraph::utils::MemoryResource *memory)
     : memory(memory),
       graph(graph),
-      vertices(std::visit([graph](auto *impl) { return impl->Vertices(graph->view); }, graph->impl)),
-      current_it(vertices.begin()) {
-#ifdef MG_ENTERPRISE
-  if (memgraph::license::global_license_checker.IsEnterpriseValidFast()) {
-    NextPermitted(*this);
-  }
-#endif
+      filter(std::move(filter)),
+      vertices(std::move(vertices)),
+      current_it(this->vertices.begin()) {
+  SkipToNextYieldedVertex(*this);
 
-  if (current_it != vertices.end()) {
+  if (current_it != this->vertices.end()) {
     std::visit(
         memgraph::utils::Overloaded{
             [this, graph, memory](memgraph::query::DbAccessor *) { current_v.emplace(*current_it, graph, memory); },
@@ -3374,6 +3397,212 @@ mgp_error mgp_graph_iter_vertices(mgp_graph *graph, mgp_memory *memory, mgp_vert
   return WrapExceptions([graph, memory] { return NewRawMgpObject<mgp_vertices_iterator>(memory, graph); }, result);
 }
 
+namespace {
+bool HasLabel(memgraph::query::VertexAccessor vertex, memgraph::storage::View view, memgraph::storage::LabelId label) {
+  const auto maybe_has_label = vertex.HasLabel(view, label);
+  return maybe_has_label.HasValue() && *maybe_has_label;
+}
+
+/// Tell whether the value is within the bounds in the same way the label-property
+/// index does: only values of types comparable to the bounds are within them.
+bool IsWithinBounds(const memgraph::storage::PropertyValue &value,
+                    const std::optional<memgraph::utils::Bound<memgraph::storage::PropertyValue>> &lower_bound,
+                    const std::optional<memgraph::utils::Bound<memgraph::storage::PropertyValue>> &upper_bound) {
+  using memgraph::storage::PropertyValue;
+  if (value.IsNull()) return false;
+  if (lower_bound) {
+    const auto &bound = lower_bound->value();
+    if (!PropertyValue::AreComparableTypes(value.type(), bound.type())) return false;
+    if (value < bound || (lower_bound->IsExclusive() && value == bound)) return false;
+  }
+  if (upper_bound) {
+    const auto &bound = upper_bound->value();
+    if (!PropertyValue::AreComparableTypes(value.type(), bound.type())) return false;
+    if (bound < value || (upper_bound->IsExclusive() && value == bound)) return false;
+  }
+  return true;
+}
+
+std::optional<memgraph::utils::Bound<memgraph::storage::PropertyValue>> ToPropertyValueBound(mgp_value *value,
+                                                                                             int inclusive) {
+  // Null bounds are ignored by the label-property index as well.
+  if (value == nullptr || value->type == mgp_value_type::MGP_VALUE_TYPE_NULL) return std::nullopt;
+  if (inclusive) return memgraph::utils::MakeBoundInclusive(ToPropertyValue(*value));
+  return memgraph::utils::MakeBoundExclusive(ToPropertyValue(*value));
+}
+
+/// Create an iterator over the vertices with the given label whose property is
+/// within the bounds. Without the property, the iterator yields all vertices
+/// with the label. The label or the label-property index is used if it exists,
+/// otherwise all of the vertices are scanned.
+/// @throw anything VerticesIterable may throw
+mgp_vertices_iterator *NewIndexedVerticesIterator(
+    mgp_graph *graph, mgp_memory *memory, const char *label_name, const char *property_name,
+    const std::optional<memgraph::utils::Bound<memgraph::storage::PropertyValue>> &lower_bound,
+    const std::optional<memgraph::utils::Bound<memgraph::storage::PropertyValue>> &upper_bound) {
+  const auto label = std::visit([label_name](auto *impl) { return impl->NameToLabel(label_name); }, graph->impl);
+  std::optional<memgraph::storage::PropertyId> property;
+  if (property_name) {
+    property = std::visit([property_name](auto *impl) { return impl->NameToProperty(property_name); }, graph->impl);
+  }
+
+  if (auto *const *db_accessor = std::get_if<memgraph::query::DbAccessor *>(&graph->impl)) {
+    auto *impl = *db_accessor;
+    if (!property && impl->LabelIndexExists(label)) {
+      return NewRawMgpObject<mgp_vertices_iterator>(memory, graph, impl->Vertices(graph->view, label),
+                                                    mgp_vertices_iterator::Filter{});
+    }
+    if (property && impl->LabelPropertyIndexExists(label, *property)) {
+      return NewRawMgpObject<mgp_vertices_iterator>(
+          memory, graph, impl->Vertices(graph->view, label, *property, lower_bound, upper_bound),
+          mgp_vertices_iterator::Filter{});
+    }
+  }
+
+  // Subgraphs have no indices, so we filter all of their vertices as well.
+  auto vertices = std::visit([graph](auto *impl) { return impl->Vertices(graph->view); }, graph->impl);
+  mgp_vertices_iterator::Filter filter;
+  if (property) {
+    filter = [view = graph->view, label, property = *property, lower_bound,
+              upper_bound](memgraph::query::VertexAccessor vertex) {
+      if (!HasLabel(vertex, view, label)) return false;
+      const auto maybe_value = vertex.GetProperty(view, property);
+      return maybe_value.HasValue() && IsWithinBounds(*maybe_value, lower_bound, upper_bound);
+    };
+  } else {
+    filter = [view = graph->view, label](memgraph::query::VertexAccessor vertex) {
+      return HasLabel(vertex, view, label);
+    };
+  }
+  return NewRawMgpObject<mgp_vertices_iterator>(memory, graph, std::move(vertices), std::move(filter));
+}
+}  // namespace
+
+mgp_error mgp_graph_iter_vertices_by_label(mgp_graph *graph, mgp_label label, mgp_memory *memory,
+                                           mgp_vertices_iterator **result) {
+  return WrapExceptions(
+      [graph, label, memory] {
+        return NewIndexedVerticesIterator(graph, memory, label.name, nullptr, std::nullopt, std::nullopt);
+      },
+      result);
+}
+
+mgp_error mgp_graph_iter_vertices_by_property(mgp_graph *graph, mgp_label label, const char *property_name,
+                                              mgp_value *value, mgp_memory *memory, mgp_vertices_iterator **result) {
+  return WrapExceptions(
+      [=] {
+        if (value->type == mgp_value_type::MGP_VALUE_TYPE_NULL) {
+          throw std::invalid_argument{"Vertices cannot be looked up by a null property value!"};
+        }
+        const auto bound = ToPropertyValueBound(value, /*inclusive=*/1);
+        return NewIndexedVerticesIterator(graph, memory, label.name, property_name, bound, bound);
+      },
+      result);
+}
+
+mgp_error mgp_graph_iter_vertices_by_property_range(mgp_graph *graph, mgp_label label, const char *property_name,
+                                                    mgp_value *lower_bound, int lower_bound_inclusive,
+                                                    mgp_value *upper_bound, int upper_bound_inclusive,
+                                                    mgp_memory *memory, mgp_vertices_iterator **result) {
+  return WrapExceptions(
+      [=] {
+        return NewIndexedVerticesIterator(graph, memory, label.name, property_name,
+                                          ToPropertyValueBound(lower_bound, lower_bound_inclusive),
+                                          ToPropertyValueBound(upper_bound, upper_bound_inclusive));
+      },
+      result);
+}
+
+namespace {
+/// Tell whether some of the vertices and edges may be hidden from the user by
+/// the fine-grained access control.
+bool MayHideGraphObjects(const mgp_graph &graph) {
+#ifdef MG_ENTERPRISE
+  return memgraph::license::global_license_checker.IsEnterpriseValidFast() && graph.ctx && graph.ctx->auth_checker;
+#else
+  return false;
+#endif
+}
+
+/// Count the remaining vertices of the iterator without creating an
+/// mgp_vertex for each of them.
+int64_t CountVertices(mgp_vertices_iterator &it) {
+  int64_t count{0};
+  while (it.current_it != it.vertices.end()) {
+    ++count;
+    ++it.current_it;
+    SkipToNextYieldedVertex(it);
+  }
+  return count;
+}
+}  // namespace
+
+mgp_error mgp_graph_vertex_count(mgp_graph *graph, int64_t *result) {
+  return WrapExceptions(
+      [graph]() -> int64_t {
+        if (auto *const *subgraph = std::get_if<memgraph::query::SubgraphDbAccessor *>(&graph->impl);
+            subgraph && !MayHideGraphObjects(*graph)) {
+          return static_cast<int64_t>((*subgraph)->getGraph()->vertices().size());
+        }
+        mgp_vertices_iterator it(graph, memgraph::utils::NewDeleteResource());
+        return CountVertices(it);
+      },
+      result);
+}
+
+mgp_error mgp_graph_vertex_count_by_label(mgp_graph *graph, mgp_label label, int64_t *result) {
+  return WrapExceptions(
+      [graph, label] {
+        mgp_memory memory{memgraph::utils::NewDeleteResource()};
+        std::unique_ptr<mgp_vertices_iterator, decltype(&mgp_vertices_iterator_destroy)> it{
+            NewIndexedVerticesIterator(graph, &memory, label.name, nullptr, std::nullopt, std::nullopt),
+            &mgp_vertices_iterator_destroy};
+        return CountVertices(*it);
+      },
+      result);
+}
+
+mgp_error mgp_graph_edge_count(mgp_graph *graph, int64_t *result) {
+  return WrapExceptions(
+      [graph]() -> int64_t {
+        if (!MayHideGraphObjects(*graph)) {
+          if (auto *const *subgraph = std::get_if<memgraph::query::SubgraphDbAccessor *>(&graph->impl)) {
+            return static_cast<int64_t>((*subgraph)->getGraph()->edges().size());
+          }
+          int64_t count{0};
+          for (const auto &vertex : std::get<memgraph::query::DbAccessor *>(graph->impl)->Vertices(graph->view)) {
+            const auto maybe_degree = vertex.OutDegree(graph->view);
+            if (maybe_degree.HasValue()) count += static_cast<int64_t>(*maybe_degree);
+          }
+          return count;
+        }
+        // Only the permitted edges between permitted vertices are counted, so
+        // they have to be visited one by one.
+        const auto check = [](const mgp_error error) {
+          if (error == mgp_error::MGP_ERROR_UNABLE_TO_ALLOCATE) throw std::bad_alloc{};
+          if (error != mgp_error::MGP_ERROR_NO_ERROR) throw std::logic_error{"Unable to count the edges of the graph"};
+        };
+        mgp_memory memory{memgraph::utils::NewDeleteResource()};
+        int64_t count{0};
+        mgp_vertices_iterator vertices_it(graph, memory.impl);
+        mgp_vertex *vertex = vertices_it.current_v ? &*vertices_it.current_v : nullptr;
+        while (vertex) {
+          mgp_edges_iterator *raw_edges_it{nullptr};
+          check(mgp_vertex_iter_out_edges(vertex, &memory, &raw_edges_it));
+          std::unique_ptr<mgp_edges_iterator, decltype(&mgp_edges_iterator_destroy)> edges_it{
+              raw_edges_it, &mgp_edges_iterator_destroy};
+          mgp_edge *edge = edges_it->current_e ? &*edges_it->current_e : nullptr;
+          while (edge) {
+            ++count;
+            check(mgp_edges_iterator_next(edges_it.get(), &edge));
+          }
+          check(mgp_vertices_iterator_next(&vertices_it, &vertex));
+        }
+        return count;
+      },
+      result);
+}
+
 mgp_error mgp_vertices_iterator_underlying_graph_is_mutable(mgp_vertices_iterator *it, int *result) {
   return mgp_graph_is_mutable(it->graph, result);
 }
@@ -3400,11 +3629,7 @@ mgp_error mgp_vertices_iterator_next(mgp_vertices_iterator *it, mgp_vertex **res
         }
 
         ++it->current_it;
-#ifdef MG_ENTERPRISE
-        if (memgraph::license::global_license_checker.IsEnterpriseValidFast()) {
-          NextPermitted(*it);
-        }
-#endif
+        SkipToNextYieldedVertex(*it);
         if (it->current_it == it->vertices.end()) {
           it->current_v = std::nullopt;
           return nullptr;
@@ -3684,8 +3909,15 @@ mgp_error MgpTransAddFixedResult(mgp_trans *trans) noexcept {
       err != mgp_error::MGP_ERROR_NO_ERROR) {
     return err;
   }
-  return AddResultToProp(trans, "parameters", Call<mgp_type *>(mgp_type_nullable, Call<mgp_type *>(mgp_type_map)),
-                         false);
+  if (const auto err = AddResultToProp(trans, "parameters",
+                                       Call<mgp_type *>(mgp_type_nullable, Call<mgp_type *>(mgp_type_map)), false);
+      err != mgp_error::MGP_ERROR_NO_ERROR) {
+    return err;
+  }
+  // Parameters for each of the rows of a single execution of the query.
+  return AddResultToProp(
+      trans, "batch",
+      Call<mgp_type *>(mgp_type_nullable, Call<mgp_type *>(mgp_type_list, Call<mgp_type *>(mgp_type_map))), false);
 }
 
 mgp_error mgp_proc_add_deprecated_result(mgp_proc *proc, const char *name, mgp_type *type) {
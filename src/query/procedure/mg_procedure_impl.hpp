@@ -707,14 +707,23 @@ struct mgp_edges_iterator {
 
 struct mgp_vertices_iterator {
   using allocator_type = memgraph::utils::Allocator<mgp_vertices_iterator>;
+  /// Tells whether the iterator should yield the given vertex.
+  using Filter = std::function<bool(memgraph::query::VertexAccessor)>;
 
   /// @throw anything VerticesIterable may throw
   mgp_vertices_iterator(mgp_graph *graph, memgraph::utils::MemoryResource *memory);
 
+  /// Iterate over the given vertices, skipping those rejected by `filter`
+  /// unless it is empty.
+  /// @throw anything VerticesIterable may throw
+  mgp_vertices_iterator(mgp_graph *graph, memgraph::query::VerticesIterable vertices, Filter filter,
+                        memgraph::utils::MemoryResource *memory);
+
   memgraph::utils::MemoryResource *GetMemoryResource() const { return memory; }
 
   memgraph::utils::MemoryResource *memory;
   mgp_graph *graph;
+  Filter filter;
   memgraph::query::VerticesIterable vertices;
   decltype(vertices.begin()) current_it;
   std::optional<mgp_vertex> current_v;
@@ -730,6 +739,14 @@ struct ProcedureInfo {
   std::optional<memgraph::query::AuthQuery::Privilege> required_privilege = std::nullopt;
 };
 
+/// Produces the next batch of results of a lazily evaluated procedure call by
+/// appending rows to the given `mgp_result`. Appending no rows signals that the
+/// call is exhausted.
+using mgp_proc_stream = std::function<void(mgp_graph *, mgp_result *, mgp_memory *)>;
+
+/// Starts a lazily evaluated procedure call with the given arguments.
+using mgp_proc_stream_factory = std::function<mgp_proc_stream(mgp_list *, mgp_graph *, mgp_memory *)>;
+
 struct mgp_proc {
   using allocator_type = memgraph::utils::Allocator<mgp_proc>;
 
@@ -777,6 +794,26 @@ struct mgp_proc {
            memgraph::utils::MemoryResource *memory, const ProcedureInfo &info = {})
       : name(name, memory), cb(cb), args(memory), opt_args(memory), results(memory), info(info) {}
 
+  /// @throw std::bad_alloc
+  /// @throw std::length_error
+  mgp_proc(const char *name, mgp_proc_stream_factory stream_factory, memgraph::utils::MemoryResource *memory,
+           const ProcedureInfo &info = {})
+      : name(name, memory),
+        // Callers which don't pull the results lazily get the whole stream at once.
+        cb([stream_factory](mgp_list *args, mgp_graph *graph, mgp_result *result, mgp_memory *memory) {
+          auto stream = stream_factory(args, graph, memory);
+          auto num_rows = result->rows.size();
+          do {
+            num_rows = result->rows.size();
+            stream(graph, result, memory);
+          } while (result->rows.size() != num_rows && !result->error_msg);
+        }),
+        stream_factory(std::move(stream_factory)),
+        args(memory),
+        opt_args(memory),
+        results(memory),
+        info(info) {}
+
   /// @throw std::bad_alloc
   /// @throw std::length_error
   mgp_proc(const mgp_proc &other, memgraph::utils::MemoryResource *memory)
@@ -784,6 +821,7 @@ struct mgp_proc {
         cb(other.cb),
         initializer(other.initializer),
         cleanup(other.cleanup),
+        stream_factory(other.stream_factory),
         args(other.args, memory),
         opt_args(other.opt_args, memory),
         results(other.results, memory),
@@ -794,6 +832,7 @@ struct mgp_proc {
         cb(std::move(other.cb)),
         initializer(other.initializer),
         cleanup(other.cleanup),
+        stream_factory(std::move(other.stream_factory)),
         args(std::move(other.args), memory),
         opt_args(std::move(other.opt_args), memory),
         results(std::move(other.results), memory),
@@ -818,6 +857,11 @@ struct mgp_proc {
   /// Dtor for batched procedure.
   std::optional<std::function<void()>> cleanup;
 
+  /// Entry-point for procedures which yield their results lazily. Each call
+  /// of the procedure gets its own stream, so no state is shared between
+  /// concurrent calls.
+  std::optional<mgp_proc_stream_factory> stream_factory;
+
   /// Required, positional arguments as a (name, type) pair.
   memgraph::utils::pmr::vector<std::pair<memgraph::utils::pmr::string, const memgraph::query::procedure::CypherType *>>
       args;
@@ -889,13 +933,18 @@ struct mgp_func {
   /// @throw std::bad_alloc
   /// @throw std::length_error
   mgp_func(const mgp_func &other, memgraph::utils::MemoryResource *memory)
-      : name(other.name, memory), cb(other.cb), args(other.args, memory), opt_args(other.opt_args, memory) {}
+      : name(other.name, memory),
+        cb(other.cb),
+        args(other.args, memory),
+        opt_args(other.opt_args, memory),
+        is_vectorized(other.is_vectorized) {}
 
   mgp_func(mgp_func &&other, memgraph::utils::MemoryResource *memory)
       : name(std::move(other.name), memory),
         cb(std::move(other.cb)),
         args(std::move(other.args), memory),
-        opt_args(std::move(other.opt_args), memory) {}
+        opt_args(std::move(other.opt_args), memory),
+        is_vectorized(other.is_vectorized) {}
 
   mgp_func(const mgp_func &other) = default;
   mgp_func(mgp_func &&other) = default;
@@ -916,6 +965,10 @@ struct mgp_func {
   memgraph::utils::pmr::vector<std::tuple<memgraph::utils::pmr::string, const memgraph::query::procedure::CypherType *,
                                           memgraph::query::TypedValue>>
       opt_args;
+  /// Whether the function is called once for several rows. Each of its
+  /// arguments is then a list of the argument values in those rows, and the
+  /// result is a list of the results for those rows.
+  bool is_vectorized{false};
 };
 
 mgp_error MgpTransAddFixedResult(mgp_trans *trans) noexcept;
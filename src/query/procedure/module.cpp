@@ -13,7 +13,9 @@
 
 #include <filesystem>
 #include <fstream>
+#include <mutex>
 #include <optional>
+#include <set>
 
 extern "C" {
 #include <dlfcn.h>
@@ -23,9 +25,12 @@ extern "C" {
 #include <unistd.h>
 
 #include "py/py.hpp"
+#include "query/exceptions.hpp"
 #include "query/procedure/callable_alias_mapper.hpp"
+#include "query/procedure/callable_profiles.hpp"
 #include "query/procedure/mg_procedure_helpers.hpp"
 #include "query/procedure/py_module.hpp"
+#include "query/procedure/signature_cache.hpp"
 #include "utils/file.hpp"
 #include "utils/logging.hpp"
 #include "utils/memory.hpp"
@@ -137,6 +142,28 @@ void RegisterMgLoad(ModuleRegistry *module_registry, utils::RWLock *lock, Builti
   };
   mgp_proc load_all("load_all", load_all_cb, utils::NewDeleteResource());
   module->AddProcedure("load_all", std::move(load_all));
+  auto load_changed_cb = [module_registry, lock](mgp_list * /*args*/, mgp_graph * /*graph*/, mgp_result *result,
+                                                 mgp_memory *memory) {
+    std::vector<std::string> names;
+    WithUpgradedLock(lock, [&]() { names = module_registry->ReloadChangedModules(); });
+    for (const auto &name : names) {
+      mgp_result_record *record{nullptr};
+      if (!TryOrSetError([&] { return mgp_result_new_record(result, &record); }, result)) {
+        return;
+      }
+      const auto name_value = GetStringValueOrSetError(name.c_str(), memory, result);
+      if (!name_value) {
+        return;
+      }
+      if (!InsertResultOrSetError(result, record, "module", name_value.get())) {
+        return;
+      }
+    }
+  };
+  mgp_proc load_changed("load_changed", load_changed_cb, utils::NewDeleteResource());
+  MG_ASSERT(mgp_proc_add_result(&load_changed, "module", Call<mgp_type *>(mgp_type_string)) ==
+            mgp_error::MGP_ERROR_NO_ERROR);
+  module->AddProcedure("load_changed", std::move(load_changed));
   auto load_cb = [module_registry, lock](mgp_list *args, mgp_graph * /*graph*/, mgp_result *result,
                                          mgp_memory * /*memory*/) {
     MG_ASSERT(Call<size_t>(mgp_list_size, args) == 1U, "Should have been type checked already");
@@ -416,6 +443,53 @@ void RegisterMgFunctions(
             mgp_error::MGP_ERROR_NO_ERROR);
   module->AddProcedure("functions", std::move(functions));
 }
+
+void RegisterMgProfiles(BuiltinModule *module) {
+  const mgp_proc_cb profiles_cb = [](mgp_list * /*args*/, mgp_graph * /*graph*/, mgp_result *result,
+                                     mgp_memory *memory) {
+    gCallableProfiles.ForEach([&](const std::string &name, const CallableProfile &profile) {
+      if (result->error_msg) return;
+
+      mgp_result_record *record{nullptr};
+      if (!TryOrSetError([&] { return mgp_result_new_record(result, &record); }, result)) {
+        return;
+      }
+
+      const auto name_value = GetStringValueOrSetError(name.c_str(), memory, result);
+      if (!name_value || !InsertResultOrSetError(result, record, "name", name_value.get())) {
+        return;
+      }
+
+      const auto insert_int = [&](const char *field_name, uint64_t value) {
+        MgpUniquePtr<mgp_value> int_value{nullptr, mgp_value_destroy};
+        if (!TryOrSetError(
+                [&] { return CreateMgpObject(int_value, mgp_value_make_int, static_cast<int64_t>(value), memory); },
+                result)) {
+          return false;
+        }
+        return InsertResultOrSetError(result, record, field_name, int_value.get());
+      };
+
+      static_cast<void>(insert_int("calls", profile.calls.load(std::memory_order_relaxed)) &&
+                        insert_int("rows", profile.rows.load(std::memory_order_relaxed)) &&
+                        insert_int("wall_time_us", profile.wall_time_us.load(std::memory_order_relaxed)) &&
+                        insert_int("wall_time_p50_us", profile.wall_time_histogram.Percentile(50)) &&
+                        insert_int("wall_time_p99_us", profile.wall_time_histogram.Percentile(99)) &&
+                        insert_int("gil_time_us", profile.gil_time_us.load(std::memory_order_relaxed)) &&
+                        insert_int("allocated_bytes", profile.allocated_bytes.load(std::memory_order_relaxed)) &&
+                        insert_int("api_calls", profile.api_calls.load(std::memory_order_relaxed)));
+    });
+  };
+  mgp_proc profiles("profiles", profiles_cb, utils::NewDeleteResource());
+  MG_ASSERT(mgp_proc_add_result(&profiles, "name", Call<mgp_type *>(mgp_type_string)) == mgp_error::MGP_ERROR_NO_ERROR);
+  for (const auto *field_name : {"calls", "rows", "wall_time_us", "wall_time_p50_us", "wall_time_p99_us", "gil_time_us",
+                                 "allocated_bytes", "api_calls"}) {
+    MG_ASSERT(mgp_proc_add_result(&profiles, field_name, Call<mgp_type *>(mgp_type_int)) ==
+              mgp_error::MGP_ERROR_NO_ERROR);
+  }
+  module->AddProcedure("profiles", std::move(profiles));
+}
+
 namespace {
 bool IsAllowedExtension(const auto &extension) {
   static constexpr std::array<std::string_view, 1> allowed_extensions{".py"};
@@ -942,7 +1016,10 @@ const std::map<std::string, mgp_func, std::less<>> *SharedLibraryModule::Functio
 
 class PythonModule final : public Module {
  public:
-  PythonModule();
+  /// If `signature_cache` isn't nullptr, the module is registered from its
+  /// cached signatures when possible, and imported on the first call of any of
+  /// its procedures, transformations or functions.
+  explicit PythonModule(const SignatureCache *signature_cache = nullptr);
   ~PythonModule() override;
   PythonModule(const PythonModule &) = delete;
   PythonModule(PythonModule &&) = delete;
@@ -959,33 +1036,77 @@ class PythonModule final : public Module {
   std::optional<std::filesystem::path> Path() const override { return file_path_; }
 
  private:
+  /// Import the Python module and register its callables into the given maps.
+  bool Import(std::map<std::string, mgp_proc, std::less<>> *procedures,
+              std::map<std::string, mgp_trans, std::less<>> *transformations,
+              std::map<std::string, mgp_func, std::less<>> *functions);
+
+  /// Register callables which import the module on their first call and then
+  /// forward to the imported ones. Return false if the signatures are invalid.
+  bool RegisterCachedSignatures(const nlohmann::json &signatures);
+
+  /// Import a lazily loaded module, unless that was already done. Return the
+  /// error message if the module couldn't be imported, or nullptr otherwise.
+  const std::string *EnsureImported();
+
+  const SignatureCache *signature_cache_;
   std::filesystem::path file_path_;
+  bool is_loaded_{false};
   py::Object py_module_;
   std::map<std::string, mgp_proc, std::less<>> procedures_;
   std::map<std::string, mgp_trans, std::less<>> transformations_;
   std::map<std::string, mgp_func, std::less<>> functions_;
+  // The cached signatures and the imported callables of a lazily loaded module.
+  nlohmann::json cached_signatures_;
+  std::once_flag import_flag_;
+  std::optional<std::string> import_error_;
+  std::map<std::string, mgp_proc, std::less<>> imported_procedures_;
+  std::map<std::string, mgp_trans, std::less<>> imported_transformations_;
+  std::map<std::string, mgp_func, std::less<>> imported_functions_;
 };
 
-PythonModule::PythonModule() {}
+PythonModule::PythonModule(const SignatureCache *signature_cache) : signature_cache_(signature_cache) {}
 
 PythonModule::~PythonModule() {
-  if (py_module_) Close();
+  if (is_loaded_ || py_module_) Close();
 }
 
 bool PythonModule::Load(const std::filesystem::path &file_path) {
-  MG_ASSERT(!py_module_, "Attempting to load an already loaded module...");
+  MG_ASSERT(!is_loaded_ && !py_module_, "Attempting to load an already loaded module...");
   spdlog::info("Loading module {}...", file_path);
   file_path_ = file_path;
+  if (signature_cache_) {
+    auto signatures = signature_cache_->Load(file_path);
+    if (signatures && RegisterCachedSignatures(*signatures)) {
+      cached_signatures_ = std::move(*signatures);
+      is_loaded_ = true;
+      spdlog::info("Loaded module {} lazily from cached signatures", file_path);
+      return true;
+    }
+  }
+  if (!Import(&procedures_, &transformations_, &functions_)) return false;
+  is_loaded_ = true;
+  if (signature_cache_) {
+    if (auto signatures = SerializeSignatures(procedures_, transformations_, functions_)) {
+      signature_cache_->Store(file_path, *signatures);
+    }
+  }
+  return true;
+}
+
+bool PythonModule::Import(std::map<std::string, mgp_proc, std::less<>> *procedures,
+                          std::map<std::string, mgp_trans, std::less<>> *transformations,
+                          std::map<std::string, mgp_func, std::less<>> *functions) {
   auto gil = py::EnsureGIL();
-  auto maybe_exc = py::AppendToSysPath(file_path.parent_path().c_str());
+  auto maybe_exc = py::AppendToSysPath(file_path_.parent_path().c_str());
   if (maybe_exc) {
     spdlog::error(
-        utils::MessageWithLink("Unable to load module {}; {}.", file_path, *maybe_exc, "https://memgr.ph/modules"));
+        utils::MessageWithLink("Unable to load module {}; {}.", file_path_, *maybe_exc, "https://memgr.ph/modules"));
     return false;
   }
   bool succ = true;
   auto module_cb = [&](auto *module_def, auto * /*memory*/) {
-    auto result = ImportPyModule(file_path.stem().c_str(), module_def);
+    auto result = ImportPyModule(file_path_.stem().c_str(), module_def);
     for (auto &trans : module_def->transformations) {
       succ = MgpTransAddFixedResult(&trans.second) == mgp_error::MGP_ERROR_NO_ERROR;
       if (!succ) {
@@ -994,10 +1115,9 @@ bool PythonModule::Load(const std::filesystem::path &file_path) {
     };
     return result;
   };
-  py_module_ = WithModuleRegistration(&procedures_, &transformations_, &functions_, module_cb);
+  py_module_ = WithModuleRegistration(procedures, transformations, functions, module_cb);
   if (py_module_) {
-    spdlog::info("Loaded module {}", file_path);
-
+    spdlog::info("Loaded module {}", file_path_);
     if (!succ) {
       spdlog::error("Unable to add result to transformation");
       return false;
@@ -1006,19 +1126,137 @@ bool PythonModule::Load(const std::filesystem::path &file_path) {
   }
   auto exc_info = py::FetchError().value();
   spdlog::error(
-      utils::MessageWithLink("Unable to load module {}; {}.", file_path, exc_info, "https://memgr.ph/modules"));
+      utils::MessageWithLink("Unable to load module {}; {}.", file_path_, exc_info, "https://memgr.ph/modules"));
   return false;
 }
 
+bool PythonModule::RegisterCachedSignatures(const nlohmann::json &signatures) {
+  auto *memory = utils::NewDeleteResource();
+  try {
+    for (const auto &signature : signatures.at("procedures")) {
+      auto name = signature.at("name").get<std::string>();
+      const ProcedureInfo info{.is_write = signature.at("is_write").get<bool>(),
+                               .is_batched = signature.at("is_batched").get<bool>()};
+      mgp_proc proc(
+          name,
+          [this, name](mgp_list *args, mgp_graph *graph, mgp_result *result, mgp_memory *memory) {
+            if (const auto *error = EnsureImported()) {
+              static_cast<void>(mgp_result_set_error_msg(result, error->c_str()));
+              return;
+            }
+            imported_procedures_.at(name).cb(args, graph, result, memory);
+          },
+          memory, info);
+      if (signature.at("is_lazy").get<bool>()) {
+        proc.stream_factory = [this, name](mgp_list *args, mgp_graph *graph, mgp_memory *memory) -> mgp_proc_stream {
+          if (const auto *error = EnsureImported()) {
+            return [error](mgp_graph * /*graph*/, mgp_result *result, mgp_memory * /*memory*/) {
+              static_cast<void>(mgp_result_set_error_msg(result, error->c_str()));
+            };
+          }
+          return (*imported_procedures_.at(name).stream_factory)(args, graph, memory);
+        };
+      }
+      if (info.is_batched) {
+        proc.initializer = [this, name](mgp_list *args, mgp_graph *graph, mgp_memory *memory) {
+          if (const auto *error = EnsureImported()) throw QueryRuntimeException(*error);
+          (*imported_procedures_.at(name).initializer)(args, graph, memory);
+        };
+        proc.cleanup = [this, name] {
+          if (EnsureImported()) return;
+          (*imported_procedures_.at(name).cleanup)();
+        };
+      }
+      DeserializeSignature(signature, &proc);
+      procedures_.emplace(name, std::move(proc));
+    }
+    for (const auto &signature : signatures.at("transformations")) {
+      auto name = signature.at("name").get<std::string>();
+      mgp_trans trans(
+          name.c_str(),
+          [this, name](mgp_messages *msgs, mgp_graph *graph, mgp_result *result, mgp_memory *memory) {
+            if (const auto *error = EnsureImported()) {
+              static_cast<void>(mgp_result_set_error_msg(result, error->c_str()));
+              return;
+            }
+            imported_transformations_.at(name).cb(msgs, graph, result, memory);
+          },
+          memory);
+      if (MgpTransAddFixedResult(&trans) != mgp_error::MGP_ERROR_NO_ERROR) {
+        throw std::invalid_argument{"Unable to add result to transformation"};
+      }
+      transformations_.emplace(name, std::move(trans));
+    }
+    for (const auto &signature : signatures.at("functions")) {
+      auto name = signature.at("name").get<std::string>();
+      mgp_func func(
+          name.c_str(),
+          [this, name](mgp_list *args, mgp_func_context *context, mgp_func_result *result, mgp_memory *memory) {
+            if (const auto *error = EnsureImported()) {
+              static_cast<void>(mgp_func_result_set_error_msg(result, error->c_str(), memory));
+              return;
+            }
+            imported_functions_.at(name).cb(args, context, result, memory);
+          },
+          memory);
+      DeserializeSignature(signature, &func);
+      functions_.emplace(name, std::move(func));
+    }
+  } catch (const std::exception &e) {
+    spdlog::warn("Ignoring the cached signatures of module {}; {}", file_path_, e.what());
+    procedures_.clear();
+    transformations_.clear();
+    functions_.clear();
+    return false;
+  }
+  return true;
+}
+
+const std::string *PythonModule::EnsureImported() {
+  // Concurrent callers wait for the first one to import the module. A failed
+  // import isn't retried until the module is reloaded.
+  std::call_once(import_flag_, [this] {
+    spdlog::info("Importing module {} on its first call...", file_path_);
+    if (!Import(&imported_procedures_, &imported_transformations_, &imported_functions_)) {
+      import_error_ = fmt::format("Unable to import module {}, see the log for details", file_path_.stem().string());
+      return;
+    }
+    // The callables registered from the cached signatures must match the
+    // imported ones, otherwise the module was changed after it was loaded.
+    auto signatures = SerializeSignatures(imported_procedures_, imported_transformations_, imported_functions_);
+    if (!signatures || *signatures != cached_signatures_) {
+      import_error_ =
+          fmt::format("Module {} changed since it was loaded, reload it with mg.load", file_path_.stem().string());
+    }
+  });
+  return import_error_ ? &*import_error_ : nullptr;
+}
+
 bool PythonModule::Close() {
-  MG_ASSERT(py_module_, "Attempting to close a module that has not been loaded...");
+  MG_ASSERT(is_loaded_ || py_module_, "Attempting to close a module that has not been loaded...");
   spdlog::info("Closing module {}...", file_path_);
+  is_loaded_ = false;
+  if (!py_module_) {
+    // A lazily loaded module which was never imported.
+    procedures_.clear();
+    transformations_.clear();
+    functions_.clear();
+    spdlog::info("Closed module {}", file_path_);
+    return true;
+  }
   // The procedures and transformations are closures which hold references to the Python callbacks.
   // Releasing these references might result in deallocations so we need to take the GIL.
   auto gil = py::EnsureGIL();
+  // Let the garbage collector find the cycles among the objects of the module.
+  // Modules are only closed under the write lock of the registry, which
+  // freezes the objects of the remaining modules again once it's done.
+  PyUnfreezeGarbage();
   procedures_.clear();
   transformations_.clear();
   functions_.clear();
+  imported_procedures_.clear();
+  imported_transformations_.clear();
+  imported_functions_.clear();
 
   // Get the reference to sys.modules dictionary
   py::Object sys(PyImport_ImportModule("sys"));
@@ -1115,28 +1353,28 @@ void ProcessFileDependencies(std::filesystem::path file_path_, const char *modul
 }
 
 const std::map<std::string, mgp_proc, std::less<>> *PythonModule::Procedures() const {
-  MG_ASSERT(py_module_,
+  MG_ASSERT(is_loaded_,
             "Attempting to access procedures of a module that has "
             "not been loaded...");
   return &procedures_;
 }
 
 const std::map<std::string, mgp_trans, std::less<>> *PythonModule::Transformations() const {
-  MG_ASSERT(py_module_,
+  MG_ASSERT(is_loaded_,
             "Attempting to access procedures of a module that has "
             "not been loaded...");
   return &transformations_;
 }
 
 const std::map<std::string, mgp_func, std::less<>> *PythonModule::Functions() const {
-  MG_ASSERT(py_module_,
+  MG_ASSERT(is_loaded_,
             "Attempting to access functions of a module that has "
             "not been loaded...");
   return &functions_;
 }
 namespace {
 
-std::unique_ptr<Module> LoadModuleFromFile(const std::filesystem::path &path) {
+std::unique_ptr<Module> LoadModuleFromFile(const std::filesystem::path &path, const SignatureCache *signature_cache) {
   const auto &ext = path.extension();
   if (ext != ".so" && ext != ".py") {
     spdlog::warn(utils::MessageWithLink("Unknown query module file {}.", path, "https://memgr.ph/modules"));
@@ -1148,13 +1386,72 @@ std::unique_ptr<Module> LoadModuleFromFile(const std::filesystem::path &path) {
     if (!lib_module->Load(path)) return nullptr;
     module = std::move(lib_module);
   } else if (path.extension() == ".py") {
-    auto py_module = std::make_unique<PythonModule>();
+    auto py_module = std::make_unique<PythonModule>(signature_cache);
     if (!py_module->Load(path)) return nullptr;
     module = std::move(py_module);
   }
   return module;
 }
 
+// Return the names of the top-level modules imported by the Python module at
+// `path`.
+std::set<std::string, std::less<>> ImportedModules(const std::filesystem::path &path) {
+  std::set<std::string, std::less<>> imported_modules;
+  if (path.extension() != ".py") return imported_modules;
+  const auto maybe_content = ReadFile(path);
+  if (!maybe_content) return imported_modules;
+  auto gil = py::EnsureGIL();
+  py::Object py_globals(PyDict_New());
+  py::Object py_code(PyUnicode_FromString(maybe_content->c_str()));
+  if (!py_globals || !py_code || PyDict_SetItemString(py_globals.Ptr(), "code", py_code.Ptr()) != 0) {
+    PyErr_Clear();
+    return imported_modules;
+  }
+  py::Object py_res(PyRun_String(func_code, Py_file_input, py_globals.Ptr(), py_globals.Ptr()));
+  if (!py_res) {
+    // The module doesn't parse, so it will fail to load anyway.
+    PyErr_Clear();
+    return imported_modules;
+  }
+  py::Object py_iterator(PyObject_GetIter(PyDict_GetItemString(py_globals.Ptr(), "modules")));
+  if (!py_iterator) {
+    PyErr_Clear();
+    return imported_modules;
+  }
+  while (auto py_module_name = py::Object(PyIter_Next(py_iterator.Ptr()))) {
+    if (const char *module_name = PyUnicode_AsUTF8(py_module_name.Ptr())) imported_modules.emplace(module_name);
+  }
+  PyErr_Clear();
+  return imported_modules;
+}
+
+// Fingerprint the Python files of the packages next to a module which the
+// module imports, since they are reloaded together with the module.
+nlohmann::json PackageFingerprints(const std::filesystem::path &path,
+                                   const std::set<std::string, std::less<>> &imported_modules) {
+  auto fingerprints = nlohmann::json::object();
+  for (const auto &imported_module : imported_modules) {
+    const auto package_path = path.parent_path() / imported_module;
+    std::error_code error_code;
+    if (!std::filesystem::is_directory(package_path, error_code)) continue;
+    for (const auto &entry : std::filesystem::recursive_directory_iterator(package_path, error_code)) {
+      if (!entry.is_regular_file() || entry.path().extension() != ".py") continue;
+      fingerprints[entry.path().string()] = ModuleFileFingerprint(entry.path()).value_or(nullptr);
+    }
+  }
+  return fingerprints;
+}
+
+// The objects of the loaded modules mostly live as long as the modules, so
+// there is no point in traversing them in every full collection. Freezing
+// affects every object in the interpreter, so it's only done while holding the
+// write lock of the registry, when no procedure or function is running.
+void FreezeLoadedModules() {
+  if (!Py_IsInitialized()) return;
+  auto gil = py::EnsureGIL();
+  PyFreezeGarbage();
+}
+
 }  // namespace
 
 bool ModuleRegistry::RegisterModule(const std::string_view name, std::unique_ptr<Module> module) {
@@ -1165,6 +1462,10 @@ bool ModuleRegistry::RegisterModule(const std::string_view name, std::unique_ptr
         utils::MessageWithLink("Unable to overwrite an already loaded module {}.", name, "https://memgr.ph/modules"));
     return false;
   }
+  if (auto path = module->Path()) {
+    module_files_.insert_or_assign(std::string(name),
+                                   ModuleFile{.path = *path, .fingerprint = ModuleFileFingerprint(*path)});
+  }
   modules_.emplace(name, std::move(module));
   return true;
 }
@@ -1176,6 +1477,7 @@ void ModuleRegistry::DoUnloadAllModules() {
   auto module = std::move(modules_["mg"]);
   modules_.clear();
   modules_.emplace("mg", std::move(module));
+  module_files_.clear();
 }
 
 ModuleRegistry::ModuleRegistry() {
@@ -1183,6 +1485,7 @@ ModuleRegistry::ModuleRegistry() {
   RegisterMgProcedures(&modules_, module.get());
   RegisterMgTransformations(&modules_, module.get());
   RegisterMgFunctions(&modules_, module.get());
+  RegisterMgProfiles(module.get());
   RegisterMgLoad(this, &lock_, module.get());
   RegisterMgGetModuleFiles(this, module.get());
   RegisterMgGetModuleFile(this, module.get());
@@ -1193,9 +1496,14 @@ ModuleRegistry::ModuleRegistry() {
 }
 
 void ModuleRegistry::SetModulesDirectory(std::vector<std::filesystem::path> modules_dirs,
-                                         const std::filesystem::path &data_directory) {
+                                         const std::filesystem::path &data_directory, bool lazy_loading) {
   internal_module_dir_ = data_directory / "internal_modules";
   utils::EnsureDirOrDie(internal_module_dir_);
+  if (lazy_loading) {
+    signature_cache_.emplace(data_directory / "query_module_signatures");
+  } else {
+    signature_cache_.reset();
+  }
   modules_dirs_ = std::move(modules_dirs);
   modules_dirs_.push_back(internal_module_dir_);
 }
@@ -1211,7 +1519,7 @@ bool ModuleRegistry::LoadModuleIfFound(const std::filesystem::path &modules_dir,
   for (const auto &entry : std::filesystem::directory_iterator(modules_dir)) {
     const auto &path = entry.path();
     if (entry.is_regular_file() && path.stem() == name) {
-      auto module = LoadModuleFromFile(path);
+      auto module = LoadModuleFromFile(path, signature_cache_ ? &*signature_cache_ : nullptr);
       if (!module) return false;
       return RegisterModule(name, std::move(module));
     }
@@ -1228,11 +1536,13 @@ bool ModuleRegistry::LoadOrReloadModuleFromName(const std::string_view name) {
     if (!found_it->second->Close()) {
       spdlog::warn("Failed to close module {}", found_it->first);
     }
+    module_files_.erase(found_it->first);
     modules_.erase(found_it);
   }
 
   for (const auto &module_dir : modules_dirs_) {
     if (LoadModuleIfFound(module_dir, name)) {
+      FreezeLoadedModules();
       return true;
     }
   }
@@ -1251,7 +1561,7 @@ void ModuleRegistry::LoadModulesFromDirectory(const std::filesystem::path &modul
     if (entry.is_regular_file()) {
       std::string name = path.stem();
       if (name.empty()) continue;
-      auto module = LoadModuleFromFile(path);
+      auto module = LoadModuleFromFile(path, signature_cache_ ? &*signature_cache_ : nullptr);
       if (!module) continue;
       RegisterModule(name, std::move(module));
     }
@@ -1264,6 +1574,132 @@ void ModuleRegistry::UnloadAndLoadModulesFromDirectories() {
   for (const auto &module_dir : modules_dirs_) {
     LoadModulesFromDirectory(module_dir);
   }
+  FreezeLoadedModules();
+}
+
+std::vector<std::string> ModuleRegistry::ReloadChangedModules() {
+  // Concurrent reloads would look for the same changes and swap the same
+  // modules twice.
+  std::lock_guard<std::mutex> reload_guard(reload_lock_);
+  std::map<std::string, ModuleFile, std::less<>> loaded_files;
+  std::vector<std::filesystem::path> modules_dirs;
+  {
+    std::shared_lock<utils::RWLock> guard(lock_);
+    loaded_files = module_files_;
+    modules_dirs = modules_dirs_;
+  }
+
+  // Find the file of each module as UnloadAndLoadModulesFromDirectories would,
+  // but keep the files of the loaded modules while they exist.
+  std::map<std::string, std::filesystem::path, std::less<>> files;
+  for (const auto &[name, loaded_file] : loaded_files) {
+    if (std::filesystem::is_regular_file(loaded_file.path)) files.emplace(name, loaded_file.path);
+  }
+  for (const auto &modules_dir : modules_dirs) {
+    if (modules_dir.empty() || !utils::DirExists(modules_dir)) continue;
+    for (const auto &entry : std::filesystem::directory_iterator(modules_dir)) {
+      const auto &path = entry.path();
+      if (!entry.is_regular_file() || path.stem().empty()) continue;
+      if (path.extension() != ".so" && path.extension() != ".py") continue;
+      files.try_emplace(path.stem(), path);
+    }
+  }
+
+  // Reading the files is the slow part, so it's done without holding any lock.
+  // Parsing the imports of a module and fingerprinting its packages is left to
+  // the first check, so that loading the modules doesn't pay for it.
+  std::set<std::string, std::less<>> affected;
+  std::set<std::string, std::less<>> first_checked;
+  std::map<std::string, std::optional<nlohmann::json>, std::less<>> fingerprints;
+  for (const auto &[name, path] : files) {
+    const auto &fingerprint = fingerprints.emplace(name, ModuleFileFingerprint(path)).first->second;
+    auto loaded_it = loaded_files.find(name);
+    if (loaded_it == loaded_files.end()) {
+      auto rejected_it = rejected_files_.find(name);
+      if (rejected_it == rejected_files_.end() || rejected_it->second.path != path ||
+          rejected_it->second.fingerprint != fingerprint) {
+        affected.insert(name);
+      }
+      continue;
+    }
+    rejected_files_.erase(name);
+    auto &loaded_file = loaded_it->second;
+    if (loaded_file.path != path || loaded_file.fingerprint != fingerprint) {
+      affected.insert(name);
+      continue;
+    }
+    if (!loaded_file.imported_modules) {
+      loaded_file.imported_modules = ImportedModules(path);
+      loaded_file.package_fingerprints = PackageFingerprints(path, *loaded_file.imported_modules);
+      first_checked.insert(name);
+    } else if (loaded_file.package_fingerprints != PackageFingerprints(path, *loaded_file.imported_modules)) {
+      affected.insert(name);
+    }
+  }
+  for (const auto &[name, loaded_file] : loaded_files) {
+    if (!files.contains(name)) affected.insert(name);
+  }
+  if (!first_checked.empty()) {
+    // Keep what the first check found, unless the module was replaced meanwhile.
+    std::shared_lock<utils::RWLock> guard(lock_);
+    for (const auto &name : first_checked) {
+      auto module_file_it = module_files_.find(name);
+      const auto &loaded_file = loaded_files.at(name);
+      if (module_file_it == module_files_.end() || module_file_it->second.path != loaded_file.path ||
+          module_file_it->second.fingerprint != loaded_file.fingerprint) {
+        continue;
+      }
+      module_file_it->second.imported_modules = loaded_file.imported_modules;
+      module_file_it->second.package_fingerprints = loaded_file.package_fingerprints;
+    }
+  }
+  // The modules importing an affected module hold references to the objects of
+  // its previous version, so they have to be reloaded as well.
+  for (bool found_importing = !affected.empty(); found_importing;) {
+    found_importing = false;
+    for (const auto &[name, loaded_file] : loaded_files) {
+      if (affected.contains(name) || !loaded_file.imported_modules) continue;
+      if (std::ranges::any_of(*loaded_file.imported_modules,
+                              [&](const auto &imported_module) { return affected.contains(imported_module); })) {
+        affected.insert(name);
+        found_importing = true;
+      }
+    }
+  }
+  if (affected.empty()) return {};
+
+  // Swap all the affected modules at once. The write lock waits for the calls
+  // in progress, which finish with the previous versions, while the unaffected
+  // modules don't have to be imported again.
+  std::unique_lock<utils::RWLock> guard(lock_);
+  for (const auto &name : affected) {
+    // Only the modules loaded from files are replaced, never the builtin ones.
+    if (!module_files_.contains(name)) continue;
+    auto found_it = modules_.find(name);
+    if (found_it != modules_.end()) {
+      if (!found_it->second->Close()) {
+        spdlog::warn("Failed to close module {}", found_it->first);
+      }
+      modules_.erase(found_it);
+    }
+    module_files_.erase(name);
+  }
+  for (const auto &name : affected) {
+    rejected_files_.erase(name);
+    auto file_it = files.find(name);
+    if (file_it == files.end()) continue;
+    if (!modules_.contains(name)) {
+      auto module = LoadModuleFromFile(file_it->second, signature_cache_ ? &*signature_cache_ : nullptr);
+      if (module && RegisterModule(name, std::move(module))) continue;
+    }
+    // Checked with the fingerprint taken before loading, so that a change
+    // made meanwhile is tried again.
+    rejected_files_.insert_or_assign(name, ModuleFile{.path = file_it->second, .fingerprint = fingerprints.at(name)});
+  }
+  FreezeLoadedModules();
+  std::vector<std::string> names(affected.begin(), affected.end());
+  spdlog::info("Reloaded the changed query modules: {}", utils::Join(names, ", "));
+  return names;
 }
 
 ModulePtr ModuleRegistry::GetModuleNamed(const std::string_view name) const {
@@ -1375,4 +1811,39 @@ std::optional<std::pair<ModulePtr, const mgp_func *>> FindFunction(const ModuleR
   return MakePairIfPropFound<mgp_func>(module_registry, fully_qualified_function_name, memory);
 }
 
+void ConstructVectorizedArguments(const std::vector<TypedValue> &columns, const size_t num_rows, const mgp_func &func,
+                                  const std::string_view fully_qualified_name, mgp_list &args_list, mgp_graph &graph) {
+  const auto n_args = columns.size();
+  const auto c_args_sz = func.args.size();
+  CheckArgumentCount(n_args, func, fully_qualified_name);
+  args_list.elems.reserve(c_args_sz + func.opt_args.size());
+
+  for (size_t i = 0; i < n_args; ++i) {
+    std::string_view name;
+    const CypherType *type = nullptr;
+    if (i < c_args_sz) {
+      name = func.args[i].first;
+      type = func.args[i].second;
+    } else {
+      name = std::get<0>(func.opt_args[i - c_args_sz]);
+      type = std::get<1>(func.opt_args[i - c_args_sz]);
+    }
+    const auto &column = columns[i].ValueList();
+    MG_ASSERT(column.size() == num_rows, "Expected a value of the argument in each of the rows");
+    for (const auto &arg : column) {
+      if (!type->SatisfiesType(arg)) {
+        throw QueryRuntimeException("'{}' argument named '{}' at position {} must be of type {}.", fully_qualified_name,
+                                    name, i, type->GetPresentableName());
+      }
+    }
+    args_list.elems.emplace_back(columns[i], &graph);
+  }
+  // Fill missing optional arguments with their default values.
+  auto *memory = args_list.GetMemoryResource();
+  for (size_t i = n_args - c_args_sz; i < func.opt_args.size(); ++i) {
+    TypedValue::TVector column(num_rows, std::get<2>(func.opt_args[i]), memory);
+    args_list.elems.emplace_back(TypedValue(std::move(column), memory), &graph);
+  }
+}
+
 }  // namespace memgraph::query::procedure
@@ -16,7 +16,9 @@
 #include <dlfcn.h>
 #include <filesystem>
 #include <functional>
+#include <mutex>
 #include <optional>
+#include <set>
 #include <shared_mutex>
 #include <string>
 #include <string_view>
@@ -24,6 +26,7 @@
 
 #include "query/procedure/cypher_types.hpp"
 #include "query/procedure/mg_procedure_impl.hpp"
+#include "query/procedure/signature_cache.hpp"
 #include "utils/memory.hpp"
 #include "utils/rw_lock.hpp"
 
@@ -91,7 +94,10 @@ class ModuleRegistry final {
   ModuleRegistry();
 
   /// Set the modules directories that will be used when (re)loading modules.
-  void SetModulesDirectory(std::vector<std::filesystem::path> modules_dir, const std::filesystem::path &data_directory);
+  /// With `lazy_loading`, the signatures of Python modules are cached in the
+  /// data directory and each module is imported on its first call.
+  void SetModulesDirectory(std::vector<std::filesystem::path> modules_dir, const std::filesystem::path &data_directory,
+                           bool lazy_loading = false);
   const std::vector<std::filesystem::path> &GetModulesDirectory() const;
 
   /// Atomically load or reload a module with a particular name from the given
@@ -113,6 +119,16 @@ class ModuleRegistry final {
   /// Takes a write lock.
   void UnloadAndLoadModulesFromDirectories();
 
+  /// Reload the modules whose files changed since they were loaded, together
+  /// with the modules which import them. Modules of new files are loaded and
+  /// modules whose files were removed are unloaded.
+  ///
+  /// The changes are looked for under a read lock. Only the affected modules
+  /// are swapped, under a single write lock.
+  ///
+  /// Return the names of the affected modules.
+  std::vector<std::string> ReloadChangedModules();
+
   /// Find a module with given name or return nullptr.
   /// Takes a read lock.
   ModulePtr GetModuleNamed(std::string_view name) const;
@@ -173,6 +189,27 @@ class ModuleRegistry final {
 #endif
   std::vector<std::filesystem::path> modules_dirs_;
   std::filesystem::path internal_module_dir_;
+  std::optional<SignatureCache> signature_cache_;
+
+  /// The file of a module at the time the module was loaded.
+  struct ModuleFile {
+    std::filesystem::path path;
+    std::optional<nlohmann::json> fingerprint;
+    /// Top-level modules imported by a Python module, looked for on the first
+    /// check for changes rather than when the module is loaded.
+    std::optional<std::set<std::string, std::less<>>> imported_modules;
+    /// Fingerprints of the files of the imported packages next to the module,
+    /// taken together with `imported_modules`.
+    std::optional<nlohmann::json> package_fingerprints;
+  };
+  /// Modified under the write lock, except for the lazily taken imports and
+  /// package fingerprints, which are only accessed while holding `reload_lock_`.
+  std::map<std::string, ModuleFile, std::less<>> module_files_;
+  /// Serializes ReloadChangedModules.
+  std::mutex reload_lock_;
+  /// Files which failed to load or whose name collides with another module,
+  /// which aren't tried again until they change. Guarded by `reload_lock_`.
+  std::map<std::string, ModuleFile, std::less<>> rejected_files_;
 };
 
 /// Single, global module registry.
@@ -207,9 +244,7 @@ template <typename T>
 concept IsCallable = utils::SameAsAnyOf<T, mgp_proc, mgp_func>;
 
 template <IsCallable TCall>
-void ConstructArguments(const std::vector<TypedValue> &args, const TCall &callable,
-                        const std::string_view fully_qualified_name, mgp_list &args_list, mgp_graph &graph) {
-  const auto n_args = args.size();
+void CheckArgumentCount(const size_t n_args, const TCall &callable, const std::string_view fully_qualified_name) {
   const auto c_args_sz = callable.args.size();
   const auto c_opt_args_sz = callable.opt_args.size();
 
@@ -226,6 +261,16 @@ void ConstructArguments(const std::vector<TypedValue> &args, const TCall &callab
     throw QueryRuntimeException("'{}' requires between {} and {} arguments.", fully_qualified_name, c_args_sz,
                                 c_args_sz + c_opt_args_sz);
   }
+}
+
+template <IsCallable TCall>
+void ConstructArguments(const std::vector<TypedValue> &args, const TCall &callable,
+                        const std::string_view fully_qualified_name, mgp_list &args_list, mgp_graph &graph) {
+  const auto n_args = args.size();
+  const auto c_args_sz = callable.args.size();
+  const auto c_opt_args_sz = callable.opt_args.size();
+
+  CheckArgumentCount(n_args, callable, fully_qualified_name);
   args_list.elems.reserve(n_args);
 
   auto is_not_optional_arg = [c_args_sz](int i) { return c_args_sz > i; };
@@ -252,4 +297,10 @@ void ConstructArguments(const std::vector<TypedValue> &args, const TCall &callab
     args_list.elems.emplace_back(std::get<2>(callable.opt_args[i]), &graph);
   }
 }
+
+/// Construct the arguments of a vectorized function from `columns`, each of
+/// which is a list of the values of a single argument in `num_rows` rows.
+/// Missing optional arguments are filled with lists of their default values.
+void ConstructVectorizedArguments(const std::vector<TypedValue> &columns, size_t num_rows, const mgp_func &func,
+                                  std::string_view fully_qualified_name, mgp_list &args_list, mgp_graph &graph);
 }  // namespace memgraph::query::procedure
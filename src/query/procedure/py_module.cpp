@@ -15,25 +15,210 @@
 #include <methodobject.h>
 #include <objimpl.h>
 #include <pyerrors.h>
+#include <algorithm>
 #include <array>
+#include <atomic>
+#include <chrono>
+#include <limits>
+#include <memory>
 #include <optional>
 #include <sstream>
 #include <stdexcept>
 #include <string>
 #include <string_view>
+#include <thread>
+#include <type_traits>
+#include <unordered_map>
+#include <unordered_set>
+#include <utility>
+#include <variant>
+#include <vector>
 
 #include "mg_procedure.h"
 #include "query/exceptions.hpp"
+#include "query/procedure/callable_profiles.hpp"
 #include "query/procedure/mg_procedure_helpers.hpp"
 #include "query/procedure/mg_procedure_impl.hpp"
 #include "storage/v2/storage_mode.hpp"
+#include "utils/event_histogram.hpp"
 #include "utils/memory.hpp"
+#include "utils/memory_tracker.hpp"
 #include "utils/on_scope_exit.hpp"
 #include "utils/pmr/vector.hpp"
+#include "utils/timer.hpp"
+#include "utils/variant_helpers.hpp"
+
+namespace memgraph::metrics {
+extern const Event PythonYoungGCLatency_us;
+extern const Event PythonFullGCLatency_us;
+}  // namespace memgraph::metrics
 
 namespace memgraph::query::procedure {
 
 namespace {
+// Time this thread spent with the GIL released in bulk graph passes, which
+// isn't counted as time holding the GIL.
+thread_local uint64_t gil_released_us{0};  // NOLINT(cppcoreguidelines-avoid-non-const-global-variables)
+
+// Acquires the GIL for a call of a Python procedure or function, and counts
+// the time it's held toward the profile of the call.
+class ProfiledEnsureGIL final {
+ public:
+  ProfiledEnsureGIL() = default;
+  ProfiledEnsureGIL(const ProfiledEnsureGIL &) = delete;
+  ProfiledEnsureGIL(ProfiledEnsureGIL &&) = delete;
+  ProfiledEnsureGIL &operator=(const ProfiledEnsureGIL &) = delete;
+  ProfiledEnsureGIL &operator=(ProfiledEnsureGIL &&) = delete;
+
+  ~ProfiledEnsureGIL() {
+    if (auto *counters = current_call_counters) {
+      const auto held_us = static_cast<uint64_t>(timer_.Elapsed<std::chrono::microseconds>().count());
+      counters->gil_time_us += held_us - std::min(held_us, gil_released_us - released_us_);
+    }
+  }
+
+ private:
+  py::EnsureGIL gil_;
+  utils::Timer timer_;
+  uint64_t released_us_{gil_released_us};
+};
+
+// Releases the GIL like `py::ReleaseGIL`, and keeps track of the time it's
+// released for `ProfiledEnsureGIL`.
+class ProfiledReleaseGIL final {
+ public:
+  ProfiledReleaseGIL() = default;
+  ProfiledReleaseGIL(const ProfiledReleaseGIL &) = delete;
+  ProfiledReleaseGIL(ProfiledReleaseGIL &&) = delete;
+  ProfiledReleaseGIL &operator=(const ProfiledReleaseGIL &) = delete;
+  ProfiledReleaseGIL &operator=(ProfiledReleaseGIL &&) = delete;
+
+  ~ProfiledReleaseGIL() {
+    gil_released_us += static_cast<uint64_t>(timer_.Elapsed<std::chrono::microseconds>().count());
+  }
+
+ private:
+  py::ReleaseGIL release_gil_;
+  utils::Timer timer_;
+};
+
+// Number of calls into Python code on this thread whose allocations of Python
+// objects are subject to the memory limits.
+thread_local uint64_t limited_py_allocations{0};  // NOLINT(cppcoreguidelines-avoid-non-const-global-variables)
+
+// Makes the allocations of Python objects fail with a `MemoryError` once they
+// would exceed the query, procedure or global memory limit.
+class PyAllocationLimits final {
+ public:
+  PyAllocationLimits() { ++limited_py_allocations; }
+  PyAllocationLimits(const PyAllocationLimits &) = delete;
+  PyAllocationLimits(PyAllocationLimits &&) = delete;
+  PyAllocationLimits &operator=(const PyAllocationLimits &) = delete;
+  PyAllocationLimits &operator=(PyAllocationLimits &&) = delete;
+
+  ~PyAllocationLimits() {
+    --limited_py_allocations;
+    // Python raises a `MemoryError` without a message when an allocation
+    // fails, so the message is replaced with the limit which was hit.
+    if (!PyErr_Occurred() || !PyErr_ExceptionMatches(PyExc_MemoryError)) return;
+    auto maybe_msg = utils::MemoryErrorStatus().msg();
+    if (!maybe_msg) return;
+    PyObject *exc_type{nullptr};
+    PyObject *exc_value{nullptr};
+    PyObject *traceback{nullptr};
+    PyErr_Fetch(&exc_type, &exc_value, &traceback);
+    Py_XDECREF(exc_value);
+    PyErr_Restore(exc_type, PyUnicode_FromString(maybe_msg->c_str()), traceback);
+  }
+};
+
+// Number of Python procedures and functions which are currently running.
+// Collections of the garbage collector are deferred while there are any.
+std::atomic<uint64_t> gRunningPyCallables{0};  // NOLINT(cppcoreguidelines-avoid-non-const-global-variables)
+
+// Runs the Python code of a procedure or a function.
+template <class TFunc>
+auto RunPyCallable(TFunc &&func) {
+  gRunningPyCallables.fetch_add(1, std::memory_order_relaxed);
+  const utils::OnScopeExit done{[] { gRunningPyCallables.fetch_sub(1, std::memory_order_relaxed); }};
+  const PyAllocationLimits limits;
+  return func();
+}
+
+// The allocators of the PYMEM_DOMAIN_MEM and PYMEM_DOMAIN_OBJ domains which
+// are wrapped by the hooks below, and the arena allocator of pymalloc.
+// NOLINTNEXTLINE(cppcoreguidelines-avoid-non-const-global-variables)
+PyMemAllocatorEx gPyMemAllocator{};
+// NOLINTNEXTLINE(cppcoreguidelines-avoid-non-const-global-variables)
+PyMemAllocatorEx gPyObjectAllocator{};
+// NOLINTNEXTLINE(cppcoreguidelines-avoid-non-const-global-variables)
+PyObjectArenaAllocator gPyArenaAllocator{};
+// Size of the arenas pymalloc has currently mapped.
+std::atomic<int64_t> gPyArenaBytes{0};  // NOLINT(cppcoreguidelines-avoid-non-const-global-variables)
+
+// The memory trackers only refuse allocations while the OutOfMemoryException
+// is enabled, which it is for the allocations of Python objects in the calls
+// of Python procedures and functions. That way the memory limits don't apply
+// to the C++ code called from Python, which doesn't expect allocations to fail.
+void *PyAllocatorMalloc(void *ctx, size_t size) {
+  auto *allocator = static_cast<PyMemAllocatorEx *>(ctx);
+  if (limited_py_allocations == 0) return allocator->malloc(allocator->ctx, size);
+  const utils::MemoryTracker::OutOfMemoryExceptionEnabler oom_exception;
+  return allocator->malloc(allocator->ctx, size);
+}
+
+void *PyAllocatorCalloc(void *ctx, size_t nelem, size_t elsize) {
+  auto *allocator = static_cast<PyMemAllocatorEx *>(ctx);
+  if (limited_py_allocations == 0) return allocator->calloc(allocator->ctx, nelem, elsize);
+  const utils::MemoryTracker::OutOfMemoryExceptionEnabler oom_exception;
+  return allocator->calloc(allocator->ctx, nelem, elsize);
+}
+
+void *PyAllocatorRealloc(void *ctx, void *ptr, size_t new_size) {
+  auto *allocator = static_cast<PyMemAllocatorEx *>(ctx);
+  if (limited_py_allocations == 0) return allocator->realloc(allocator->ctx, ptr, new_size);
+  const utils::MemoryTracker::OutOfMemoryExceptionEnabler oom_exception;
+  return allocator->realloc(allocator->ctx, ptr, new_size);
+}
+
+void PyAllocatorFree(void *ctx, void *ptr) {
+  auto *allocator = static_cast<PyMemAllocatorEx *>(ctx);
+  allocator->free(allocator->ctx, ptr);
+}
+
+// pymalloc maps its arenas directly instead of allocating them with jemalloc,
+// so they are tracked here. An arena holds objects of any query, and may be
+// freed by another query than the one which allocated it, so arenas are only
+// charged to the total memory tracker. Arenas mapped before the hooks were
+// installed aren't tracked, so they aren't credited either once freed. Arenas
+// are only allocated and freed while holding the GIL, which guards the set.
+// It's never destroyed, because Python may free arenas while it's finalized.
+std::unordered_set<void *> &TrackedPyArenas() {
+  static auto *arenas = new std::unordered_set<void *>();
+  return *arenas;
+}
+
+void *PyArenaAlloc(void *ctx, size_t size) {
+  auto *allocator = static_cast<PyObjectArenaAllocator *>(ctx);
+  if (!utils::total_memory_tracker.Alloc(static_cast<int64_t>(size))) return nullptr;
+  auto *ptr = allocator->alloc(allocator->ctx, size);
+  if (ptr == nullptr) {
+    utils::total_memory_tracker.Free(static_cast<int64_t>(size));
+    return nullptr;
+  }
+  TrackedPyArenas().insert(ptr);
+  gPyArenaBytes.fetch_add(static_cast<int64_t>(size), std::memory_order_relaxed);
+  return ptr;
+}
+
+void PyArenaFree(void *ctx, void *ptr, size_t size) {
+  auto *allocator = static_cast<PyObjectArenaAllocator *>(ctx);
+  allocator->free(allocator->ctx, ptr, size);
+  if (TrackedPyArenas().erase(ptr) == 0) return;
+  gPyArenaBytes.fetch_sub(static_cast<int64_t>(size), std::memory_order_relaxed);
+  utils::total_memory_tracker.Free(static_cast<int64_t>(size));
+}
+
 // Set this as a __reduce__ special method on our types to prevent `pickle` and
 // `copy` module operations on our types.
 PyObject *DisallowPickleAndCopy(PyObject *self, PyObject *Py_UNUSED(ignored)) {
@@ -117,6 +302,37 @@ bool RaiseExceptionFromErrorCode(const mgp_error error) {
   }
 }
 
+// Error of work done while the GIL is released, which is raised as a Python
+// exception once the GIL is held again.
+class DeferredPyError {
+ public:
+  // Returns true if `error` is an error, like RaiseExceptionFromErrorCode.
+  bool Set(const mgp_error error) {
+    if (error == mgp_error::MGP_ERROR_NO_ERROR) return false;
+    error_ = error;
+    return true;
+  }
+
+  void Set(PyObject *exception_type, std::string message) {
+    exception_type_ = exception_type;
+    message_ = std::move(message);
+  }
+
+  // Returns true if an exception is raised
+  bool Raise() const {
+    if (exception_type_) {
+      PyErr_SetString(exception_type_, message_.c_str());
+      return true;
+    }
+    return RaiseExceptionFromErrorCode(error_);
+  }
+
+ private:
+  mgp_error error_{mgp_error::MGP_ERROR_NO_ERROR};
+  PyObject *exception_type_{nullptr};
+  std::string message_;
+};
+
 mgp_value *PyObjectToMgpValueWithPythonExceptions(PyObject *py_value, mgp_memory *memory) noexcept {
   try {
     return PyObjectToMgpValue(py_value, memory);
@@ -144,6 +360,169 @@ mgp_value *PyObjectToMgpValueWithPythonExceptions(PyObject *py_value, mgp_memory
 // These should all be in the private `_mgp` Python module, which will be used
 // by the `mgp` to implement the user friendly Python API.
 
+// Elements of `_mgp.Array`. Booleans are stored one per byte.
+using PyArrayValues = std::variant<std::vector<int64_t>, std::vector<double>, std::vector<uint8_t>>;
+
+// Owns a contiguous array of numbers exported from the graph, and exposes it
+// through the buffer protocol, so that `memoryview` and NumPy can wrap it
+// without copying. The array is a copy of the data, so unlike the other `_mgp`
+// objects, it remains valid after the procedure call ends. It's a snapshot, so
+// the buffer is exported read-only.
+//
+// clang-format off
+struct PyArray {
+  PyObject_HEAD
+  PyArrayValues *values;
+  Py_ssize_t shape;
+  Py_ssize_t stride;
+};
+// clang-format on
+
+void PyArrayDealloc(PyArray *self) {
+  delete self->values;
+  Py_TYPE(self)->tp_free(self);
+}
+
+int PyArrayGetBuffer(PyArray *self, Py_buffer *view, int flags) {
+  MG_ASSERT(self->values);
+  if ((flags & PyBUF_WRITABLE) == PyBUF_WRITABLE) {
+    view->obj = nullptr;
+    PyErr_SetString(PyExc_BufferError, "_mgp.Array is read-only.");
+    return -1;
+  }
+  auto [buf, format] = std::visit(
+      utils::Overloaded{
+          [](std::vector<int64_t> &values) { return std::make_pair(static_cast<void *>(values.data()), "q"); },
+          [](std::vector<double> &values) { return std::make_pair(static_cast<void *>(values.data()), "d"); },
+          [](std::vector<uint8_t> &values) { return std::make_pair(static_cast<void *>(values.data()), "?"); },
+      },
+      *self->values);
+  Py_INCREF(self);
+  view->obj = reinterpret_cast<PyObject *>(self);
+  view->buf = buf;
+  view->len = self->shape * self->stride;
+  view->readonly = 1;
+  view->itemsize = self->stride;
+  // `format`, `shape` and `strides` may only be set if they were requested.
+  view->format = (flags & PyBUF_FORMAT) ? const_cast<char *>(format) : nullptr;
+  view->ndim = 1;
+  view->shape = (flags & PyBUF_ND) ? &self->shape : nullptr;
+  view->strides = ((flags & PyBUF_STRIDES) == PyBUF_STRIDES) ? &self->stride : nullptr;
+  view->suboffsets = nullptr;
+  view->internal = nullptr;
+  return 0;
+}
+
+static PyBufferProcs PyArrayBufferProcs = {
+    .bf_getbuffer = reinterpret_cast<getbufferproc>(PyArrayGetBuffer),
+    .bf_releasebuffer = nullptr,
+};
+
+static PyMethodDef PyArrayMethods[] = {
+    {"__reduce__", reinterpret_cast<PyCFunction>(DisallowPickleAndCopy), METH_NOARGS, "__reduce__ is not supported"},
+    {nullptr, {}, {}, {}},
+};
+
+// clang-format off
+static PyTypeObject PyArrayType = {
+    PyVarObject_HEAD_INIT(nullptr, 0)
+    .tp_name = "_mgp.Array",
+    .tp_basicsize = sizeof(PyArray),
+    .tp_dealloc = reinterpret_cast<destructor>(PyArrayDealloc),
+    .tp_as_buffer = &PyArrayBufferProcs,
+    .tp_flags = Py_TPFLAGS_DEFAULT,
+    .tp_doc = "Contiguous array of numbers supporting the buffer protocol.",
+    .tp_methods = PyArrayMethods,
+};
+// clang-format on
+
+template <typename T>
+PyObject *MakePyArray(std::vector<T> values) {
+  auto *py_array = PyObject_New(PyArray, &PyArrayType);
+  if (!py_array) return nullptr;
+  py_array->shape = static_cast<Py_ssize_t>(values.size());
+  py_array->stride = sizeof(T);
+  py_array->values = new PyArrayValues(std::move(values));
+  return reinterpret_cast<PyObject *>(py_array);
+}
+
+template <typename TElement, typename TValue>
+PyArrayValues CopyBufferElements(const Py_buffer &view) {
+  const auto *elements = static_cast<const TElement *>(view.buf);
+  return std::vector<TValue>(elements, elements + view.shape[0]);
+}
+
+// Unsigned 64-bit integers above INT64_MAX don't fit into int64, so they are
+// rejected instead of wrapping around. Return std::nullopt with a Python
+// exception set in that case.
+template <typename TElement>
+std::optional<PyArrayValues> CopyUnsignedBufferElements(const Py_buffer &view, const char *name) {
+  static_assert(std::is_unsigned_v<TElement>);
+  if constexpr (sizeof(TElement) >= sizeof(int64_t)) {
+    const auto *elements = static_cast<const TElement *>(view.buf);
+    constexpr auto kMax = static_cast<TElement>(std::numeric_limits<int64_t>::max());
+    if (std::any_of(elements, elements + view.shape[0], [](TElement element) { return element > kMax; })) {
+      PyErr_Format(PyExc_ValueError, "Elements of %s don't fit into 64-bit signed integers.", name);
+      return std::nullopt;
+    }
+  }
+  return CopyBufferElements<TElement, int64_t>(view);
+}
+
+// Copy the elements of a one-dimensional object supporting the buffer
+// protocol, such as a NumPy array or a `memoryview`. Integers of any size are
+// read as int64, unless they are too large for it, and floating point numbers
+// as double. Return std::nullopt with a Python exception set if the object
+// cannot be read.
+std::optional<PyArrayValues> PyBufferToArrayValues(PyObject *obj, const char *name) {
+  Py_buffer view;
+  if (PyObject_GetBuffer(obj, &view, PyBUF_C_CONTIGUOUS | PyBUF_FORMAT) == -1) {
+    return std::nullopt;
+  }
+  const utils::OnScopeExit release_view{[&view] { PyBuffer_Release(&view); }};
+  if (view.ndim != 1) {
+    PyErr_Format(PyExc_ValueError, "Expected %s to be one-dimensional.", name);
+    return std::nullopt;
+  }
+  // Only the native sizes, which `memoryview` and NumPy use, are supported.
+  std::string_view format{view.format};
+  if (format.starts_with('@')) format.remove_prefix(1);
+  if (format.size() == 1) {
+    switch (format.front()) {
+      case 'b':
+        return CopyBufferElements<signed char, int64_t>(view);
+      case 'B':
+        return CopyBufferElements<unsigned char, int64_t>(view);
+      case 'h':
+        return CopyBufferElements<short, int64_t>(view);
+      case 'H':
+        return CopyBufferElements<unsigned short, int64_t>(view);
+      case 'i':
+        return CopyBufferElements<int, int64_t>(view);
+      case 'I':
+        return CopyBufferElements<unsigned int, int64_t>(view);
+      case 'l':
+        return CopyBufferElements<long, int64_t>(view);
+      case 'L':
+        return CopyUnsignedBufferElements<unsigned long>(view, name);
+      case 'q':
+        return CopyBufferElements<long long, int64_t>(view);
+      case 'Q':
+        return CopyUnsignedBufferElements<unsigned long long>(view, name);
+      case 'f':
+        return CopyBufferElements<float, double>(view);
+      case 'd':
+        return CopyBufferElements<double, double>(view);
+      case '?':
+        return CopyBufferElements<bool, uint8_t>(view);
+      default:
+        break;
+    }
+  }
+  PyErr_Format(PyExc_ValueError, "Unsupported element format '%s' of %s.", view.format, name);
+  return std::nullopt;
+}
+
 // Wraps mgp_graph in a PyObject.
 //
 // Executing a `CALL python_module.procedure(...)` in openCypher should
@@ -161,9 +540,68 @@ struct PyGraph {
   PyObject_HEAD
   mgp_graph *graph;
   mgp_memory *memory;
+  // Counts of an immutable graph, or -1 until they are counted.
+  int64_t vertex_count;
+  int64_t edge_count;
+  // Number of bulk passes over the graph running without the GIL. It's only
+  // read and changed while holding the GIL.
+  int64_t passes_in_progress;
 };
 // clang-format on
 
+// Waits until the bulk passes which run without the GIL, possibly started by
+// other Python threads, are done with the graph. The graph mustn't be used or
+// invalidated while they access it.
+void WaitForPyGraphPasses(PyGraph &self) {
+  while (self.passes_in_progress > 0) {
+    const py::ReleaseGIL release_gil;
+    std::this_thread::yield();
+  }
+}
+
+// Releases the GIL for the duration of a bulk pass over the graph. Other
+// threads which use the same graph in the meantime wait for the pass to end.
+class PyGraphPass final {
+ public:
+  explicit PyGraphPass(PyGraph &graph) : graph_(graph) {
+    WaitForPyGraphPasses(graph_);
+    ++graph_.passes_in_progress;
+    release_gil_.emplace();
+  }
+  PyGraphPass(const PyGraphPass &) = delete;
+  PyGraphPass(PyGraphPass &&) = delete;
+  PyGraphPass &operator=(const PyGraphPass &) = delete;
+  PyGraphPass &operator=(PyGraphPass &&) = delete;
+
+  ~PyGraphPass() {
+    release_gil_.reset();
+    --graph_.passes_in_progress;
+  }
+
+ private:
+  PyGraph &graph_;
+  std::optional<ProfiledReleaseGIL> release_gil_;
+};
+
+void InvalidatePyGraph(PyGraph &self) {
+  WaitForPyGraphPasses(self);
+  self.graph = nullptr;
+  self.memory = nullptr;
+}
+
+bool PyGraphIsValidImpl(PyGraph &self) {
+  WaitForPyGraphPasses(self);
+  return self.graph != nullptr;
+}
+
+// Threads started by a procedure may outlive it, and find out that the graph
+// was invalidated only once they're already calling a bulk pass over it.
+bool RaiseIfPyGraphInvalid(PyGraph &self) {
+  if (PyGraphIsValidImpl(self)) return false;
+  PyErr_SetString(PyExc_RuntimeError, "The graph is only valid during the procedure call.");
+  return true;
+}
+
 // clang-format off
 struct PyVerticesIterator {
   PyObject_HEAD
@@ -180,7 +618,7 @@ void PyVerticesIteratorDealloc(PyVerticesIterator *self) {
   // Avoid invoking `mgp_vertices_iterator_destroy` if we are not in valid
   // execution context. The query execution should free all memory used during
   // execution, so we may cause a double free issue.
-  if (self->py_graph->graph) mgp_vertices_iterator_destroy(self->it);
+  if (PyGraphIsValidImpl(*self->py_graph)) mgp_vertices_iterator_destroy(self->it);
   Py_DECREF(self->py_graph);
   Py_TYPE(self)->tp_free(self);
 }
@@ -188,7 +626,7 @@ void PyVerticesIteratorDealloc(PyVerticesIterator *self) {
 PyObject *PyVerticesIteratorGet(PyVerticesIterator *self, PyObject *Py_UNUSED(ignored)) {
   MG_ASSERT(self->it);
   MG_ASSERT(self->py_graph);
-  MG_ASSERT(self->py_graph->graph);
+  MG_ASSERT(PyGraphIsValidImpl(*self->py_graph));
   mgp_vertex *vertex{nullptr};
   if (RaiseExceptionFromErrorCode(mgp_vertices_iterator_get(self->it, &vertex))) {
     return nullptr;
@@ -203,7 +641,7 @@ PyObject *PyVerticesIteratorGet(PyVerticesIterator *self, PyObject *Py_UNUSED(ig
 PyObject *PyVerticesIteratorNext(PyVerticesIterator *self, PyObject *Py_UNUSED(ignored)) {
   MG_ASSERT(self->it);
   MG_ASSERT(self->py_graph);
-  MG_ASSERT(self->py_graph->graph);
+  MG_ASSERT(PyGraphIsValidImpl(*self->py_graph));
   mgp_vertex *vertex{nullptr};
   if (RaiseExceptionFromErrorCode(mgp_vertices_iterator_next(self->it, &vertex))) {
     return nullptr;
@@ -252,7 +690,7 @@ void PyEdgesIteratorDealloc(PyEdgesIterator *self) {
   // Avoid invoking `mgp_edges_iterator_destroy` if we are not in valid
   // execution context. The query execution should free all memory used during
   // execution, so we may cause a double free issue.
-  if (self->py_graph->graph) mgp_edges_iterator_destroy(self->it);
+  if (PyGraphIsValidImpl(*self->py_graph)) mgp_edges_iterator_destroy(self->it);
   Py_DECREF(self->py_graph);
   Py_TYPE(self)->tp_free(self);
 }
@@ -260,7 +698,7 @@ void PyEdgesIteratorDealloc(PyEdgesIterator *self) {
 PyObject *PyEdgesIteratorGet(PyEdgesIterator *self, PyObject *Py_UNUSED(ignored)) {
   MG_ASSERT(self->it);
   MG_ASSERT(self->py_graph);
-  MG_ASSERT(self->py_graph->graph);
+  MG_ASSERT(PyGraphIsValidImpl(*self->py_graph));
   mgp_edge *edge{nullptr};
   if (RaiseExceptionFromErrorCode(mgp_edges_iterator_get(self->it, &edge))) {
     return nullptr;
@@ -275,7 +713,7 @@ PyObject *PyEdgesIteratorGet(PyEdgesIterator *self, PyObject *Py_UNUSED(ignored)
 PyObject *PyEdgesIteratorNext(PyEdgesIterator *self, PyObject *Py_UNUSED(ignored)) {
   MG_ASSERT(self->it);
   MG_ASSERT(self->py_graph);
-  MG_ASSERT(self->py_graph->graph);
+  MG_ASSERT(PyGraphIsValidImpl(*self->py_graph));
   mgp_edge *edge{nullptr};
   if (RaiseExceptionFromErrorCode(mgp_edges_iterator_next(self->it, &edge))) {
     return nullptr;
@@ -309,13 +747,10 @@ static PyTypeObject PyEdgesIteratorType = {
 // clang-format on
 
 PyObject *PyGraphInvalidate(PyGraph *self, PyObject *Py_UNUSED(ignored)) {
-  self->graph = nullptr;
-  self->memory = nullptr;
+  InvalidatePyGraph(*self);
   Py_RETURN_NONE;
 }
 
-bool PyGraphIsValidImpl(PyGraph &self) { return self.graph != nullptr; }
-
 PyObject *PyGraphIsValid(PyGraph *self, PyObject *Py_UNUSED(ignored)) {
   return PyBool_FromLong(PyGraphIsValidImpl(*self));
 }
@@ -367,6 +802,30 @@ PyObject *PyGraphDetachDeleteVertex(PyGraph *self, PyObject *args);
 
 PyObject *PyGraphDeleteEdge(PyGraph *self, PyObject *args);
 
+PyObject *PyGraphAdjacency(PyGraph *self, PyObject *args);
+
+PyObject *PyGraphVertexIds(PyGraph *self, PyObject *args);
+
+PyObject *PyGraphPropertyColumn(PyGraph *self, PyObject *args);
+
+PyObject *PyGraphSetPropertyColumn(PyGraph *self, PyObject *args);
+
+PyObject *PyGraphCreateVertices(PyGraph *self, PyObject *args);
+
+PyObject *PyGraphCreateEdges(PyGraph *self, PyObject *args);
+
+PyObject *MakePyVerticesIterator(mgp_vertices_iterator *vertices_it, PyGraph *py_graph) {
+  auto *py_vertices_it = PyObject_New(PyVerticesIterator, &PyVerticesIteratorType);
+  if (!py_vertices_it) {
+    mgp_vertices_iterator_destroy(vertices_it);
+    return nullptr;
+  }
+  py_vertices_it->it = vertices_it;
+  Py_INCREF(py_graph);
+  py_vertices_it->py_graph = py_graph;
+  return reinterpret_cast<PyObject *>(py_vertices_it);
+}
+
 PyObject *PyGraphIterVertices(PyGraph *self, PyObject *Py_UNUSED(ignored)) {
   MG_ASSERT(PyGraphIsValidImpl(*self));
   MG_ASSERT(self->memory);
@@ -374,15 +833,68 @@ PyObject *PyGraphIterVertices(PyGraph *self, PyObject *Py_UNUSED(ignored)) {
   if (RaiseExceptionFromErrorCode(mgp_graph_iter_vertices(self->graph, self->memory, &vertices_it))) {
     return nullptr;
   }
-  auto *py_vertices_it = PyObject_New(PyVerticesIterator, &PyVerticesIteratorType);
-  if (!py_vertices_it) {
-    mgp_vertices_iterator_destroy(vertices_it);
+  return MakePyVerticesIterator(vertices_it, self);
+}
+
+PyObject *PyGraphIterVerticesByLabel(PyGraph *self, PyObject *args) {
+  MG_ASSERT(PyGraphIsValidImpl(*self));
+  MG_ASSERT(self->memory);
+  const char *label{nullptr};
+  if (!PyArg_ParseTuple(args, "s", &label)) {
     return nullptr;
   }
-  py_vertices_it->it = vertices_it;
-  Py_INCREF(self);
-  py_vertices_it->py_graph = self;
-  return reinterpret_cast<PyObject *>(py_vertices_it);
+  mgp_vertices_iterator *vertices_it{nullptr};
+  if (RaiseExceptionFromErrorCode(
+          mgp_graph_iter_vertices_by_label(self->graph, mgp_label{label}, self->memory, &vertices_it))) {
+    return nullptr;
+  }
+  return MakePyVerticesIterator(vertices_it, self);
+}
+
+PyObject *PyGraphIterVerticesByProperty(PyGraph *self, PyObject *args);
+
+PyObject *PyGraphIterVerticesByPropertyRange(PyGraph *self, PyObject *args);
+
+PyObject *PyGraphVertexCount(PyGraph *self, PyObject *args) {
+  if (RaiseIfPyGraphInvalid(*self)) return nullptr;
+  const char *label{nullptr};
+  if (!PyArg_ParseTuple(args, "|z", &label)) {
+    return nullptr;
+  }
+  if (!label && self->vertex_count >= 0) {
+    return PyLong_FromLongLong(self->vertex_count);
+  }
+  int64_t count{0};
+  mgp_error error{mgp_error::MGP_ERROR_NO_ERROR};
+  {
+    const PyGraphPass pass(*self);
+    error = label ? mgp_graph_vertex_count_by_label(self->graph, mgp_label{label}, &count)
+                  : mgp_graph_vertex_count(self->graph, &count);
+  }
+  if (RaiseExceptionFromErrorCode(error)) {
+    return nullptr;
+  }
+  // The graph of a read-only procedure doesn't change during the call.
+  if (!label && !CallBool(mgp_graph_is_mutable, self->graph)) self->vertex_count = count;
+  return PyLong_FromLongLong(count);
+}
+
+PyObject *PyGraphEdgeCount(PyGraph *self, PyObject *Py_UNUSED(ignored)) {
+  if (RaiseIfPyGraphInvalid(*self)) return nullptr;
+  if (self->edge_count >= 0) {
+    return PyLong_FromLongLong(self->edge_count);
+  }
+  int64_t count{0};
+  mgp_error error{mgp_error::MGP_ERROR_NO_ERROR};
+  {
+    const PyGraphPass pass(*self);
+    error = mgp_graph_edge_count(self->graph, &count);
+  }
+  if (RaiseExceptionFromErrorCode(error)) {
+    return nullptr;
+  }
+  if (!CallBool(mgp_graph_is_mutable, self->graph)) self->edge_count = count;
+  return PyLong_FromLongLong(count);
 }
 
 PyObject *PyGraphMustAbort(PyGraph *self, PyObject *Py_UNUSED(ignored)) {
@@ -390,6 +902,24 @@ PyObject *PyGraphMustAbort(PyGraph *self, PyObject *Py_UNUSED(ignored)) {
   return PyBool_FromLong(mgp_must_abort(self->graph));
 }
 
+PyObject *PyGraphVersion(PyGraph *self, PyObject *Py_UNUSED(ignored)) {
+  MG_ASSERT(PyGraphIsValidImpl(*self));
+  auto *graph = self->graph;
+#ifdef MG_ENTERPRISE
+  // Users may be allowed to see different parts of the graph.
+  if (graph->ctx && graph->ctx->auth_checker) Py_RETURN_NONE;
+#endif
+  // Projected graphs are passed in place of the whole graph, so results computed from them can't be told apart.
+  auto *const *db_accessor = std::get_if<query::DbAccessor *>(&graph->impl);
+  if (!db_accessor) Py_RETURN_NONE;
+  const auto version = (*db_accessor)->GetGraphVersion();
+  if (!version) Py_RETURN_NONE;
+  const auto &database = (*db_accessor)->id();
+  return Py_BuildValue("(s#KK)", database.data(), static_cast<Py_ssize_t>(database.size()),
+                       static_cast<unsigned long long>(version->generation),
+                       static_cast<unsigned long long>(version->commit_timestamp));
+}
+
 static PyMethodDef PyGraphMethods[] = {
     {"__reduce__", reinterpret_cast<PyCFunction>(DisallowPickleAndCopy), METH_NOARGS, "__reduce__ is not supported"},
     {"invalidate", reinterpret_cast<PyCFunction>(PyGraphInvalidate), METH_NOARGS,
@@ -402,13 +932,36 @@ static PyMethodDef PyGraphMethods[] = {
      "Get the vertex or raise IndexError."},
     {"create_vertex", reinterpret_cast<PyCFunction>(PyGraphCreateVertex), METH_NOARGS, "Create a vertex."},
     {"create_edge", reinterpret_cast<PyCFunction>(PyGraphCreateEdge), METH_VARARGS, "Create an edge."},
+    {"create_vertices", reinterpret_cast<PyCFunction>(PyGraphCreateVertices), METH_VARARGS,
+     "Create vertices with the given labels and property columns, and return their IDs as _mgp.Array."},
+    {"create_edges", reinterpret_cast<PyCFunction>(PyGraphCreateEdges), METH_VARARGS,
+     "Create edges between the given vertices with property columns, and return their IDs as _mgp.Array."},
     {"delete_vertex", reinterpret_cast<PyCFunction>(PyGraphDeleteVertex), METH_VARARGS, "Delete a vertex."},
     {"detach_delete_vertex", reinterpret_cast<PyCFunction>(PyGraphDetachDeleteVertex), METH_VARARGS,
      "Delete a vertex and all of its edges."},
     {"delete_edge", reinterpret_cast<PyCFunction>(PyGraphDeleteEdge), METH_VARARGS, "Delete an edge."},
+    {"adjacency", reinterpret_cast<PyCFunction>(PyGraphAdjacency), METH_VARARGS,
+     "Return the adjacency of the graph in compressed sparse row format as a tuple of _mgp.Array."},
+    {"vertex_ids", reinterpret_cast<PyCFunction>(PyGraphVertexIds), METH_VARARGS,
+     "Return the IDs of the vertices, optionally only the ones with the given label, as _mgp.Array."},
+    {"property_column", reinterpret_cast<PyCFunction>(PyGraphPropertyColumn), METH_VARARGS,
+     "Return the values of a vertex property and a mask of the missing ones as a tuple of _mgp.Array."},
+    {"set_property_column", reinterpret_cast<PyCFunction>(PyGraphSetPropertyColumn), METH_VARARGS,
+     "Set a property of the vertices with the given IDs to the values from a buffer."},
     {"iter_vertices", reinterpret_cast<PyCFunction>(PyGraphIterVertices), METH_NOARGS, "Return _mgp.VerticesIterator."},
+    {"iter_vertices_by_label", reinterpret_cast<PyCFunction>(PyGraphIterVerticesByLabel), METH_VARARGS,
+     "Return _mgp.VerticesIterator over the vertices with the given label."},
+    {"iter_vertices_by_property", reinterpret_cast<PyCFunction>(PyGraphIterVerticesByProperty), METH_VARARGS,
+     "Return _mgp.VerticesIterator over the vertices with the given label and property value."},
+    {"iter_vertices_by_property_range", reinterpret_cast<PyCFunction>(PyGraphIterVerticesByPropertyRange), METH_VARARGS,
+     "Return _mgp.VerticesIterator over the vertices with the given label and property value range."},
+    {"vertex_count", reinterpret_cast<PyCFunction>(PyGraphVertexCount), METH_VARARGS,
+     "Return the number of vertices, optionally only of the ones with the given label."},
+    {"edge_count", reinterpret_cast<PyCFunction>(PyGraphEdgeCount), METH_NOARGS, "Return the number of edges."},
     {"must_abort", reinterpret_cast<PyCFunction>(PyGraphMustAbort), METH_NOARGS,
      "Check whether the running procedure should abort"},
+    {"version", reinterpret_cast<PyCFunction>(PyGraphVersion), METH_NOARGS,
+     "Return a tuple identifying the committed state of the graph, or None if it cannot be identified."},
     {nullptr, {}, {}, {}},
 };
 
@@ -429,6 +982,9 @@ PyObject *MakePyGraph(mgp_graph *graph, mgp_memory *memory) {
   if (!py_graph) return nullptr;
   py_graph->graph = graph;
   py_graph->memory = memory;
+  py_graph->vertex_count = -1;
+  py_graph->edge_count = -1;
+  py_graph->passes_in_progress = 0;
   return reinterpret_cast<PyObject *>(py_graph);
 }
 
@@ -457,10 +1013,21 @@ PyObject *MakePyCypherType(mgp_type *type) {
   return reinterpret_cast<PyObject *>(py_type);
 }
 
+// Layout of the records a Python procedure returns. It is compiled once, while
+// the procedure is being registered, from its `mgp.Record` return annotation,
+// so that the records need not be inspected on each row.
+struct PyRecordSchema {
+  // `mgp.Record` class of the `mgp` module the procedure was registered with.
+  py::Object record_cls;
+  // Interned names of the result fields, in the order they were declared.
+  std::vector<py::Object> field_names;
+};
+
 // clang-format off
 struct PyQueryProc {
   PyObject_HEAD
   mgp_proc *callable;
+  PyRecordSchema *record_schema;
 };
 // clang-format on
 
@@ -528,6 +1095,14 @@ PyObject *PyQueryProcAddArg(PyQueryProc *self, PyObject *args) { return PyCallab
 
 PyObject *PyQueryProcAddOptArg(PyQueryProc *self, PyObject *args) { return PyCallableAddOptArg(self, args); }
 
+bool AddRecordSchemaField(PyRecordSchema *record_schema, const char *name) {
+  MG_ASSERT(record_schema);
+  py::Object py_name(PyUnicode_InternFromString(name));
+  if (!py_name) return false;
+  record_schema->field_names.push_back(std::move(py_name));
+  return true;
+}
+
 PyObject *PyQueryProcAddResult(PyQueryProc *self, PyObject *args) {
   MG_ASSERT(self->callable);
   const char *name = nullptr;
@@ -538,6 +1113,7 @@ PyObject *PyQueryProcAddResult(PyQueryProc *self, PyObject *args) {
   if (RaiseExceptionFromErrorCode(mgp_proc_add_result(self->callable, name, type))) {
     return nullptr;
   }
+  if (!AddRecordSchemaField(self->record_schema, name)) return nullptr;
   Py_RETURN_NONE;
 }
 
@@ -550,6 +1126,7 @@ PyObject *PyQueryProcAddDeprecatedResult(PyQueryProc *self, PyObject *args) {
   if (RaiseExceptionFromErrorCode(mgp_proc_add_deprecated_result(self->callable, name, type))) {
     return nullptr;
   }
+  if (!AddRecordSchemaField(self->record_schema, name)) return nullptr;
   Py_RETURN_NONE;
 }
 
@@ -615,15 +1192,113 @@ struct PyMessages {
   PyObject_HEAD;
   mgp_messages *messages;
   mgp_memory *memory;
+  // List of the memoryviews of the payloads and keys, which are released once
+  // the messages are invalidated.
+  PyObject *views;
+  // Number of buffers exported from the message data. The views share a
+  // single export with the views sliced or cast from them, which lasts as long
+  // as any of them, or a buffer derived from them, e.g. a NumPy array.
+  Py_ssize_t exports;
 };
 
 struct PyMessage {
   PyObject_HEAD;
   mgp_message *message;
-  const PyMessages *messages;
+  PyMessages *messages;
   mgp_memory *memory;
 };
 
+// Exports the data of a message through the buffer protocol, without copying
+// it. The data is owned by the stream consumer, so no buffer may be exported
+// once the messages are invalidated, and the exports are counted in `messages`.
+//
+// clang-format off
+struct PyMessageBuffer {
+  PyObject_HEAD
+  PyMessages *messages;
+  const char *data;
+  Py_ssize_t size;
+};
+// clang-format on
+
+void PyMessageBufferDealloc(PyMessageBuffer *self) {
+  // NOLINTNEXTLINE
+  Py_DECREF(self->messages);
+  // NOLINTNEXTLINE
+  Py_TYPE(self)->tp_free(self);
+}
+
+int PyMessageBufferGetBuffer(PyMessageBuffer *self, Py_buffer *view, int flags) {
+  if (!self->messages->messages) {
+    view->obj = nullptr;
+    PyErr_SetString(PyExc_BufferError, "The messages are only valid during the transformation call.");
+    return -1;
+  }
+  // NOLINTNEXTLINE(cppcoreguidelines-pro-type-const-cast)
+  if (PyBuffer_FillInfo(view, reinterpret_cast<PyObject *>(self), const_cast<char *>(self->data), self->size,
+                        /* readonly = */ 1, flags) != 0) {
+    return -1;
+  }
+  ++self->messages->exports;
+  return 0;
+}
+
+void PyMessageBufferReleaseBuffer(PyMessageBuffer *self, Py_buffer * /*view*/) { --self->messages->exports; }
+
+static PyBufferProcs PyMessageBufferProcs = {
+    .bf_getbuffer = reinterpret_cast<getbufferproc>(PyMessageBufferGetBuffer),
+    .bf_releasebuffer = reinterpret_cast<releasebufferproc>(PyMessageBufferReleaseBuffer),
+};
+
+// clang-format off
+static PyTypeObject PyMessageBufferType = {
+    PyVarObject_HEAD_INIT(nullptr, 0)
+    .tp_name = "_mgp.MessageBuffer",
+    .tp_basicsize = sizeof(PyMessageBuffer),
+    .tp_dealloc = reinterpret_cast<destructor>(PyMessageBufferDealloc),
+    .tp_as_buffer = &PyMessageBufferProcs,
+    .tp_flags = Py_TPFLAGS_DEFAULT,
+    .tp_doc = "Exports the data of a stream message through the buffer protocol.",
+};
+// clang-format on
+
+// Return a read-only memoryview of the message data, without copying it. The
+// view is released once `messages` are invalidated.
+PyObject *MakePyMessageView(PyMessages *messages, const char *data, size_t size) {
+  py::Object buffer(reinterpret_cast<PyObject *>(PyObject_New(PyMessageBuffer, &PyMessageBufferType)));
+  if (!buffer) return nullptr;
+  auto *py_buffer = reinterpret_cast<PyMessageBuffer *>(buffer.Ptr());
+  // NOLINTNEXTLINE
+  Py_INCREF(messages);
+  py_buffer->messages = messages;
+  py_buffer->data = data ? data : "";
+  py_buffer->size = static_cast<Py_ssize_t>(size);
+  py::Object view(PyMemoryView_FromObject(buffer.Ptr()));
+  if (!view) return nullptr;
+  if (!messages->views) {
+    messages->views = PyList_New(0);
+    if (!messages->views) return nullptr;
+  }
+  if (PyList_Append(messages->views, view.Ptr()) != 0) return nullptr;
+  return view.Steal();
+}
+
+// Release the memoryviews of the message data. Return false if a buffer
+// exported from the data is still in use, e.g. a NumPy array derived from a
+// view, which would read the data after it's freed.
+bool ReleasePyMessageViews(PyMessages *messages) {
+  if (messages->views) {
+    const auto size = PyList_GET_SIZE(messages->views);
+    for (Py_ssize_t i = 0; i < size; ++i) {
+      // A view with exported buffers can't be released.
+      py::Object res(PyObject_CallMethod(PyList_GET_ITEM(messages->views, i), "release", nullptr));
+      if (!res) PyErr_Clear();
+    }
+    Py_CLEAR(messages->views);
+  }
+  return messages->exports == 0;
+}
+
 PyObject *PyMessagesIsValid(const PyMessages *self, PyObject *Py_UNUSED(ignored)) {
   return PyBool_FromLong(!!self->messages);
 }
@@ -665,6 +1340,19 @@ PyObject *PyMessageGetPayload(PyMessage *self, PyObject *Py_UNUSED(ignored)) {
   return raw_bytes;
 }
 
+PyObject *PyMessageGetPayloadView(PyMessage *self, PyObject *Py_UNUSED(ignored)) {
+  MG_ASSERT(self->message);
+  size_t payload_size{0};
+  if (RaiseExceptionFromErrorCode(mgp_message_payload_size(self->message, &payload_size))) {
+    return nullptr;
+  }
+  const char *payload{nullptr};
+  if (RaiseExceptionFromErrorCode(mgp_message_payload(self->message, &payload))) {
+    return nullptr;
+  }
+  return MakePyMessageView(self->messages, payload, payload_size);
+}
+
 PyObject *PyMessageGetTopicName(PyMessage *self, PyObject *Py_UNUSED(ignored)) {
   MG_ASSERT(self->message);
   MG_ASSERT(self->memory);
@@ -699,6 +1387,20 @@ PyObject *PyMessageGetKey(PyMessage *self, PyObject *Py_UNUSED(ignored)) {
   return raw_bytes;
 }
 
+PyObject *PyMessageGetKeyView(PyMessage *self, PyObject *Py_UNUSED(ignored)) {
+  MG_ASSERT(self->message);
+  MG_ASSERT(self->memory);
+  size_t key_size{0};
+  if (RaiseExceptionFromErrorCode(mgp_message_key_size(self->message, &key_size))) {
+    return nullptr;
+  }
+  const char *key{nullptr};
+  if (RaiseExceptionFromErrorCode(mgp_message_key(self->message, &key))) {
+    return nullptr;
+  }
+  return MakePyMessageView(self->messages, key, key_size);
+}
+
 PyObject *PyMessageGetTimestamp(PyMessage *self, PyObject *Py_UNUSED(ignored)) {
   MG_ASSERT(self->message);
   MG_ASSERT(self->memory);
@@ -736,8 +1438,12 @@ static PyMethodDef PyMessageMethods[] = {
      "Return True if messages is in valid context and may be used."},
     {"source_type", reinterpret_cast<PyCFunction>(PyMessageGetSourceType), METH_NOARGS, "Get stream source type."},
     {"payload", reinterpret_cast<PyCFunction>(PyMessageGetPayload), METH_NOARGS, "Get payload"},
+    {"payload_view", reinterpret_cast<PyCFunction>(PyMessageGetPayloadView), METH_NOARGS,
+     "Get a read-only memoryview of the payload."},
     {"topic_name", reinterpret_cast<PyCFunction>(PyMessageGetTopicName), METH_NOARGS, "Get topic name."},
     {"key", reinterpret_cast<PyCFunction>(PyMessageGetKey), METH_NOARGS, "Get message key."},
+    {"key_view", reinterpret_cast<PyCFunction>(PyMessageGetKeyView), METH_NOARGS,
+     "Get a read-only memoryview of the message key."},
     {"timestamp", reinterpret_cast<PyCFunction>(PyMessageGetTimestamp), METH_NOARGS, "Get message timestamp."},
     {"offset", reinterpret_cast<PyCFunction>(PyMessageGetOffset), METH_NOARGS, "Get message offset."},
     {nullptr, {}, {}, {}},
@@ -766,6 +1472,10 @@ static PyTypeObject PyMessageType = {
 };
 
 PyObject *PyMessagesInvalidate(PyMessages *self, PyObject *Py_UNUSED(ignored)) {
+  // Using a released view raises an exception instead of reading the freed
+  // message data. The transformation already failed if a buffer exported from
+  // the data is still in use.
+  static_cast<void>(ReleasePyMessageViews(self));
   self->messages = nullptr;
   self->memory = nullptr;
   Py_RETURN_NONE;
@@ -783,6 +1493,28 @@ PyObject *PyMessagesGetTotalMessages(PyMessages *self, PyObject *Py_UNUSED(ignor
   return py_int;
 }
 
+PyObject *PyMessagesGetPayloadViews(PyMessages *self, PyObject *Py_UNUSED(ignored)) {
+  MG_ASSERT(self->messages);
+  MG_ASSERT(self->memory);
+  auto &messages = self->messages->messages;
+  py::Object py_payloads(PyList_New(static_cast<Py_ssize_t>(messages.size())));
+  if (!py_payloads) return nullptr;
+  for (size_t i = 0; i < messages.size(); ++i) {
+    size_t payload_size{0};
+    if (RaiseExceptionFromErrorCode(mgp_message_payload_size(&messages[i], &payload_size))) {
+      return nullptr;
+    }
+    const char *payload{nullptr};
+    if (RaiseExceptionFromErrorCode(mgp_message_payload(&messages[i], &payload))) {
+      return nullptr;
+    }
+    auto *py_payload = MakePyMessageView(self, payload, payload_size);
+    if (!py_payload) return nullptr;
+    PyList_SET_ITEM(py_payloads.Ptr(), static_cast<Py_ssize_t>(i), py_payload);
+  }
+  return py_payloads.Steal();
+}
+
 PyObject *PyMessagesGetMessageAt(PyMessages *self, PyObject *args) {
   MG_ASSERT(self->messages);
   MG_ASSERT(self->memory);
@@ -819,13 +1551,23 @@ static PyMethodDef PyMessagesMethods[] = {
      "Get number of messages available"},
     {"message_at", reinterpret_cast<PyCFunction>(PyMessagesGetMessageAt), METH_VARARGS,
      "Get message at index idx from messages"},
+    {"payload_views", reinterpret_cast<PyCFunction>(PyMessagesGetPayloadViews), METH_NOARGS,
+     "Get read-only memoryviews of the payloads of all the messages."},
     {nullptr, {}, {}, {}},
 };
 
+void PyMessagesDealloc(PyMessages *self) {
+  // NOLINTNEXTLINE
+  Py_XDECREF(self->views);
+  // NOLINTNEXTLINE
+  Py_TYPE(self)->tp_free(self);
+}
+
 // NOLINTNEXTLINE
 static PyTypeObject PyMessagesType = {
     PyVarObject_HEAD_INIT(nullptr, 0).tp_name = "_mgp.Messages",
     .tp_basicsize = sizeof(PyMessages),
+    .tp_dealloc = reinterpret_cast<destructor>(PyMessagesDealloc),
     // NOLINTNEXTLINE
     .tp_flags = Py_TPFLAGS_DEFAULT,
     .tp_doc = "Wraps struct mgp_messages.",
@@ -840,9 +1582,249 @@ PyObject *MakePyMessages(mgp_messages *msgs, mgp_memory *memory) {
   if (!py_messages) return nullptr;
   py_messages->messages = msgs;
   py_messages->memory = memory;
+  py_messages->views = nullptr;
+  py_messages->exports = 0;
   return reinterpret_cast<PyObject *>(py_messages);
 }
 
+// A list argument of a procedure whose elements are converted to Python
+// objects only when they're accessed. The list belongs to the procedure call,
+// so the object is only valid while its `_mgp.Graph` is.
+//
+// clang-format off
+struct PyLazyList {
+  PyObject_HEAD
+  mgp_list *list;
+  PyGraph *py_graph;
+};
+// clang-format on
+
+void PyLazyListDealloc(PyLazyList *self) {
+  MG_ASSERT(self->py_graph);
+  Py_DECREF(self->py_graph);
+  Py_TYPE(self)->tp_free(self);
+}
+
+PyObject *PyLazyListIsValid(PyLazyList *self, PyObject *Py_UNUSED(ignored)) {
+  return PyBool_FromLong(PyGraphIsValidImpl(*self->py_graph));
+}
+
+PyObject *PyLazyListSize(PyLazyList *self, PyObject *Py_UNUSED(ignored)) {
+  MG_ASSERT(PyGraphIsValidImpl(*self->py_graph));
+  return PyLong_FromSize_t(self->list->elems.size());
+}
+
+PyObject *PyLazyListAt(PyLazyList *self, PyObject *args) {
+  MG_ASSERT(PyGraphIsValidImpl(*self->py_graph));
+  Py_ssize_t index{0};
+  if (!PyArg_ParseTuple(args, "n", &index)) return nullptr;
+  if (index < 0 || static_cast<size_t>(index) >= self->list->elems.size()) {
+    PyErr_SetString(PyExc_IndexError, "List index out of range.");
+    return nullptr;
+  }
+  return MgpValueToPyObject(self->list->elems[index], self->py_graph).Steal();
+}
+
+PyObject *PyLazyListIds(PyLazyList *self, mgp_value_type type) {
+  MG_ASSERT(PyGraphIsValidImpl(*self->py_graph));
+  std::vector<int64_t> ids;
+  ids.reserve(self->list->elems.size());
+  for (auto &elem : self->list->elems) {
+    if (elem.type != type) {
+      PyErr_SetString(PyExc_TypeError,
+                      type == MGP_VALUE_TYPE_VERTEX ? "Expected a list of vertices." : "Expected a list of edges.");
+      return nullptr;
+    }
+    ids.push_back(type == MGP_VALUE_TYPE_VERTEX ? Call<mgp_vertex_id>(mgp_vertex_get_id, elem.vertex_v).as_int
+                                                : Call<mgp_edge_id>(mgp_edge_get_id, elem.edge_v).as_int);
+  }
+  return MakePyArray(std::move(ids));
+}
+
+PyObject *PyLazyListVertexIds(PyLazyList *self, PyObject *Py_UNUSED(ignored)) {
+  return PyLazyListIds(self, MGP_VALUE_TYPE_VERTEX);
+}
+
+PyObject *PyLazyListEdgeIds(PyLazyList *self, PyObject *Py_UNUSED(ignored)) {
+  return PyLazyListIds(self, MGP_VALUE_TYPE_EDGE);
+}
+
+PyObject *PyLazyListEdgeEndpoints(PyLazyList *self, PyObject *args) {
+  MG_ASSERT(PyGraphIsValidImpl(*self->py_graph));
+  Py_ssize_t start{0};
+  Py_ssize_t stop{0};
+  if (!PyArg_ParseTuple(args, "nn", &start, &stop)) return nullptr;
+  const auto size = static_cast<Py_ssize_t>(self->list->elems.size());
+  start = std::clamp<Py_ssize_t>(start, 0, size);
+  stop = std::clamp<Py_ssize_t>(stop, start, size);
+  std::vector<int64_t> from_ids;
+  std::vector<int64_t> to_ids;
+  from_ids.reserve(stop - start);
+  to_ids.reserve(stop - start);
+  for (auto i = start; i < stop; ++i) {
+    auto &elem = self->list->elems[i];
+    if (elem.type != MGP_VALUE_TYPE_EDGE) {
+      PyErr_SetString(PyExc_TypeError, "Expected a list of edges.");
+      return nullptr;
+    }
+    auto *from = Call<mgp_vertex *>(mgp_edge_get_from, elem.edge_v);
+    auto *to = Call<mgp_vertex *>(mgp_edge_get_to, elem.edge_v);
+    from_ids.push_back(Call<mgp_vertex_id>(mgp_vertex_get_id, from).as_int);
+    to_ids.push_back(Call<mgp_vertex_id>(mgp_vertex_get_id, to).as_int);
+  }
+  py::Object py_from_ids(MakePyArray(std::move(from_ids)));
+  if (!py_from_ids) return nullptr;
+  py::Object py_to_ids(MakePyArray(std::move(to_ids)));
+  if (!py_to_ids) return nullptr;
+  return PyTuple_Pack(2, py_from_ids.Ptr(), py_to_ids.Ptr());
+}
+
+static PyMethodDef PyLazyListMethods[] = {
+    {"__reduce__", reinterpret_cast<PyCFunction>(DisallowPickleAndCopy), METH_NOARGS, "__reduce__ is not supported"},
+    {"is_valid", reinterpret_cast<PyCFunction>(PyLazyListIsValid), METH_NOARGS,
+     "Return True if the list is in valid context and may be used."},
+    {"size", reinterpret_cast<PyCFunction>(PyLazyListSize), METH_NOARGS, "Return the number of elements."},
+    {"at", reinterpret_cast<PyCFunction>(PyLazyListAt), METH_VARARGS, "Convert the element at the given index."},
+    {"vertex_ids", reinterpret_cast<PyCFunction>(PyLazyListVertexIds), METH_NOARGS,
+     "Return the IDs of the vertices in the list as an Array."},
+    {"edge_ids", reinterpret_cast<PyCFunction>(PyLazyListEdgeIds), METH_NOARGS,
+     "Return the IDs of the edges in the list as an Array."},
+    {"edge_endpoints", reinterpret_cast<PyCFunction>(PyLazyListEdgeEndpoints), METH_VARARGS,
+     "Return the IDs of the endpoints of the edges in the given range of the list as a pair of Arrays."},
+    {nullptr, {}, {}, {}},
+};
+
+// clang-format off
+static PyTypeObject PyLazyListType = {
+    PyVarObject_HEAD_INIT(nullptr, 0)
+    .tp_name = "_mgp.LazyList",
+    .tp_basicsize = sizeof(PyLazyList),
+    .tp_dealloc = reinterpret_cast<destructor>(PyLazyListDealloc),
+    .tp_flags = Py_TPFLAGS_DEFAULT,
+    .tp_doc = "Wraps struct mgp_list, converting its elements on access.",
+    .tp_methods = PyLazyListMethods,
+};
+// clang-format on
+
+// A map argument of a procedure whose values are converted to Python objects
+// only when they're accessed. Valid while its `_mgp.Graph` is.
+//
+// clang-format off
+struct PyLazyMap {
+  PyObject_HEAD
+  mgp_map *map;
+  PyGraph *py_graph;
+};
+// clang-format on
+
+void PyLazyMapDealloc(PyLazyMap *self) {
+  MG_ASSERT(self->py_graph);
+  Py_DECREF(self->py_graph);
+  Py_TYPE(self)->tp_free(self);
+}
+
+PyObject *PyLazyMapIsValid(PyLazyMap *self, PyObject *Py_UNUSED(ignored)) {
+  return PyBool_FromLong(PyGraphIsValidImpl(*self->py_graph));
+}
+
+PyObject *PyLazyMapSize(PyLazyMap *self, PyObject *Py_UNUSED(ignored)) {
+  MG_ASSERT(PyGraphIsValidImpl(*self->py_graph));
+  return PyLong_FromSize_t(self->map->items.size());
+}
+
+PyObject *PyLazyMapKeys(PyLazyMap *self, PyObject *Py_UNUSED(ignored)) {
+  MG_ASSERT(PyGraphIsValidImpl(*self->py_graph));
+  py::Object py_keys(PyTuple_New(static_cast<Py_ssize_t>(self->map->items.size())));
+  if (!py_keys) return nullptr;
+  Py_ssize_t i = 0;
+  for (const auto &[key, value] : self->map->items) {
+    auto *py_key = PyUnicode_FromStringAndSize(key.data(), static_cast<Py_ssize_t>(key.size()));
+    if (!py_key) return nullptr;
+    PyTuple_SET_ITEM(py_keys.Ptr(), i++, py_key);
+  }
+  return py_keys.Steal();
+}
+
+PyObject *PyLazyMapAt(PyLazyMap *self, PyObject *args) {
+  MG_ASSERT(PyGraphIsValidImpl(*self->py_graph));
+  const char *key{nullptr};
+  if (!PyArg_ParseTuple(args, "s", &key)) return nullptr;
+  auto *value = Call<mgp_value *>(mgp_map_at, self->map, key);
+  if (!value) {
+    PyErr_SetString(PyExc_KeyError, key);
+    return nullptr;
+  }
+  return MgpValueToPyObject(*value, self->py_graph).Steal();
+}
+
+static PyMethodDef PyLazyMapMethods[] = {
+    {"__reduce__", reinterpret_cast<PyCFunction>(DisallowPickleAndCopy), METH_NOARGS, "__reduce__ is not supported"},
+    {"is_valid", reinterpret_cast<PyCFunction>(PyLazyMapIsValid), METH_NOARGS,
+     "Return True if the map is in valid context and may be used."},
+    {"size", reinterpret_cast<PyCFunction>(PyLazyMapSize), METH_NOARGS, "Return the number of items."},
+    {"keys", reinterpret_cast<PyCFunction>(PyLazyMapKeys), METH_NOARGS, "Return a tuple of the keys."},
+    {"at", reinterpret_cast<PyCFunction>(PyLazyMapAt), METH_VARARGS, "Convert the value of the given key."},
+    {nullptr, {}, {}, {}},
+};
+
+// clang-format off
+static PyTypeObject PyLazyMapType = {
+    PyVarObject_HEAD_INIT(nullptr, 0)
+    .tp_name = "_mgp.LazyMap",
+    .tp_basicsize = sizeof(PyLazyMap),
+    .tp_dealloc = reinterpret_cast<destructor>(PyLazyMapDealloc),
+    .tp_flags = Py_TPFLAGS_DEFAULT,
+    .tp_doc = "Wraps struct mgp_map, converting its values on access.",
+    .tp_methods = PyLazyMapMethods,
+};
+// clang-format on
+
+// Convert the arguments of a procedure like `MgpListToPyTuple`, except that
+// list and map arguments become `mgp.LazyList` and `mgp.LazyMap` objects.
+py::Object MgpListToPyLazyArgs(mgp_list *args, PyGraph *py_graph) {
+  MG_ASSERT(args);
+  MG_ASSERT(py_graph);
+  const auto len = args->elems.size();
+  py::Object py_tuple(PyTuple_New(len));
+  if (!py_tuple) return nullptr;
+  py::Object py_mgp;
+  for (size_t i = 0; i < len; ++i) {
+    auto &arg = args->elems[i];
+    py::Object elem;
+    if (arg.type == MGP_VALUE_TYPE_LIST || arg.type == MGP_VALUE_TYPE_MAP) {
+      if (!py_mgp) {
+        py_mgp = py::Object(PyImport_ImportModule("mgp"));
+        if (!py_mgp) return nullptr;
+      }
+      Py_INCREF(py_graph);
+      if (arg.type == MGP_VALUE_TYPE_LIST) {
+        auto *py_list = PyObject_New(PyLazyList, &PyLazyListType);  // NOLINT(cppcoreguidelines-pro-type-cstyle-cast)
+        if (!py_list) {
+          Py_DECREF(py_graph);
+          return nullptr;
+        }
+        py_list->list = arg.list_v;
+        py_list->py_graph = py_graph;
+        elem = py_mgp.CallMethod("LazyList", py::Object(reinterpret_cast<PyObject *>(py_list)));
+      } else {
+        auto *py_map = PyObject_New(PyLazyMap, &PyLazyMapType);  // NOLINT(cppcoreguidelines-pro-type-cstyle-cast)
+        if (!py_map) {
+          Py_DECREF(py_graph);
+          return nullptr;
+        }
+        py_map->map = arg.map_v;
+        py_map->py_graph = py_graph;
+        elem = py_mgp.CallMethod("LazyMap", py::Object(reinterpret_cast<PyObject *>(py_map)));
+      }
+    } else {
+      elem = MgpValueToPyObject(arg, py_graph);
+    }
+    if (!elem) return nullptr;
+    PyTuple_SET_ITEM(py_tuple.Ptr(), i, elem.Steal());
+  }
+  return py_tuple;
+}
+
 py::Object MgpListToPyTuple(mgp_list *list, PyGraph *py_graph) {
   MG_ASSERT(list);
   MG_ASSERT(py_graph);
@@ -867,7 +1849,83 @@ py::Object MgpListToPyTuple(mgp_list *list, PyObject *py_graph) {
   return MgpListToPyTuple(list, reinterpret_cast<PyGraph *>(py_graph));
 }
 
-void PyCollectGarbage() {
+namespace {
+// CPython's default threshold of the oldest generation. A full collection is
+// due once this many collections of the middle generation have happened since
+// the last one and pymalloc has grown by a quarter since then, which mirrors
+// CPython's own heuristic, or once the interval between full collections has
+// passed. It's deferred while Python procedures and functions are running,
+// unless pymalloc has doubled or the interval has passed twice.
+constexpr int kFullCollectionThreshold{10};
+
+// Lower bound of the pymalloc size the growth is measured against. Arenas
+// allocated before the allocator hooks were installed aren't counted, so the
+// measured size may be close to 0 and would otherwise make every check due.
+constexpr int64_t kMinArenaBytesBaseline{16L * 1024 * 1024};
+
+// State of the scheduled collections, only accessed with the GIL held.
+struct PyGarbageCollectionState {
+  int64_t arena_bytes_after_full_collection{0};
+  utils::Timer since_full_collection;
+};
+
+// NOLINTNEXTLINE(cppcoreguidelines-avoid-non-const-global-variables)
+PyGarbageCollectionState gPyGarbageCollection;
+
+py::Object ImportGc() {
+  py::Object gc(PyImport_ImportModule("gc"));
+  if (!gc) {
+    LOG_FATAL(py::FetchError().value());
+  }
+  return gc;
+}
+
+template <class... TArgs>
+py::Object CallGcFunction(std::string_view name, const TArgs &...args) {
+  auto result = ImportGc().CallMethod(name, args...);
+  if (!result) {
+    LOG_FATAL(py::FetchError().value());
+  }
+  return result;
+}
+
+void CollectGeneration(long generation, metrics::Event latency_histogram) {
+  const utils::Timer timer;
+  const py::Object py_generation(PyLong_FromLong(generation));
+  static_cast<void>(CallGcFunction("collect", py_generation));
+  metrics::Measure(latency_histogram, timer.Elapsed<std::chrono::microseconds>().count());
+}
+}  // namespace
+
+void PySetUpGarbageCollection() {
+  // Full collections are only run by PyCollectGarbage, so that they don't
+  // happen in the middle of procedure calls.
+  auto thresholds = CallGcFunction("get_threshold");
+  const py::Object max_threshold(PyLong_FromLong(std::numeric_limits<int>::max()));
+  static_cast<void>(CallGcFunction("set_threshold", PyTuple_GET_ITEM(thresholds.Ptr(), 0),
+                                   PyTuple_GET_ITEM(thresholds.Ptr(), 1), max_threshold));
+  gPyGarbageCollection.arena_bytes_after_full_collection = gPyArenaBytes.load(std::memory_order_relaxed);
+}
+
+void PyFreezeGarbage() { static_cast<void>(CallGcFunction("freeze")); }
+
+void PyUnfreezeGarbage() { static_cast<void>(CallGcFunction("unfreeze")); }
+
+PyGarbageCollection SchedulePyGarbageCollection(const PyGarbageCollectionStats &stats,
+                                                std::chrono::seconds full_collection_interval) {
+  const auto baseline = std::max(stats.arena_bytes_after_full_collection, kMinArenaBytesBaseline);
+  const bool is_full_collection_due =
+      stats.old_count > 0 && ((stats.old_count >= kFullCollectionThreshold && 4 * stats.arena_bytes >= 5 * baseline) ||
+                              stats.since_full_collection >= full_collection_interval);
+  const bool cannot_wait =
+      stats.arena_bytes >= 2 * baseline || stats.since_full_collection >= 2 * full_collection_interval;
+
+  if (is_full_collection_due && (stats.is_idle || cannot_wait)) return PyGarbageCollection::FULL;
+  if (stats.is_idle && stats.young_count > 0) return PyGarbageCollection::YOUNG;
+  return PyGarbageCollection::NONE;
+}
+
+void PyCollectGarbage(std::chrono::seconds full_collection_interval) {
   // NOTE: No need to call _Py_IsFinalizing(), we ensure
   // Python GC thread is stopped before Py_Finalize() is called
   // in memgraph.cpp
@@ -878,13 +1936,31 @@ void PyCollectGarbage() {
 
   auto gil = py::EnsureGIL();
 
-  py::Object gc(PyImport_ImportModule("gc"));
-  if (!gc) {
-    LOG_FATAL(py::FetchError().value());
-  }
+  auto counts = CallGcFunction("get_count");
+  const auto young_count = PyLong_AsLong(PyTuple_GET_ITEM(counts.Ptr(), 0));
+  const auto old_count = PyLong_AsLong(PyTuple_GET_ITEM(counts.Ptr(), 2));
+
+  auto &state = gPyGarbageCollection;
+  const PyGarbageCollectionStats stats{
+      .young_count = young_count,
+      .old_count = old_count,
+      .arena_bytes = gPyArenaBytes.load(std::memory_order_relaxed),
+      .arena_bytes_after_full_collection = state.arena_bytes_after_full_collection,
+      .since_full_collection = state.since_full_collection.Elapsed<std::chrono::seconds>(),
+      .is_idle = gRunningPyCallables.load(std::memory_order_relaxed) == 0,
+  };
 
-  if (!gc.CallMethod("collect")) {
-    LOG_FATAL(py::FetchError().value());
+  switch (SchedulePyGarbageCollection(stats, full_collection_interval)) {
+    case PyGarbageCollection::FULL:
+      CollectGeneration(2, metrics::PythonFullGCLatency_us);
+      state.arena_bytes_after_full_collection = gPyArenaBytes.load(std::memory_order_relaxed);
+      state.since_full_collection = utils::Timer();
+      break;
+    case PyGarbageCollection::YOUNG:
+      CollectGeneration(1, metrics::PythonYoungGCLatency_us);
+      break;
+    case PyGarbageCollection::NONE:
+      break;
   }
 }
 
@@ -911,34 +1987,49 @@ std::optional<py::ExceptionInfo> InsertField(PyObject *key, PyObject *val, mgp_r
   return std::nullopt;
 }
 
-void SkipRecord(mgp_value *field_val, std::vector<RecordFieldCache> &current_record_cache) {
-  mgp_value_destroy(field_val);
-  for (auto &cache_entry : current_record_cache) {
-    mgp_value_destroy(cache_entry.field_val);
-  }
-}
-
+// A record is either an instance of `mgp.Record`, or, when the layout of the
+// records is known from `record_schema`, a tuple with the value of each result
+// field in the declared order. The latter spares building a `mgp.Record` and
+// its `fields` dictionary for each row.
 std::optional<py::ExceptionInfo> AddRecordFromPython(mgp_result *result, py::Object py_record, mgp_graph *graph,
-                                                     mgp_memory *memory) {
-  py::Object py_mgp(PyImport_ImportModule("mgp"));
-  if (!py_mgp) return py::FetchError();
-  auto record_cls = py_mgp.GetAttr("Record");
-  if (!record_cls) return py::FetchError();
-  if (!PyObject_IsInstance(py_record.Ptr(), record_cls.Ptr())) {
-    std::stringstream ss;
-    ss << "Value '" << py_record << "' is not an instance of 'mgp.Record'";
-    const auto &msg = ss.str();
-    PyErr_SetString(PyExc_TypeError, msg.c_str());
-    return py::FetchError();
-  }
-  py::Object fields(py_record.GetAttr("fields"));
-  if (!fields) return py::FetchError();
-  if (!PyDict_Check(fields)) {
-    PyErr_SetString(PyExc_TypeError, "Expected 'mgp.Record.fields' to be a 'dict'");
-    return py::FetchError();
+                                                     mgp_memory *memory,
+                                                     const PyRecordSchema *record_schema = nullptr) {
+  const bool is_positional = record_schema && PyTuple_CheckExact(py_record.Ptr());
+  py::Object fields;
+  if (is_positional) {
+    const auto num_fields = static_cast<Py_ssize_t>(record_schema->field_names.size());
+    if (PyTuple_GET_SIZE(py_record.Ptr()) != num_fields) {
+      std::stringstream ss;
+      ss << "Value '" << py_record << "' doesn't have exactly " << num_fields
+         << " elements, one for each of the result fields";
+      const auto &msg = ss.str();
+      PyErr_SetString(PyExc_TypeError, msg.c_str());
+      return py::FetchError();
+    }
+  } else {
+    py::Object record_cls;
+    if (record_schema) {
+      record_cls = record_schema->record_cls;
+    } else {
+      py::Object py_mgp(PyImport_ImportModule("mgp"));
+      if (!py_mgp) return py::FetchError();
+      record_cls = py_mgp.GetAttr("Record");
+      if (!record_cls) return py::FetchError();
+    }
+    if (!PyObject_IsInstance(py_record.Ptr(), record_cls.Ptr())) {
+      std::stringstream ss;
+      ss << "Value '" << py_record << "' is not an instance of 'mgp.Record'";
+      const auto &msg = ss.str();
+      PyErr_SetString(PyExc_TypeError, msg.c_str());
+      return py::FetchError();
+    }
+    fields = py_record.GetAttr("fields");
+    if (!fields) return py::FetchError();
+    if (!PyDict_Check(fields)) {
+      PyErr_SetString(PyExc_TypeError, "Expected 'mgp.Record.fields' to be a 'dict'");
+      return py::FetchError();
+    }
   }
-  py::Object items(PyDict_Items(fields.Ptr()));
-  if (!items) return py::FetchError();
   mgp_result_record *record{nullptr};
   const auto is_transactional = storage::IsTransactional(graph->storage_mode);
   if (is_transactional) {
@@ -951,17 +2042,13 @@ std::optional<py::ExceptionInfo> AddRecordFromPython(mgp_result *result, py::Obj
 
   utils::OnScopeExit clear_record_cache{[&current_record_cache] {
     for (auto &record : current_record_cache) {
-      mgp_value_destroy(record.field_val);
+      // Values which were already inserted are owned by the record.
+      if (record.field_val) mgp_value_destroy(record.field_val);
     }
   }};
 
-  Py_ssize_t len = PyList_GET_SIZE(items.Ptr());
-  for (Py_ssize_t i = 0; i < len; ++i) {
-    auto *item = PyList_GET_ITEM(items.Ptr(), i);
-    if (!item) return py::FetchError();
-    MG_ASSERT(PyTuple_Check(item));
-    PyObject *key = PyTuple_GetItem(item, 0);
-    if (!key) return py::FetchError();
+  bool skip_record = false;
+  auto add_field = [&](PyObject *key, PyObject *val) -> std::optional<py::ExceptionInfo> {
     if (!PyUnicode_Check(key)) {
       std::stringstream ss;
       ss << "Field name '" << py::Object::FromBorrow(key) << "' is not an instance of 'str'";
@@ -971,29 +2058,42 @@ std::optional<py::ExceptionInfo> AddRecordFromPython(mgp_result *result, py::Obj
     }
     const char *field_name = PyUnicode_AsUTF8(key);
     if (!field_name) return py::FetchError();
-    PyObject *val = PyTuple_GetItem(item, 1);
-    if (!val) return py::FetchError();
     // This memory is one dedicated for mg_procedure.
     mgp_value *field_val = PyObjectToMgpValueWithPythonExceptions(val, memory);
     if (field_val == nullptr) {
       return py::FetchError();
     }
 
-    if (!is_transactional) {
-      // If a deleted value is being inserted into a record, skip the whole record
-      if (ContainsDeleted(field_val)) {
-        SkipRecord(field_val, current_record_cache);
-        return std::nullopt;
-      }
-      current_record_cache.emplace_back(
-          RecordFieldCache{.key = key, .val = val, .field_name = field_name, .field_val = field_val});
-    } else {
-      auto maybe_exc = InsertField(key, val, record, field_name, field_val);
+    if (is_transactional) {
+      return InsertField(key, val, record, field_name, field_val);
+    }
+    // If a deleted value is being inserted into a record, skip the whole record
+    if (ContainsDeleted(field_val)) {
+      mgp_value_destroy(field_val);
+      skip_record = true;
+      return std::nullopt;
+    }
+    current_record_cache.emplace_back(
+        RecordFieldCache{.key = key, .val = val, .field_name = field_name, .field_val = field_val});
+    return std::nullopt;
+  };
+
+  if (is_positional) {
+    for (Py_ssize_t i = 0; i < PyTuple_GET_SIZE(py_record.Ptr()) && !skip_record; ++i) {
+      auto maybe_exc = add_field(record_schema->field_names[i].Ptr(), PyTuple_GET_ITEM(py_record.Ptr(), i));
+      if (maybe_exc) return maybe_exc;
+    }
+  } else {
+    Py_ssize_t pos = 0;
+    PyObject *key{nullptr};
+    PyObject *val{nullptr};
+    while (!skip_record && PyDict_Next(fields.Ptr(), &pos, &key, &val)) {
+      auto maybe_exc = add_field(key, val);
       if (maybe_exc) return maybe_exc;
     }
   }
 
-  if (is_transactional) {
+  if (is_transactional || skip_record) {
     return std::nullopt;
   }
 
@@ -1002,8 +2102,8 @@ std::optional<py::ExceptionInfo> AddRecordFromPython(mgp_result *result, py::Obj
     return py::FetchError();
   }
   for (auto &cache_entry : current_record_cache) {
-    auto maybe_exc =
-        InsertField(cache_entry.key, cache_entry.val, record, cache_entry.field_name, cache_entry.field_val);
+    auto *field_val = std::exchange(cache_entry.field_val, nullptr);
+    auto maybe_exc = InsertField(cache_entry.key, cache_entry.val, record, cache_entry.field_name, field_val);
     if (maybe_exc) return maybe_exc;
   }
 
@@ -1011,7 +2111,8 @@ std::optional<py::ExceptionInfo> AddRecordFromPython(mgp_result *result, py::Obj
 }
 
 std::optional<py::ExceptionInfo> AddMultipleRecordsFromPython(mgp_result *result, py::Object py_seq, mgp_graph *graph,
-                                                              mgp_memory *memory) {
+                                                              mgp_memory *memory,
+                                                              const PyRecordSchema *record_schema = nullptr) {
   Py_ssize_t len = PySequence_Size(py_seq.Ptr());
   if (len == -1) return py::FetchError();
   result->rows.reserve(len);
@@ -1020,7 +2121,7 @@ std::optional<py::ExceptionInfo> AddMultipleRecordsFromPython(mgp_result *result
   for (Py_ssize_t i = 0, curr_item = 0; i < len; ++i, ++curr_item) {
     py::Object py_record(PySequence_GetItem(py_seq.Ptr(), curr_item));
     if (!py_record) return py::FetchError();
-    auto maybe_exc = AddRecordFromPython(result, py_record, graph, memory);
+    auto maybe_exc = AddRecordFromPython(result, py_record, graph, memory, record_schema);
     if (maybe_exc) return maybe_exc;
     // Once PySequence_DelSlice deletes "transformed" objects, starting index is 0 again.
     if (i && i % del_cnt == 0) {
@@ -1034,18 +2135,142 @@ std::optional<py::ExceptionInfo> AddMultipleRecordsFromPython(mgp_result *result
 }
 
 std::optional<py::ExceptionInfo> AddMultipleBatchRecordsFromPython(mgp_result *result, py::Object py_seq,
-                                                                   mgp_graph *graph, mgp_memory *memory) {
+                                                                   mgp_graph *graph, mgp_memory *memory,
+                                                                   const PyRecordSchema *record_schema) {
   Py_ssize_t len = PySequence_Size(py_seq.Ptr());
   if (len == -1) return py::FetchError();
   result->rows.reserve(len);
   for (Py_ssize_t i = 0; i < len; ++i) {
     py::Object py_record(PySequence_GetItem(py_seq.Ptr(), i));
     if (!py_record) return py::FetchError();
-    auto maybe_exc = AddRecordFromPython(result, py_record, graph, memory);
+    auto maybe_exc = AddRecordFromPython(result, py_record, graph, memory, record_schema);
     if (maybe_exc) return maybe_exc;
   }
-  PySequence_DelSlice(py_seq.Ptr(), 0, PySequence_Size(py_seq.Ptr()));
-  return std::nullopt;
+  PySequence_DelSlice(py_seq.Ptr(), 0, PySequence_Size(py_seq.Ptr()));
+  return std::nullopt;
+}
+
+// Upper bound on the number of records pulled from a generator procedure in
+// a single batch. Batches start with a single record, so that the first row is
+// delivered right away, and grow up to this size.
+constexpr size_t kMaxGeneratorBatchSize{1024};
+
+// State of a single call of a generator procedure. The `_mgp.Graph` passed to
+// the generator is bound to `graph` and allocates from `memory_resource`, both
+// of which live as long as the generator. That way, the `_mgp` objects the
+// generator holds on to remain usable between the batches it yields. The
+// `_mgp.Graph` is valid only while a batch is being pulled.
+struct PyGeneratorProcedureCall {
+  PyGeneratorProcedureCall(const mgp_graph &graph, std::shared_ptr<const PyRecordSchema> record_schema)
+      : graph(graph), record_schema(std::move(record_schema)) {}
+
+  PyGeneratorProcedureCall(const PyGeneratorProcedureCall &) = delete;
+  PyGeneratorProcedureCall(PyGeneratorProcedureCall &&) = delete;
+  PyGeneratorProcedureCall &operator=(const PyGeneratorProcedureCall &) = delete;
+  PyGeneratorProcedureCall &operator=(PyGeneratorProcedureCall &&) = delete;
+
+  ~PyGeneratorProcedureCall() {
+    if (!Py_IsInitialized()) {
+      // Calling EnsureGIL will crash the program if this is true.
+      static_cast<void>(py_gen.Steal());
+      static_cast<void>(py_graph.Steal());
+      return;
+    }
+    auto gil = py::EnsureGIL();
+    if (py_gen && !py_gen.CallMethod("close")) {
+      // The graph is no longer valid, so any cleanup the generator does in
+      // its `finally` blocks can fail; there is nobody to report that to.
+      PyErr_Clear();
+    }
+    py_gen = py::Object();
+    py_graph = py::Object();
+    record_schema.reset();
+  }
+
+  PyGraph *GetPyGraph() const { return reinterpret_cast<PyGraph *>(py_graph.Ptr()); }
+
+  utils::PoolResource memory_resource{128, 1024};
+  mgp_memory memory{&memory_resource};
+  mgp_graph graph;
+  std::shared_ptr<const PyRecordSchema> record_schema;
+  py::Object py_graph;
+  py::Object py_gen;
+  size_t batch_size{1};
+};
+
+void PullFromPythonGenerator(PyGeneratorProcedureCall &call, mgp_graph *graph, mgp_result *result, mgp_memory *memory) {
+  const ProfiledEnsureGIL gil;
+
+  // Refresh the graph all `_mgp` objects of this call point to, and make the
+  // `_mgp.Graph` valid for the duration of this batch.
+  call.graph = *graph;
+  auto *py_graph = call.GetPyGraph();
+  py_graph->graph = &call.graph;
+  py_graph->memory = &call.memory;
+  utils::OnScopeExit invalidate_graph{[py_graph] { InvalidatePyGraph(*py_graph); }};
+
+  auto pull = [&]() -> std::optional<py::ExceptionInfo> {
+    for (size_t i = 0; i < call.batch_size; ++i) {
+      py::Object py_record(RunPyCallable([&] { return PyIter_Next(call.py_gen.Ptr()); }));
+      if (!py_record) {
+        // No exception set means that the generator is exhausted.
+        return py::FetchError();
+      }
+      auto maybe_exc = AddRecordFromPython(result, py_record, graph, memory, call.record_schema.get());
+      if (maybe_exc) return maybe_exc;
+    }
+    call.batch_size = std::min(call.batch_size * 2, kMaxGeneratorBatchSize);
+    return std::nullopt;
+  };
+
+  // As with the other callables, we only keep the error message and not the
+  // `ExceptionInfo`, so that no extra references to `_mgp` objects are kept.
+  std::optional<std::string> maybe_msg;
+  {
+    auto maybe_exc = pull();
+    // The traceback starts in the generator itself, so there is no internal
+    // wrapper line which needs to be skipped.
+    if (maybe_exc) maybe_msg = py::FormatException(*maybe_exc);
+  }
+  if (maybe_msg) {
+    static_cast<void>(mgp_result_set_error_msg(result, maybe_msg->c_str()));
+  }
+}
+
+mgp_proc_stream StartPythonGenerator(const py::Object &py_cb,
+                                     const std::shared_ptr<const PyRecordSchema> &record_schema, mgp_list *args,
+                                     mgp_graph *graph) {
+  const ProfiledEnsureGIL gil;
+
+  auto call = std::make_shared<PyGeneratorProcedureCall>(*graph, record_schema);
+  auto start = [&]() -> std::optional<py::ExceptionInfo> {
+    call->py_graph = py::Object(MakePyGraph(&call->graph, &call->memory));
+    if (!call->py_graph) return py::FetchError();
+    py::Object py_args(MgpListToPyTuple(args, call->py_graph.Ptr()));
+    if (!py_args) return py::FetchError();
+    call->py_gen = RunPyCallable([&] { return py_cb.Call(call->py_graph, py_args); });
+    if (!call->py_gen) return py::FetchError();
+    if (!PyIter_Check(call->py_gen.Ptr())) {
+      PyErr_SetString(PyExc_TypeError, "Expected the generator procedure to return an iterator.");
+      return py::FetchError();
+    }
+    return std::nullopt;
+  };
+
+  std::optional<std::string> maybe_msg;
+  {
+    auto maybe_exc = start();
+    if (maybe_exc) maybe_msg = py::FormatException(*maybe_exc, /* skip_first_line = */ true);
+  }
+  if (call->py_graph) InvalidatePyGraph(*call->GetPyGraph());
+  if (maybe_msg) {
+    return [msg = std::move(*maybe_msg)](mgp_graph * /*graph*/, mgp_result *result, mgp_memory * /*memory*/) {
+      static_cast<void>(mgp_result_set_error_msg(result, msg.c_str()));
+    };
+  }
+  return [call = std::move(call)](mgp_graph *graph, mgp_result *result, mgp_memory *memory) {
+    PullFromPythonGenerator(*call, graph, result, memory);
+  };
 }
 
 std::function<void()> PyObjectCleanup(py::Object &py_object) {
@@ -1061,9 +2286,9 @@ std::function<void()> PyObjectCleanup(py::Object &py_object) {
   };
 }
 
-void CallPythonProcedure(const py::Object &py_cb, mgp_list *args, mgp_graph *graph, mgp_result *result,
-                         mgp_memory *memory, bool is_batched) {
-  auto gil = py::EnsureGIL();
+void CallPythonProcedure(const py::Object &py_cb, const PyRecordSchema &record_schema, mgp_list *args, mgp_graph *graph,
+                         mgp_result *result, mgp_memory *memory, bool is_batched, bool lazy_args = false) {
+  const ProfiledEnsureGIL gil;
 
   auto error_to_msg = [](const std::optional<py::ExceptionInfo> &exc_info) -> std::optional<std::string> {
     if (!exc_info) return std::nullopt;
@@ -1075,17 +2300,18 @@ void CallPythonProcedure(const py::Object &py_cb, mgp_list *args, mgp_graph *gra
   };
 
   auto call = [&](py::Object py_graph) -> std::optional<py::ExceptionInfo> {
-    py::Object py_args(MgpListToPyTuple(args, py_graph.Ptr()));
+    py::Object py_args(lazy_args ? MgpListToPyLazyArgs(args, reinterpret_cast<PyGraph *>(py_graph.Ptr()))
+                                 : MgpListToPyTuple(args, py_graph.Ptr()));
     if (!py_args) return py::FetchError();
-    auto py_res = py_cb.Call(py_graph, py_args);
+    auto py_res = RunPyCallable([&] { return py_cb.Call(py_graph, py_args); });
     if (!py_res) return py::FetchError();
     if (PySequence_Check(py_res.Ptr())) {
       if (is_batched) {
-        return AddMultipleBatchRecordsFromPython(result, py_res, graph, memory);
+        return AddMultipleBatchRecordsFromPython(result, py_res, graph, memory, &record_schema);
       }
-      return AddMultipleRecordsFromPython(result, py_res, graph, memory);
+      return AddMultipleRecordsFromPython(result, py_res, graph, memory, &record_schema);
     }
-    return AddRecordFromPython(result, py_res, graph, memory);
+    return AddRecordFromPython(result, py_res, graph, memory, &record_schema);
   };
 
   // It is *VERY IMPORTANT* to note that this code takes great care not to keep
@@ -1114,12 +2340,12 @@ void CallPythonProcedure(const py::Object &py_cb, mgp_list *args, mgp_graph *gra
 }
 
 void CallPythonCleanup(const py::Object &py_cleanup) {
-  auto gil = py::EnsureGIL();
+  const ProfiledEnsureGIL gil;
   auto py_res = py_cleanup.Call();
 }
 
 void CallPythonInitializer(const py::Object &py_initializer, mgp_list *args, mgp_graph *graph, mgp_memory *memory) {
-  auto gil = py::EnsureGIL();
+  const ProfiledEnsureGIL gil;
   auto error_to_msg = [](const std::optional<py::ExceptionInfo> &exc_info) -> std::optional<std::string> {
     if (!exc_info) return std::nullopt;
     // Here we tell the traceback formatter to skip the first line of the
@@ -1132,7 +2358,7 @@ void CallPythonInitializer(const py::Object &py_initializer, mgp_list *args, mgp
   auto call = [&](py::Object py_graph) -> std::optional<py::ExceptionInfo> {
     py::Object py_args(MgpListToPyTuple(args, py_graph.Ptr()));
     if (!py_args) return py::FetchError();
-    auto py_res = py_initializer.Call(py_graph, py_args);
+    auto py_res = RunPyCallable([&] { return py_initializer.Call(py_graph, py_args); });
     if (!py_res) return py::FetchError();
     return std::nullopt;
   };
@@ -1166,7 +2392,7 @@ void CallPythonTransformation(const py::Object &py_cb, mgp_messages *msgs, mgp_g
   };
 
   auto call = [&](py::Object py_graph, py::Object py_messages) -> std::optional<py::ExceptionInfo> {
-    auto py_res = py_cb.Call(py_graph, py_messages);
+    auto py_res = RunPyCallable([&] { return py_cb.Call(py_graph, py_messages); });
     if (!py_res) return py::FetchError();
     if (PySequence_Check(py_res.Ptr())) {
       return AddMultipleRecordsFromPython(result, py_res, graph, memory);
@@ -1193,6 +2419,11 @@ void CallPythonTransformation(const py::Object &py_cb, mgp_messages *msgs, mgp_g
 
     if (py_graph && py_messages) {
       maybe_msg = error_to_msg(call(py_graph, py_messages));
+      if (!maybe_msg && !ReleasePyMessageViews(reinterpret_cast<PyMessages *>(py_messages.Ptr()))) {
+        maybe_msg =
+            "A buffer derived from the payload or key views of the messages is still in use after the transformation "
+            "returned. Use bytes() to keep a copy of the data.";
+      }
     } else {
       maybe_msg = error_to_msg(py::FetchError());
     }
@@ -1204,8 +2435,8 @@ void CallPythonTransformation(const py::Object &py_cb, mgp_messages *msgs, mgp_g
 }
 
 void CallPythonFunction(const py::Object &py_cb, mgp_list *args, mgp_graph *graph, mgp_func_result *result,
-                        mgp_memory *memory) {
-  auto gil = py::EnsureGIL();
+                        mgp_memory *memory, bool is_vectorized) {
+  const ProfiledEnsureGIL gil;
 
   auto error_to_msg = [](const std::optional<py::ExceptionInfo> &exc_info) -> std::optional<std::string> {
     if (!exc_info) return std::nullopt;
@@ -1220,10 +2451,12 @@ void CallPythonFunction(const py::Object &py_cb, mgp_list *args, mgp_graph *grap
     py::Object py_args(MgpListToPyTuple(args, py_graph.Ptr()));
     if (!py_args) return {py::FetchError()};
     const auto is_transactional = storage::IsTransactional(graph->storage_mode);
-    auto py_res = py_cb.Call(py_graph, py_args);
+    auto py_res = RunPyCallable([&] { return py_cb.Call(py_graph, py_args); });
     if (!py_res) return {py::FetchError()};
     mgp_value *ret_val = PyObjectToMgpValueWithPythonExceptions(py_res.Ptr(), memory);
-    if (!is_transactional && ContainsDeleted(ret_val)) {
+    // Deleted objects in the results of a vectorized function are replaced
+    // one by one once the results are split between the rows.
+    if (!is_transactional && !is_vectorized && ContainsDeleted(ret_val)) {
       mgp_value_destroy(ret_val);
       mgp_value *null_val{nullptr};
       mgp_error last_error{mgp_error::MGP_ERROR_NO_ERROR};
@@ -1277,8 +2510,25 @@ void CallPythonFunction(const py::Object &py_cb, mgp_list *args, mgp_graph *grap
   }
 }
 
-PyObject *PyQueryModuleAddProcedure(PyQueryModule *self, PyObject *cb, bool is_write_procedure) {
+// The result fields are added to the returned schema as the procedure declares
+// them through `_mgp.Proc.add_result`.
+std::shared_ptr<PyRecordSchema> MakePyRecordSchema() {
+  py::Object py_mgp(PyImport_ImportModule("mgp"));
+  if (!py_mgp) return nullptr;
+  py::Object record_cls(py_mgp.GetAttr("Record"));
+  if (!record_cls) return nullptr;
+  auto record_schema = std::make_shared<PyRecordSchema>();
+  record_schema->record_cls = std::move(record_cls);
+  return record_schema;
+}
+
+PyObject *PyQueryModuleAddProcedure(PyQueryModule *self, PyObject *args, bool is_write_procedure) {
   MG_ASSERT(self->module);
+  PyObject *cb{nullptr};
+  int lazy_args{0};
+  if (!PyArg_ParseTuple(args, "O|p", &cb, &lazy_args)) {
+    return nullptr;
+  }
   if (!PyCallable_Check(cb)) {
     PyErr_SetString(PyExc_TypeError, "Expected a callable object.");
     return nullptr;
@@ -1291,10 +2541,13 @@ PyObject *PyQueryModuleAddProcedure(PyQueryModule *self, PyObject *cb, bool is_w
     PyErr_SetString(PyExc_ValueError, "Procedure name is not a valid identifier");
     return nullptr;
   }
+  auto record_schema = MakePyRecordSchema();
+  if (!record_schema) return nullptr;
   auto *memory = self->module->procedures.get_allocator().GetMemoryResource();
   mgp_proc proc(name,
-                [py_cb](mgp_list *args, mgp_graph *graph, mgp_result *result, mgp_memory *memory) {
-                  CallPythonProcedure(py_cb, args, graph, result, memory, false);
+                [py_cb, record_schema, lazy_args = static_cast<bool>(lazy_args)](
+                    mgp_list *args, mgp_graph *graph, mgp_result *result, mgp_memory *memory) {
+                  CallPythonProcedure(py_cb, *record_schema, args, graph, result, memory, false, lazy_args);
                 },
                 memory, {.is_write = is_write_procedure});
   const auto &[proc_it, did_insert] = self->module->procedures.emplace(name, std::move(proc));
@@ -1305,6 +2558,41 @@ PyObject *PyQueryModuleAddProcedure(PyQueryModule *self, PyObject *cb, bool is_w
   auto *py_proc = PyObject_New(PyQueryProc, &PyQueryProcType);  // NOLINT(cppcoreguidelines-pro-type-cstyle-cast)
   if (!py_proc) return nullptr;
   py_proc->callable = &proc_it->second;
+  py_proc->record_schema = record_schema.get();
+  return reinterpret_cast<PyObject *>(py_proc);
+}
+
+PyObject *PyQueryModuleAddGeneratorProcedure(PyQueryModule *self, PyObject *cb, bool is_write_procedure) {
+  MG_ASSERT(self->module);
+  if (!PyCallable_Check(cb)) {
+    PyErr_SetString(PyExc_TypeError, "Expected a callable object.");
+    return nullptr;
+  }
+  auto py_cb = py::Object::FromBorrow(cb);
+  py::Object py_name(py_cb.GetAttr("__name__"));
+  const auto *name = PyUnicode_AsUTF8(py_name.Ptr());
+  if (!name) return nullptr;
+  if (!IsValidIdentifierName(name)) {
+    PyErr_SetString(PyExc_ValueError, "Procedure name is not a valid identifier");
+    return nullptr;
+  }
+  auto record_schema = MakePyRecordSchema();
+  if (!record_schema) return nullptr;
+  auto *memory = self->module->procedures.get_allocator().GetMemoryResource();
+  mgp_proc proc(
+      name, mgp_proc_stream_factory{[py_cb, record_schema](mgp_list *args, mgp_graph *graph, mgp_memory * /*memory*/) {
+        return StartPythonGenerator(py_cb, record_schema, args, graph);
+      }},
+      memory, {.is_write = is_write_procedure, .is_batched = true});
+  const auto &[proc_it, did_insert] = self->module->procedures.emplace(name, std::move(proc));
+  if (!did_insert) {
+    PyErr_SetString(PyExc_ValueError, "Already registered a procedure with the same name.");
+    return nullptr;
+  }
+  auto *py_proc = PyObject_New(PyQueryProc, &PyQueryProcType);  // NOLINT(cppcoreguidelines-pro-type-cstyle-cast)
+  if (!py_proc) return nullptr;
+  py_proc->callable = &proc_it->second;
+  py_proc->record_schema = record_schema.get();
   return reinterpret_cast<PyObject *>(py_proc);
 }
 
@@ -1332,11 +2620,13 @@ PyObject *PyQueryModuleAddBatchProcedure(PyQueryModule *self, PyObject *args, bo
     PyErr_SetString(PyExc_ValueError, "Procedure name is not a valid identifier");
     return nullptr;
   }
+  auto record_schema = MakePyRecordSchema();
+  if (!record_schema) return nullptr;
   auto *memory = self->module->procedures.get_allocator().GetMemoryResource();
   mgp_proc proc(
       name,
-      [py_cb](mgp_list *args, mgp_graph *graph, mgp_result *result, mgp_memory *memory) {
-        CallPythonProcedure(py_cb, args, graph, result, memory, true);
+      [py_cb, record_schema](mgp_list *args, mgp_graph *graph, mgp_result *result, mgp_memory *memory) {
+        CallPythonProcedure(py_cb, *record_schema, args, graph, result, memory, true);
       },
       [py_initializer](mgp_list *args, mgp_graph *graph, mgp_memory *memory) {
         CallPythonInitializer(py_initializer, args, graph, memory);
@@ -1350,17 +2640,26 @@ PyObject *PyQueryModuleAddBatchProcedure(PyQueryModule *self, PyObject *args, bo
   auto *py_proc = PyObject_New(PyQueryProc, &PyQueryProcType);  // NOLINT(cppcoreguidelines-pro-type-cstyle-cast)
   if (!py_proc) return nullptr;
   py_proc->callable = &proc_it->second;
+  py_proc->record_schema = record_schema.get();
   return reinterpret_cast<PyObject *>(py_proc);
 }
 
 }  // namespace
 
-PyObject *PyQueryModuleAddReadProcedure(PyQueryModule *self, PyObject *cb) {
-  return PyQueryModuleAddProcedure(self, cb, false);
+PyObject *PyQueryModuleAddReadProcedure(PyQueryModule *self, PyObject *args) {
+  return PyQueryModuleAddProcedure(self, args, false);
+}
+
+PyObject *PyQueryModuleAddWriteProcedure(PyQueryModule *self, PyObject *args) {
+  return PyQueryModuleAddProcedure(self, args, true);
+}
+
+PyObject *PyQueryModuleAddGeneratorReadProcedure(PyQueryModule *self, PyObject *cb) {
+  return PyQueryModuleAddGeneratorProcedure(self, cb, false);
 }
 
-PyObject *PyQueryModuleAddWriteProcedure(PyQueryModule *self, PyObject *cb) {
-  return PyQueryModuleAddProcedure(self, cb, true);
+PyObject *PyQueryModuleAddGeneratorWriteProcedure(PyQueryModule *self, PyObject *cb) {
+  return PyQueryModuleAddGeneratorProcedure(self, cb, true);
 }
 
 PyObject *PyQueryModuleAddBatchReadProcedure(PyQueryModule *self, PyObject *args) {
@@ -1400,8 +2699,13 @@ PyObject *PyQueryModuleAddTransformation(PyQueryModule *self, PyObject *cb) {
   Py_RETURN_NONE;
 }
 
-PyObject *PyQueryModuleAddFunction(PyQueryModule *self, PyObject *cb) {
+PyObject *PyQueryModuleAddFunction(PyQueryModule *self, PyObject *args) {
   MG_ASSERT(self->module);
+  PyObject *cb{nullptr};
+  int is_vectorized{0};
+  if (!PyArg_ParseTuple(args, "O|p", &cb, &is_vectorized)) {
+    return nullptr;
+  }
   if (!PyCallable_Check(cb)) {
     PyErr_SetString(PyExc_TypeError, "Expected a callable object.");
     return nullptr;
@@ -1417,11 +2721,12 @@ PyObject *PyQueryModuleAddFunction(PyQueryModule *self, PyObject *cb) {
   auto *memory = self->module->functions.get_allocator().GetMemoryResource();
   mgp_func func(
       name,
-      [py_cb](mgp_list *args, mgp_func_context *func_ctx, mgp_func_result *result, mgp_memory *memory) {
+      [py_cb, is_vectorized](mgp_list *args, mgp_func_context *func_ctx, mgp_func_result *result, mgp_memory *memory) {
         auto graph = mgp_graph::NonWritableGraph(*(func_ctx->impl), func_ctx->view);
-        return CallPythonFunction(py_cb, args, &graph, result, memory);
+        return CallPythonFunction(py_cb, args, &graph, result, memory, is_vectorized);
       },
       memory);
+  func.is_vectorized = is_vectorized;
   const auto [func_it, did_insert] = self->module->functions.emplace(name, std::move(func));
   if (!did_insert) {
     PyErr_SetString(PyExc_ValueError, "Already registered a function with the same name.");
@@ -1435,18 +2740,22 @@ PyObject *PyQueryModuleAddFunction(PyQueryModule *self, PyObject *cb) {
 
 static PyMethodDef PyQueryModuleMethods[] = {
     {"__reduce__", reinterpret_cast<PyCFunction>(DisallowPickleAndCopy), METH_NOARGS, "__reduce__ is not supported"},
-    {"add_read_procedure", reinterpret_cast<PyCFunction>(PyQueryModuleAddReadProcedure), METH_O,
-     "Register a read-only procedure with this module."},
-    {"add_write_procedure", reinterpret_cast<PyCFunction>(PyQueryModuleAddWriteProcedure), METH_O,
-     "Register a writeable procedure with this module."},
+    {"add_read_procedure", reinterpret_cast<PyCFunction>(PyQueryModuleAddReadProcedure), METH_VARARGS,
+     "Register a read-only procedure with this module, optionally receiving lazy list and map arguments."},
+    {"add_write_procedure", reinterpret_cast<PyCFunction>(PyQueryModuleAddWriteProcedure), METH_VARARGS,
+     "Register a writeable procedure with this module, optionally receiving lazy list and map arguments."},
+    {"add_generator_read_procedure", reinterpret_cast<PyCFunction>(PyQueryModuleAddGeneratorReadProcedure), METH_O,
+     "Register a read-only procedure which lazily yields its records with this module."},
+    {"add_generator_write_procedure", reinterpret_cast<PyCFunction>(PyQueryModuleAddGeneratorWriteProcedure), METH_O,
+     "Register a writeable procedure which lazily yields its records with this module."},
     {"add_batch_read_procedure", reinterpret_cast<PyCFunction>(PyQueryModuleAddBatchReadProcedure), METH_VARARGS,
      "Register a read-only batch procedure with this module."},
     {"add_batch_write_procedure", reinterpret_cast<PyCFunction>(PyQueryModuleAddBatchWriteProcedure), METH_VARARGS,
      "Register a writeable batched procedure with this module."},
     {"add_transformation", reinterpret_cast<PyCFunction>(PyQueryModuleAddTransformation), METH_O,
      "Register a transformation with this module."},
-    {"add_function", reinterpret_cast<PyCFunction>(PyQueryModuleAddFunction), METH_O,
-     "Register a function with this module."},
+    {"add_function", reinterpret_cast<PyCFunction>(PyQueryModuleAddFunction), METH_VARARGS,
+     "Register a function with this module, optionally computing it for several rows at once."},
     {nullptr, {}, {}, {}},
 };
 
@@ -1520,6 +2829,33 @@ DEFINE_PY_MGP_MODULE_TYPE(LocalTime, local_time);
 DEFINE_PY_MGP_MODULE_TYPE(LocalDateTime, local_date_time);
 DEFINE_PY_MGP_MODULE_TYPE(Duration, duration);
 
+PyObject *PyMgpModuleTrackMemory(PyObject * /*mod*/, PyObject *args) {
+  long long size{0};
+  if (!PyArg_ParseTuple(args, "L", &size)) return nullptr;
+  if (size < 0) {
+    PyErr_SetString(PyExc_ValueError, "Expected a non-negative size.");
+    return nullptr;
+  }
+  auto &tracker = utils::total_memory_tracker;
+  const auto hard_limit = tracker.HardLimit();
+  if (hard_limit && tracker.Amount() + size > hard_limit) Py_RETURN_FALSE;
+  // The limit was checked above, and exceeding it because of a concurrent allocation is fine.
+  utils::MemoryTracker::OutOfMemoryExceptionBlocker exception_blocker;
+  tracker.Alloc(size);
+  Py_RETURN_TRUE;
+}
+
+PyObject *PyMgpModuleUntrackMemory(PyObject * /*mod*/, PyObject *args) {
+  long long size{0};
+  if (!PyArg_ParseTuple(args, "L", &size)) return nullptr;
+  if (size < 0) {
+    PyErr_SetString(PyExc_ValueError, "Expected a non-negative size.");
+    return nullptr;
+  }
+  utils::total_memory_tracker.Free(size);
+  Py_RETURN_NONE;
+}
+
 static PyMethodDef PyMgpModuleMethods[] = {
     {"type_nullable", PyMgpModuleTypeNullable, METH_O,
      "Build a type representing either a `null` value or a value of given "
@@ -1541,6 +2877,10 @@ static PyMethodDef PyMgpModuleMethods[] = {
     {"type_local_time", PyMgpModuleTypeLocalTime, METH_NOARGS, "Get the type representing a LocalTime."},
     {"type_local_date_time", PyMgpModuleTypeLocalDateTime, METH_NOARGS, "Get the type representing a LocalDateTime."},
     {"type_duration", PyMgpModuleTypeDuration, METH_NOARGS, "Get the type representing a Duration."},
+    {"track_memory", PyMgpModuleTrackMemory, METH_VARARGS,
+     "Charge memory held by Python objects to the total memory tracker, and return False if it would exceed the "
+     "memory limit."},
+    {"untrack_memory", PyMgpModuleUntrackMemory, METH_VARARGS, "Release memory previously charged with track_memory."},
     {nullptr, {}, {}, {}},
 };
 
@@ -1568,7 +2908,7 @@ void PyPropertiesIteratorDealloc(PyPropertiesIterator *self) {
   // Avoid invoking `mgp_properties_iterator_destroy` if we are not in valid
   // execution context. The query execution should free all memory used during
   // execution, so we may cause a double free issue.
-  if (self->py_graph->graph) mgp_properties_iterator_destroy(self->it);
+  if (PyGraphIsValidImpl(*self->py_graph)) mgp_properties_iterator_destroy(self->it);
   Py_DECREF(self->py_graph);
   Py_TYPE(self)->tp_free(self);
 }
@@ -1576,7 +2916,7 @@ void PyPropertiesIteratorDealloc(PyPropertiesIterator *self) {
 PyObject *PyPropertiesIteratorGet(PyPropertiesIterator *self, PyObject *Py_UNUSED(ignored)) {
   MG_ASSERT(self->it);
   MG_ASSERT(self->py_graph);
-  MG_ASSERT(self->py_graph->graph);
+  MG_ASSERT(PyGraphIsValidImpl(*self->py_graph));
   mgp_property *property{nullptr};
   if (RaiseExceptionFromErrorCode(mgp_properties_iterator_get(self->it, &property))) {
     return nullptr;
@@ -1595,7 +2935,7 @@ PyObject *PyPropertiesIteratorGet(PyPropertiesIterator *self, PyObject *Py_UNUSE
 PyObject *PyPropertiesIteratorNext(PyPropertiesIterator *self, PyObject *Py_UNUSED(ignored)) {
   MG_ASSERT(self->it);
   MG_ASSERT(self->py_graph);
-  MG_ASSERT(self->py_graph->graph);
+  MG_ASSERT(PyGraphIsValidImpl(*self->py_graph));
   mgp_property *property{nullptr};
   if (RaiseExceptionFromErrorCode(mgp_properties_iterator_next(self->it, &property))) {
     return nullptr;
@@ -1643,7 +2983,7 @@ PyObject *PyEdgeGetTypeName(PyEdge *self, PyObject *Py_UNUSED(ignored)) {
   MG_ASSERT(self);
   MG_ASSERT(self->edge);
   MG_ASSERT(self->py_graph);
-  MG_ASSERT(self->py_graph->graph);
+  MG_ASSERT(PyGraphIsValidImpl(*self->py_graph));
   mgp_edge_type edge_type{nullptr};
   if (RaiseExceptionFromErrorCode(mgp_edge_get_type(self->edge, &edge_type))) {
     return nullptr;
@@ -1655,7 +2995,7 @@ PyObject *PyEdgeFromVertex(PyEdge *self, PyObject *Py_UNUSED(ignored)) {
   MG_ASSERT(self);
   MG_ASSERT(self->edge);
   MG_ASSERT(self->py_graph);
-  MG_ASSERT(self->py_graph->graph);
+  MG_ASSERT(PyGraphIsValidImpl(*self->py_graph));
   return MakePyVertex(self->edge->from, self->py_graph);
 }
 
@@ -1663,7 +3003,7 @@ PyObject *PyEdgeToVertex(PyEdge *self, PyObject *Py_UNUSED(ignored)) {
   MG_ASSERT(self);
   MG_ASSERT(self->edge);
   MG_ASSERT(self->py_graph);
-  MG_ASSERT(self->py_graph->graph);
+  MG_ASSERT(PyGraphIsValidImpl(*self->py_graph));
   return MakePyVertex(self->edge->to, self->py_graph);
 }
 
@@ -1673,7 +3013,7 @@ void PyEdgeDealloc(PyEdge *self) {
   // Avoid invoking `mgp_edge_destroy` if we are not in valid execution context.
   // The query execution should free all memory used during execution, so we may
   // cause a double free issue.
-  if (self->py_graph->graph) mgp_edge_destroy(self->edge);
+  if (PyGraphIsValidImpl(*self->py_graph)) mgp_edge_destroy(self->edge);
   Py_DECREF(self->py_graph);
   Py_TYPE(self)->tp_free(self);
 }
@@ -1686,7 +3026,7 @@ PyObject *PyEdgeUnderlyingGraphIsMutable(PyEdge *self, PyObject *Py_UNUSED(ignor
   MG_ASSERT(self);
   MG_ASSERT(self->edge);
   MG_ASSERT(self->py_graph);
-  MG_ASSERT(self->py_graph->graph);
+  MG_ASSERT(PyGraphIsValidImpl(*self->py_graph));
   return PyBool_FromLong(CallBool(mgp_graph_is_mutable, self->py_graph->graph));
 }
 
@@ -1694,7 +3034,7 @@ PyObject *PyEdgeGetId(PyEdge *self, PyObject *Py_UNUSED(ignored)) {
   MG_ASSERT(self);
   MG_ASSERT(self->edge);
   MG_ASSERT(self->py_graph);
-  MG_ASSERT(self->py_graph->graph);
+  MG_ASSERT(PyGraphIsValidImpl(*self->py_graph));
   mgp_edge_id edge_id{0};
   if (RaiseExceptionFromErrorCode(mgp_edge_get_id(self->edge, &edge_id))) {
     return nullptr;
@@ -1706,7 +3046,7 @@ PyObject *PyEdgeIterProperties(PyEdge *self, PyObject *Py_UNUSED(ignored)) {
   MG_ASSERT(self);
   MG_ASSERT(self->edge);
   MG_ASSERT(self->py_graph);
-  MG_ASSERT(self->py_graph->graph);
+  MG_ASSERT(PyGraphIsValidImpl(*self->py_graph));
   mgp_properties_iterator *properties_it{nullptr};
   if (RaiseExceptionFromErrorCode(mgp_edge_iter_properties(self->edge, self->py_graph->memory, &properties_it))) {
     return nullptr;
@@ -1726,7 +3066,7 @@ PyObject *PyEdgeGetProperty(PyEdge *self, PyObject *args) {
   MG_ASSERT(self);
   MG_ASSERT(self->edge);
   MG_ASSERT(self->py_graph);
-  MG_ASSERT(self->py_graph->graph);
+  MG_ASSERT(PyGraphIsValidImpl(*self->py_graph));
   const char *prop_name = nullptr;
   if (!PyArg_ParseTuple(args, "s", &prop_name)) return nullptr;
   mgp_value *prop_value{nullptr};
@@ -1742,7 +3082,7 @@ PyObject *PyEdgeSetProperty(PyEdge *self, PyObject *args) {
   MG_ASSERT(self);
   MG_ASSERT(self->edge);
   MG_ASSERT(self->py_graph);
-  MG_ASSERT(self->py_graph->graph);
+  MG_ASSERT(PyGraphIsValidImpl(*self->py_graph));
   const char *prop_name = nullptr;
   PyObject *py_value{nullptr};
   if (!PyArg_ParseTuple(args, "sO", &prop_name, &py_value)) {
@@ -1762,7 +3102,7 @@ PyObject *PyEdgeSetProperties(PyEdge *self, PyObject *args) {
   MG_ASSERT(self);
   MG_ASSERT(self->edge);
   MG_ASSERT(self->py_graph);
-  MG_ASSERT(self->py_graph->graph);
+  MG_ASSERT(PyGraphIsValidImpl(*self->py_graph));
 
   PyObject *props{nullptr};
   if (!PyArg_ParseTuple(args, "O", &props)) {
@@ -1907,7 +3247,7 @@ void PyVertexDealloc(PyVertex *self) {
   // Avoid invoking `mgp_vertex_destroy` if we are not in valid execution
   // context. The query execution should free all memory used during
   // execution, so  we may cause a double free issue.
-  if (self->py_graph->graph) mgp_vertex_destroy(self->vertex);
+  if (PyGraphIsValidImpl(*self->py_graph)) mgp_vertex_destroy(self->vertex);
   Py_DECREF(self->py_graph);
   Py_TYPE(self)->tp_free(self);
 }
@@ -1920,7 +3260,7 @@ PyObject *PyVertexUnderlyingGraphIsMutable(PyVertex *self, PyObject *Py_UNUSED(i
   MG_ASSERT(self);
   MG_ASSERT(self->vertex);
   MG_ASSERT(self->py_graph);
-  MG_ASSERT(self->py_graph->graph);
+  MG_ASSERT(PyGraphIsValidImpl(*self->py_graph));
   return PyBool_FromLong(CallBool(mgp_graph_is_mutable, self->py_graph->graph));
 }
 
@@ -1928,7 +3268,7 @@ PyObject *PyVertexGetId(PyVertex *self, PyObject *Py_UNUSED(ignored)) {
   MG_ASSERT(self);
   MG_ASSERT(self->vertex);
   MG_ASSERT(self->py_graph);
-  MG_ASSERT(self->py_graph->graph);
+  MG_ASSERT(PyGraphIsValidImpl(*self->py_graph));
   mgp_vertex_id id{};
   if (RaiseExceptionFromErrorCode(mgp_vertex_get_id(self->vertex, &id))) {
     return nullptr;
@@ -1940,7 +3280,7 @@ PyObject *PyVertexLabelsCount(PyVertex *self, PyObject *Py_UNUSED(ignored)) {
   MG_ASSERT(self);
   MG_ASSERT(self->vertex);
   MG_ASSERT(self->py_graph);
-  MG_ASSERT(self->py_graph->graph);
+  MG_ASSERT(PyGraphIsValidImpl(*self->py_graph));
   size_t label_count{0};
   if (RaiseExceptionFromErrorCode(mgp_vertex_labels_count(self->vertex, &label_count))) {
     return nullptr;
@@ -1952,7 +3292,7 @@ PyObject *PyVertexLabelAt(PyVertex *self, PyObject *args) {
   MG_ASSERT(self);
   MG_ASSERT(self->vertex);
   MG_ASSERT(self->py_graph);
-  MG_ASSERT(self->py_graph->graph);
+  MG_ASSERT(PyGraphIsValidImpl(*self->py_graph));
   static_assert(std::numeric_limits<Py_ssize_t>::max() <= std::numeric_limits<size_t>::max());
   Py_ssize_t id;
   if (!PyArg_ParseTuple(args, "n", &id)) {
@@ -1969,7 +3309,7 @@ PyObject *PyVertexIterInEdges(PyVertex *self, PyObject *Py_UNUSED(ignored)) {
   MG_ASSERT(self);
   MG_ASSERT(self->vertex);
   MG_ASSERT(self->py_graph);
-  MG_ASSERT(self->py_graph->graph);
+  MG_ASSERT(PyGraphIsValidImpl(*self->py_graph));
   mgp_edges_iterator *edges_it{nullptr};
   if (RaiseExceptionFromErrorCode(mgp_vertex_iter_in_edges(self->vertex, self->py_graph->memory, &edges_it))) {
     return nullptr;
@@ -1989,7 +3329,7 @@ PyObject *PyVertexIterOutEdges(PyVertex *self, PyObject *Py_UNUSED(ignored)) {
   MG_ASSERT(self);
   MG_ASSERT(self->vertex);
   MG_ASSERT(self->py_graph);
-  MG_ASSERT(self->py_graph->graph);
+  MG_ASSERT(PyGraphIsValidImpl(*self->py_graph));
   mgp_edges_iterator *edges_it{nullptr};
   if (RaiseExceptionFromErrorCode(mgp_vertex_iter_out_edges(self->vertex, self->py_graph->memory, &edges_it))) {
     return nullptr;
@@ -2009,7 +3349,7 @@ PyObject *PyVertexIterProperties(PyVertex *self, PyObject *Py_UNUSED(ignored)) {
   MG_ASSERT(self);
   MG_ASSERT(self->vertex);
   MG_ASSERT(self->py_graph);
-  MG_ASSERT(self->py_graph->graph);
+  MG_ASSERT(PyGraphIsValidImpl(*self->py_graph));
   mgp_properties_iterator *properties_it{nullptr};
   if (RaiseExceptionFromErrorCode(mgp_vertex_iter_properties(self->vertex, self->py_graph->memory, &properties_it))) {
     return nullptr;
@@ -2029,7 +3369,7 @@ PyObject *PyVertexGetProperty(PyVertex *self, PyObject *args) {
   MG_ASSERT(self);
   MG_ASSERT(self->vertex);
   MG_ASSERT(self->py_graph);
-  MG_ASSERT(self->py_graph->graph);
+  MG_ASSERT(PyGraphIsValidImpl(*self->py_graph));
   const char *prop_name{nullptr};
   if (!PyArg_ParseTuple(args, "s", &prop_name)) {
     return nullptr;
@@ -2048,7 +3388,7 @@ PyObject *PyVertexSetProperty(PyVertex *self, PyObject *args) {
   MG_ASSERT(self);
   MG_ASSERT(self->vertex);
   MG_ASSERT(self->py_graph);
-  MG_ASSERT(self->py_graph->graph);
+  MG_ASSERT(PyGraphIsValidImpl(*self->py_graph));
   const char *prop_name = nullptr;
   PyObject *py_value{nullptr};
   if (!PyArg_ParseTuple(args, "sO", &prop_name, &py_value)) {
@@ -2068,7 +3408,7 @@ PyObject *PyVertexSetProperties(PyVertex *self, PyObject *args) {
   MG_ASSERT(self);
   MG_ASSERT(self->vertex);
   MG_ASSERT(self->py_graph);
-  MG_ASSERT(self->py_graph->graph);
+  MG_ASSERT(PyGraphIsValidImpl(*self->py_graph));
 
   PyObject *props{nullptr};
   if (!PyArg_ParseTuple(args, "O", &props)) {
@@ -2123,7 +3463,7 @@ PyObject *PyVertexAddLabel(PyVertex *self, PyObject *args) {
   MG_ASSERT(self);
   MG_ASSERT(self->vertex);
   MG_ASSERT(self->py_graph);
-  MG_ASSERT(self->py_graph->graph);
+  MG_ASSERT(PyGraphIsValidImpl(*self->py_graph));
   const char *label_name = nullptr;
   if (!PyArg_ParseTuple(args, "s", &label_name)) {
     return nullptr;
@@ -2138,7 +3478,7 @@ PyObject *PyVertexRemoveLabel(PyVertex *self, PyObject *args) {
   MG_ASSERT(self);
   MG_ASSERT(self->vertex);
   MG_ASSERT(self->py_graph);
-  MG_ASSERT(self->py_graph->graph);
+  MG_ASSERT(PyGraphIsValidImpl(*self->py_graph));
   const char *label_name = nullptr;
   if (!PyArg_ParseTuple(args, "s", &label_name)) {
     return nullptr;
@@ -2250,7 +3590,7 @@ void PyPathDealloc(PyPath *self) {
   // Avoid invoking `mgp_path_destroy` if we are not in valid execution
   // context. The query execution should free all memory used during
   // execution, so  we may cause a double free issue.
-  if (self->py_graph->graph) mgp_path_destroy(self->path);
+  if (PyGraphIsValidImpl(*self->py_graph)) mgp_path_destroy(self->path);
   Py_DECREF(self->py_graph);
   Py_TYPE(self)->tp_free(self);
 }
@@ -2264,7 +3604,7 @@ PyObject *PyPathMakeWithStart(PyTypeObject *type, PyObject *vertex);
 PyObject *PyPathExpand(PyPath *self, PyObject *edge) {
   MG_ASSERT(self->path);
   MG_ASSERT(self->py_graph);
-  MG_ASSERT(self->py_graph->graph);
+  MG_ASSERT(PyGraphIsValidImpl(*self->py_graph));
   if (Py_TYPE(edge) != &PyEdgeType) {
     PyErr_SetString(PyExc_TypeError, "Expected a _mgp.Edge.");
     return nullptr;
@@ -2280,7 +3620,7 @@ PyObject *PyPathExpand(PyPath *self, PyObject *edge) {
 PyObject *PyPathPop(PyPath *self) {
   MG_ASSERT(self->path);
   MG_ASSERT(self->py_graph);
-  MG_ASSERT(self->py_graph->graph);
+  MG_ASSERT(PyGraphIsValidImpl(*self->py_graph));
 
   if (RaiseExceptionFromErrorCode(mgp_path_pop(self->path))) {
     return nullptr;
@@ -2291,14 +3631,14 @@ PyObject *PyPathPop(PyPath *self) {
 PyObject *PyPathSize(PyPath *self, PyObject *Py_UNUSED(ignored)) {
   MG_ASSERT(self->path);
   MG_ASSERT(self->py_graph);
-  MG_ASSERT(self->py_graph->graph);
+  MG_ASSERT(PyGraphIsValidImpl(*self->py_graph));
   return PyLong_FromSize_t(Call<size_t>(mgp_path_size, self->path));
 }
 
 PyObject *PyPathVertexAt(PyPath *self, PyObject *args) {
   MG_ASSERT(self->path);
   MG_ASSERT(self->py_graph);
-  MG_ASSERT(self->py_graph->graph);
+  MG_ASSERT(PyGraphIsValidImpl(*self->py_graph));
   static_assert(std::numeric_limits<Py_ssize_t>::max() <= std::numeric_limits<size_t>::max());
   Py_ssize_t i;
   if (!PyArg_ParseTuple(args, "n", &i)) {
@@ -2314,7 +3654,7 @@ PyObject *PyPathVertexAt(PyPath *self, PyObject *args) {
 PyObject *PyPathEdgeAt(PyPath *self, PyObject *args) {
   MG_ASSERT(self->path);
   MG_ASSERT(self->py_graph);
-  MG_ASSERT(self->py_graph->graph);
+  MG_ASSERT(PyGraphIsValidImpl(*self->py_graph));
   static_assert(std::numeric_limits<Py_ssize_t>::max() <= std::numeric_limits<size_t>::max());
   Py_ssize_t i;
   if (!PyArg_ParseTuple(args, "n", &i)) {
@@ -2525,8 +3865,12 @@ PyObject *PyInitMgpModule() {
   if (!register_type(&PyVertexType, "Vertex")) return nullptr;
   if (!register_type(&PyPathType, "Path")) return nullptr;
   if (!register_type(&PyCypherTypeType, "Type")) return nullptr;
+  if (!register_type(&PyArrayType, "Array")) return nullptr;
   if (!register_type(&PyMessagesType, "Messages")) return nullptr;
   if (!register_type(&PyMessageType, "Message")) return nullptr;
+  if (!register_type(&PyMessageBufferType, "MessageBuffer")) return nullptr;
+  if (!register_type(&PyLazyListType, "LazyList")) return nullptr;
+  if (!register_type(&PyLazyMapType, "LazyMap")) return nullptr;
   if (!register_type(&PyLoggerType, "Logger")) return nullptr;
 
   std::array py_mgp_errors{
@@ -2580,6 +3924,22 @@ PyObject *PyInitMgpModule() {
   return mgp;
 }
 
+void InstallPyAllocatorHooks() {
+  PyMem_GetAllocator(PYMEM_DOMAIN_MEM, &gPyMemAllocator);
+  PyMemAllocatorEx mem_hooks{&gPyMemAllocator, PyAllocatorMalloc, PyAllocatorCalloc, PyAllocatorRealloc,
+                             PyAllocatorFree};
+  PyMem_SetAllocator(PYMEM_DOMAIN_MEM, &mem_hooks);
+
+  PyMem_GetAllocator(PYMEM_DOMAIN_OBJ, &gPyObjectAllocator);
+  PyMemAllocatorEx object_hooks{&gPyObjectAllocator, PyAllocatorMalloc, PyAllocatorCalloc, PyAllocatorRealloc,
+                                PyAllocatorFree};
+  PyMem_SetAllocator(PYMEM_DOMAIN_OBJ, &object_hooks);
+
+  PyObject_GetArenaAllocator(&gPyArenaAllocator);
+  PyObjectArenaAllocator arena_hooks{&gPyArenaAllocator, PyArenaAlloc, PyArenaFree};
+  PyObject_SetArenaAllocator(&arena_hooks);
+}
+
 namespace {
 
 template <class TFun>
@@ -3080,4 +4440,606 @@ PyObject *PyGraphDeleteEdge(PyGraph *self, PyObject *args) {
   Py_RETURN_NONE;
 }
 
+PyObject *PyGraphIterVerticesByProperty(PyGraph *self, PyObject *args) {
+  MG_ASSERT(PyGraphIsValidImpl(*self));
+  MG_ASSERT(self->memory);
+  const char *label{nullptr};
+  const char *property_name{nullptr};
+  PyObject *py_value{nullptr};
+  if (!PyArg_ParseTuple(args, "ssO", &label, &property_name, &py_value)) {
+    return nullptr;
+  }
+  MgpUniquePtr<mgp_value> value{PyObjectToMgpValueWithPythonExceptions(py_value, self->memory), mgp_value_destroy};
+  if (!value) {
+    return nullptr;
+  }
+  mgp_vertices_iterator *vertices_it{nullptr};
+  if (RaiseExceptionFromErrorCode(mgp_graph_iter_vertices_by_property(self->graph, mgp_label{label}, property_name,
+                                                                      value.get(), self->memory, &vertices_it))) {
+    return nullptr;
+  }
+  return MakePyVerticesIterator(vertices_it, self);
+}
+
+PyObject *PyGraphIterVerticesByPropertyRange(PyGraph *self, PyObject *args) {
+  MG_ASSERT(PyGraphIsValidImpl(*self));
+  MG_ASSERT(self->memory);
+  const char *label{nullptr};
+  const char *property_name{nullptr};
+  PyObject *py_lower_bound{nullptr};
+  int lower_bound_inclusive{1};
+  PyObject *py_upper_bound{nullptr};
+  int upper_bound_inclusive{1};
+  if (!PyArg_ParseTuple(args, "ssOpOp", &label, &property_name, &py_lower_bound, &lower_bound_inclusive,
+                        &py_upper_bound, &upper_bound_inclusive)) {
+    return nullptr;
+  }
+  MgpUniquePtr<mgp_value> lower_bound{PyObjectToMgpValueWithPythonExceptions(py_lower_bound, self->memory),
+                                      mgp_value_destroy};
+  if (!lower_bound) {
+    return nullptr;
+  }
+  MgpUniquePtr<mgp_value> upper_bound{PyObjectToMgpValueWithPythonExceptions(py_upper_bound, self->memory),
+                                      mgp_value_destroy};
+  if (!upper_bound) {
+    return nullptr;
+  }
+  mgp_vertices_iterator *vertices_it{nullptr};
+  if (RaiseExceptionFromErrorCode(mgp_graph_iter_vertices_by_property_range(
+          self->graph, mgp_label{label}, property_name, lower_bound.get(), lower_bound_inclusive, upper_bound.get(),
+          upper_bound_inclusive, self->memory, &vertices_it))) {
+    return nullptr;
+  }
+  return MakePyVerticesIterator(vertices_it, self);
+}
+
+namespace {
+// Call `func` with every vertex of the graph, or only with the ones which have
+// the label if it isn't null, in the same order as `mgp_graph_iter_vertices`.
+// Return false with `error` set if iterating or `func` fails. Python C API
+// isn't used, so this may be called with the GIL released.
+template <typename TFunc>
+bool ForEachPyGraphVertex(PyGraph *py_graph, const char *label, DeferredPyError &error, TFunc func) {
+  MgpUniquePtr<mgp_vertices_iterator> vertices_it{nullptr, mgp_vertices_iterator_destroy};
+  const auto err = label ? CreateMgpObject(vertices_it, mgp_graph_iter_vertices_by_label, py_graph->graph,
+                                           mgp_label{label}, py_graph->memory)
+                         : CreateMgpObject(vertices_it, mgp_graph_iter_vertices, py_graph->graph, py_graph->memory);
+  if (error.Set(err)) {
+    return false;
+  }
+  mgp_vertex *vertex{nullptr};
+  if (error.Set(mgp_vertices_iterator_get(vertices_it.get(), &vertex))) {
+    return false;
+  }
+  while (vertex != nullptr) {
+    if (!func(vertex)) return false;
+    if (error.Set(mgp_vertices_iterator_next(vertices_it.get(), &vertex))) {
+      return false;
+    }
+  }
+  return true;
+}
+
+// Fill the column with the property of each vertex. Missing properties are
+// stored as zeroes and marked in `null_mask`. `get_value` returns std::nullopt
+// for the values which cannot be stored in the column.
+template <typename T, typename TGetValue>
+PyObject *MakePyPropertyColumn(PyGraph *py_graph, const char *label, const char *property_name, const char *dtype_name,
+                               TGetValue get_value) {
+  std::vector<T> values;
+  std::vector<uint8_t> null_mask;
+  DeferredPyError error;
+  const auto add_value = [&](mgp_vertex *vertex) {
+    MgpUniquePtr<mgp_value> value{nullptr, mgp_value_destroy};
+    if (error.Set(CreateMgpObject(value, mgp_vertex_get_property, vertex, property_name, py_graph->memory))) {
+      return false;
+    }
+    if (Call<int>(mgp_value_is_null, value.get())) {
+      values.push_back(T{});
+      null_mask.push_back(1);
+      return true;
+    }
+    const std::optional<T> column_value = get_value(value.get());
+    if (!column_value) {
+      std::stringstream ss;
+      ss << "Property '" << property_name << "' of vertex " << Call<mgp_vertex_id>(mgp_vertex_get_id, vertex).as_int
+         << " cannot be stored as " << dtype_name;
+      error.Set(PyExc_ValueError, ss.str());
+      return false;
+    }
+    values.push_back(*column_value);
+    null_mask.push_back(0);
+    return true;
+  };
+  {
+    const PyGraphPass pass(*py_graph);
+    ForEachPyGraphVertex(py_graph, label, error, add_value);
+  }
+  if (error.Raise()) {
+    return nullptr;
+  }
+  py::Object py_values(MakePyArray(std::move(values)));
+  if (!py_values) return nullptr;
+  py::Object py_null_mask(MakePyArray(std::move(null_mask)));
+  if (!py_null_mask) return nullptr;
+  return PyTuple_Pack(2, py_values.Ptr(), py_null_mask.Ptr());
+}
+}  // namespace
+
+PyObject *PyGraphAdjacency(PyGraph *self, PyObject *args) {
+  if (RaiseIfPyGraphInvalid(*self)) return nullptr;
+  MG_ASSERT(self->memory);
+  const char *direction{nullptr};
+  PyObject *py_edge_types{nullptr};
+  const char *weight_property{nullptr};
+  double default_weight{1.0};
+  Py_ssize_t start{0};
+  PyObject *py_stop{nullptr};
+  if (!PyArg_ParseTuple(args, "sOzdnO", &direction, &py_edge_types, &weight_property, &default_weight, &start,
+                        &py_stop)) {
+    return nullptr;
+  }
+  // Only the rows of the vertices from `start` to `stop` are collected.
+  auto stop = std::numeric_limits<Py_ssize_t>::max();
+  if (py_stop != Py_None) {
+    stop = PyLong_AsSsize_t(py_stop);
+    if (stop == -1 && PyErr_Occurred()) return nullptr;
+  }
+  start = std::max<Py_ssize_t>(start, 0);
+  stop = std::max(stop, start);
+  const std::string_view direction_name{direction};
+  const bool with_out_edges = direction_name == "out" || direction_name == "both";
+  const bool with_in_edges = direction_name == "in" || direction_name == "both";
+  if (!with_out_edges && !with_in_edges) {
+    PyErr_SetString(PyExc_ValueError, "Expected direction to be one of 'out', 'in' or 'both'.");
+    return nullptr;
+  }
+  std::optional<std::vector<std::string>> edge_types;
+  if (py_edge_types != Py_None) {
+    py::Object py_seq(PySequence_Fast(py_edge_types, "Expected edge types to be a sequence of 'str'."));
+    if (!py_seq) return nullptr;
+    edge_types.emplace();
+    for (Py_ssize_t i = 0; i < PySequence_Fast_GET_SIZE(py_seq.Ptr()); ++i) {
+      const char *edge_type = PyUnicode_AsUTF8(PySequence_Fast_GET_ITEM(py_seq.Ptr(), i));
+      if (!edge_type) return nullptr;
+      edge_types->emplace_back(edge_type);
+    }
+  }
+
+  std::vector<int64_t> vertex_ids;
+  std::vector<int64_t> indptr{0};
+  // Until all of the vertices are visited, this holds the ids of the neighbours
+  // instead of their positions in `vertex_ids`.
+  std::vector<int64_t> indices;
+  std::vector<int64_t> edge_ids;
+  std::vector<double> weights;
+
+  // The graph is traversed with the GIL released, so Python errors are only
+  // raised once it's reacquired.
+  DeferredPyError error;
+
+  auto get_weight = [&](mgp_edge *edge) -> std::optional<double> {
+    MgpUniquePtr<mgp_value> value{nullptr, mgp_value_destroy};
+    if (error.Set(CreateMgpObject(value, mgp_edge_get_property, edge, weight_property, self->memory))) {
+      return std::nullopt;
+    }
+    switch (Call<mgp_value_type>(mgp_value_get_type, value.get())) {
+      case MGP_VALUE_TYPE_NULL:
+        return default_weight;
+      case MGP_VALUE_TYPE_INT:
+        return static_cast<double>(Call<int64_t>(mgp_value_get_int, value.get()));
+      case MGP_VALUE_TYPE_DOUBLE:
+        return Call<double>(mgp_value_get_double, value.get());
+      default: {
+        std::stringstream ss;
+        ss << "Property '" << weight_property << "' of edge " << Call<mgp_edge_id>(mgp_edge_get_id, edge).as_int
+           << " is not a number";
+        error.Set(PyExc_ValueError, ss.str());
+        return std::nullopt;
+      }
+    }
+  };
+
+  auto add_edges = [&](mgp_vertex *vertex, auto iter_edges, auto get_neighbour) -> bool {
+    MgpUniquePtr<mgp_edges_iterator> edges_it{nullptr, mgp_edges_iterator_destroy};
+    if (error.Set(CreateMgpObject(edges_it, iter_edges, vertex, self->memory))) {
+      return false;
+    }
+    mgp_edge *edge{nullptr};
+    if (error.Set(mgp_edges_iterator_get(edges_it.get(), &edge))) {
+      return false;
+    }
+    while (edge != nullptr) {
+      if (!edge_types ||
+          std::ranges::find(*edge_types, std::string_view{Call<mgp_edge_type>(mgp_edge_get_type, edge).name}) !=
+              edge_types->end()) {
+        auto *neighbour = Call<mgp_vertex *>(get_neighbour, edge);
+        indices.push_back(Call<mgp_vertex_id>(mgp_vertex_get_id, neighbour).as_int);
+        edge_ids.push_back(Call<mgp_edge_id>(mgp_edge_get_id, edge).as_int);
+        if (weight_property) {
+          auto weight = get_weight(edge);
+          if (!weight) return false;
+          weights.push_back(*weight);
+        }
+      }
+      if (error.Set(mgp_edges_iterator_next(edges_it.get(), &edge))) {
+        return false;
+      }
+    }
+    return true;
+  };
+
+  // The IDs of all of the vertices are collected, as the neighbours of the rows
+  // are given by their positions among them.
+  Py_ssize_t position{0};
+  const auto add_vertex = [&](mgp_vertex *vertex) {
+    vertex_ids.push_back(Call<mgp_vertex_id>(mgp_vertex_get_id, vertex).as_int);
+    const bool is_row = position >= start && position < stop;
+    ++position;
+    if (!is_row) return true;
+    if (with_out_edges && !add_edges(vertex, mgp_vertex_iter_out_edges, mgp_edge_get_to)) return false;
+    if (with_in_edges && !add_edges(vertex, mgp_vertex_iter_in_edges, mgp_edge_get_from)) return false;
+    indptr.push_back(static_cast<int64_t>(indices.size()));
+    return true;
+  };
+  {
+    const PyGraphPass pass(*self);
+    ForEachPyGraphVertex(self, nullptr, error, add_vertex);
+  }
+  if (error.Raise()) {
+    return nullptr;
+  }
+
+  {
+    const PyGraphPass pass(*self);
+    // Replace the ids of the neighbours with their positions. Edges leading to
+    // vertices which aren't part of the graph, as can happen with subgraphs or
+    // fine grained access control, are dropped.
+    std::unordered_map<int64_t, int64_t> positions;
+    positions.reserve(vertex_ids.size());
+    for (size_t i = 0; i < vertex_ids.size(); ++i) {
+      positions.emplace(vertex_ids[i], static_cast<int64_t>(i));
+    }
+    size_t num_kept = 0;
+    for (size_t row = 0, begin = 0; row + 1 < indptr.size(); ++row) {
+      const auto end = static_cast<size_t>(indptr[row + 1]);
+      for (auto i = begin; i < end; ++i) {
+        auto it = positions.find(indices[i]);
+        if (it == positions.end()) continue;
+        indices[num_kept] = it->second;
+        edge_ids[num_kept] = edge_ids[i];
+        if (weight_property) weights[num_kept] = weights[i];
+        ++num_kept;
+      }
+      begin = end;
+      indptr[row + 1] = static_cast<int64_t>(num_kept);
+    }
+    indices.resize(num_kept);
+    edge_ids.resize(num_kept);
+    if (weight_property) weights.resize(num_kept);
+    const auto num_vertices = static_cast<Py_ssize_t>(vertex_ids.size());
+    vertex_ids.erase(vertex_ids.begin() + std::min(stop, num_vertices), vertex_ids.end());
+    vertex_ids.erase(vertex_ids.begin(), vertex_ids.begin() + std::min(start, num_vertices));
+  }
+
+  py::Object py_vertex_ids(MakePyArray(std::move(vertex_ids)));
+  if (!py_vertex_ids) return nullptr;
+  py::Object py_indptr(MakePyArray(std::move(indptr)));
+  if (!py_indptr) return nullptr;
+  py::Object py_indices(MakePyArray(std::move(indices)));
+  if (!py_indices) return nullptr;
+  py::Object py_edge_ids(MakePyArray(std::move(edge_ids)));
+  if (!py_edge_ids) return nullptr;
+  py::Object py_weights =
+      weight_property ? py::Object(MakePyArray(std::move(weights))) : py::Object::FromBorrow(Py_None);
+  if (!py_weights) return nullptr;
+  return PyTuple_Pack(5, py_vertex_ids.Ptr(), py_indptr.Ptr(), py_indices.Ptr(), py_edge_ids.Ptr(), py_weights.Ptr());
+}
+
+PyObject *PyGraphVertexIds(PyGraph *self, PyObject *args) {
+  if (RaiseIfPyGraphInvalid(*self)) return nullptr;
+  MG_ASSERT(self->memory);
+  const char *label{nullptr};
+  if (!PyArg_ParseTuple(args, "z", &label)) {
+    return nullptr;
+  }
+  std::vector<int64_t> vertex_ids;
+  const auto add_vertex_id = [&vertex_ids](mgp_vertex *vertex) {
+    vertex_ids.push_back(Call<mgp_vertex_id>(mgp_vertex_get_id, vertex).as_int);
+    return true;
+  };
+  DeferredPyError error;
+  {
+    const PyGraphPass pass(*self);
+    ForEachPyGraphVertex(self, label, error, add_vertex_id);
+  }
+  if (error.Raise()) {
+    return nullptr;
+  }
+  return MakePyArray(std::move(vertex_ids));
+}
+
+PyObject *PyGraphPropertyColumn(PyGraph *self, PyObject *args) {
+  if (RaiseIfPyGraphInvalid(*self)) return nullptr;
+  MG_ASSERT(self->memory);
+  const char *label{nullptr};
+  const char *property_name{nullptr};
+  const char *dtype{nullptr};
+  if (!PyArg_ParseTuple(args, "zss", &label, &property_name, &dtype)) {
+    return nullptr;
+  }
+  const std::string_view dtype_name{dtype};
+  if (dtype_name == "int64") {
+    return MakePyPropertyColumn<int64_t>(self, label, property_name, dtype,
+                                         [](mgp_value *value) -> std::optional<int64_t> {
+                                           if (!Call<int>(mgp_value_is_int, value)) return std::nullopt;
+                                           return Call<int64_t>(mgp_value_get_int, value);
+                                         });
+  }
+  if (dtype_name == "float64") {
+    return MakePyPropertyColumn<double>(self, label, property_name, dtype,
+                                        [](mgp_value *value) -> std::optional<double> {
+                                          if (Call<int>(mgp_value_is_double, value)) {
+                                            return Call<double>(mgp_value_get_double, value);
+                                          }
+                                          if (Call<int>(mgp_value_is_int, value)) {
+                                            return static_cast<double>(Call<int64_t>(mgp_value_get_int, value));
+                                          }
+                                          return std::nullopt;
+                                        });
+  }
+  if (dtype_name == "bool") {
+    return MakePyPropertyColumn<uint8_t>(self, label, property_name, dtype,
+                                         [](mgp_value *value) -> std::optional<uint8_t> {
+                                           if (!Call<int>(mgp_value_is_bool, value)) return std::nullopt;
+                                           return Call<int>(mgp_value_get_bool, value) != 0;
+                                         });
+  }
+  PyErr_SetString(PyExc_ValueError, "Expected dtype to be one of 'int64', 'float64' or 'bool'.");
+  return nullptr;
+}
+
+namespace {
+// Values of a property of many vertices or edges, read from Python buffers.
+struct PropertyColumnValues {
+  std::string name;
+  PyArrayValues values;
+  std::optional<PyArrayValues> null_mask;
+};
+
+size_t ArrayValuesSize(const PyArrayValues &values) {
+  return std::visit([](const auto &v) { return v.size(); }, values);
+}
+
+std::optional<std::vector<int64_t>> PyBufferToIds(PyObject *obj, const char *name) {
+  auto values = PyBufferToArrayValues(obj, name);
+  if (!values) return std::nullopt;
+  auto *ids = std::get_if<std::vector<int64_t>>(&*values);
+  if (!ids) {
+    PyErr_Format(PyExc_ValueError, "Expected %s to be integers.", name);
+    return std::nullopt;
+  }
+  return std::move(*ids);
+}
+
+std::optional<PropertyColumnValues> PyBuffersToPropertyColumn(const char *name, PyObject *py_values,
+                                                              PyObject *py_null_mask, size_t size) {
+  PropertyColumnValues column{.name = name};
+  auto values = PyBufferToArrayValues(py_values, "values");
+  if (!values) return std::nullopt;
+  column.values = std::move(*values);
+  if (py_null_mask != Py_None) {
+    column.null_mask = PyBufferToArrayValues(py_null_mask, "null mask");
+    if (!column.null_mask) return std::nullopt;
+  }
+  if (ArrayValuesSize(column.values) != size || (column.null_mask && ArrayValuesSize(*column.null_mask) != size)) {
+    PyErr_Format(PyExc_ValueError, "Expected the values and null mask of property '%s' to have %zu elements.", name,
+                 size);
+    return std::nullopt;
+  }
+  return column;
+}
+
+// Read a sequence of (name, values, null mask) tuples.
+std::optional<std::vector<PropertyColumnValues>> PyObjectToPropertyColumns(PyObject *py_columns, size_t size) {
+  py::Object py_seq(PySequence_Fast(py_columns, "Expected properties to be a sequence."));
+  if (!py_seq) return std::nullopt;
+  std::vector<PropertyColumnValues> columns;
+  columns.reserve(PySequence_Fast_GET_SIZE(py_seq.Ptr()));
+  for (Py_ssize_t i = 0; i < PySequence_Fast_GET_SIZE(py_seq.Ptr()); ++i) {
+    const char *name{nullptr};
+    PyObject *py_values{nullptr};
+    PyObject *py_null_mask{nullptr};
+    if (!PyArg_ParseTuple(PySequence_Fast_GET_ITEM(py_seq.Ptr(), i), "sOO", &name, &py_values, &py_null_mask)) {
+      return std::nullopt;
+    }
+    auto column = PyBuffersToPropertyColumn(name, py_values, py_null_mask, size);
+    if (!column) return std::nullopt;
+    columns.push_back(std::move(*column));
+  }
+  return columns;
+}
+
+mgp_error MakePropertyColumnValue(const PropertyColumnValues &column, size_t i, mgp_memory *memory,
+                                  mgp_value **result) {
+  if (column.null_mask && std::visit([i](const auto &mask) { return mask[i] != 0; }, *column.null_mask)) {
+    return mgp_value_make_null(memory, result);
+  }
+  return std::visit(utils::Overloaded{
+                        [&](const std::vector<int64_t> &v) { return mgp_value_make_int(v[i], memory, result); },
+                        [&](const std::vector<double> &v) { return mgp_value_make_double(v[i], memory, result); },
+                        [&](const std::vector<uint8_t> &v) { return mgp_value_make_bool(v[i], memory, result); },
+                    },
+                    column.values);
+}
+
+// Set the properties of the `i`th vertex or edge from the columns with
+// `set_property`, which is `mgp_vertex_set_property` or `mgp_edge_set_property`.
+template <typename TObj>
+bool SetPropertiesFromColumns(TObj *obj, mgp_error (*set_property)(TObj *, const char *, mgp_value *),
+                              const std::vector<PropertyColumnValues> &columns, size_t i, mgp_memory *memory,
+                              DeferredPyError &error) {
+  for (const auto &column : columns) {
+    MgpUniquePtr<mgp_value> value{nullptr, mgp_value_destroy};
+    if (error.Set(CreateMgpObject(value, MakePropertyColumnValue, column, i, memory)) ||
+        error.Set(set_property(obj, column.name.c_str(), value.get()))) {
+      return false;
+    }
+  }
+  return true;
+}
+
+// Return the vertex with the ID or nullptr with `error` set.
+MgpUniquePtr<mgp_vertex> GetVertexById(PyGraph *py_graph, int64_t id, DeferredPyError &error) {
+  MgpUniquePtr<mgp_vertex> vertex{nullptr, mgp_vertex_destroy};
+  if (error.Set(
+          CreateMgpObject(vertex, mgp_graph_get_vertex_by_id, py_graph->graph, mgp_vertex_id{id}, py_graph->memory))) {
+    return vertex;
+  }
+  if (!vertex) {
+    error.Set(PyExc_IndexError, "Unable to find the vertex with ID " + std::to_string(id) + ".");
+  }
+  return vertex;
+}
+}  // namespace
+
+PyObject *PyGraphSetPropertyColumn(PyGraph *self, PyObject *args) {
+  if (RaiseIfPyGraphInvalid(*self)) return nullptr;
+  MG_ASSERT(self->memory);
+  PyObject *py_vertex_ids{nullptr};
+  const char *property_name{nullptr};
+  PyObject *py_values{nullptr};
+  PyObject *py_null_mask{nullptr};
+  if (!PyArg_ParseTuple(args, "OsOO", &py_vertex_ids, &property_name, &py_values, &py_null_mask)) {
+    return nullptr;
+  }
+  const auto vertex_ids = PyBufferToIds(py_vertex_ids, "vertex IDs");
+  if (!vertex_ids) return nullptr;
+  auto column = PyBuffersToPropertyColumn(property_name, py_values, py_null_mask, vertex_ids->size());
+  if (!column) return nullptr;
+  const std::vector<PropertyColumnValues> columns{std::move(*column)};
+  DeferredPyError error;
+  {
+    const PyGraphPass pass(*self);
+    for (size_t i = 0; i < vertex_ids->size(); ++i) {
+      auto vertex = GetVertexById(self, (*vertex_ids)[i], error);
+      if (!vertex ||
+          !SetPropertiesFromColumns(vertex.get(), mgp_vertex_set_property, columns, i, self->memory, error)) {
+        break;
+      }
+    }
+  }
+  if (error.Raise()) {
+    return nullptr;
+  }
+  Py_RETURN_NONE;
+}
+
+PyObject *PyGraphCreateVertices(PyGraph *self, PyObject *args) {
+  if (RaiseIfPyGraphInvalid(*self)) return nullptr;
+  MG_ASSERT(self->memory);
+  Py_ssize_t count{0};
+  PyObject *py_labels{nullptr};
+  PyObject *py_columns{nullptr};
+  if (!PyArg_ParseTuple(args, "nOO", &count, &py_labels, &py_columns)) {
+    return nullptr;
+  }
+  if (count < 0) {
+    PyErr_SetString(PyExc_ValueError, "Expected a non-negative number of vertices.");
+    return nullptr;
+  }
+  std::vector<const char *> labels;
+  py::Object py_labels_seq(PySequence_Fast(py_labels, "Expected labels to be a sequence of 'str'."));
+  if (!py_labels_seq) return nullptr;
+  for (Py_ssize_t i = 0; i < PySequence_Fast_GET_SIZE(py_labels_seq.Ptr()); ++i) {
+    const char *label = PyUnicode_AsUTF8(PySequence_Fast_GET_ITEM(py_labels_seq.Ptr(), i));
+    if (!label) return nullptr;
+    labels.push_back(label);
+  }
+  const auto columns = PyObjectToPropertyColumns(py_columns, static_cast<size_t>(count));
+  if (!columns) return nullptr;
+
+  std::vector<int64_t> vertex_ids;
+  vertex_ids.reserve(count);
+  DeferredPyError error;
+  const auto create_vertex = [&](size_t i) {
+    MgpUniquePtr<mgp_vertex> vertex{nullptr, mgp_vertex_destroy};
+    if (error.Set(CreateMgpObject(vertex, mgp_graph_create_vertex, self->graph, self->memory))) {
+      return false;
+    }
+    for (const auto *label : labels) {
+      if (error.Set(mgp_vertex_add_label(vertex.get(), mgp_label{label}))) {
+        return false;
+      }
+    }
+    if (!SetPropertiesFromColumns(vertex.get(), mgp_vertex_set_property, *columns, i, self->memory, error)) {
+      return false;
+    }
+    vertex_ids.push_back(Call<mgp_vertex_id>(mgp_vertex_get_id, vertex.get()).as_int);
+    return true;
+  };
+  {
+    const PyGraphPass pass(*self);
+    for (size_t i = 0; i < static_cast<size_t>(count); ++i) {
+      if (!create_vertex(i)) break;
+    }
+  }
+  if (error.Raise()) {
+    return nullptr;
+  }
+  return MakePyArray(std::move(vertex_ids));
+}
+
+PyObject *PyGraphCreateEdges(PyGraph *self, PyObject *args) {
+  if (RaiseIfPyGraphInvalid(*self)) return nullptr;
+  MG_ASSERT(self->memory);
+  PyObject *py_from_ids{nullptr};
+  PyObject *py_to_ids{nullptr};
+  const char *edge_type{nullptr};
+  PyObject *py_columns{nullptr};
+  if (!PyArg_ParseTuple(args, "OOsO", &py_from_ids, &py_to_ids, &edge_type, &py_columns)) {
+    return nullptr;
+  }
+  const auto from_ids = PyBufferToIds(py_from_ids, "source vertex IDs");
+  if (!from_ids) return nullptr;
+  const auto to_ids = PyBufferToIds(py_to_ids, "destination vertex IDs");
+  if (!to_ids) return nullptr;
+  if (from_ids->size() != to_ids->size()) {
+    PyErr_SetString(PyExc_ValueError, "Expected source and destination vertex IDs to have the same length.");
+    return nullptr;
+  }
+  const auto columns = PyObjectToPropertyColumns(py_columns, from_ids->size());
+  if (!columns) return nullptr;
+
+  std::vector<int64_t> edge_ids;
+  edge_ids.reserve(from_ids->size());
+  DeferredPyError error;
+  const auto create_edge = [&](size_t i) {
+    auto from = GetVertexById(self, (*from_ids)[i], error);
+    if (!from) return false;
+    auto to = GetVertexById(self, (*to_ids)[i], error);
+    if (!to) return false;
+    MgpUniquePtr<mgp_edge> edge{nullptr, mgp_edge_destroy};
+    if (error.Set(CreateMgpObject(edge, mgp_graph_create_edge, self->graph, from.get(), to.get(),
+                                  mgp_edge_type{edge_type}, self->memory))) {
+      return false;
+    }
+    if (!SetPropertiesFromColumns(edge.get(), mgp_edge_set_property, *columns, i, self->memory, error)) {
+      return false;
+    }
+    edge_ids.push_back(Call<mgp_edge_id>(mgp_edge_get_id, edge.get()).as_int);
+    return true;
+  };
+  {
+    const PyGraphPass pass(*self);
+    for (size_t i = 0; i < from_ids->size(); ++i) {
+      if (!create_edge(i)) break;
+    }
+  }
+  if (error.Raise()) {
+    return nullptr;
+  }
+  return MakePyArray(std::move(edge_ids));
+}
+
 }  // namespace memgraph::query::procedure
@@ -13,6 +13,9 @@
 /// Functions and types for loading Query Modules written in Python.
 #pragma once
 
+#include <chrono>
+#include <cstdint>
+
 #include "py/py.hpp"
 
 struct mgp_graph;
@@ -60,6 +63,13 @@ mgp_value *PyObjectToMgpValue(PyObject *, mgp_memory *);
 ///     PyImport_AppendInittab("_mgp", &query::procedure::PyInitMgpModule);
 PyObject *PyInitMgpModule();
 
+/// Hook the Python memory allocators, so that the allocations of Python
+/// objects are tracked by the memory trackers and, in calls of Python
+/// procedures and functions, fail once they would exceed the memory limits.
+///
+/// The function is to be called after Py_Initialize, with the GIL held.
+void InstallPyAllocatorHooks();
+
 /// Create an instance of _mgp.Graph class.
 PyObject *MakePyGraph(mgp_graph *, mgp_memory *);
 
@@ -79,7 +89,49 @@ py::Object ImportPyModule(const char *, mgp_module *);
 /// Return nullptr and set appropriate Python exception on failure.
 py::Object ReloadPyModule(PyObject *, mgp_module *);
 
-/// Call full python circular reference garbage collection (all generations)
-void PyCollectGarbage();
+/// Hand the full collections of Python's garbage collector over to
+/// PyCollectGarbage, so that they aren't run in the middle of procedure calls.
+///
+/// The function is to be called after Py_Initialize, with the GIL held.
+void PySetUpGarbageCollection();
+
+/// Move the objects currently tracked by Python's garbage collector to the
+/// permanent generation, which isn't collected. This freezes every object in
+/// the interpreter, so it's only to be called while no Python procedure or
+/// function is running, e.g. after loading the modules under the write lock of
+/// the module registry. The GIL must be held.
+void PyFreezeGarbage();
+
+/// Move the objects of the permanent generation back to the oldest one, e.g.
+/// before unloading a module. The GIL must be held.
+void PyUnfreezeGarbage();
+
+/// Collection of Python's garbage collector chosen by
+/// SchedulePyGarbageCollection.
+enum class PyGarbageCollection : uint8_t { NONE, YOUNG, FULL };
+
+/// State of Python's garbage collector which the collections are scheduled by.
+struct PyGarbageCollectionStats {
+  long young_count;
+  long old_count;
+  int64_t arena_bytes;
+  int64_t arena_bytes_after_full_collection;
+  std::chrono::seconds since_full_collection;
+  bool is_idle;
+};
+
+/// Choose the collection PyCollectGarbage runs for the given `stats`. The
+/// pymalloc size after the last full collection is clamped to a lower bound, so
+/// that a tiny or unknown size doesn't make a full collection always due.
+PyGarbageCollection SchedulePyGarbageCollection(const PyGarbageCollectionStats &stats,
+                                                std::chrono::seconds full_collection_interval);
+
+/// Run a scheduled collection of Python's garbage collector, to be called
+/// periodically. The young generations are collected while no Python procedure
+/// or function is running. A full collection is run once enough memory was
+/// allocated since the last one or `full_collection_interval` has passed, and
+/// is deferred while Python procedures or functions are running unless the
+/// memory has doubled.
+void PyCollectGarbage(std::chrono::seconds full_collection_interval);
 
 }  // namespace memgraph::query::procedure
@@ -0,0 +1,226 @@
+// Copyright 2024 Memgraph Ltd.
+//
+// Use of this software is governed by the Business Source License
+// included in the file licenses/BSL.txt; by using this file, you agree to be bound by the terms of the Business Source
+// License, and you may not use this file except in compliance with the Business Source License.
+//
+// As of the Change Date specified in that file, in accordance with
+// the Business Source License, use of this software will be governed
+// by the Apache License, Version 2.0, included in the file
+// licenses/APL.txt.
+
+#include "query/procedure/signature_cache.hpp"
+
+#include <fstream>
+#include <sstream>
+#include <string_view>
+
+#include <fmt/format.h>
+
+#include "query/procedure/cypher_types.hpp"
+#include "query/procedure/mg_procedure_helpers.hpp"
+#include "query/serialization/property_value.hpp"
+#include "utils/logging.hpp"
+
+namespace memgraph::query::procedure {
+
+namespace {
+
+// Bump when the format of the cached signatures changes.
+constexpr uint64_t kSignatureCacheVersion{1};
+
+std::optional<std::string> ReadFile(const std::filesystem::path &path) {
+  std::ifstream file(path);
+  if (!file.is_open()) return std::nullopt;
+  std::stringstream content;
+  content << file.rdbuf();
+  if (file.bad()) return std::nullopt;
+  return content.str();
+}
+
+std::filesystem::path CacheFilePath(const std::filesystem::path &directory, const std::filesystem::path &module_path) {
+  // Modules with the same name can live in different module directories.
+  const auto path_hash = std::hash<std::string>{}(std::filesystem::absolute(module_path).string());
+  return directory / fmt::format("{}-{:016x}.json", module_path.stem().string(), path_hash);
+}
+
+mgp_type *ParseType(std::string_view name) {
+  static constexpr std::string_view kNullableList{"LIST? OF "};
+  static constexpr std::string_view kList{"LIST OF "};
+  // The names are those of `CypherType::GetPresentableName`, in which a
+  // nullable list is formatted specially.
+  if (name.starts_with(kNullableList)) {
+    auto *list = Call<mgp_type *>(mgp_type_list, ParseType(name.substr(kNullableList.size())));
+    return Call<mgp_type *>(mgp_type_nullable, list);
+  }
+  if (name.starts_with(kList)) {
+    return Call<mgp_type *>(mgp_type_list, ParseType(name.substr(kList.size())));
+  }
+  if (name.ends_with('?')) {
+    return Call<mgp_type *>(mgp_type_nullable, ParseType(name.substr(0, name.size() - 1)));
+  }
+  static const std::map<std::string_view, mgp_error (*)(mgp_type **), std::less<>> kTypes{
+      {"ANY", mgp_type_any},
+      {"BOOLEAN", mgp_type_bool},
+      {"STRING", mgp_type_string},
+      {"INTEGER", mgp_type_int},
+      {"FLOAT", mgp_type_float},
+      {"NUMBER", mgp_type_number},
+      {"MAP", mgp_type_map},
+      {"NODE", mgp_type_node},
+      {"RELATIONSHIP", mgp_type_relationship},
+      {"PATH", mgp_type_path},
+      {"DATE", mgp_type_date},
+      {"LOCAL_TIME", mgp_type_local_time},
+      {"LOCAL_DATE_TIME", mgp_type_local_date_time},
+      {"DURATION", mgp_type_duration},
+  };
+  auto found_it = kTypes.find(name);
+  if (found_it == kTypes.end()) {
+    throw std::invalid_argument{fmt::format("Unknown type '{}' in the cached signature", name)};
+  }
+  return Call<mgp_type *>(found_it->second);
+}
+
+template <class TCallable>
+void SerializeArguments(const TCallable &callable, nlohmann::json *signature) {
+  auto args = nlohmann::json::array();
+  for (const auto &[name, type] : callable.args) {
+    args.push_back({std::string(name), std::string(type->GetPresentableName())});
+  }
+  auto opt_args = nlohmann::json::array();
+  for (const auto &[name, type, default_value] : callable.opt_args) {
+    opt_args.push_back({std::string(name), std::string(type->GetPresentableName()),
+                        serialization::SerializePropertyValue(storage::PropertyValue(default_value))});
+  }
+  (*signature)["args"] = std::move(args);
+  (*signature)["opt_args"] = std::move(opt_args);
+}
+
+template <class TCallable>
+void DeserializeArguments(const nlohmann::json &signature, TCallable *callable) {
+  auto *memory = callable->args.get_allocator().GetMemoryResource();
+  for (const auto &arg : signature.at("args")) {
+    callable->args.emplace_back(utils::pmr::string(arg.at(0).get<std::string>(), memory),
+                                ParseType(arg.at(1).get<std::string>())->impl.get());
+  }
+  for (const auto &arg : signature.at("opt_args")) {
+    callable->opt_args.emplace_back(utils::pmr::string(arg.at(0).get<std::string>(), memory),
+                                    ParseType(arg.at(1).get<std::string>())->impl.get(),
+                                    TypedValue(serialization::DeserializePropertyValue(arg.at(2)), memory));
+  }
+}
+
+}  // namespace
+
+std::optional<nlohmann::json> ModuleFileFingerprint(const std::filesystem::path &module_path) {
+  std::error_code error_code;
+  const auto size = std::filesystem::file_size(module_path, error_code);
+  if (error_code) return std::nullopt;
+  const auto modified = std::filesystem::last_write_time(module_path, error_code);
+  if (error_code) return std::nullopt;
+  const auto content = ReadFile(module_path);
+  if (!content) return std::nullopt;
+  return nlohmann::json{{"size", size},
+                        {"modified", modified.time_since_epoch().count()},
+                        {"hash", std::hash<std::string_view>{}(*content)}};
+}
+
+std::optional<nlohmann::json> SignatureCache::Load(const std::filesystem::path &module_path) const {
+  const auto cache_path = CacheFilePath(directory_, module_path);
+  const auto content = ReadFile(cache_path);
+  if (!content) return std::nullopt;
+  auto cached = nlohmann::json::parse(*content, nullptr, /* allow_exceptions = */ false);
+  if (!cached.is_object() || cached.value("version", uint64_t{0}) != kSignatureCacheVersion) {
+    spdlog::warn("Ignoring the invalid cached signatures {} of module {}", cache_path, module_path);
+    return std::nullopt;
+  }
+  const auto fingerprint = ModuleFileFingerprint(module_path);
+  if (!fingerprint || cached.value("module", nlohmann::json{}) != *fingerprint) return std::nullopt;
+  return std::move(cached["signatures"]);
+}
+
+void SignatureCache::Store(const std::filesystem::path &module_path, const nlohmann::json &signatures) const {
+  const auto fingerprint = ModuleFileFingerprint(module_path);
+  if (!fingerprint) return;
+  std::error_code error_code;
+  std::filesystem::create_directories(directory_, error_code);
+  if (error_code) {
+    spdlog::warn("Unable to create the directory {} for the signatures of query modules: {}", directory_,
+                 error_code.message());
+    return;
+  }
+  const auto cache_path = CacheFilePath(directory_, module_path);
+  // Write to a temporary file first, so that a crash can't leave a truncated
+  // cache file behind.
+  auto temporary_path = cache_path;
+  temporary_path += ".tmp";
+  {
+    std::ofstream file(temporary_path);
+    file << nlohmann::json{{"version", kSignatureCacheVersion}, {"module", *fingerprint}, {"signatures", signatures}};
+    if (!file) {
+      spdlog::warn("Unable to write the signatures of module {} to {}", module_path, temporary_path);
+      return;
+    }
+  }
+  std::filesystem::rename(temporary_path, cache_path, error_code);
+  if (error_code) {
+    spdlog::warn("Unable to write the signatures of module {} to {}: {}", module_path, cache_path,
+                 error_code.message());
+  }
+}
+
+std::optional<nlohmann::json> SerializeSignatures(const std::map<std::string, mgp_proc, std::less<>> &procedures,
+                                                  const std::map<std::string, mgp_trans, std::less<>> &transformations,
+                                                  const std::map<std::string, mgp_func, std::less<>> &functions) {
+  try {
+    auto serialized_procedures = nlohmann::json::array();
+    for (const auto &[name, proc] : procedures) {
+      nlohmann::json signature{{"name", name},
+                               {"is_write", proc.info.is_write},
+                               {"is_batched", proc.info.is_batched},
+                               {"is_lazy", proc.stream_factory.has_value()}};
+      SerializeArguments(proc, &signature);
+      auto results = nlohmann::json::array();
+      for (const auto &[result_name, result] : proc.results) {
+        const auto &[type, is_deprecated] = result;
+        results.push_back({std::string(result_name), std::string(type->GetPresentableName()), is_deprecated});
+      }
+      signature["results"] = std::move(results);
+      serialized_procedures.push_back(std::move(signature));
+    }
+    auto serialized_transformations = nlohmann::json::array();
+    for (const auto &[name, trans] : transformations) {
+      serialized_transformations.push_back({{"name", name}});
+    }
+    auto serialized_functions = nlohmann::json::array();
+    for (const auto &[name, func] : functions) {
+      nlohmann::json signature{{"name", name}, {"is_vectorized", func.is_vectorized}};
+      SerializeArguments(func, &signature);
+      serialized_functions.push_back(std::move(signature));
+    }
+    return nlohmann::json{{"procedures", std::move(serialized_procedures)},
+                          {"transformations", std::move(serialized_transformations)},
+                          {"functions", std::move(serialized_functions)}};
+  } catch (const TypedValueException &) {
+    // A default value which isn't a property value.
+    return std::nullopt;
+  }
+}
+
+void DeserializeSignature(const nlohmann::json &signature, mgp_proc *proc) {
+  DeserializeArguments(signature, proc);
+  auto *memory = proc->results.get_allocator().GetMemoryResource();
+  for (const auto &result : signature.at("results")) {
+    proc->results.emplace(
+        utils::pmr::string(result.at(0).get<std::string>(), memory),
+        std::make_pair(ParseType(result.at(1).get<std::string>())->impl.get(), result.at(2).get<bool>()));
+  }
+}
+
+void DeserializeSignature(const nlohmann::json &signature, mgp_func *func) {
+  DeserializeArguments(signature, func);
+  func->is_vectorized = signature.value("is_vectorized", false);
+}
+
+}  // namespace memgraph::query::procedure
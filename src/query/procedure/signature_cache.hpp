@@ -0,0 +1,71 @@
+// Copyright 2024 Memgraph Ltd.
+//
+// Use of this software is governed by the Business Source License
+// included in the file licenses/BSL.txt; by using this file, you agree to be bound by the terms of the Business Source
+// License, and you may not use this file except in compliance with the Business Source License.
+//
+// As of the Change Date specified in that file, in accordance with
+// the Business Source License, use of this software will be governed
+// by the Apache License, Version 2.0, included in the file
+// licenses/APL.txt.
+
+/// @file
+/// Cache of the signatures of query modules, which allows registering a Python
+/// module without importing it.
+#pragma once
+
+#include <filesystem>
+#include <functional>
+#include <map>
+#include <optional>
+#include <string>
+
+#include <json/json.hpp>
+
+#include "query/procedure/mg_procedure_impl.hpp"
+
+namespace memgraph::query::procedure {
+
+/// Identify the contents of the module file at `module_path` by its size,
+/// modification time and hash. The modification time and the size are cheap
+/// to check, but are not enough on their own, e.g. when a file is restored
+/// with its original modification time. Return std::nullopt if the file can't
+/// be read.
+std::optional<nlohmann::json> ModuleFileFingerprint(const std::filesystem::path &module_path);
+
+/// Stores the signatures of the procedures, transformations and functions of
+/// each module in its own file. An entry records the size, the modification
+/// time and the hash of the module file it was created from, and is ignored
+/// once the module file changes.
+class SignatureCache final {
+ public:
+  explicit SignatureCache(std::filesystem::path directory) : directory_(std::move(directory)) {}
+
+  /// Return the cached signatures of the module at `module_path`, or
+  /// std::nullopt if there are none or the module file changed since.
+  std::optional<nlohmann::json> Load(const std::filesystem::path &module_path) const;
+
+  /// Cache the signatures of the module at `module_path`. Errors are logged.
+  void Store(const std::filesystem::path &module_path, const nlohmann::json &signatures) const;
+
+ private:
+  std::filesystem::path directory_;
+};
+
+/// Serialize the signatures of a module, or return std::nullopt if any of
+/// them can't be serialized.
+std::optional<nlohmann::json> SerializeSignatures(const std::map<std::string, mgp_proc, std::less<>> &procedures,
+                                                  const std::map<std::string, mgp_trans, std::less<>> &transformations,
+                                                  const std::map<std::string, mgp_func, std::less<>> &functions);
+
+/// Add the arguments and results of a serialized procedure to `proc`.
+/// @throw nlohmann::json::exception if the signature is malformed
+/// @throw std::invalid_argument if the signature contains an unknown type
+void DeserializeSignature(const nlohmann::json &signature, mgp_proc *proc);
+
+/// Add the arguments of a serialized function to `func`.
+/// @throw nlohmann::json::exception if the signature is malformed
+/// @throw std::invalid_argument if the signature contains an unknown type
+void DeserializeSignature(const nlohmann::json &signature, mgp_func *func);
+
+}  // namespace memgraph::query::procedure
@@ -16,9 +16,9 @@
 #include "integrations/constants.hpp"
 
 namespace memgraph::query::stream {
-KafkaStream::KafkaStream(std::string stream_name, StreamInfo stream_info,
-                         ConsumerFunction<integrations::kafka::Message> consumer_function) {
-  integrations::kafka::ConsumerInfo consumer_info{
+namespace {
+integrations::kafka::ConsumerInfo MakeConsumerInfo(std::string stream_name, KafkaStream::StreamInfo stream_info) {
+  return {
       .consumer_name = std::move(stream_name),
       .topics = std::move(stream_info.topics),
       .consumer_group = std::move(stream_info.consumer_group),
@@ -28,7 +28,17 @@ KafkaStream::KafkaStream(std::string stream_name, StreamInfo stream_info,
       .public_configs = std::move(stream_info.configs),
       .private_configs = std::move(stream_info.credentials),
   };
-  consumer_.emplace(std::move(consumer_info), std::move(consumer_function));
+}
+}  // namespace
+
+KafkaStream::KafkaStream(std::string stream_name, StreamInfo stream_info,
+                         ConsumerFunction<integrations::kafka::Message> consumer_function) {
+  consumer_.emplace(MakeConsumerInfo(std::move(stream_name), std::move(stream_info)), std::move(consumer_function));
+};
+
+KafkaStream::KafkaStream(std::string stream_name, StreamInfo stream_info,
+                         integrations::kafka::PipelinedConsumerFunction consumer_function) {
+  consumer_.emplace(MakeConsumerInfo(std::move(stream_name), std::move(stream_info)), std::move(consumer_function));
 };
 
 KafkaStream::StreamInfo KafkaStream::Info(std::string transformation_name) const {
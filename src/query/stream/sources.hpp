@@ -32,6 +32,8 @@ struct KafkaStream {
 
   KafkaStream(std::string stream_name, StreamInfo stream_info,
               ConsumerFunction<integrations::kafka::Message> consumer_function);
+  KafkaStream(std::string stream_name, StreamInfo stream_info,
+              integrations::kafka::PipelinedConsumerFunction consumer_function);
 
   StreamInfo Info(std::string transformation_name) const;
 
@@ -45,10 +45,15 @@ extern const Event MessagesConsumed;
 
 namespace memgraph::query::stream {
 namespace {
-inline constexpr auto kExpectedTransformationResultSize = 2;
+inline constexpr auto kExpectedTransformationResultSize = 3;
+inline constexpr auto kRequiredTransformationResultSize = 2;
 inline constexpr auto kCheckStreamResultSize = 2;
+// The query of a row with a batch is executed once for all of its parameter
+// maps, as `UNWIND $batch AS row <query>`.
+inline constexpr std::string_view kBatchParameterName{"batch"};
 const utils::pmr::string query_param_name{"query", utils::NewDeleteResource()};
 const utils::pmr::string params_param_name{"parameters", utils::NewDeleteResource()};
+const utils::pmr::string batch_param_name{"batch", utils::NewDeleteResource()};
 
 const std::map<std::string, storage::PropertyValue> empty_parameters{};
 
@@ -59,10 +64,11 @@ auto GetStream(auto &map, const std::string &stream_name) {
   throw StreamsException("Couldn't find stream '{}'", stream_name);
 }
 
-std::pair<TypedValue /*query*/, TypedValue /*parameters*/> ExtractTransformationResult(
+std::tuple<TypedValue /*query*/, TypedValue /*parameters*/, TypedValue /*batch*/> ExtractTransformationResult(
     const utils::pmr::map<utils::pmr::string, TypedValue> &values, const std::string_view transformation_name,
     const std::string_view stream_name) {
-  if (values.size() != kExpectedTransformationResultSize) {
+  // The batch is optional.
+  if (values.size() < kRequiredTransformationResultSize) {
     throw StreamsException(
         "Transformation '{}' in stream '{}' did not yield all fields (query, parameters) as required.",
         transformation_name, stream_name);
@@ -81,7 +87,10 @@ std::pair<TypedValue /*query*/, TypedValue /*parameters*/> ExtractTransformation
   MG_ASSERT(query_value.IsString());
   const auto &params_value = get_value(params_param_name);
   MG_ASSERT(params_value.IsNull() || params_value.IsMap());
-  return {query_value, params_value};
+  auto batch_it = values.find(batch_param_name);
+  if (batch_it == values.end()) return {query_value, params_value, TypedValue()};
+  MG_ASSERT(batch_it->second.IsNull() || batch_it->second.IsList());
+  return {query_value, params_value, batch_it->second};
 }
 
 template <typename TMessage>
@@ -109,6 +118,7 @@ void CallCustomTransformation(const std::string &transformation_name, const std:
     MG_ASSERT(result.signature->size() == kExpectedTransformationResultSize);
     MG_ASSERT(result.signature->contains(query_param_name));
     MG_ASSERT(result.signature->contains(params_param_name));
+    MG_ASSERT(result.signature->contains(batch_param_name));
 
     spdlog::trace("Calling transformation in stream '{}'", stream_name);
     trans.cb(&mgp_messages, &graph, &result, &memory);
@@ -502,80 +512,124 @@ Streams::StreamsMap::iterator Streams::CreateConsumer(StreamsMap &map, const std
 
   auto *memory_resource = utils::NewDeleteResource();
 
-  auto consumer_function = [interpreter_context, memory_resource, stream_name,
-                            transformation_name = stream_info.common_info.transformation_name, owner = std::move(owner),
-                            interpreter = std::make_shared<Interpreter>(interpreter_context, std::move(db_acc)),
-                            result = mgp_result{nullptr, memory_resource},
-                            total_retries = interpreter_context->config.stream_transaction_conflict_retries,
-                            retry_interval = interpreter_context->config.stream_transaction_retry_interval](
-                               const std::vector<typename TStream::Message> &messages) mutable {
-    // Set interpreter's user to the stream owner
-    // NOTE: We generate an empty user to avoid generating interpreter's fine grained access control and rely only on
-    // the global auth_checker used in the stream itself
-    // TODO: Fix auth inconsistency
-    interpreter->SetUser(interpreter_context->auth_checker->GenQueryUser(std::nullopt, std::nullopt));
-#ifdef MG_ENTERPRISE
-    interpreter->OnChangeCB([](auto) { return false; });  // Disable database change
-#endif
-    auto accessor = interpreter->current_db_.db_acc_->get()->Access();
-    // register new interpreter into interpreter_context
-    interpreter_context->interpreters->insert(interpreter.get());
-    utils::OnScopeExit interpreter_cleanup{
-        [interpreter_context, interpreter]() { interpreter_context->interpreters->erase(interpreter.get()); }};
-
+  auto transform_batch = [memory_resource, stream_name,
+                          transformation_name = stream_info.common_info.transformation_name,
+                          db_acc](const std::vector<typename TStream::Message> &messages, mgp_result &result) mutable {
+    auto accessor = db_acc->Access();
     memgraph::metrics::IncrementCounter(memgraph::metrics::MessagesConsumed, messages.size());
     CallCustomTransformation(transformation_name, messages, result, *accessor, *memory_resource, stream_name);
+  };
 
-    DiscardValueResultStream stream;
-
-    spdlog::trace("Start transaction in stream '{}'", stream_name);
-    utils::OnScopeExit cleanup{[&interpreter, &result]() {
-      result.rows.clear();
-      interpreter->Abort();
-    }};
-
-    const static std::map<std::string, storage::PropertyValue> empty_parameters{};
-    uint32_t i = 0;
-    while (true) {
-      try {
-        interpreter->BeginTransaction();
-        for (auto &row : result.rows) {
-          spdlog::trace("Processing row in stream '{}'", stream_name);
-          auto [query_value, params_value] = ExtractTransformationResult(row.values, transformation_name, stream_name);
-          storage::PropertyValue params_prop{params_value};
-          std::string query{query_value.ValueString()};
-          spdlog::trace("Executing query '{}' in stream '{}'", query, stream_name);
-          auto prepare_result =
-              interpreter->Prepare(query, params_prop.IsNull() ? empty_parameters : params_prop.ValueMap(), {});
-          if (!owner->IsAuthorized(prepare_result.privileges, "", &up_to_date_policy)) {
-            throw StreamsException{
-                "Couldn't execute query '{}' for stream '{}' because the owner is not authorized to execute the "
-                "query!",
-                query, stream_name};
+  auto execute_batch =
+      [interpreter_context, stream_name, transformation_name = stream_info.common_info.transformation_name,
+       owner = std::move(owner), interpreter = std::make_shared<Interpreter>(interpreter_context, std::move(db_acc)),
+       total_retries = interpreter_context->config.stream_transaction_conflict_retries,
+       retry_interval = interpreter_context->config.stream_transaction_retry_interval](mgp_result &result) mutable {
+        // Set interpreter's user to the stream owner
+        // NOTE: We generate an empty user to avoid generating interpreter's fine grained access control and rely only
+        // on the global auth_checker used in the stream itself
+        // TODO: Fix auth inconsistency
+        interpreter->SetUser(interpreter_context->auth_checker->GenQueryUser(std::nullopt, std::nullopt));
+#ifdef MG_ENTERPRISE
+        interpreter->OnChangeCB([](auto) { return false; });  // Disable database change
+#endif
+        // register new interpreter into interpreter_context
+        interpreter_context->interpreters->insert(interpreter.get());
+        utils::OnScopeExit interpreter_cleanup{
+            [interpreter_context, interpreter]() { interpreter_context->interpreters->erase(interpreter.get()); }};
+
+        DiscardValueResultStream stream;
+
+        spdlog::trace("Start transaction in stream '{}'", stream_name);
+        utils::OnScopeExit cleanup{[&interpreter, &result]() {
+          result.rows.clear();
+          interpreter->Abort();
+        }};
+
+        const static std::map<std::string, storage::PropertyValue> empty_parameters{};
+        uint32_t i = 0;
+        while (true) {
+          try {
+            interpreter->BeginTransaction();
+            for (auto &row : result.rows) {
+              spdlog::trace("Processing row in stream '{}'", stream_name);
+              auto [query_value, params_value, batch_value] =
+                  ExtractTransformationResult(row.values, transformation_name, stream_name);
+              storage::PropertyValue params_prop{params_value};
+              std::string query{query_value.ValueString()};
+              if (!batch_value.IsNull()) {
+                // A single execution for all the rows of the batch, instead of one per row.
+                if (params_prop.IsNull()) params_prop = storage::PropertyValue(empty_parameters);
+                if (!params_prop.ValueMap()
+                         .try_emplace(std::string(kBatchParameterName), storage::PropertyValue(batch_value))
+                         .second) {
+                  throw StreamsException{
+                      "Transformation '{}' in stream '{}' yielded a batch together with a parameter named '{}'.",
+                      transformation_name, stream_name, kBatchParameterName};
+                }
+                query = fmt::format("UNWIND ${} AS row {}", kBatchParameterName, query);
+              }
+              spdlog::trace("Executing query '{}' in stream '{}'", query, stream_name);
+              auto prepare_result =
+                  interpreter->Prepare(query, params_prop.IsNull() ? empty_parameters : params_prop.ValueMap(), {});
+              if (!owner->IsAuthorized(prepare_result.privileges, "", &up_to_date_policy)) {
+                throw StreamsException{
+                    "Couldn't execute query '{}' for stream '{}' because the owner is not authorized to execute the "
+                    "query!",
+                    query, stream_name};
+              }
+              interpreter->PullAll(&stream);
+            }
+
+            spdlog::trace("Commit transaction in stream '{}'", stream_name);
+            interpreter->CommitTransaction();
+            result.rows.clear();
+            break;
+          } catch (const query::TransactionSerializationException &e) {
+            interpreter->Abort();
+            if (i == total_retries) {
+              throw;
+            }
+            ++i;
+            std::this_thread::sleep_for(retry_interval);
           }
-          interpreter->PullAll(&stream);
         }
+      };
 
-        spdlog::trace("Commit transaction in stream '{}'", stream_name);
-        interpreter->CommitTransaction();
-        result.rows.clear();
-        break;
-      } catch (const query::TransactionSerializationException &e) {
-        interpreter->Abort();
-        if (i == total_retries) {
-          throw;
-        }
-        ++i;
-        std::this_thread::sleep_for(retry_interval);
-      }
-    }
+  auto transformation_name = stream_info.common_info.transformation_name;
+  auto make_stream_source = [&](auto consumer_function) {
+    return std::make_unique<SynchronizedStreamSource<TStream>>(stream_name, std::move(stream_info),
+                                                               std::move(consumer_function));
   };
+  std::unique_ptr<SynchronizedStreamSource<TStream>> stream_source;
+  if constexpr (std::same_as<TStream, KafkaStream>) {
+    if (interpreter_context->config.stream_pipelined_consumption) {
+      // The transformation of the next batch runs while the queries of this batch are executed, so each batch gets
+      // its own result. Only a single batch is executed at a time, which makes sharing the interpreter safe.
+      // NOTE: The accessor of the transformation is taken before the previous batch commits, so the transformation
+      // doesn't see the changes made by its queries.
+      stream_source = make_stream_source(integrations::kafka::PipelinedConsumerFunction{
+          [transform_batch, memory_resource,
+           execute_batch = std::make_shared<decltype(execute_batch)>(std::move(execute_batch))](
+              const std::vector<integrations::kafka::Message> &messages) mutable -> std::function<void()> {
+            auto result = std::make_shared<mgp_result>(nullptr, memory_resource);
+            transform_batch(messages, *result);
+            return [execute_batch, result] { (*execute_batch)(*result); };
+          }});
+    }
+  }
+  if (!stream_source) {
+    stream_source = make_stream_source(ConsumerFunction<typename TStream::Message>{
+        [transform_batch, execute_batch, result = mgp_result{nullptr, memory_resource}](
+            const std::vector<typename TStream::Message> &messages) mutable {
+          transform_batch(messages, result);
+          execute_batch(result);
+        }});
+  }
 
-  auto insert_result = map.try_emplace(
-      stream_name, StreamData<TStream>{std::move(stream_info.common_info.transformation_name), std::move(ownername),
-                                       std::move(rolename),
-                                       std::make_unique<SynchronizedStreamSource<TStream>>(
-                                           stream_name, std::move(stream_info), std::move(consumer_function))});
+  auto insert_result =
+      map.try_emplace(stream_name, StreamData<TStream>{std::move(transformation_name), std::move(ownername),
+                                                       std::move(rolename), std::move(stream_source)});
   MG_ASSERT(insert_result.second, "Unexpected error during storing consumer '{}'", stream_name);
   return insert_result.first;
 }
@@ -802,13 +856,16 @@ TransformationResult Streams::Check(const std::string &stream_name, TDbAccess db
           result_row.reserve(kCheckStreamResultSize);
 
           auto queries_and_parameters = std::vector<TypedValue>(result.rows.size());
-          std::transform(
-              result.rows.cbegin(), result.rows.cend(), queries_and_parameters.begin(), [&](const auto &row) {
-                auto [query, parameters] = ExtractTransformationResult(row.values, transformation_name, stream_name);
-
-                return std::map<std::string, TypedValue>{{"query", std::move(query)},
-                                                         {"parameters", std::move(parameters)}};
-              });
+          std::transform(result.rows.cbegin(), result.rows.cend(), queries_and_parameters.begin(),
+                         [&](const auto &row) {
+                           auto [query, parameters, batch] =
+                               ExtractTransformationResult(row.values, transformation_name, stream_name);
+
+                           auto query_and_parameters = std::map<std::string, TypedValue>{
+                               {"query", std::move(query)}, {"parameters", std::move(parameters)}};
+                           if (!batch.IsNull()) query_and_parameters.emplace("batch", std::move(batch));
+                           return query_and_parameters;
+                         });
           result_row.emplace_back(std::move(queries_and_parameters));
 
           auto messages_list = std::vector<TypedValue>(messages.size());
@@ -1434,9 +1434,13 @@ Transaction InMemoryStorage::CreateTransaction(
   // `timestamp`) below.
   uint64_t transaction_id = 0;
   uint64_t start_timestamp = 0;
+  uint64_t last_commit_timestamp = kTimestampInitialId;
   {
     std::lock_guard<utils::SpinLock> guard(engine_lock_);
     transaction_id = transaction_id_++;
+    // Commits are made visible while holding the engine lock as well, so the transaction sees exactly the commits up
+    // to this one.
+    last_commit_timestamp = repl_storage_state_.last_commit_timestamp_.load(std::memory_order_acquire);
     // Replica should have only read queries and the write queries
     // can come from main instance with any past timestamp.
     // To preserve snapshot isolation we set the start timestamp
@@ -1449,7 +1453,9 @@ Transaction InMemoryStorage::CreateTransaction(
       start_timestamp = timestamp_;
     }
   }
-  return {transaction_id, start_timestamp, isolation_level, storage_mode, false};
+  Transaction transaction{transaction_id, start_timestamp, isolation_level, storage_mode, false};
+  transaction.last_commit_timestamp = last_commit_timestamp;
+  return transaction;
 }
 
 void InMemoryStorage::SetStorageMode(StorageMode new_storage_mode) {
@@ -1467,6 +1473,8 @@ void InMemoryStorage::SetStorageMode(StorageMode new_storage_mode) {
     }
 
     storage_mode_ = new_storage_mode;
+    // Changes made in the analytical mode don't get commit timestamps.
+    graph_generation_.fetch_add(1, std::memory_order_acq_rel);
     FreeMemory(std::move(main_guard), false);
   }
 }
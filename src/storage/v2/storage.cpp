@@ -106,6 +106,20 @@ std::optional<uint64_t> Storage::Accessor::GetTransactionId() const {
   return {};
 }
 
+std::optional<GraphVersion> Storage::Accessor::GetGraphVersion() const {
+  // Only the transactional in-memory storage assigns commit timestamps to all of the changes, and only snapshot
+  // isolation guarantees that the transaction sees exactly the transactions committed before it started.
+  if (!is_transaction_active_ || transaction_.storage_mode != StorageMode::IN_MEMORY_TRANSACTIONAL ||
+      transaction_.isolation_level != IsolationLevel::SNAPSHOT_ISOLATION || !transaction_.deltas.empty()) {
+    return std::nullopt;
+  }
+  // The version is keyed only on commit timestamps, which may come from the clock of the main instance, and never on
+  // the start timestamp, which comes from the clock of this one. The generation doesn't change while there are active
+  // transactions.
+  const auto generation = storage_->graph_generation_.load(std::memory_order_acquire);
+  return GraphVersion{generation, transaction_.last_commit_timestamp};
+}
+
 std::vector<LabelId> Storage::Accessor::ListAllPossiblyPresentVertexLabels() const {
   std::vector<LabelId> vertex_labels;
   storage_->stored_node_labels_.for_each([&vertex_labels](const auto &label) { vertex_labels.push_back(label); });
@@ -121,6 +121,15 @@ struct CommitReplArgs {
   bool IsMain() { return is_main; }
 };
 
+// Identifies the committed state of the graph seen by a transaction. Transactions seeing equal versions see the same
+// graph, so results computed by one of them can be reused by the others.
+struct GraphVersion {
+  uint64_t generation;
+  uint64_t commit_timestamp;
+
+  friend bool operator==(const GraphVersion &, const GraphVersion &) = default;
+};
+
 class Storage {
   friend class ReplicationServer;
   friend class ReplicationStorageClient;
@@ -246,6 +255,10 @@ class Storage {
 
     std::optional<uint64_t> GetTransactionId() const;
 
+    // Returns nothing if the state of the graph seen by the transaction isn't determined by the last commit, e.g.
+    // because the transaction made changes of its own or doesn't run with snapshot isolation.
+    std::optional<GraphVersion> GetGraphVersion() const;
+
     void AdvanceCommand();
 
     const std::string &LabelToName(LabelId label) const { return storage_->LabelToName(label); }
@@ -409,6 +422,11 @@ class Storage {
   // for disk storage.
   std::atomic<uint64_t> edge_count_{0};
 
+  // Incremented whenever the graph changes without a commit timestamp being assigned to the changes, e.g. when the
+  // analytical storage mode is used or a replica recovers from a snapshot. Together with the last commit timestamp it
+  // makes up the `GraphVersion`.
+  std::atomic<uint64_t> graph_generation_{0};
+
   std::unique_ptr<NameIdMapper> name_id_mapper_;
   Config config_;
 
@@ -81,6 +81,9 @@ struct Transaction {
 
   uint64_t transaction_id{};
   uint64_t start_timestamp{};
+  // Commit timestamp of the last transaction committed before this one started, i.e. the last one it sees. Unlike
+  // `start_timestamp`, it comes from the main instance on replicas, like the timestamps of the commits themselves.
+  uint64_t last_commit_timestamp{kTimestampInitialId};
   // The `Transaction` object is stack allocated, but the `commit_timestamp`
   // must be heap allocated because `Delta`s have a pointer to it, and that
   // pointer must stay valid after the `Transaction` is moved into
@@ -12,10 +12,12 @@
 #include "utils/event_histogram.hpp"
 
 // NOLINTNEXTLINE(cppcoreguidelines-macro-usage)
-#define APPLY_FOR_HISTOGRAMS(M)                                                                    \
-  M(QueryExecutionLatency_us, Query, "Query execution latency in microseconds", 50, 90, 99)        \
-  M(SnapshotCreationLatency_us, Snapshot, "Snapshot creation latency in microseconds", 50, 90, 99) \
-  M(SnapshotRecoveryLatency_us, Snapshot, "Snapshot recovery latency in microseconds", 50, 90, 99)
+#define APPLY_FOR_HISTOGRAMS(M)                                                                           \
+  M(QueryExecutionLatency_us, Query, "Query execution latency in microseconds", 50, 90, 99)               \
+  M(SnapshotCreationLatency_us, Snapshot, "Snapshot creation latency in microseconds", 50, 90, 99)        \
+  M(SnapshotRecoveryLatency_us, Snapshot, "Snapshot recovery latency in microseconds", 50, 90, 99)        \
+  M(PythonYoungGCLatency_us, QueryModule, "Python young generation GC pause in microseconds", 50, 90, 99) \
+  M(PythonFullGCLatency_us, QueryModule, "Python full GC pause in microseconds", 50, 90, 99)
 
 namespace memgraph::metrics {
 
@@ -1,4 +1,4 @@
-// Copyright 2023 Memgraph Ltd.
+// Copyright 2024 Memgraph Ltd.
 //
 // Use of this software is governed by the Business Source License
 // included in the file licenses/BSL.txt; by using this file, you agree to be bound by the terms of the Business Source
@@ -11,8 +11,11 @@
 
 #pragma once
 
+#include <atomic>
 #include <cmath>
+#include <memory>
 #include <utility>
+#include <vector>
 
 #include "utils/logging.hpp"
 
@@ -35,6 +38,7 @@ using Measurement = std::atomic<uint64_t>;
 //   less than 100, so if measuring latency, generally do
 //   so in microseconds.
 // * ~32kb constant space, single allocation per Histogram.
+// * measuring is lock-free, so it can be done on hot paths.
 // * Histogram::Percentile() will return 0 if there were no
 //   samples measured yet.
 class Histogram {
@@ -54,7 +58,7 @@ class Histogram {
   // samples_ stores per-bucket counts for measurements
   // that have been mapped to a specific uint64_t in
   // the "compression" logic below.
-  std::vector<uint64_t> samples_ = {};
+  std::unique_ptr<Measurement[]> samples_ = std::make_unique<Measurement[]>(kSampleLimit);
 
   std::vector<uint8_t> percentiles_;
 
@@ -66,17 +70,10 @@ class Histogram {
   // have been included in this Histogram.
   Measurement sum_ = 0;
 
-  std::mutex samples_mutex_;
-
  public:
-  Histogram() {
-    samples_.resize(kSampleLimit, 0);
-    percentiles_ = {0, 25, 50, 75, 90, 100};
-  }
+  Histogram() { percentiles_ = {0, 25, 50, 75, 90, 100}; }
 
-  explicit Histogram(std::vector<uint8_t> percentiles) : percentiles_(std::move(percentiles)) {
-    samples_.resize(kSampleLimit, 0);
-  }
+  explicit Histogram(std::vector<uint8_t> percentiles) : percentiles_(std::move(percentiles)) {}
 
   uint64_t Count() const { return count_.load(std::memory_order_relaxed); }
 
@@ -93,13 +90,11 @@ class Histogram {
     MG_ASSERT(compressed < kSampleLimit, "compressing value {} to {} is invalid", value, compressed);
     auto sample_index = static_cast<uint16_t>(compressed);
 
-    count_.fetch_add(1, std::memory_order_relaxed);
+    // The sample is counted after its bucket, so `Percentile` never sees more
+    // samples than there are in the buckets.
+    samples_[sample_index].fetch_add(1, std::memory_order_relaxed);
     sum_.fetch_add(value, std::memory_order_relaxed);
-
-    {
-      std::lock_guard<std::mutex> lock(samples_mutex_);
-      samples_[sample_index]++;
-    }
+    count_.fetch_add(1, std::memory_order_release);
   }
 
   std::vector<std::pair<uint64_t, uint64_t>> YieldPercentiles() const {
@@ -117,7 +112,7 @@ class Histogram {
     MG_ASSERT(percentile <= 100.0, "percentiles must not exceed 100.0");
     MG_ASSERT(percentile >= 0.0, "percentiles must be greater than or equal to 0.0");
 
-    auto count = Count();
+    auto count = count_.load(std::memory_order_acquire);
 
     if (count == 0) {
       return 0;
@@ -129,7 +124,7 @@ class Histogram {
     auto scanned = 0.0;
 
     for (int i = 0; i < kSampleLimit; i++) {
-      const auto samples_at_index = samples_[i];
+      const auto samples_at_index = samples_[i].load(std::memory_order_relaxed);
       scanned += static_cast<double>(samples_at_index);
       if (scanned >= target) {
         // "decompression" logic
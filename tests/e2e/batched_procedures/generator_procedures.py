@@ -0,0 +1,71 @@
+# Copyright 2024 Memgraph Ltd.
+#
+# Use of this software is governed by the Business Source License
+# included in the file licenses/BSL.txt; by using this file, you agree to be bound by the terms of the Business Source
+# License, and you may not use this file except in compliance with the Business Source License.
+#
+# As of the Change Date specified in that file, in accordance with
+# the Business Source License, use of this software will be governed
+# by the Apache License, Version 2.0, included in the file
+# licenses/APL.txt.
+
+# isort: off
+import sys
+import pytest
+
+from common import execute_and_fetch_all, has_n_result_row
+from mgclient import DatabaseError
+
+
+def test_generator_nums(connection):
+    cursor = connection.cursor()
+    num_ints = 10000
+    result = execute_and_fetch_all(cursor, f"CALL generator_py.nums({num_ints}) YIELD num RETURN num")
+    assert [row[0] for row in result] == list(range(1, num_ints + 1))
+
+
+def test_generator_limit(connection):
+    cursor = connection.cursor()
+    result = execute_and_fetch_all(cursor, "CALL generator_py.nums(1000000) YIELD num RETURN num LIMIT 3")
+    assert [row[0] for row in result] == [1, 2, 3]
+
+
+def test_generator_per_input_row(connection):
+    cursor = connection.cursor()
+    result = execute_and_fetch_all(cursor, "UNWIND [1, 2, 3] AS x CALL generator_py.nums(x) YIELD num RETURN x, num")
+    assert result == [(1, 1), (2, 1), (2, 2), (3, 1), (3, 2), (3, 3)]
+
+
+def test_generator_nested_calls(connection):
+    cursor = connection.cursor()
+    result = execute_and_fetch_all(
+        cursor,
+        "CALL generator_py.nums(3) YIELD num AS outer CALL generator_py.nums(outer) YIELD num RETURN outer, num",
+    )
+    assert result == [(1, 1), (2, 1), (2, 2), (3, 1), (3, 2), (3, 3)]
+
+
+def test_generator_vertices(connection):
+    cursor = connection.cursor()
+    num_vertices = 2000
+    execute_and_fetch_all(cursor, f"UNWIND range(1, {num_vertices}) AS i CREATE (:Node {{id: i}})")
+    result = execute_and_fetch_all(
+        cursor, "CALL generator_py.vertices() YIELD vertex, is_valid RETURN vertex.id AS id, is_valid ORDER BY id"
+    )
+    assert result == [(i, True) for i in range(1, num_vertices + 1)]
+
+
+def test_generator_error(connection):
+    cursor = connection.cursor()
+    with pytest.raises(DatabaseError, match="Generator failed"):
+        execute_and_fetch_all(cursor, "CALL generator_py.fail_after(100) YIELD num RETURN num")
+
+
+def test_generator_write(connection):
+    cursor = connection.cursor()
+    execute_and_fetch_all(cursor, "CALL generator_py.create_vertices(100) YIELD vertex RETURN count(vertex)")
+    assert has_n_result_row(cursor, "MATCH (n) RETURN n", 100)
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-rA"]))
@@ -0,0 +1,79 @@
+# Copyright 2024 Memgraph Ltd.
+#
+# Use of this software is governed by the Business Source License
+# included in the file licenses/BSL.txt; by using this file, you agree to be bound by the terms of the Business Source
+# License, and you may not use this file except in compliance with the Business Source License.
+#
+# As of the Change Date specified in that file, in accordance with
+# the Business Source License, use of this software will be governed
+# by the Apache License, Version 2.0, included in the file
+# licenses/APL.txt.
+
+# isort: off
+import sys
+import pytest
+
+from common import execute_and_fetch_all
+from mgclient import DatabaseError
+
+
+def test_lazy_list_and_map(connection):
+    cursor = connection.cursor()
+    result = execute_and_fetch_all(
+        cursor,
+        "CALL lazy_args_py.summary(range(1, 1000), {b: 1, a: [2]}) YIELD size, first, last, keys "
+        "RETURN size, first, last, keys",
+    )
+    assert result == [(1000, 1, 1000, ["a", "b"])]
+
+
+def test_lazy_list_empty(connection):
+    cursor = connection.cursor()
+    result = execute_and_fetch_all(
+        cursor, "CALL lazy_args_py.summary([], {}) YIELD size, first, last, keys RETURN size, first, last, keys"
+    )
+    assert result == [(0, None, None, [])]
+
+
+def test_lazy_list_vertex_ids(connection):
+    cursor = connection.cursor()
+    execute_and_fetch_all(cursor, "UNWIND range(1, 10) AS i CREATE (:Node {i: i})-[:EDGE]->(:Node)")
+    expected = execute_and_fetch_all(cursor, "MATCH (n) RETURN collect(id(n))")[0][0]
+    result = execute_and_fetch_all(
+        cursor, "MATCH (n) WITH collect(n) AS nodes CALL lazy_args_py.vertex_ids(nodes) YIELD ids RETURN ids"
+    )
+    assert result == [(expected,)]
+
+
+def test_lazy_list_edge_ids(connection):
+    cursor = connection.cursor()
+    execute_and_fetch_all(cursor, "UNWIND range(1, 10) AS i CREATE (:Node {i: i})-[:EDGE]->(:Node)")
+    expected = execute_and_fetch_all(cursor, "MATCH ()-[e]->() RETURN collect(id(e))")[0][0]
+    result = execute_and_fetch_all(
+        cursor, "MATCH ()-[e]->() WITH collect(e) AS edges CALL lazy_args_py.edge_ids(edges) YIELD ids RETURN ids"
+    )
+    assert result == [(expected,)]
+
+
+def test_lazy_list_ids_of_wrong_type(connection):
+    cursor = connection.cursor()
+    with pytest.raises(DatabaseError, match="Expected a list of vertices"):
+        execute_and_fetch_all(cursor, "CALL lazy_args_py.vertex_ids([1, 2, 3]) YIELD ids RETURN ids")
+
+
+def test_lazy_args_write(connection):
+    cursor = connection.cursor()
+    execute_and_fetch_all(cursor, "UNWIND range(1, 3) AS i CREATE (:Node)")
+    node_ids = [node_id for (node_id,) in execute_and_fetch_all(cursor, "MATCH (n) RETURN id(n)")]
+    names = "{" + ", ".join(f"`{node_id}`: 'node{node_id}'" for node_id in node_ids) + "}"
+    result = execute_and_fetch_all(
+        cursor,
+        f"MATCH (n) WITH collect(n) AS nodes CALL lazy_args_py.set_names(nodes, {names}) YIELD count RETURN count",
+    )
+    assert result == [(3,)]
+    result = execute_and_fetch_all(cursor, "MATCH (n) RETURN id(n), n.name")
+    assert sorted(result) == sorted((node_id, f"node{node_id}") for node_id in node_ids)
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-rA"]))
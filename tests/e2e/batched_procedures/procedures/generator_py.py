@@ -0,0 +1,38 @@
+# Copyright 2024 Memgraph Ltd.
+#
+# Use of this software is governed by the Business Source License
+# included in the file licenses/BSL.txt; by using this file, you agree to be bound by the terms of the Business Source
+# License, and you may not use this file except in compliance with the Business Source License.
+#
+# As of the Change Date specified in that file, in accordance with
+# the Business Source License, use of this software will be governed
+# by the Apache License, Version 2.0, included in the file
+# licenses/APL.txt.
+
+import mgp
+
+
+@mgp.read_proc
+def nums(count: int) -> mgp.Record(num=int):
+    for i in range(1, count + 1):
+        yield mgp.Record(num=i)
+
+
+@mgp.read_proc
+def vertices(ctx: mgp.ProcCtx) -> mgp.Record(vertex=mgp.Vertex, is_valid=bool):
+    # The vertices iterator is kept alive between the batches the generator yields.
+    for vertex in ctx.graph.vertices:
+        yield mgp.Record(vertex=vertex, is_valid=ctx.is_valid())
+
+
+@mgp.read_proc
+def fail_after(count: int) -> mgp.Record(num=int):
+    for i in range(count):
+        yield mgp.Record(num=i)
+    raise RuntimeError("Generator failed")
+
+
+@mgp.write_proc
+def create_vertices(ctx: mgp.ProcCtx, count: int) -> mgp.Record(vertex=mgp.Vertex):
+    for _ in range(count):
+        yield mgp.Record(vertex=ctx.graph.create_vertex())
@@ -0,0 +1,38 @@
+# Copyright 2024 Memgraph Ltd.
+#
+# Use of this software is governed by the Business Source License
+# included in the file licenses/BSL.txt; by using this file, you agree to be bound by the terms of the Business Source
+# License, and you may not use this file except in compliance with the Business Source License.
+#
+# As of the Change Date specified in that file, in accordance with
+# the Business Source License, use of this software will be governed
+# by the Apache License, Version 2.0, included in the file
+# licenses/APL.txt.
+
+import mgp
+
+
+@mgp.read_proc(lazy_args=True)
+def summary(
+    values: mgp.List[mgp.Any], options: mgp.Map
+) -> mgp.Record(size=int, first=mgp.Nullable[mgp.Any], last=mgp.Nullable[mgp.Any], keys=list):
+    first = values[0] if values else None
+    last = values[-1] if values else None
+    return mgp.Record(size=len(values), first=first, last=last, keys=sorted(options))
+
+
+@mgp.read_proc(lazy_args=True)
+def vertex_ids(vertices: mgp.List[mgp.Vertex]) -> mgp.Record(ids=mgp.List[int]):
+    return mgp.Record(ids=list(vertices.vertex_ids()))
+
+
+@mgp.read_proc(lazy_args=True)
+def edge_ids(edges: mgp.List[mgp.Edge]) -> mgp.Record(ids=mgp.List[int]):
+    return mgp.Record(ids=list(edges.edge_ids()))
+
+
+@mgp.write_proc(lazy_args=True)
+def set_names(vertices: mgp.List[mgp.Vertex], names: mgp.Map) -> mgp.Record(count=int):
+    for vertex in vertices:
+        vertex.properties.set("name", names[str(vertex.id)])
+    return mgp.Record(count=len(vertices))
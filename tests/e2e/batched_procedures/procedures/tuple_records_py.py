@@ -0,0 +1,39 @@
+# Copyright 2024 Memgraph Ltd.
+#
+# Use of this software is governed by the Business Source License
+# included in the file licenses/BSL.txt; by using this file, you agree to be bound by the terms of the Business Source
+# License, and you may not use this file except in compliance with the Business Source License.
+#
+# As of the Change Date specified in that file, in accordance with
+# the Business Source License, use of this software will be governed
+# by the Apache License, Version 2.0, included in the file
+# licenses/APL.txt.
+
+import mgp
+
+
+@mgp.read_proc
+def squares(count: int) -> mgp.Record(num=int, square=int):
+    return [(i, i * i) for i in range(1, count + 1)]
+
+
+@mgp.read_proc
+def squares_generator(count: int) -> mgp.Record(num=int, square=int):
+    for i in range(1, count + 1):
+        yield (i, i * i)
+
+
+@mgp.read_proc
+def mixed(count: int) -> mgp.Record(num=int, square=int):
+    for i in range(1, count + 1):
+        yield (i, i * i) if i % 2 else mgp.Record(square=i * i, num=i)
+
+
+@mgp.read_proc
+def too_few_values() -> mgp.Record(num=int, square=int):
+    return [(1,)]
+
+
+@mgp.write_proc
+def create_vertices(ctx: mgp.ProcCtx, count: int) -> mgp.Record(vertex=mgp.Vertex, id=int):
+    return [(ctx.graph.create_vertex(), i) for i in range(count)]
@@ -0,0 +1,56 @@
+# Copyright 2024 Memgraph Ltd.
+#
+# Use of this software is governed by the Business Source License
+# included in the file licenses/BSL.txt; by using this file, you agree to be bound by the terms of the Business Source
+# License, and you may not use this file except in compliance with the Business Source License.
+#
+# As of the Change Date specified in that file, in accordance with
+# the Business Source License, use of this software will be governed
+# by the Apache License, Version 2.0, included in the file
+# licenses/APL.txt.
+
+# isort: off
+import sys
+import pytest
+
+from common import execute_and_fetch_all, has_n_result_row
+from mgclient import DatabaseError
+
+
+def test_tuple_records(connection):
+    cursor = connection.cursor()
+    result = execute_and_fetch_all(cursor, "CALL tuple_records_py.squares(1000) YIELD num, square RETURN num, square")
+    assert result == [(i, i * i) for i in range(1, 1001)]
+
+
+def test_tuple_records_generator(connection):
+    cursor = connection.cursor()
+    result = execute_and_fetch_all(
+        cursor, "CALL tuple_records_py.squares_generator(1000) YIELD square, num RETURN num, square"
+    )
+    assert result == [(i, i * i) for i in range(1, 1001)]
+
+
+def test_tuple_records_mixed_with_records(connection):
+    cursor = connection.cursor()
+    result = execute_and_fetch_all(cursor, "CALL tuple_records_py.mixed(4) YIELD num, square RETURN num, square")
+    assert result == [(1, 1), (2, 4), (3, 9), (4, 16)]
+
+
+def test_tuple_records_wrong_size(connection):
+    cursor = connection.cursor()
+    with pytest.raises(DatabaseError, match="one for each of the result fields"):
+        execute_and_fetch_all(cursor, "CALL tuple_records_py.too_few_values() YIELD num RETURN num")
+
+
+def test_tuple_records_write(connection):
+    cursor = connection.cursor()
+    result = execute_and_fetch_all(
+        cursor, "CALL tuple_records_py.create_vertices(10) YIELD vertex, id SET vertex.id = id RETURN count(vertex)"
+    )
+    assert result == [(10,)]
+    assert has_n_result_row(cursor, "MATCH (n) WHERE n.id IS NOT NULL RETURN n", 10)
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-rA"]))
@@ -136,13 +136,22 @@ startup_config_dict = {
         "",
         "Directory where modules with custom query procedures are stored. NOTE: Multiple comma-separated directories can be defined.",
     ),
+    "query_modules_lazy_loading": (
+        "false",
+        "false",
+        "Import Python query modules on the first call of one of their procedures, transformations or functions instead of at startup. The signatures of the modules are cached in the data directory.",
+    ),
     "replication_replica_check_frequency_sec": (
         "1",
         "1",
         "The time duration between two replica checks/pings. If < 1, replicas will NOT be checked at all. NOTE: The MAIN instance allocates a new thread for each REPLICA.",
     ),
     "storage_gc_cycle_sec": ("30", "30", "Storage garbage collector interval (in seconds)."),
-    "storage_python_gc_cycle_sec": ("180", "180", "Storage python full garbage collection interval (in seconds)."),
+    "storage_python_gc_cycle_sec": (
+        "180",
+        "180",
+        "Maximum interval between python full garbage collections (in seconds). Full collections run earlier if enough memory was allocated by Python.",
+    ),
     "storage_items_per_batch": (
         "1000000",
         "1000000",
@@ -173,6 +182,11 @@ startup_config_dict = {
         "Default storage mode Memgraph uses. Allowed values: IN_MEMORY_TRANSACTIONAL, IN_MEMORY_ANALYTICAL, ON_DISK_TRANSACTIONAL",
     ),
     "storage_wal_file_size_kib": ("20480", "20480", "Minimum file size of each WAL file."),
+    "stream_pipelined_consumption": (
+        "false",
+        "false",
+        "Set to true to transform the next batch of a Kafka stream while the queries of the current batch are executed. The offsets of the batches are still committed in order. A transformation then doesn't see the changes made by the queries of the previous batch, so enable it only for transformations which don't read the graph.",
+    ),
     "stream_transaction_conflict_retries": (
         "30",
         "30",
@@ -139,5 +139,32 @@ def test_case_sensitivity(multi_db, function_type):
         )
 
 
+@pytest.mark.parametrize("multi_db", [False, True], indirect=True)
+def test_vectorized_function(multi_db):
+    cursor = multi_db.cursor()
+    result = execute_and_fetch_all(cursor, "UNWIND range(1, 10000) AS x RETURN x, py_vectorized.scale(x) AS y;")
+    assert result == [(x, 2 * x) for x in range(1, 10001)]
+    result = execute_and_fetch_all(cursor, "UNWIND range(1, 3) AS x RETURN py_vectorized.scale(x, 0.5) AS y;")
+    assert result == [(0.5,), (1.0,), (1.5,)]
+
+
+@pytest.mark.parametrize("multi_db", [False, True], indirect=True)
+def test_vectorized_function_batches(multi_db):
+    cursor = multi_db.cursor()
+    result = execute_and_fetch_all(cursor, "UNWIND range(1, 5000) AS x RETURN py_vectorized.batch_size(x) AS size;")
+    assert len(result) == 5000
+    assert all(size > 1 for (size,) in result)
+    # Calls nested in other expressions are computed row by row.
+    result = execute_and_fetch_all(cursor, "UNWIND range(1, 3) AS x RETURN py_vectorized.batch_size(x) + 1 AS size;")
+    assert result == [(2,), (2,), (2,)]
+
+
+@pytest.mark.parametrize("multi_db", [False, True], indirect=True)
+def test_vectorized_function_wrong_result_length(multi_db):
+    cursor = multi_db.cursor()
+    with pytest.raises(mgclient.DatabaseError):
+        execute_and_fetch_all(cursor, "UNWIND range(1, 3) AS x RETURN py_vectorized.wrong_length(x) AS y;")
+
+
 if __name__ == "__main__":
     sys.exit(pytest.main([__file__, "-rA"]))
@@ -0,0 +1,27 @@
+# Copyright 2024 Memgraph Ltd.
+#
+# Use of this software is governed by the Business Source License
+# included in the file licenses/BSL.txt; by using this file, you agree to be bound by the terms of the Business Source
+# License, and you may not use this file except in compliance with the Business Source License.
+#
+# As of the Change Date specified in that file, in accordance with
+# the Business Source License, use of this software will be governed
+# by the Apache License, Version 2.0, included in the file
+# licenses/APL.txt.
+
+import mgp
+
+
+@mgp.function(vectorized=True)
+def scale(ctx: mgp.FuncCtx, values: mgp.Number, factor: mgp.Number = 2):
+    return [value * f for value, f in zip(values, factor)]
+
+
+@mgp.function(vectorized=True)
+def batch_size(values: mgp.Any):
+    return (len(values) for _ in values)
+
+
+@mgp.function(vectorized=True)
+def wrong_length(values: mgp.Any):
+    return values[1:]
@@ -0,0 +1,25 @@
+# Copyright 2024 Memgraph Ltd.
+#
+# Use of this software is governed by the Business Source License
+# included in the file licenses/BSL.txt; by using this file, you agree to be bound by the terms of the Business Source
+# License, and you may not use this file except in compliance with the Business Source License.
+#
+# As of the Change Date specified in that file, in accordance with
+# the Business Source License, use of this software will be governed
+# by the Apache License, Version 2.0, included in the file
+# licenses/APL.txt.
+
+import mgp
+
+
+@mgp.read_proc
+def error(ctx: mgp.ProcCtx) -> mgp.Record(allocated=int):
+    # Small objects are served from pymalloc arenas, which count against the global memory limit.
+    objects = [object() for _ in range(50_000_000)]
+    return mgp.Record(allocated=len(objects))
+
+
+@mgp.read_proc
+def success(ctx: mgp.ProcCtx) -> mgp.Record(allocated=int):
+    objects = [object() for _ in range(100_000)]
+    return mgp.Record(allocated=len(objects))
@@ -28,6 +28,52 @@ def compare_apis(ctx: mgp.ProcCtx) -> mgp.Record(results_dict=mgp.Map):
         27,
     )
 
+    adjacency = ctx.graph.adjacency()
+    mock_adjacency = mock_ctx.graph.adjacency()
+    results["adjacency"] = test_utils.all_equal(
+        (len(adjacency), adjacency.num_edges, sorted(test_utils.get_degrees(adjacency))),
+        (len(mock_adjacency), mock_adjacency.num_edges, sorted(test_utils.get_degrees(mock_adjacency))),
+    )
+
+    adjacency = ctx.graph.adjacency(direction="in")
+    mock_adjacency = mock_ctx.graph.adjacency(direction="in")
+    results["adjacency[in]"] = test_utils.all_equal(
+        sorted(test_utils.get_degrees(adjacency)),
+        sorted(test_utils.get_degrees(mock_adjacency)),
+    )
+
+    chunks = [ctx.graph.adjacency(start=start, stop=start + 10) for start in range(0, 27, 10)]
+    mock_chunks = [mock_ctx.graph.adjacency(start=start, stop=start + 10) for start in range(0, 27, 10)]
+    results["adjacency[chunks]"] = test_utils.all_equal(
+        ([len(chunk) for chunk in chunks], sorted(sum((test_utils.get_degrees(chunk) for chunk in chunks), []))),
+        (
+            [len(chunk) for chunk in mock_chunks],
+            sorted(sum((test_utils.get_degrees(chunk) for chunk in mock_chunks), [])),
+        ),
+        ([10, 10, 7], sorted(test_utils.get_degrees(ctx.graph.adjacency()))),
+    )
+
+    column = ctx.graph.property_column("Person", "permanent_id", "int64")
+    mock_column = mock_ctx.graph.property_column("Person", "permanent_id", "int64")
+    results["property_column"] = test_utils.all_equal(
+        (len(ctx.graph.vertex_ids("Person")), sorted(column.values), any(column.null_mask)),
+        (len(mock_ctx.graph.vertex_ids("Person")), sorted(mock_column.values), any(mock_column.null_mask)),
+        (4, [0, 10, 12, 22], False),
+    )
+
+    for graph in (ctx.graph, mock_ctx.graph):
+        graph.set_property_column(graph.vertex_ids("Person"), "rank", [0.5, 1, 2.5, True])
+    column = ctx.graph.property_column("Person", "rank", "float64")
+    mock_column = mock_ctx.graph.property_column("Person", "rank", "float64")
+    results["set_property_column"] = test_utils.all_equal(
+        sorted(column.values),
+        sorted(mock_column.values),
+        [0.5, 1.0, 1.0, 2.5],
+    )
+    for graph in (ctx.graph, mock_ctx.graph):
+        person_ids = graph.vertex_ids("Person")
+        graph.set_property_column(person_ids, "rank", [0] * len(person_ids), null_mask=[True] * len(person_ids))
+
     results["is_mutable"] = test_utils.all_equal(
         ctx.graph.is_mutable(),
         mock_ctx.graph.is_mutable(),
@@ -85,6 +131,21 @@ def compare_apis(ctx: mgp.ProcCtx) -> mgp.Record(results_dict=mgp.Map):
         MAX_EDGE_ID + 2,
     )
 
+    new_mock_vertex_ids = mock_ctx.graph.create_vertices(2, ["Bulk"], {"n": [1, 2]})
+    results["create_vertices"] = test_utils.all_equal(
+        (len(new_mock_vertex_ids), list(mock_ctx.graph.property_column("Bulk", "n", "int64").values)),
+        (2, [1, 2]),
+    )
+
+    new_mock_edge_ids = mock_ctx.graph.create_edges(
+        new_mock_vertex_ids[:1], new_mock_vertex_ids[1:], mock_edge_type, {"weight": [0.5]}
+    )
+    new_mock_edges = list(mock_ctx.graph.get_vertex_by_id(new_mock_vertex_ids[0]).out_edges)
+    results["create_edges"] = test_utils.all_equal(
+        (list(new_mock_edge_ids), [edge.properties["weight"] for edge in new_mock_edges]),
+        ([MAX_EDGE_ID + 3], [0.5]),
+    )
+
     return mgp.Record(results_dict=results)
 
 
@@ -13,6 +13,10 @@ def all_equal(*args):
     return next(g, True) and not next(g, False)
 
 
+def get_degrees(adjacency) -> list:
+    return [end - start for start, end in zip(adjacency.indptr[:-1], adjacency.indptr[1:])]
+
+
 def get_mock_proc_ctx(is_write: bool) -> mgp_mock.ProcCtx:
     GRAPH_DATA = [
         (0, 1, 0),
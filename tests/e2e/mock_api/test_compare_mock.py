@@ -166,12 +166,19 @@ def test_vertices():
 
 def test_graph():
     expected_results = {
+        "adjacency": True,
+        "adjacency[in]": True,
+        "adjacency[chunks]": True,
+        "property_column": True,
+        "set_property_column": True,
         "create_edge": True,
         "create_vertex": True,
         "delete_edge": True,
         "delete_vertex": True,
         "detach_delete_vertex": True,
         "edge_id_assignment": True,
+        "create_vertices": True,
+        "create_edges": True,
         "get_vertex_by_id": True,
         "is_mutable": True,
         "is_not_mutable": True,
@@ -0,0 +1,66 @@
+# Copyright 2024 Memgraph Ltd.
+#
+# Use of this software is governed by the Business Source License
+# included in the file licenses/BSL.txt; by using this file, you agree to be bound by the terms of the Business Source
+# License, and you may not use this file except in compliance with the Business Source License.
+#
+# As of the Change Date specified in that file, in accordance with
+# the Business Source License, use of this software will be governed
+# by the Apache License, Version 2.0, included in the file
+# licenses/APL.txt.
+
+import sys
+import threading
+import time
+
+import pytest
+from common import connect, execute_and_fetch_all
+
+
+def test_isolated_procedure_runs_in_worker(connection):
+    cursor = connection.cursor()
+    memgraph_pid = execute_and_fetch_all(cursor, "CALL isolation_py.pid() YIELD pid RETURN pid")[0][0]
+    worker_pid = execute_and_fetch_all(cursor, "CALL isolation_py.isolated_pid() YIELD pid RETURN pid")[0][0]
+    assert worker_pid != memgraph_pid
+
+
+def test_isolated_generator(connection):
+    cursor = connection.cursor()
+    result = execute_and_fetch_all(cursor, "CALL isolation_py.isolated_range(5) YIELD value RETURN value")
+    assert result == [(value,) for value in range(5)]
+
+
+def test_isolated_procedure_doesnt_block_others(connection):
+    def call():
+        cursor = connect().cursor()
+        execute_and_fetch_all(cursor, "CALL isolation_py.isolated_sleep(5) YIELD slept RETURN slept")
+
+    thread = threading.Thread(target=call)
+    thread.start()
+    time.sleep(1)
+    cursor = connection.cursor()
+    start = time.monotonic()
+    execute_and_fetch_all(cursor, "CALL isolation_py.pid() YIELD pid RETURN pid")
+    assert time.monotonic() - start < 3
+    thread.join()
+
+
+def test_concurrent_passes_over_graph(connection):
+    cursor = connection.cursor()
+    execute_and_fetch_all(cursor, "UNWIND range(1, 1000) AS i CREATE (:Node {i: i})")
+    result = execute_and_fetch_all(cursor, "CALL isolation_py.concurrent_passes(4) YIELD consistent RETURN consistent")
+    assert result == [(True,)]
+
+
+def test_passes_outliving_procedure(connection):
+    cursor = connection.cursor()
+    execute_and_fetch_all(cursor, "UNWIND range(1, 1000) AS i CREATE (:Node {i: i})")
+    for _ in range(10):
+        result = execute_and_fetch_all(cursor, "CALL isolation_py.outlived_passes() YIELD started RETURN started")
+        assert result == [(True,)]
+        execute_and_fetch_all(cursor, "MATCH (n) SET n.i = n.i + 1")
+    assert execute_and_fetch_all(cursor, "MATCH (n) RETURN count(n)") == [(1000,)]
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-rA"]))
@@ -0,0 +1,117 @@
+# Copyright 2024 Memgraph Ltd.
+#
+# Use of this software is governed by the Business Source License
+# included in the file licenses/BSL.txt; by using this file, you agree to be bound by the terms of the Business Source
+# License, and you may not use this file except in compliance with the Business Source License.
+#
+# As of the Change Date specified in that file, in accordance with
+# the Business Source License, use of this software will be governed
+# by the Apache License, Version 2.0, included in the file
+# licenses/APL.txt.
+
+import os
+import sys
+import threading
+import time
+
+import mgclient
+import pytest
+from common import connect, execute_and_fetch_all
+
+
+def test_offload(connection):
+    cursor = connection.cursor()
+    execute_and_fetch_all(cursor, "UNWIND range(1, 10) AS i CREATE (:Node {i: i})")
+    expected = execute_and_fetch_all(cursor, "MATCH (n) RETURN sum(id(n))")[0][0]
+    result = execute_and_fetch_all(cursor, "CALL offload_py.vertex_id_sum() YIELD total RETURN total")
+    assert result == [(expected,)]
+
+
+def test_offload_timeout(connection):
+    cursor = connection.cursor()
+    start = time.monotonic()
+    result = execute_and_fetch_all(cursor, "CALL offload_py.sleep(600, 1) YIELD timed_out RETURN timed_out")
+    assert result == [(True,)]
+    assert time.monotonic() - start < 60
+
+
+def test_offload_after_timeout(connection):
+    cursor = connection.cursor()
+    # There is a call which runs out of time for every worker, so the pool is
+    # only usable afterwards if those calls were stopped.
+    for _ in range(os.cpu_count() or 1):
+        result = execute_and_fetch_all(cursor, "CALL offload_py.sleep(600, 1) YIELD timed_out RETURN timed_out")
+        assert result == [(True,)]
+    execute_and_fetch_all(cursor, "UNWIND range(1, 10) AS i CREATE (:Node {i: i})")
+    expected = execute_and_fetch_all(cursor, "MATCH (n) RETURN sum(id(n))")[0][0]
+    result = execute_and_fetch_all(cursor, "CALL offload_py.vertex_id_sum() YIELD total RETURN total")
+    assert result == [(expected,)]
+    result = execute_and_fetch_all(cursor, "CALL offload_py.sleep(0, 60) YIELD timed_out RETURN timed_out")
+    assert result == [(False,)]
+
+
+def test_offload_all_timeout(connection):
+    cursor = connection.cursor()
+    workers = os.cpu_count() or 1
+    seconds = [600] * workers + [0] * workers
+    result = execute_and_fetch_all(cursor, f"CALL offload_py.sleep_all({seconds}, 5) YIELD timed_out RETURN timed_out")
+    assert result == [([True] * workers + [False] * workers,)]
+    result = execute_and_fetch_all(cursor, "CALL offload_py.sleep(0, 60) YIELD timed_out RETURN timed_out")
+    assert result == [(False,)]
+
+
+def test_offload_timeout_doesnt_restart_other_calls(connection, tmp_path):
+    log_path = tmp_path / "calls.log"
+    results = []
+
+    def call():
+        cursor = connect().cursor()
+        results.extend(
+            execute_and_fetch_all(
+                cursor, f"CALL offload_py.logged_sleep('{log_path}', 5) YIELD timed_out RETURN timed_out"
+            )
+        )
+
+    thread = threading.Thread(target=call)
+    thread.start()
+    time.sleep(1)
+    cursor = connection.cursor()
+    result = execute_and_fetch_all(cursor, "CALL offload_py.sleep(600, 1) YIELD timed_out RETURN timed_out")
+    assert result == [(True,)]
+    thread.join()
+    assert results == [(False,)]
+    # The call of the other session wasn't started again when the call which
+    # ran out of time was stopped.
+    assert log_path.read_text().count("started") == 1
+
+
+def test_offload_abort(connection):
+    query = "CALL offload_py.sleep_until_aborted(600) YIELD slept RETURN slept"
+    errors = []
+
+    def call():
+        cursor = connect().cursor()
+        try:
+            execute_and_fetch_all(cursor, query)
+        except mgclient.DatabaseError as error:
+            errors.append(error)
+
+    start = time.monotonic()
+    thread = threading.Thread(target=call)
+    thread.start()
+    cursor = connection.cursor()
+    transaction_ids = []
+    while not transaction_ids:
+        time.sleep(0.5)
+        transactions = execute_and_fetch_all(cursor, "SHOW TRANSACTIONS")
+        transaction_ids = [transaction[1] for transaction in transactions if transaction[2] == [query]]
+    execute_and_fetch_all(cursor, f"TERMINATE TRANSACTIONS '{transaction_ids[0]}'")
+    thread.join()
+    assert len(errors) == 1
+    assert time.monotonic() - start < 60
+    result = execute_and_fetch_all(cursor, "CALL offload_py.sleep(0, 60) YIELD timed_out RETURN timed_out")
+    assert result == [(False,)]
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-rA"]))
@@ -0,0 +1,78 @@
+# Copyright 2024 Memgraph Ltd.
+#
+# Use of this software is governed by the Business Source License
+# included in the file licenses/BSL.txt; by using this file, you agree to be bound by the terms of the Business Source
+# License, and you may not use this file except in compliance with the Business Source License.
+#
+# As of the Change Date specified in that file, in accordance with
+# the Business Source License, use of this software will be governed
+# by the Apache License, Version 2.0, included in the file
+# licenses/APL.txt.
+
+import os
+import threading
+import time
+
+import mgp
+
+
+@mgp.read_proc
+def pid() -> mgp.Record(pid=int):
+    return mgp.Record(pid=os.getpid())
+
+
+@mgp.read_proc(isolated=True)
+def isolated_pid() -> mgp.Record(pid=int):
+    return mgp.Record(pid=os.getpid())
+
+
+@mgp.read_proc(isolated=True)
+def isolated_range(count: int) -> mgp.Record(value=int):
+    for value in range(count):
+        yield mgp.Record(value=value)
+
+
+@mgp.read_proc(isolated=True)
+def isolated_sleep(seconds: mgp.Number) -> mgp.Record(slept=bool):
+    time.sleep(seconds)
+    return mgp.Record(slept=True)
+
+
+@mgp.read_proc
+def concurrent_passes(context: mgp.ProcCtx, threads: int) -> mgp.Record(consistent=bool):
+    expected = sorted(vertex.id for vertex in context.graph.vertices)
+    results = []
+
+    def pass_over_graph():
+        for _ in range(10):
+            results.append(sorted(context.graph.vertex_ids()))
+            results.append(sorted(context.graph.adjacency().vertex_ids))
+
+    workers = [threading.Thread(target=pass_over_graph) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    # The vertices are read while the other threads pass over the graph.
+    while any(worker.is_alive() for worker in workers):
+        results.append(sorted(vertex.id for vertex in context.graph.vertices))
+    for worker in workers:
+        worker.join()
+    return mgp.Record(consistent=all(result == expected for result in results))
+
+
+@mgp.read_proc
+def outlived_passes(context: mgp.ProcCtx) -> mgp.Record(started=bool):
+    graph = context.graph
+
+    def pass_over_graph():
+        # The graph is invalidated while a pass may still be running, after
+        # which the next one fails, either in `mgp` or, if the graph was
+        # invalidated after `mgp` checked it, in `_mgp`.
+        try:
+            while True:
+                graph.adjacency()
+        except (mgp.InvalidContextError, RuntimeError):
+            pass
+
+    threading.Thread(target=pass_over_graph).start()
+    time.sleep(0.1)
+    return mgp.Record(started=True)
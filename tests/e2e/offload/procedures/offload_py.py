@@ -0,0 +1,65 @@
+# Copyright 2024 Memgraph Ltd.
+#
+# Use of this software is governed by the Business Source License
+# included in the file licenses/BSL.txt; by using this file, you agree to be bound by the terms of the Business Source
+# License, and you may not use this file except in compliance with the Business Source License.
+#
+# As of the Change Date specified in that file, in accordance with
+# the Business Source License, use of this software will be governed
+# by the Apache License, Version 2.0, included in the file
+# licenses/APL.txt.
+
+import os
+import time
+
+import mgp
+
+
+def _sleep(snapshot, seconds):
+    time.sleep(seconds)
+    return os.getpid()
+
+
+def _sum(snapshot):
+    return sum(snapshot)
+
+
+def _log_and_sleep(snapshot, path, seconds):
+    with open(path, "a") as log:
+        log.write("started\n")
+    time.sleep(seconds)
+
+
+@mgp.read_proc
+def sleep(seconds: mgp.Number, timeout: mgp.Number) -> mgp.Record(timed_out=bool):
+    try:
+        mgp.offload(_sleep, None, seconds, timeout=timeout)
+    except TimeoutError:
+        return mgp.Record(timed_out=True)
+    return mgp.Record(timed_out=False)
+
+
+@mgp.read_proc
+def vertex_id_sum(context: mgp.ProcCtx) -> mgp.Record(total=int):
+    return mgp.Record(total=mgp.offload(_sum, context.graph.vertex_ids(), timeout=60))
+
+
+@mgp.read_proc
+def sleep_all(seconds: mgp.List[mgp.Number], timeout: mgp.Number) -> mgp.Record(timed_out=mgp.List[bool]):
+    results = mgp.offload_all([(_sleep, s) for s in seconds], timeout=timeout)
+    return mgp.Record(timed_out=[isinstance(result, TimeoutError) for result in results])
+
+
+@mgp.read_proc
+def logged_sleep(path: str, seconds: mgp.Number) -> mgp.Record(timed_out=bool):
+    try:
+        mgp.offload(_log_and_sleep, None, path, seconds, timeout=60)
+    except TimeoutError:
+        return mgp.Record(timed_out=True)
+    return mgp.Record(timed_out=False)
+
+
+@mgp.read_proc
+def sleep_until_aborted(context: mgp.ProcCtx, seconds: mgp.Number) -> mgp.Record(slept=bool):
+    mgp.offload(_sleep, None, seconds, context=context)
+    return mgp.Record(slept=True)
@@ -0,0 +1,21 @@
+# Copyright 2024 Memgraph Ltd.
+#
+# Use of this software is governed by the Business Source License
+# included in the file licenses/BSL.txt; by using this file, you agree to be bound by the terms of the Business Source
+# License, and you may not use this file except in compliance with the Business Source License.
+#
+# As of the Change Date specified in that file, in accordance with
+# the Business Source License, use of this software will be governed
+# by the Apache License, Version 2.0, included in the file
+# licenses/APL.txt.
+
+import gc
+
+import mgp
+
+FROZEN_AT_IMPORT = gc.get_freeze_count()
+
+
+@mgp.read_proc
+def freeze_count(ctx: mgp.ProcCtx) -> mgp.Record(at_import=int, current=int):
+    return mgp.Record(at_import=FROZEN_AT_IMPORT, current=gc.get_freeze_count())
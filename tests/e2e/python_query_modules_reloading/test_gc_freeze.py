@@ -0,0 +1,50 @@
+# Copyright 2024 Memgraph Ltd.
+#
+# Use of this software is governed by the Business Source License
+# included in the file licenses/BSL.txt; by using this file, you agree to be bound by the terms of the Business Source
+# License, and you may not use this file except in compliance with the Business Source License.
+#
+# As of the Change Date specified in that file, in accordance with
+# the Business Source License, use of this software will be governed
+# by the Apache License, Version 2.0, included in the file
+# licenses/APL.txt.
+
+import sys
+
+import pytest
+from common import connect, execute_and_fetch_all
+
+
+def freeze_count(cursor):
+    return execute_and_fetch_all(cursor, "CALL gc_freeze.freeze_count() YIELD at_import, current RETURN *;")[0]
+
+
+def is_lazy_loading(cursor):
+    config = dict((flag[0], flag[2]) for flag in execute_and_fetch_all(cursor, "SHOW CONFIG;"))
+    return config["query_modules_lazy_loading"] == "true"
+
+
+@pytest.mark.parametrize("load_query", ["CALL mg.load('gc_freeze');", "CALL mg.load_all();"])
+def test_modules_are_frozen_only_when_loaded(load_query):
+    cursor = connect().cursor()
+    execute_and_fetch_all(cursor, load_query)
+    at_import, current = freeze_count(cursor)
+    if is_lazy_loading(cursor):
+        # The module is imported by the call, and its objects aren't frozen
+        # until the modules are loaded again.
+        assert current == at_import
+    else:
+        assert current > at_import
+
+
+def test_calls_dont_freeze():
+    cursor = connect().cursor()
+    execute_and_fetch_all(cursor, "CALL mg.load('gc_freeze');")
+    _, first = freeze_count(cursor)
+    execute_and_fetch_all(cursor, "UNWIND range(1, 100) AS i CALL gc_freeze.freeze_count() YIELD current RETURN *;")
+    _, second = freeze_count(cursor)
+    assert second == first
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-rA"]))
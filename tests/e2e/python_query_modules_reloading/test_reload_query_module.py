@@ -192,5 +192,57 @@ def test_mg_load_all_reload_submodule(switch):
     execute_and_fetch_all(cursor, "CALL mg.load_all();")
 
 
+@pytest.mark.parametrize("switch", [False, True])
+def test_mg_load_changed_reload_submodule(switch):
+    """Tests whether mg.load_changed reloads only the modules whose code changed"""
+    cursor = connect().cursor()
+    if switch:
+        create_multi_db(cursor)
+        switch_db(cursor)
+    assert execute_and_fetch_all(cursor, "CALL mg.load_changed();") == []
+    test_module_res = execute_and_fetch_all(cursor, "CALL test_module.test(10, 2) YIELD * RETURN *;")
+    try:
+        assert test_module_res[0][0] == 12  # + operator
+        assert test_module_res[0][1] == 20  # * operator
+        # Now modify content of test function
+        preprocess_functions(FUNC1_PATH, FUNC2_PATH)
+        # Reload the changed modules
+        assert execute_and_fetch_all(cursor, "CALL mg.load_changed();") == [("test_module",)]
+        test_module_res = execute_and_fetch_all(cursor, "CALL test_module.test(10, 2) YIELD * RETURN *;")
+        assert test_module_res[0][0] == 8  # - operator
+        assert test_module_res[0][1] == 5  # / operator
+        new_test_module_res = execute_and_fetch_all(cursor, "CALL new_test_module.test(10, 2) YIELD * RETURN *;")
+        assert new_test_module_res[0][0] == 12  # + operator
+        assert new_test_module_res[0][1] == 20  # * operator
+    finally:
+        # Revert to the original state for the consistency
+        postprocess_functions(FUNC1_PATH, FUNC2_PATH)
+    assert execute_and_fetch_all(cursor, "CALL mg.load_changed();") == [("test_module",)]
+
+
+def test_mg_load_changed_skips_rejected_files():
+    """Tests whether mg.load_changed only tries to load a failing module again once its file changes"""
+    cursor = connect().cursor()
+    assert execute_and_fetch_all(cursor, "CALL mg.load_changed();") == []
+    module_path = os.path.join(os.path.dirname(__file__), "procedures", "rejected_module.py")
+    try:
+        with open(module_path, "w") as module_file:
+            module_file.write("import mgp\n\nraise RuntimeError('Failed to import')\n")
+        assert execute_and_fetch_all(cursor, "CALL mg.load_changed();") == [("rejected_module",)]
+        assert execute_and_fetch_all(cursor, "CALL mg.load_changed();") == []
+
+        with open(module_path, "w") as module_file:
+            module_file.write(
+                "import mgp\n\n\n@mgp.read_proc\ndef test(ctx: mgp.ProcCtx) -> mgp.Record(result=int):\n"
+                "    return mgp.Record(result=42)\n"
+            )
+        assert execute_and_fetch_all(cursor, "CALL mg.load_changed();") == [("rejected_module",)]
+        assert execute_and_fetch_all(cursor, "CALL rejected_module.test() YIELD result RETURN result;") == [(42,)]
+    finally:
+        os.remove(module_path)
+    assert execute_and_fetch_all(cursor, "CALL mg.load_changed();") == [("rejected_module",)]
+    assert execute_and_fetch_all(cursor, "CALL mg.load_changed();") == []
+
+
 if __name__ == "__main__":
     sys.exit(pytest.main([__file__, "-rA"]))
@@ -0,0 +1,52 @@
+# Copyright 2024 Memgraph Ltd.
+#
+# Use of this software is governed by the Business Source License
+# included in the file licenses/BSL.txt; by using this file, you agree to be bound by the terms of the Business Source
+# License, and you may not use this file except in compliance with the Business Source License.
+#
+# As of the Change Date specified in that file, in accordance with
+# the Business Source License, use of this software will be governed
+# by the Apache License, Version 2.0, included in the file
+# licenses/APL.txt.
+
+import sys
+
+import pytest
+from common import connect, execute_and_fetch_all
+
+
+def create_graph(cursor):
+    execute_and_fetch_all(cursor, "UNWIND range(0, 9) AS i CREATE (:Node {id: i});")
+    execute_and_fetch_all(
+        cursor,
+        "MATCH (a:Node), (b:Node) WHERE b.id = (a.id + 1) % 10 OR b.id = (a.id * 3) % 10 AND a.id <> b.id "
+        "CREATE (a)-[:EDGE {weight: a.id + 1}]->(b);",
+    )
+
+
+def test_pagerank_materialized():
+    cursor = connect().cursor()
+    create_graph(cursor)
+    expected = dict(execute_and_fetch_all(cursor, "CALL nxalg.pagerank() YIELD node, rank RETURN node.id, rank;"))
+    result = dict(
+        execute_and_fetch_all(
+            cursor,
+            "CALL nxalg.pagerank(0.85, NULL, 100, 1e-06, NULL, 'weight', NULL, true) YIELD node, rank "
+            "RETURN node.id, rank;",
+        )
+    )
+    assert result.keys() == expected.keys()
+    for node_id, rank in expected.items():
+        assert result[node_id] == pytest.approx(rank, abs=1e-6)
+
+
+def test_core_number_materialized():
+    cursor = connect().cursor()
+    create_graph(cursor)
+    expected = dict(execute_and_fetch_all(cursor, "CALL nxalg.core_number() YIELD node, core RETURN node.id, core;"))
+    result = dict(execute_and_fetch_all(cursor, "CALL nxalg.core_number(true) YIELD node, core RETURN node.id, core;"))
+    assert result == expected
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-rA"]))
@@ -41,6 +41,24 @@ def test_simple(kafka_producer, kafka_topics, connection, transformation):
         common.kafka_check_vertex_exists_with_topic_and_payload(cursor, topic, common.SIMPLE_MSG)
 
 
+def test_batch(kafka_producer, kafka_topics, connection):
+    assert len(kafka_topics) > 0
+    stream_name = "test_batch"
+
+    cursor = connection.cursor()
+    common.create_stream(cursor, stream_name, ",".join(kafka_topics), "kafka_transform.with_batch", batch_size=10)
+    common.start_stream(cursor, stream_name)
+
+    messages = [f"{i} message".encode() for i in range(10)]
+    for topic in kafka_topics:
+        for message in messages:
+            kafka_producer.send(topic, message).get(timeout=KAFKA_PRODUCER_SENDING_MSG_DEFAULT_TIMEOUT)
+
+    for topic in kafka_topics:
+        for message in messages:
+            common.kafka_check_vertex_exists_with_topic_and_payload(cursor, topic, message)
+
+
 @pytest.mark.parametrize("transformation", TRANSFORMATIONS_TO_CHECK_PY)
 def test_separate_consumers(kafka_producer, kafka_topics, connection, transformation):
     assert len(kafka_topics) > 0
@@ -251,6 +269,28 @@ def test_restart_after_error(kafka_producer, kafka_topics, connection):
     assert common.check_one_result_row(cursor, "MATCH (n:VERTEX { id : 42 }) RETURN n")
 
 
+def test_payload_views(kafka_producer, kafka_topics, connection):
+    cursor = connection.cursor()
+    stream_name = "test_payload_views"
+    common.create_stream(cursor, stream_name, kafka_topics[0], "kafka_transform.payload_views")
+    common.start_stream(cursor, stream_name)
+
+    kafka_producer.send(kafka_topics[0], common.SIMPLE_MSG).get(timeout=KAFKA_PRODUCER_SENDING_MSG_DEFAULT_TIMEOUT)
+    assert common.check_one_result_row(
+        cursor, f"MATCH (n:MESSAGE {{payload: '{common.SIMPLE_MSG.decode('utf-8')}', key: ''}}) RETURN n"
+    )
+
+
+def test_payload_view_kept_after_transformation(kafka_producer, kafka_topics, connection):
+    cursor = connection.cursor()
+    stream_name = "test_payload_view_kept_after_transformation"
+    common.create_stream(cursor, stream_name, kafka_topics[0], "kafka_transform.keep_payload_view")
+    common.start_stream(cursor, stream_name)
+
+    kafka_producer.send(kafka_topics[0], common.SIMPLE_MSG).get(timeout=KAFKA_PRODUCER_SENDING_MSG_DEFAULT_TIMEOUT)
+    assert common.timed_wait(lambda: not common.get_is_running(cursor, stream_name))
+
+
 @pytest.mark.parametrize("transformation", TRANSFORMATIONS_TO_CHECK_PY)
 def test_bootstrap_server(kafka_producer, kafka_topics, connection, transformation):
     assert len(kafka_topics) > 0
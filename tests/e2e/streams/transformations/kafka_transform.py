@@ -67,6 +67,37 @@ def with_parameters(context: mgp.TransCtx, messages: mgp.Messages) -> mgp.Record
     return result_queries
 
 
+@mgp.transformation
+def with_batch(context: mgp.TransCtx, messages: mgp.Messages) -> mgp.Record(query=str, parameters=mgp.Map):
+    batch = []
+
+    for i in range(0, messages.total_messages()):
+        message = messages.message_at(i)
+        assert message.source_type() == mgp.SOURCE_TYPE_KAFKA
+        batch.append(
+            {
+                "timestamp": message.timestamp(),
+                "payload": message.payload().decode("utf-8"),
+                "offset": message.offset(),
+                "topic": message.topic_name(),
+            }
+        )
+
+    return [
+        mgp.Record(
+            query="""
+            CREATE (n:MESSAGE {
+                timestamp: row.timestamp,
+                payload: row.payload,
+                offset: row.offset,
+                topic: row.topic
+            })""",
+            parameters=None,
+            batch=batch,
+        )
+    ]
+
+
 @mgp.transformation
 def query(
     messages: mgp.Messages,
@@ -80,3 +111,33 @@ def query(
         result_queries.append(mgp.Record(query=payload_as_str, parameters=None))
 
     return result_queries
+
+
+@mgp.transformation
+def payload_views(messages: mgp.Messages) -> mgp.Record(query=str, parameters=mgp.Map):
+    result_queries = []
+
+    for i, payload in enumerate(messages.payload_views()):
+        message = messages.message_at(i)
+        assert message.source_type() == mgp.SOURCE_TYPE_KAFKA
+        result_queries.append(
+            mgp.Record(
+                query="CREATE (n:MESSAGE {payload: $payload, key: $key})",
+                parameters={"payload": str(payload, "utf-8"), "key": str(message.key_view(), "utf-8")},
+            )
+        )
+
+    return result_queries
+
+
+kept_payload_views = []
+
+
+@mgp.transformation
+def keep_payload_view(messages: mgp.Messages) -> mgp.Record(query=str, parameters=mgp.Nullable[mgp.Map]):
+    for i in range(0, messages.total_messages()):
+        # A slice shares the buffer of the view, so it would read the payload
+        # after the transformation returns.
+        kept_payload_views.append(messages.message_at(i).payload_view()[1:])
+
+    return []
@@ -800,3 +800,32 @@ TYPED_TEST(CppApiTestFixture, TestMapKeyExist) {
   map.Insert("null_key", mgp::Value());
   ASSERT_EQ(true, map.KeyExists("null_key"));
 }
+
+TYPED_TEST(CppApiTestFixture, TestNodesByLabelAndProperty) {
+  mgp_graph raw_graph = this->CreateGraph();
+  auto graph = mgp::Graph(&raw_graph);
+
+  for (int64_t i = 0; i < 5; ++i) {
+    auto node = graph.CreateNode();
+    node.AddLabel(i % 2 == 0 ? "Even" : "Odd");
+    node.SetProperty("i", mgp::Value(i));
+  }
+
+  auto collect = [](const mgp::GraphNodes &nodes) {
+    std::vector<int64_t> values;
+    for (const auto &node : nodes) {
+      values.push_back(node.GetProperty("i").ValueInt());
+    }
+    std::sort(values.begin(), values.end());
+    return values;
+  };
+
+  ASSERT_EQ(collect(graph.NodesByLabel("Even")), (std::vector<int64_t>{0, 2, 4}));
+  ASSERT_EQ(collect(graph.NodesByLabel("None")), std::vector<int64_t>{});
+  ASSERT_EQ(collect(graph.NodesByProperty("Odd", "i", mgp::Value(int64_t{3}))), std::vector<int64_t>{3});
+  ASSERT_EQ(collect(graph.NodesByProperty("Even", "i", mgp::Value(int64_t{3}))), std::vector<int64_t>{});
+  ASSERT_EQ(collect(graph.NodesByPropertyRange("Even", "i", mgp::Value(int64_t{0}), false, mgp::Value(4.0), true)),
+            (std::vector<int64_t>{2, 4}));
+  ASSERT_EQ(collect(graph.NodesByPropertyRange("Even", "i", mgp::Value(), false, mgp::Value(int64_t{2}), false)),
+            std::vector<int64_t>{0});
+}
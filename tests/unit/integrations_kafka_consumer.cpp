@@ -275,6 +275,58 @@ TEST_F(ConsumerTest, BatchSize) {
   check_received_timestamp(received_timestamps.size() - 1, kLastBatchMessageCount);
 }
 
+TEST_F(ConsumerTest, PipelinedConsumption) {
+  static constexpr auto kMessageCount = 20;
+  auto info = CreateDefaultConsumerInfo();
+  info.batch_size = 2;
+  std::vector<int> executed_messages;
+  std::atomic<int> last_executed_message{0};
+  std::atomic<int> running_second_stages{0};
+  std::atomic<bool> second_stages_overlapped{false};
+  PipelinedConsumerFunction consumer_function = [&](const std::vector<Message> &messages) -> std::function<void()> {
+    std::vector<int> values;
+    for (const auto &message : messages) {
+      values.push_back(SpanToInt(message.Payload()));
+    }
+    return [&, values = std::move(values)] {
+      if (running_second_stages.fetch_add(1) != 0) {
+        second_stages_overlapped = true;
+      }
+      std::this_thread::sleep_for(std::chrono::milliseconds(50));
+      executed_messages.insert(executed_messages.end(), values.begin(), values.end());
+      last_executed_message = values.back();
+      running_second_stages.fetch_sub(1);
+    };
+  };
+
+  Consumer consumer{std::move(info), std::move(consumer_function)};
+  consumer.Start();
+  ASSERT_TRUE(consumer.IsRunning());
+
+  // Wait until the consumer group has a leader, see CreateConsumer.
+  int sent_messages{1};
+  SeedTopicWithInt(kTopicName, sent_messages);
+  while (last_executed_message.load() == 0) {
+    std::this_thread::sleep_for(std::chrono::milliseconds(500));
+    SeedTopicWithInt(kTopicName, ++sent_messages);
+  }
+
+  for (auto i = 0; i < kMessageCount; ++i) {
+    SeedTopicWithInt(kTopicName, ++sent_messages);
+  }
+  while (last_executed_message.load() != sent_messages) {
+    std::this_thread::sleep_for(std::chrono::milliseconds(100));
+  }
+  consumer.Stop();
+
+  EXPECT_FALSE(second_stages_overlapped);
+  ASSERT_FALSE(executed_messages.empty());
+  for (size_t i = 1; i < executed_messages.size(); ++i) {
+    EXPECT_EQ(executed_messages[i - 1] + 1, executed_messages[i]);
+  }
+  EXPECT_EQ(sent_messages, executed_messages.back());
+}
+
 TEST_F(ConsumerTest, InvalidBootstrapServers) {
   auto info = CreateDefaultConsumerInfo();
   info.bootstrap_servers = "non.existing.host:9092";
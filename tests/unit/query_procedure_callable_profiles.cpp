@@ -0,0 +1,74 @@
+// Copyright 2024 Memgraph Ltd.
+//
+// Use of this software is governed by the Business Source License
+// included in the file licenses/BSL.txt; by using this file, you agree to be bound by the terms of the Business Source
+// License, and you may not use this file except in compliance with the Business Source License.
+//
+// As of the Change Date specified in that file, in accordance with
+// the Business Source License, use of this software will be governed
+// by the Apache License, Version 2.0, included in the file
+// licenses/APL.txt.
+
+#include <gtest/gtest.h>
+
+#include <string>
+#include <vector>
+
+#include "query/procedure/callable_profiles.hpp"
+
+using memgraph::query::procedure::CallableProfile;
+using memgraph::query::procedure::CallableProfiles;
+using memgraph::query::procedure::CallCountingResource;
+using memgraph::query::procedure::CountApiCall;
+using memgraph::query::procedure::ProfiledCall;
+
+TEST(CallableProfiles, GetReturnsTheSameProfile) {
+  CallableProfiles profiles;
+  auto &profile = profiles.Get("module.procedure");
+  EXPECT_EQ(&profile, &profiles.Get("module.procedure"));
+  EXPECT_NE(&profile, &profiles.Get("module.function"));
+  std::vector<std::string> names;
+  profiles.ForEach([&](const auto &name, const auto &) { names.push_back(name); });
+  EXPECT_EQ(names, (std::vector<std::string>{"module.function", "module.procedure"}));
+}
+
+TEST(CallableProfiles, ProfiledCall) {
+  CallableProfile profile;
+  CallCountingResource memory(memgraph::utils::NewDeleteResource());
+  CountApiCall();
+  {
+    ProfiledCall call(profile);
+    CountApiCall();
+    CountApiCall();
+    memory.Deallocate(memory.Allocate(64), 64);
+    call.AddRows(3);
+  }
+  // Calls outside of the profiled call aren't counted.
+  CountApiCall();
+  memory.Deallocate(memory.Allocate(64), 64);
+  {
+    ProfiledCall batch(profile, false);
+    batch.AddRows(2);
+  }
+  EXPECT_EQ(profile.calls, 1);
+  EXPECT_EQ(profile.rows, 5);
+  EXPECT_EQ(profile.api_calls, 2);
+  EXPECT_EQ(profile.allocated_bytes, 64);
+}
+
+TEST(CallableProfiles, NestedCalls) {
+  CallableProfile outer_profile;
+  CallableProfile inner_profile;
+  {
+    ProfiledCall outer(outer_profile);
+    CountApiCall();
+    {
+      ProfiledCall inner(inner_profile);
+      CountApiCall();
+      CountApiCall();
+    }
+    CountApiCall();
+  }
+  EXPECT_EQ(outer_profile.api_calls, 2);
+  EXPECT_EQ(inner_profile.api_calls, 2);
+}
@@ -313,6 +313,69 @@ TYPED_TEST(PyModule, PyObjectToMgpValue) {
   mgp_value_destroy(value);
 }
 
+TEST(PyGarbageCollection, YoungCollectionOnlyWhileIdle) {
+  using memgraph::query::procedure::PyGarbageCollection;
+  using memgraph::query::procedure::SchedulePyGarbageCollection;
+  constexpr std::chrono::seconds kInterval{180};
+  memgraph::query::procedure::PyGarbageCollectionStats stats{.young_count = 5,
+                                                             .old_count = 0,
+                                                             .arena_bytes = 1L << 30,
+                                                             .arena_bytes_after_full_collection = 1L << 30,
+                                                             .since_full_collection = std::chrono::seconds{1},
+                                                             .is_idle = true};
+  EXPECT_EQ(SchedulePyGarbageCollection(stats, kInterval), PyGarbageCollection::YOUNG);
+  stats.is_idle = false;
+  EXPECT_EQ(SchedulePyGarbageCollection(stats, kInterval), PyGarbageCollection::NONE);
+  stats.is_idle = true;
+  stats.young_count = 0;
+  EXPECT_EQ(SchedulePyGarbageCollection(stats, kInterval), PyGarbageCollection::NONE);
+}
+
+TEST(PyGarbageCollection, FullCollectionOnGrowth) {
+  using memgraph::query::procedure::PyGarbageCollection;
+  using memgraph::query::procedure::SchedulePyGarbageCollection;
+  constexpr std::chrono::seconds kInterval{180};
+  memgraph::query::procedure::PyGarbageCollectionStats stats{.young_count = 0,
+                                                             .old_count = 10,
+                                                             .arena_bytes = 1L << 30,
+                                                             .arena_bytes_after_full_collection = 1L << 30,
+                                                             .since_full_collection = std::chrono::seconds{1},
+                                                             .is_idle = true};
+  EXPECT_EQ(SchedulePyGarbageCollection(stats, kInterval), PyGarbageCollection::NONE);
+  stats.arena_bytes = (1L << 30) + (1L << 28);
+  EXPECT_EQ(SchedulePyGarbageCollection(stats, kInterval), PyGarbageCollection::FULL);
+  // A due full collection waits for the running callables, unless pymalloc has
+  // doubled or the interval has passed twice.
+  stats.is_idle = false;
+  EXPECT_EQ(SchedulePyGarbageCollection(stats, kInterval), PyGarbageCollection::NONE);
+  stats.arena_bytes = 1L << 31;
+  EXPECT_EQ(SchedulePyGarbageCollection(stats, kInterval), PyGarbageCollection::FULL);
+  stats.arena_bytes = 1L << 30;
+  stats.since_full_collection = kInterval;
+  EXPECT_EQ(SchedulePyGarbageCollection(stats, kInterval), PyGarbageCollection::NONE);
+  stats.since_full_collection = 2 * kInterval;
+  EXPECT_EQ(SchedulePyGarbageCollection(stats, kInterval), PyGarbageCollection::FULL);
+}
+
+TEST(PyGarbageCollection, BaselineIsClamped) {
+  using memgraph::query::procedure::PyGarbageCollection;
+  using memgraph::query::procedure::SchedulePyGarbageCollection;
+  constexpr std::chrono::seconds kInterval{180};
+  // Nothing was measured yet, or the arenas allocated before the allocator
+  // hooks were installed were freed since.
+  for (const int64_t baseline : {0L, -(1L << 20)}) {
+    memgraph::query::procedure::PyGarbageCollectionStats stats{.young_count = 0,
+                                                               .old_count = 10,
+                                                               .arena_bytes = 1L << 20,
+                                                               .arena_bytes_after_full_collection = baseline,
+                                                               .since_full_collection = std::chrono::seconds{1},
+                                                               .is_idle = false};
+    EXPECT_EQ(SchedulePyGarbageCollection(stats, kInterval), PyGarbageCollection::NONE);
+    stats.is_idle = true;
+    EXPECT_EQ(SchedulePyGarbageCollection(stats, kInterval), PyGarbageCollection::NONE);
+  }
+}
+
 int main(int argc, char **argv) {
   ::testing::InitGoogleTest(&argc, argv);
   // Initialize Python
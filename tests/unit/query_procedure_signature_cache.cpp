@@ -0,0 +1,90 @@
+// Copyright 2024 Memgraph Ltd.
+//
+// Use of this software is governed by the Business Source License
+// included in the file licenses/BSL.txt; by using this file, you agree to be bound by the terms of the Business Source
+// License, and you may not use this file except in compliance with the Business Source License.
+//
+// As of the Change Date specified in that file, in accordance with
+// the Business Source License, use of this software will be governed
+// by the Apache License, Version 2.0, included in the file
+// licenses/APL.txt.
+
+#include <gtest/gtest.h>
+
+#include <filesystem>
+#include <fstream>
+#include <map>
+#include <string>
+
+#include "query/procedure/mg_procedure_helpers.hpp"
+#include "query/procedure/signature_cache.hpp"
+
+using memgraph::query::procedure::Call;
+using memgraph::query::procedure::DeserializeSignature;
+using memgraph::query::procedure::SerializeSignatures;
+using memgraph::query::procedure::SignatureCache;
+
+namespace {
+void DummyCallback(mgp_list * /*args*/, mgp_graph * /*graph*/, mgp_result * /*result*/, mgp_memory * /*memory*/) {}
+}  // namespace
+
+class SignatureCacheTest : public ::testing::Test {
+ protected:
+  void SetUp() override {
+    std::filesystem::remove_all(directory_);
+    std::filesystem::create_directories(directory_);
+    WriteModule("def procedure():\n    pass\n");
+  }
+
+  void TearDown() override { std::filesystem::remove_all(directory_); }
+
+  void WriteModule(const std::string &content) const { std::ofstream(module_path_) << content; }
+
+  std::filesystem::path directory_{std::filesystem::temp_directory_path() / "MG_tests_unit_signature_cache"};
+  std::filesystem::path module_path_{directory_ / "module.py"};
+  SignatureCache cache_{directory_ / "signatures"};
+};
+
+TEST_F(SignatureCacheTest, LoadStored) {
+  EXPECT_FALSE(cache_.Load(module_path_));
+  const nlohmann::json signatures{{"procedures", nlohmann::json::array()}};
+  cache_.Store(module_path_, signatures);
+  EXPECT_EQ(cache_.Load(module_path_), signatures);
+}
+
+TEST_F(SignatureCacheTest, ModuleChanged) {
+  cache_.Store(module_path_, nlohmann::json{{"procedures", nlohmann::json::array()}});
+  WriteModule("def procedure():\n    return\n");
+  EXPECT_FALSE(cache_.Load(module_path_));
+}
+
+TEST(SignatureCache, SerializeRoundTrip) {
+  auto *resource = memgraph::utils::NewDeleteResource();
+  mgp_memory memory{resource};
+  mgp_proc proc("procedure", DummyCallback, resource, {.is_write = true});
+  ASSERT_EQ(mgp_proc_add_arg(&proc, "list", Call<mgp_type *>(mgp_type_list, Call<mgp_type *>(mgp_type_int))),
+            mgp_error::MGP_ERROR_NO_ERROR);
+  auto *default_value = Call<mgp_value *>(mgp_value_make_string, "default", &memory);
+  ASSERT_EQ(mgp_proc_add_opt_arg(&proc, "string", Call<mgp_type *>(mgp_type_string), default_value),
+            mgp_error::MGP_ERROR_NO_ERROR);
+  mgp_value_destroy(default_value);
+  ASSERT_EQ(mgp_proc_add_result(&proc, "node", Call<mgp_type *>(mgp_type_nullable, Call<mgp_type *>(mgp_type_node))),
+            mgp_error::MGP_ERROR_NO_ERROR);
+  std::map<std::string, mgp_proc, std::less<>> procedures;
+  procedures.emplace("procedure", std::move(proc));
+  const auto signatures = SerializeSignatures(procedures, {}, {});
+  ASSERT_TRUE(signatures);
+
+  mgp_proc deserialized("procedure", DummyCallback, resource, {.is_write = true});
+  DeserializeSignature(signatures->at("procedures").at(0), &deserialized);
+  std::map<std::string, mgp_proc, std::less<>> deserialized_procedures;
+  deserialized_procedures.emplace("procedure", std::move(deserialized));
+  EXPECT_EQ(SerializeSignatures(deserialized_procedures, {}, {}), signatures);
+}
+
+TEST(SignatureCache, UnknownType) {
+  const auto signature =
+      nlohmann::json::parse(R"({"name": "procedure", "args": [["arg", "TABLE"]], "opt_args": [], "results": []})");
+  mgp_proc proc("procedure", DummyCallback, memgraph::utils::NewDeleteResource());
+  EXPECT_THROW(DeserializeSignature(signature, &proc), std::invalid_argument);
+}
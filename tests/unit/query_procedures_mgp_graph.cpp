@@ -306,6 +306,97 @@ TYPED_TEST(MgpGraphTest, VerticesIterator) {
   }
 }
 
+template <typename TFixture>
+void CheckVerticesByLabelAndPropertyIterators(TFixture &fixture) {
+  static constexpr std::string_view label{"Label"};
+  static constexpr std::string_view property{"prop"};
+  {
+    auto &accessor = fixture.CreateDbAccessor(memgraph::storage::IsolationLevel::SNAPSHOT_ISOLATION);
+    for (int64_t i = 0; i < 4; ++i) {
+      auto vertex = accessor.InsertVertex();
+      ASSERT_TRUE(vertex.AddLabel(accessor.NameToLabel(label)).HasValue());
+      ASSERT_TRUE(
+          vertex.SetProperty(accessor.NameToProperty(property), memgraph::storage::PropertyValue(i)).HasValue());
+    }
+    auto vertex = accessor.InsertVertex();
+    ASSERT_TRUE(vertex.SetProperty(accessor.NameToProperty(property), memgraph::storage::PropertyValue(1)).HasValue());
+    ASSERT_FALSE(accessor.Commit().HasError());
+  }
+  const auto count_vertices = [](mgp_vertices_iterator *it) {
+    size_t count = 0;
+    for (auto *vertex = EXPECT_MGP_NO_ERROR(mgp_vertex *, mgp_vertices_iterator_get, it); vertex != nullptr;
+         vertex = EXPECT_MGP_NO_ERROR(mgp_vertex *, mgp_vertices_iterator_next, it)) {
+      ++count;
+    }
+    return count;
+  };
+  mgp_graph graph = fixture.CreateGraph(memgraph::storage::View::OLD);
+  MgpVerticesIteratorPtr by_label{EXPECT_MGP_NO_ERROR(mgp_vertices_iterator *, mgp_graph_iter_vertices_by_label, &graph,
+                                                      mgp_label{label.data()}, &fixture.memory)};
+  EXPECT_EQ(count_vertices(by_label.get()), 4);
+
+  MgpValuePtr one{EXPECT_MGP_NO_ERROR(mgp_value *, mgp_value_make_int, 1, &fixture.memory)};
+  MgpVerticesIteratorPtr by_property{EXPECT_MGP_NO_ERROR(mgp_vertices_iterator *, mgp_graph_iter_vertices_by_property,
+                                                         &graph, mgp_label{label.data()}, property.data(), one.get(),
+                                                         &fixture.memory)};
+  EXPECT_EQ(count_vertices(by_property.get()), 1);
+
+  MgpValuePtr two{EXPECT_MGP_NO_ERROR(mgp_value *, mgp_value_make_double, 2.0, &fixture.memory)};
+  MgpVerticesIteratorPtr by_range{
+      EXPECT_MGP_NO_ERROR(mgp_vertices_iterator *, mgp_graph_iter_vertices_by_property_range, &graph,
+                          mgp_label{label.data()}, property.data(), one.get(), 0, two.get(), 1, &fixture.memory)};
+  EXPECT_EQ(count_vertices(by_range.get()), 1);
+
+  MgpVerticesIteratorPtr unbounded_below{
+      EXPECT_MGP_NO_ERROR(mgp_vertices_iterator *, mgp_graph_iter_vertices_by_property_range, &graph,
+                          mgp_label{label.data()}, property.data(), nullptr, 0, two.get(), 0, &fixture.memory)};
+  EXPECT_EQ(count_vertices(unbounded_below.get()), 2);
+
+  MgpValuePtr null_value{EXPECT_MGP_NO_ERROR(mgp_value *, mgp_value_make_null, &fixture.memory)};
+  mgp_vertices_iterator *invalid{nullptr};
+  EXPECT_EQ(mgp_graph_iter_vertices_by_property(&graph, mgp_label{label.data()}, property.data(), null_value.get(),
+                                                &fixture.memory, &invalid),
+            mgp_error::MGP_ERROR_INVALID_ARGUMENT);
+}
+
+TYPED_TEST(MgpGraphTest, VerticesByLabelAndPropertyIterators) { CheckVerticesByLabelAndPropertyIterators(*this); }
+
+TYPED_TEST(MgpGraphTest, IndexedVerticesByLabelAndPropertyIterators) {
+  const auto label = this->storage->NameToLabel("Label");
+  const auto property = this->storage->NameToProperty("prop");
+  {
+    auto unique_acc = this->storage->UniqueAccess(ReplicationRole::MAIN);
+    ASSERT_FALSE(unique_acc->CreateIndex(label).HasError());
+    ASSERT_FALSE(unique_acc->Commit().HasError());
+  }
+  {
+    auto unique_acc = this->storage->UniqueAccess(ReplicationRole::MAIN);
+    ASSERT_FALSE(unique_acc->CreateIndex(label, property).HasError());
+    ASSERT_FALSE(unique_acc->Commit().HasError());
+  }
+  CheckVerticesByLabelAndPropertyIterators(*this);
+}
+
+TYPED_TEST(MgpGraphTest, VertexAndEdgeCounts) {
+  const auto first_edge = this->CreateEdge();
+  this->CreateEdge();
+  auto graph = this->CreateGraph();
+  EXPECT_EQ(EXPECT_MGP_NO_ERROR(int64_t, mgp_graph_vertex_count, &graph), 4);
+  EXPECT_EQ(EXPECT_MGP_NO_ERROR(int64_t, mgp_graph_edge_count, &graph), 2);
+  EXPECT_EQ(EXPECT_MGP_NO_ERROR(int64_t, mgp_graph_vertex_count_by_label, &graph, mgp_label{"Label"}), 0);
+
+  MgpVertexPtr vertex{EXPECT_MGP_NO_ERROR(mgp_vertex *, mgp_graph_create_vertex, &graph, &this->memory)};
+  ASSERT_NE(vertex, nullptr);
+  EXPECT_SUCCESS(mgp_vertex_add_label(vertex.get(), mgp_label{"Label"}));
+  MgpEdgePtr edge;
+  this->GetFirstOutEdge(graph, first_edge[0], edge);
+  ASSERT_NE(edge, nullptr);
+  EXPECT_SUCCESS(mgp_graph_delete_edge(&graph, edge.get()));
+  EXPECT_EQ(EXPECT_MGP_NO_ERROR(int64_t, mgp_graph_vertex_count, &graph), 5);
+  EXPECT_EQ(EXPECT_MGP_NO_ERROR(int64_t, mgp_graph_edge_count, &graph), 1);
+  EXPECT_EQ(EXPECT_MGP_NO_ERROR(int64_t, mgp_graph_vertex_count_by_label, &graph, mgp_label{"Label"}), 1);
+}
+
 TYPED_TEST(MgpGraphTest, VertexIsMutable) {
   auto graph = this->CreateGraph(memgraph::storage::View::NEW);
   MgpVertexPtr vertex{EXPECT_MGP_NO_ERROR(mgp_vertex *, mgp_graph_create_vertex, &graph, &this->memory)};
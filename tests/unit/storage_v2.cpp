@@ -2648,3 +2648,76 @@ TYPED_TEST(StorageV2Test, DeletedVertexAccessor) {
     ASSERT_EQ(property_value, *maybe_property);
   }
 }
+
+// NOLINTNEXTLINE(hicpp-special-member-functions)
+TYPED_TEST(StorageV2Test, GraphVersion) {
+  if constexpr (std::is_same_v<TypeParam, memgraph::storage::DiskStorage>) {
+    auto acc = this->store->Access(ReplicationRole::MAIN);
+    ASSERT_FALSE(acc->GetGraphVersion().has_value());
+    return;
+  }
+
+  std::optional<memgraph::storage::GraphVersion> version;
+  {
+    auto acc1 = this->store->Access(ReplicationRole::MAIN);
+    auto acc2 = this->store->Access(ReplicationRole::MAIN);
+    version = acc1->GetGraphVersion();
+    ASSERT_TRUE(version.has_value());
+    ASSERT_EQ(acc2->GetGraphVersion(), version);
+    acc1->Abort();
+    acc2->Abort();
+  }
+  {
+    auto acc1 = this->store->Access(ReplicationRole::MAIN);
+    auto acc2 = this->store->Access(ReplicationRole::MAIN);
+    acc1->CreateVertex();
+    // The writer sees its own changes, and the reader doesn't see the ones
+    // committed after it started.
+    ASSERT_FALSE(acc1->GetGraphVersion().has_value());
+    ASSERT_EQ(acc2->GetGraphVersion(), version);
+    ASSERT_FALSE(acc1->Commit().HasError());
+    ASSERT_EQ(acc2->GetGraphVersion(), version);
+    acc2->Abort();
+  }
+  {
+    auto acc = this->store->Access(ReplicationRole::MAIN);
+    auto new_version = acc->GetGraphVersion();
+    ASSERT_TRUE(new_version.has_value());
+    ASSERT_NE(new_version, version);
+    acc->Abort();
+  }
+  {
+    auto acc = this->store->Access(ReplicationRole::MAIN, memgraph::storage::IsolationLevel::READ_COMMITTED);
+    ASSERT_FALSE(acc->GetGraphVersion().has_value());
+    acc->Abort();
+  }
+}
+
+// NOLINTNEXTLINE(hicpp-special-member-functions)
+TYPED_TEST(StorageV2Test, GraphVersionOnReplica) {
+  if constexpr (std::is_same_v<TypeParam, memgraph::storage::DiskStorage>) {
+    return;
+  }
+
+  auto reader = this->store->Access(ReplicationRole::REPLICA);
+  const auto version = reader->GetGraphVersion();
+  ASSERT_TRUE(version.has_value());
+  {
+    // Commits replicated from the main instance keep its timestamps, which may be far ahead of the clock of the
+    // replica.
+    auto acc = this->store->Access(ReplicationRole::REPLICA);
+    acc->CreateVertex();
+    ASSERT_FALSE(acc->Commit({.desired_commit_timestamp = 1000, .is_main = false}).HasError());
+  }
+  ASSERT_EQ(reader->GetGraphVersion(), version);
+  reader->Abort();
+
+  auto acc1 = this->store->Access(ReplicationRole::REPLICA);
+  auto acc2 = this->store->Access(ReplicationRole::REPLICA);
+  const auto new_version = acc1->GetGraphVersion();
+  ASSERT_TRUE(new_version.has_value());
+  ASSERT_NE(new_version, version);
+  ASSERT_EQ(acc2->GetGraphVersion(), new_version);
+  acc1->Abort();
+  acc2->Abort();
+}
@@ -1,4 +1,4 @@
-// Copyright 2023 Memgraph Ltd.
+// Copyright 2024 Memgraph Ltd.
 //
 // Use of this software is governed by the Business Source License
 // included in the file licenses/BSL.txt; by using this file, you agree to be bound by the terms of the Business Source
@@ -9,6 +9,10 @@
 // by the Apache License, Version 2.0, included in the file
 // licenses/APL.txt.
 
+#include <atomic>
+#include <thread>
+#include <vector>
+
 #include <gmock/gmock.h>
 #include <gtest/gtest.h>
 
@@ -45,3 +49,34 @@ TEST(Histogram, BasicFunctionality) {
 
   ASSERT_NEAR(diff, 0, 0.01);
 }
+
+TEST(Histogram, ConcurrentMeasurements) {
+  memgraph::metrics::Histogram histo{{50, 100}};
+  constexpr int kThreads = 4;
+  constexpr int kMeasurements = 10000;
+
+  std::atomic<bool> done{false};
+  // Percentiles are read while the other threads keep measuring.
+  std::thread reader([&] {
+    while (!done.load()) {
+      static_cast<void>(histo.YieldPercentiles());
+    }
+  });
+  std::vector<std::thread> writers;
+  for (int i = 0; i < kThreads; i++) {
+    writers.emplace_back([&histo, i] {
+      for (int j = 0; j < kMeasurements; j++) {
+        histo.Measure(i == 0 ? 500 : 10);
+      }
+    });
+  }
+  for (auto &writer : writers) {
+    writer.join();
+  }
+  done.store(true);
+  reader.join();
+
+  ASSERT_EQ(histo.Count(), kThreads * kMeasurements);
+  ASSERT_EQ(histo.Percentile(50.0), 10);
+  ASSERT_EQ(histo.Percentile(100.0), 500);
+}